@@ -0,0 +1,9 @@
+"""Benchmarks for pylegifrance.
+
+Each module runs standalone from the repository root, e.g.::
+
+    python -m benchmarks.codec
+
+Benchmarks run offline against synthetic payloads and need no PISTE
+credentials.
+"""
@@ -0,0 +1,110 @@
+"""Wall time of walking every page of a search against page fan-out.
+
+A bulk export walks all the pages of a ``/search`` query. This benchmark
+runs :func:`~pylegifrance.pagination.iter_pages` over the whole corpus of
+:class:`~pylegifrance.testing.StubPisteServer`, with a per-request latency
+standing in for the PISTE round trip, for each ``--workers`` value (the
+``max_workers`` argument of ``iter_pages``). ``max_workers=1`` is the
+sequential walk, with the next page prefetched::
+
+    python -m benchmarks.bulk_export [--corpus-size 5000] [--page-size 100]
+        [--workers 1,2,4,8] [--latency 0.05] [--repeat 3]
+        [--output bulk_export.json]
+
+Results are printed as JSON, with the speed-up over the sequential walk.
+"""
+
+import argparse
+import json
+import logging
+import platform
+import sys
+import time
+from contextlib import closing
+from pathlib import Path
+
+from pylegifrance.client import LegifranceClient
+from pylegifrance.pagination import iter_pages
+from pylegifrance.testing import StubPisteServer
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(v) for v in value.split(",") if v]
+
+
+def measure(
+    stub: StubPisteServer, page_size: int, workers: list[int], repeat: int
+) -> list[dict]:
+    """Time one full walk per worker count, keeping the best run."""
+    config = stub.config(pool_maxsize=max(workers))
+    payload = {"fond": "JURI", "recherche": {}}
+    results = []
+    with closing(LegifranceClient(config)) as client:
+        serial = None
+        for max_workers in workers:
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                walked = sum(
+                    len(page.results)
+                    for page in iter_pages(
+                        client, payload, page_size=page_size, max_workers=max_workers
+                    )
+                )
+                timings.append(time.perf_counter() - started)
+            best = min(timings)
+            if max_workers == 1:
+                serial = best
+            results.append(
+                {
+                    "max_workers": max_workers,
+                    "results": walked,
+                    "wall_ms": round(best * 1e3, 1),
+                    "speedup": round(serial / best, 2) if serial else None,
+                }
+            )
+            print(
+                f"max_workers={max_workers:<3} {best * 1e3:>9.1f} ms", file=sys.stderr
+            )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus-size", type=int, default=5000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--workers", type=_int_list, default=[1, 2, 4, 8])
+    parser.add_argument(
+        "--latency", type=float, default=0.05, help="Stub latency in seconds."
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Write the JSON results to this file.")
+    args = parser.parse_args()
+
+    logging.getLogger("pylegifrance").setLevel(logging.WARNING)
+    with StubPisteServer(
+        corpus_size=args.corpus_size, latency=args.latency, text_chars=100
+    ) as stub:
+        results = measure(stub, args.page_size, sorted(args.workers), args.repeat)
+
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "parameters": {
+            "corpus_size": args.corpus_size,
+            "page_size": args.page_size,
+            "latency_s": args.latency,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Per-request CPU cost of JSON encoding and decoding.
+
+Compares the former request path (``json.loads(json.dumps(model_dump(),
+cls=EnumEncoder))`` in the façade, a second ``json.dumps`` in ``requests``
+and ``Response.json()`` decoding text) with the codec path (``model_dump(
+mode="json")`` encoded once to bytes, response decoded from bytes).
+
+Usage::
+
+    python -m benchmarks.codec [--number 2000] [--decisions 20]
+"""
+
+import argparse
+import json
+import timeit
+
+from pylegifrance.codec import OrjsonCodec, StdlibCodec
+from pylegifrance.models.juri.search import SearchRequest
+from pylegifrance.utils import EnumEncoder
+
+
+def _search_response(decisions: int) -> bytes:
+    """Build a ``/search`` response body shaped like the JURI fond."""
+    paragraph = "Attendu que la cour d'appel a légalement justifié sa décision ; " * 40
+    results = [
+        {
+            "titles": [{"id": f"JURITEXT0000000{i:05d}", "title": f"Arrêt {i}"}],
+            "text": paragraph,
+            "sections": [{"extracts": [{"values": [paragraph[:400]]}]}],
+            "date": "2020-01-01T00:00:00.000+0000",
+        }
+        for i in range(decisions)
+    ]
+    body = {"totalResultNumber": decisions, "results": results, "facets": []}
+    return json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+
+def _legacy(dto, body: bytes) -> None:
+    payload = json.loads(json.dumps(dto.model_dump(by_alias=True), cls=EnumEncoder))
+    json.dumps(payload).encode("utf-8")  # what requests does with json=
+    json.loads(body.decode("utf-8"))  # Response.text then json.loads
+
+
+def _with_codec(codec, dto, body: bytes) -> None:
+    codec.dumps(dto.model_dump(by_alias=True, mode="json"))
+    codec.loads(body)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--decisions", type=int, default=20)
+    args = parser.parse_args()
+
+    dto = SearchRequest(search="responsabilité contractuelle").to_api_model()
+    body = _search_response(args.decisions)
+
+    candidates = {"legacy round-trip": lambda: _legacy(dto, body)}
+    stdlib_codec = StdlibCodec()
+    candidates["StdlibCodec"] = lambda: _with_codec(stdlib_codec, dto, body)
+    try:
+        orjson_codec = OrjsonCodec()
+    except ImportError:
+        print("orjson not installed: skipping OrjsonCodec")
+    else:
+        candidates["OrjsonCodec"] = lambda: _with_codec(orjson_codec, dto, body)
+
+    print(f"response body: {len(body) / 1024:.0f} KiB, {args.number} requests")
+    baseline = None
+    for name, fn in candidates.items():
+        per_call = min(timeit.repeat(fn, number=args.number, repeat=3)) / args.number
+        baseline = baseline or per_call
+        saved = 100 * (1 - per_call / baseline)
+        print(f"{name:<20} {per_call * 1e6:9.1f} µs/request  ({saved:.0f}% saved)")
+
+
+if __name__ == "__main__":
+    main()
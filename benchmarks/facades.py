@@ -0,0 +1,391 @@
+"""End-to-end throughput and latency of the façade operations.
+
+Each operation runs through a real :class:`~pylegifrance.LegifranceClient`
+(encoding, transport, decoding, pydantic validation, façade hydration)
+against :class:`~pylegifrance.testing.StubPisteServer`, at several
+concurrency levels and corpus sizes. Two transports are measured:
+
+- ``stub``: HTTP requests to the local stub server, socket cost included;
+- ``replay``: the stub's answers, recorded once to a cassette and replayed
+  in-process by :class:`~pylegifrance.transport.ReplayTransport`, so the
+  figures isolate the client-side CPU cost of hydration.
+
+Results are printed as JSON (one record per operation, transport, corpus
+size and concurrency level) so runs can be compared across commits::
+
+    python -m benchmarks.facades --output before.json
+    git checkout feature && python -m benchmarks.facades --output after.json
+    python -m benchmarks.facades --compare before.json after.json
+
+``--compare`` exits with status 1 when an operation got slower than
+``--threshold`` (default 10%) on either throughput or median latency.
+
+Usage::
+
+    python -m benchmarks.facades [--operations juri.search,loda.fetch]
+        [--concurrency 1,4,16] [--corpus 100,10000] [--iterations 200]
+        [--transports stub,replay] [--latency 0] [--page-size 10]
+"""
+
+import argparse
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+from pylegifrance.client import LegifranceClient
+from pylegifrance.fonds.code import Code
+from pylegifrance.fonds.juri import JuriAPI
+from pylegifrance.fonds.kali import KaliAPI
+from pylegifrance.fonds.loda import Loda
+from pylegifrance.models.code.enum import NomCode
+from pylegifrance.models.juri.search import SearchRequest as JuriSearchRequest
+from pylegifrance.models.kali.search import SearchRequest as KaliSearchRequest
+from pylegifrance.retry import RetryPolicy
+from pylegifrance.testing import StubPisteServer
+from pylegifrance.transport import RecordingTransport, ReplayTransport
+
+# Distinct documents each operation cycles through, spread over the corpus.
+_DISTINCT_INPUTS = 32
+_CONSULT_DATE = "2024-01-01"
+
+
+@dataclass(frozen=True)
+class Operation:
+    """
+    A façade operation under benchmark.
+
+    Attributes:
+        name: The operation name used in the results.
+        run: Runs the operation once for input ``i``.
+        setup: Optional preparation run once per client, outside the
+            measurement; its result is passed to ``run``.
+    """
+
+    name: str
+    run: Callable[[LegifranceClient, Any, int], Any]
+    setup: Callable[[LegifranceClient, list[int]], Any] | None = None
+
+
+def _doc_id(prefix: str, index: int) -> str:
+    return f"{prefix}{index:012d}"
+
+
+def _operations(page_size: int) -> list[Operation]:
+    def code_search(client, _, i):
+        return (
+            Code(client)
+            .search()
+            .in_code(NomCode.CC)
+            .text("contrat")
+            .paginate(page_size=page_size)
+            .execute()
+        )
+
+    def code_consult(client, ids, i):
+        text_id = _doc_id("LEGITEXT", ids[i % len(ids)])
+        return Code(client).fetch_code(text_id).at(_CONSULT_DATE)
+
+    def juri_search(client, _, i):
+        query = JuriSearchRequest(search="responsabilité", page_size=page_size)
+        return JuriAPI(client).search(query)
+
+    def juri_search_lazy(client, _, i):
+        # The UI flow: list the hits, then open one of them.
+        query = JuriSearchRequest(search="responsabilité", page_size=page_size)
+        decisions = JuriAPI(client).search(query, lazy=True)
+        opened = decisions[i % len(decisions)].text if decisions else None
+        return decisions, opened
+
+    def juri_fetch_by_id(client, ids, i):
+        return JuriAPI(client).fetch_by_id(_doc_id("JURITEXT", ids[i % len(ids)]))
+
+    def loda_fetch(client, ids, i):
+        return Loda(client).fetch(_doc_id("LEGITEXT", ids[i % len(ids)]))
+
+    def loda_fetch_versions(client, ids, i):
+        return Loda(client).fetch_versions(_doc_id("LEGITEXT", ids[i % len(ids)]))
+
+    def kali_search(client, _, i):
+        query = KaliSearchRequest(search="boulangerie", page_size=page_size)
+        return KaliAPI(client).search(query)
+
+    def fetch_texts(client, ids):
+        loda = Loda(client)
+        return [loda.fetch(_doc_id("LEGITEXT", index)) for index in ids]
+
+    def modifications_report(client, texts, i):
+        return texts[i % len(texts)].format_modifications_report()
+
+    def ids(client, ids):
+        return ids
+
+    return [
+        Operation("code.search", code_search),
+        Operation("code.consult", code_consult, ids),
+        Operation("juri.search", juri_search),
+        Operation("juri.search_lazy", juri_search_lazy),
+        Operation("juri.fetch_by_id", juri_fetch_by_id, ids),
+        Operation("loda.fetch", loda_fetch, ids),
+        Operation("loda.fetch_versions", loda_fetch_versions, ids),
+        Operation("kali.search", kali_search),
+        Operation(
+            "loda.format_modifications_report", modifications_report, fetch_texts
+        ),
+    ]
+
+
+def _spread(corpus_size: int) -> list[int]:
+    """Pick distinct document indexes spread over the corpus."""
+    count = min(corpus_size, _DISTINCT_INPUTS)
+    step = corpus_size // count
+    return [1 + n * step for n in range(count)]
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, round(fraction * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def _measure(
+    operation: Operation,
+    client: LegifranceClient,
+    state: Any,
+    concurrency: int,
+    iterations: int,
+) -> dict[str, Any]:
+    latencies: list[float] = []
+    lock = threading.Lock()
+
+    def worker(worker_index: int) -> None:
+        local = []
+        for i in range(worker_index, iterations, concurrency):
+            started = time.perf_counter()
+            operation.run(client, state, i)
+            local.append(time.perf_counter() - started)
+        with lock:
+            latencies.extend(local)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for future in [pool.submit(worker, w) for w in range(concurrency)]:
+            future.result()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "iterations": iterations,
+        "elapsed_s": round(elapsed, 4),
+        "throughput_ops_s": round(iterations / elapsed, 2),
+        "latency_ms": {
+            "mean": round(statistics.fmean(latencies) * 1e3, 3),
+            "p50": round(_percentile(latencies, 0.50) * 1e3, 3),
+            "p95": round(_percentile(latencies, 0.95) * 1e3, 3),
+            "p99": round(_percentile(latencies, 0.99) * 1e3, 3),
+            "max": round(latencies[-1] * 1e3, 3),
+        },
+    }
+
+
+def _client(stub: StubPisteServer, concurrency: int, transport=None):
+    return LegifranceClient(
+        stub.config(pool_maxsize=max(concurrency, 10)),
+        retry_policy=RetryPolicy.disabled(),
+        transport=transport,
+    )
+
+
+def _run_corpus(args, corpus_size: int, operations: list[Operation]) -> list[dict]:
+    records = []
+    ids = _spread(corpus_size)
+    max_concurrency = max(args.concurrency)
+    stub = StubPisteServer(
+        corpus_size,
+        latency=args.latency,
+        text_chars=args.text_chars,
+        articles_per_text=args.articles_per_text,
+    )
+    with stub, tempfile.TemporaryDirectory() as tmp:
+        for operation in operations:
+            cassette = Path(tmp) / f"{operation.name}.jsonl.gz"
+            # The warm-up pass primes connections and records the cassette
+            # replayed by the in-process transport.
+            with RecordingTransport(cassette) as recorder:
+                warmup = _client(stub, 1, recorder)
+                state = operation.setup(warmup, ids) if operation.setup else None
+                for i in range(len(ids)):
+                    operation.run(warmup, state, i)
+                warmup.close()
+
+            for transport_name in args.transports:
+                transport = (
+                    ReplayTransport(cassette) if transport_name == "replay" else None
+                )
+                client = _client(stub, max_concurrency, transport)
+                state = operation.setup(client, ids) if operation.setup else None
+                for concurrency in args.concurrency:
+                    stub.reset_stats()
+                    result = _measure(
+                        operation, client, state, concurrency, args.iterations
+                    )
+                    requests = stub.stats().total_requests
+                    if transport_name == "stub":
+                        result["requests_per_op"] = round(requests / args.iterations, 2)
+                    records.append(
+                        {
+                            "operation": operation.name,
+                            "transport": transport_name,
+                            "corpus_size": corpus_size,
+                            "concurrency": concurrency,
+                            **result,
+                        }
+                    )
+                    print(
+                        f"{operation.name:<34} {transport_name:<6} "
+                        f"corpus={corpus_size:<6} c={concurrency:<3} "
+                        f"{result['throughput_ops_s']:>9.1f} ops/s  "
+                        f"p50={result['latency_ms']['p50']:.2f} ms",
+                        file=sys.stderr,
+                    )
+                client.close()
+    return records
+
+
+def _environment() -> dict[str, Any]:
+    try:
+        version = metadata.version("pylegifrance")
+    except metadata.PackageNotFoundError:
+        version = None
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "commit": commit,
+        "pylegifrance": version,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+
+def _key(record: dict) -> tuple:
+    return (
+        record["operation"],
+        record["transport"],
+        record["corpus_size"],
+        record["concurrency"],
+    )
+
+
+def compare(baseline_path: str, current_path: str, threshold: float) -> int:
+    """Print the relative change between two result files.
+
+    Returns:
+        1 if an operation regressed by more than ``threshold``, else 0.
+    """
+    baseline = {
+        _key(r): r for r in json.loads(Path(baseline_path).read_text())["results"]
+    }
+    current = json.loads(Path(current_path).read_text())["results"]
+    regressions = 0
+    for record in current:
+        before = baseline.get(_key(record))
+        if before is None:
+            continue
+        throughput = record["throughput_ops_s"] / before["throughput_ops_s"] - 1
+        p50 = record["latency_ms"]["p50"] / before["latency_ms"]["p50"] - 1
+        regressed = throughput < -threshold or p50 > threshold
+        regressions += regressed
+        operation, transport, corpus_size, concurrency = _key(record)
+        print(
+            f"{'REGRESSION' if regressed else 'ok':<10} {operation:<34} "
+            f"{transport:<6} corpus={corpus_size:<6} c={concurrency:<3} "
+            f"throughput {throughput:+7.1%}  p50 {p50:+7.1%}"
+        )
+    return 1 if regressions else 0
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(v) for v in value.split(",") if v]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--operations", help="Comma-separated operation names.")
+    parser.add_argument("--concurrency", type=_int_list, default=[1, 4, 16])
+    parser.add_argument("--corpus", type=_int_list, default=[100, 10_000])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument(
+        "--transports",
+        type=lambda v: v.split(","),
+        default=["stub", "replay"],
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Stub latency in seconds."
+    )
+    parser.add_argument("--page-size", type=int, default=10)
+    parser.add_argument("--text-chars", type=int, default=2000)
+    parser.add_argument("--articles-per-text", type=int, default=3)
+    parser.add_argument("--output", help="Write the JSON results to this file.")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("BASELINE", "CURRENT"),
+        help="Compare two result files instead of running.",
+    )
+    parser.add_argument("--threshold", type=float, default=0.10)
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(compare(*args.compare, args.threshold))
+
+    logging.getLogger("pylegifrance").setLevel(logging.WARNING)
+    operations = _operations(args.page_size)
+    if args.operations:
+        wanted = set(args.operations.split(","))
+        operations = [op for op in operations if op.name in wanted]
+        unknown = wanted - {op.name for op in operations}
+        if unknown:
+            parser.error(f"unknown operations: {', '.join(sorted(unknown))}")
+
+    results = []
+    for corpus_size in args.corpus:
+        results.extend(_run_corpus(args, corpus_size, operations))
+
+    report = {
+        "environment": _environment(),
+        "parameters": {
+            "iterations": args.iterations,
+            "latency_s": args.latency,
+            "page_size": args.page_size,
+            "text_chars": args.text_chars,
+            "articles_per_text": args.articles_per_text,
+        },
+        "results": results,
+    }
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
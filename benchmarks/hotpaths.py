@@ -0,0 +1,415 @@
+"""Micro-benchmarks of the parsing and model-construction hot paths.
+
+Measures, for small, medium and huge payloads:
+
+- ``models.Article.from_orm`` on ``/consult/getArticle`` answers;
+- ``_extract_articles_from_response`` on code ``/search`` answers;
+- ``models.Code.from_orm`` on ``/consult/code`` trees;
+- ``Decision.model_validate`` on ``/consult/juri`` answers;
+- ``TexteLodaModel.model_validate``, ``ConsultTextResponse.model_validate``
+  and ``Loda._build_texte_model`` (which runs both) on
+  ``/consult/lawDecree`` answers;
+- the same consults end to end from the response bytes, through the
+  default path (decode, then validate) and the trusted fast path of
+  :mod:`pylegifrance.hydration` (``*.from_bytes`` and
+  ``*.from_bytes_trusted``);
+- the BeautifulSoup cleaners: ``TexteLoda.texte_brut``,
+  ``TexteLoda._clean_html_for_markdown`` and
+  ``JuriDecision._extract_plain_text``.
+
+Payloads come from cassettes recorded against PISTE with
+:class:`~pylegifrance.transport.RecordingTransport` (``--cassette``); for
+each route the smallest, median and largest answers are used. Routes absent
+from the cassettes fall back to synthetic payloads shaped like the API's,
+so the suite also runs without credentials.
+
+Each benchmark reports ops/s (best of ``--repeat`` runs) and, measured with
+:mod:`tracemalloc` on a separate call, the peak memory allocated during one
+call and the memory it retains. Results are printed as JSON::
+
+    python -m benchmarks.hotpaths [--cassette code.jsonl.gz ...]
+        [--benchmarks article.from_orm,code.from_orm] [--repeat 5]
+        [--output hotpaths.json]
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any
+
+from pylegifrance.codec import default_codec
+from pylegifrance.fonds.code import _extract_articles_from_response
+from pylegifrance.fonds.juri import JuriAPI, JuriDecision
+from pylegifrance.fonds.loda import Loda, TexteLoda
+from pylegifrance.models.code import models
+from pylegifrance.models.generated.model import ConsultTextResponse
+from pylegifrance.models.juri.models import Decision
+from pylegifrance.models.loda.models import TexteLoda as TexteLodaModel
+from pylegifrance.transport import read_cassette
+
+SIZES = ("small", "medium", "huge")
+
+# Synthetic payload dimensions by size: characters of text, number of
+# search results, and (sections per level, depth, articles per section)
+# of code trees. "huge" code trees weigh a few MB, like the Code civil.
+_TEXT_CHARS = {"small": 1_500, "medium": 20_000, "huge": 200_000}
+_SEARCH_RESULTS = {"small": 5, "medium": 25, "huge": 100}
+_CODE_TREE = {"small": (2, 2, 2), "medium": (4, 3, 3), "huge": (5, 4, 4)}
+
+_PARAGRAPH = (
+    "<p>Attendu que la cour d'appel, qui a relevé que le contrat de "
+    "travail avait été rompu, a <b>légalement justifié</b> sa décision ;"
+    "<br/>Par ces motifs, rejette le pourvoi.</p>\n"
+)
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """
+    A function benchmarked on one payload.
+
+    Attributes:
+        name: The hot path measured.
+        size: ``"small"``, ``"medium"`` or ``"huge"``.
+        source: ``"cassette"`` or ``"synthetic"``.
+        payload_bytes: Size of the JSON payload.
+        fn: Runs the hot path once.
+    """
+
+    name: str
+    size: str
+    source: str
+    payload_bytes: int
+    fn: Callable[[], Any]
+
+
+def _html(chars: int) -> str:
+    return _PARAGRAPH * max(1, chars // len(_PARAGRAPH))
+
+
+def _article(index: int, chars: int) -> dict:
+    html = _html(chars)
+    return {
+        "id": f"LEGIARTI{index:012d}",
+        "cid": f"LEGIARTI{index:012d}",
+        "num": f"L{index}",
+        "etat": "VIGUEUR",
+        "dateDebut": 1_704_067_200_000,
+        "dateFin": 32_472_144_000_000,
+        "texte": html,
+        "texteHtml": html,
+        "content": html,
+        "textTitles": [{"id": "LEGITEXT000006070721", "titre": "Code civil"}],
+        "lstLienModification": [
+            {
+                "linkType": "MODIFIE",
+                "articleId": f"LEGIARTI{index + 1:012d}",
+                "textTitle": "LOI n°2015-990 du 6 août 2015 - art. 53 (V)",
+            }
+        ],
+    }
+
+
+def _synthetic(route: str, size: str) -> dict:
+    chars = _TEXT_CHARS[size]
+    if route == "consult/getArticle":
+        return {"article": _article(1, chars)}
+    if route == "search":
+        return {
+            "totalResultNumber": _SEARCH_RESULTS[size],
+            "results": [
+                {
+                    "titles": [{"id": "LEGITEXT000006070721", "title": "Code civil"}],
+                    "sections": [
+                        {
+                            "id": f"LEGISCTA{i:012d}",
+                            "title": "Chapitre Ier",
+                            "extracts": [
+                                {
+                                    "type": "articles",
+                                    "id": f"LEGIARTI{i:012d}",
+                                    "num": f"L{i}",
+                                    "legalStatus": "VIGUEUR",
+                                    "values": [_html(400)],
+                                }
+                            ],
+                        }
+                    ],
+                }
+                for i in range(_SEARCH_RESULTS[size])
+            ],
+        }
+    if route == "consult/code":
+        fanout, depth, per_section = _CODE_TREE[size]
+        counter = iter(range(1, sys.maxsize))
+
+        def section(level: int) -> dict:
+            return {
+                "id": f"LEGISCTA{next(counter):012d}",
+                "title": f"Section de niveau {level}",
+                "etat": "VIGUEUR",
+                "articles": [_article(next(counter), 600) for _ in range(per_section)],
+                "sections": (
+                    [section(level + 1) for _ in range(fanout)] if level < depth else []
+                ),
+            }
+
+        return {
+            "id": "LEGITEXT000006070721",
+            "cid": "LEGITEXT000006070721",
+            "title": "Code civil",
+            "etat": "VIGUEUR",
+            "sections": [section(1) for _ in range(fanout)],
+            "articles": [],
+        }
+    if route == "consult/juri":
+        html = _html(chars)
+        return {
+            "text": {
+                "id": "JURITEXT000000000001",
+                "titre": "Cour de cassation, civile, Chambre sociale",
+                "juridiction": "Cour de cassation",
+                "num": "21-12.345",
+                "texteHtml": html,
+                "texte": None,
+            }
+        }
+    if route == "consult/lawDecree":
+        count = max(1, chars // 2_000)
+        return {
+            "id": "LEGITEXT000031000000",
+            "cid": "JORFTEXT000030978561",
+            "title": "LOI n° 2015-990 du 6 août 2015",
+            "nor": "EINX1426821L",
+            "etat": "VIGUEUR",
+            "articles": [_article(i, 2_000) for i in range(count)],
+            "sections": [],
+        }
+    raise ValueError(f"No synthetic payload for {route}")
+
+
+def _recorded(cassettes: list[str]) -> dict[str, dict[str, dict]]:
+    """Pick the smallest, median and largest recorded answer of each route."""
+    bodies: dict[str, list[str]] = {}
+    for path in cassettes:
+        for record in read_cassette(path):
+            if record["status"] == 200:
+                bodies.setdefault(record["route"], []).append(record["body"])
+    picked = {}
+    for route, route_bodies in bodies.items():
+        route_bodies.sort(key=len)
+        indexes = (0, len(route_bodies) // 2, len(route_bodies) - 1)
+        picked[route] = {
+            size: json.loads(route_bodies[index])
+            for size, index in zip(SIZES, indexes, strict=True)
+        }
+    return picked
+
+
+def _benchmarks(cassettes: list[str]) -> list[Benchmark]:
+    recorded = _recorded(cassettes)
+    loda = Loda(None)
+    benchmarks = []
+
+    def payloads(route: str):
+        for size in SIZES:
+            if route in recorded:
+                payload, source = recorded[route][size], "cassette"
+            else:
+                payload, source = _synthetic(route, size), "synthetic"
+            yield size, source, len(json.dumps(payload, ensure_ascii=False)), payload
+
+    def add(name, route, make_fn):
+        for size, source, payload_bytes, payload in payloads(route):
+            benchmarks.append(
+                Benchmark(name, size, source, payload_bytes, make_fn(payload))
+            )
+
+    add(
+        "article.from_orm",
+        "consult/getArticle",
+        lambda p: lambda: models.Article.from_orm(p),
+    )
+    add(
+        "code.extract_articles",
+        "search",
+        lambda p: lambda: list(_extract_articles_from_response(p["results"], False)),
+    )
+    add("code.from_orm", "consult/code", lambda p: lambda: models.Code.from_orm(p))
+    add(
+        "decision.model_validate",
+        "consult/juri",
+        lambda p: lambda: Decision.model_validate(p["text"]),
+    )
+    add(
+        "loda.texte_model_validate",
+        "consult/lawDecree",
+        lambda p: lambda: TexteLodaModel.model_validate(p),
+    )
+    add(
+        "loda.consult_response_validate",
+        "consult/lawDecree",
+        lambda p: lambda: ConsultTextResponse.model_validate(p),
+    )
+    add(
+        "loda.build_texte_model",
+        "consult/lawDecree",
+        lambda p: lambda: loda._build_texte_model(p),
+    )
+
+    codec = default_codec()
+    juri = JuriAPI(None)
+    trusted_loda = Loda(SimpleNamespace(trust_responses=True))
+
+    def from_bytes(process):
+        def make(payload):
+            content = codec.dumps(payload)
+            return lambda: process(content)
+
+        return make
+
+    add(
+        "decision.from_bytes",
+        "consult/juri",
+        from_bytes(lambda c: juri._process_consult_response(codec.loads(c))),
+    )
+    add(
+        "decision.from_bytes_trusted",
+        "consult/juri",
+        from_bytes(JuriAPI._decision_from_bytes),
+    )
+    add(
+        "loda.from_bytes",
+        "consult/lawDecree",
+        from_bytes(lambda c: loda._process_consult_response(codec.loads(c))),
+    )
+    add(
+        "loda.from_bytes_trusted",
+        "consult/lawDecree",
+        from_bytes(trusted_loda._texte_model_from_bytes),
+    )
+
+    def texte(payload):
+        return TexteLoda(loda._build_texte_model(payload), None)
+
+    def texte_brut(payload):
+        texte_loda = texte(payload)
+        return lambda: texte_loda.texte_brut
+
+    add("html.loda_texte_brut", "consult/lawDecree", texte_brut)
+
+    def clean_markdown(payload):
+        texte_loda = texte(payload)
+        html = texte_loda.texte_html or ""
+        return lambda: texte_loda._clean_html_for_markdown(html)
+
+    add("html.loda_clean_markdown", "consult/lawDecree", clean_markdown)
+
+    def juri_plain_text(payload):
+        decision = Decision.model_validate({**payload["text"], "texte": None})
+        return lambda: JuriDecision(decision, None)._extract_plain_text()
+
+    add("html.juri_plain_text", "consult/juri", juri_plain_text)
+    return benchmarks
+
+
+def _allocations(fn: Callable[[], Any]) -> dict[str, float]:
+    """Measure the memory allocated by one call with :mod:`tracemalloc`."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = fn()
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return {
+        "peak_kib": round((peak - before) / 1024, 1),
+        "retained_kib": round((after - before) / 1024, 1),
+    }
+
+
+def _measure(benchmark: Benchmark, repeat: int, min_time: float) -> dict[str, Any]:
+    timer = timeit.Timer(benchmark.fn)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    per_call = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "benchmark": benchmark.name,
+        "size": benchmark.size,
+        "source": benchmark.source,
+        "payload_kib": round(benchmark.payload_bytes / 1024, 1),
+        "ops_s": round(1 / min(per_call), 1),
+        "us_per_op": {
+            "best": round(min(per_call) * 1e6, 2),
+            "median": round(statistics.median(per_call) * 1e6, 2),
+        },
+        "allocations": _allocations(benchmark.fn),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--cassette",
+        action="append",
+        default=[],
+        help="Cassette of recorded PISTE answers; may be repeated.",
+    )
+    parser.add_argument("--benchmarks", help="Comma-separated benchmark names.")
+    parser.add_argument("--sizes", default=",".join(SIZES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="Minimum duration of each timed run, in seconds.",
+    )
+    parser.add_argument("--output", help="Write the JSON results to this file.")
+    args = parser.parse_args()
+
+    benchmarks = _benchmarks(args.cassette)
+    if args.benchmarks:
+        wanted = set(args.benchmarks.split(","))
+        benchmarks = [b for b in benchmarks if b.name in wanted]
+    sizes = set(args.sizes.split(","))
+    benchmarks = [b for b in benchmarks if b.size in sizes]
+
+    results = []
+    for benchmark in benchmarks:
+        result = _measure(benchmark, args.repeat, args.min_time)
+        results.append(result)
+        print(
+            f"{benchmark.name:<32} {benchmark.size:<6} "
+            f"{result['payload_kib']:>9.1f} KiB {result['ops_s']:>11.1f} ops/s  "
+            f"peak {result['allocations']['peak_kib']:>9.1f} KiB",
+            file=sys.stderr,
+        )
+
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
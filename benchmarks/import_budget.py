@@ -0,0 +1,158 @@
+"""Import time and memory footprint of the pylegifrance modules, with budgets.
+
+Each module is imported in a fresh interpreter, ``--runs`` times; the
+fastest run is kept. For each module the report gives the import wall time,
+the resident memory added by the import and the slowest modules it pulled
+in, according to ``python -X importtime``.
+
+``--check`` compares the figures with ``benchmarks/import_budget.json`` and
+exits with status 1 if a module exceeds its time or memory budget, so a
+change re-introducing eager imports is caught in CI. ``--update`` rewrites
+the budget from the current figures plus ``--headroom``::
+
+    python -m benchmarks.import_budget --check
+    python -m benchmarks.import_budget --update --headroom 0.5
+
+Budgets are machine dependent: update them on the machine running the
+check.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+BUDGET_FILE = Path(__file__).with_name("import_budget.json")
+
+MODULES = (
+    "pylegifrance",
+    "pylegifrance.client",
+    "pylegifrance.async_client",
+    "pylegifrance.models.generated.model",
+    "pylegifrance.fonds.code",
+    "pylegifrance.fonds.juri",
+    "pylegifrance.fonds.kali",
+    "pylegifrance.fonds.loda",
+)
+
+# Runs in the child interpreter; prints one JSON object.
+_PROBE = """
+import importlib, json, sys, time
+
+def rss():
+    try:
+        with open("/proc/self/statm") as statm:
+            import os
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+        scale = 1 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+before = rss()
+started = time.perf_counter()
+importlib.import_module(sys.argv[1])
+elapsed = time.perf_counter() - started
+print(json.dumps({"ms": elapsed * 1e3, "rss_mib": (rss() - before) / 2**20}))
+"""
+
+
+def _probe(module: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE, module],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def _slowest_imports(module: str, count: int) -> list[dict]:
+    """Parse ``-X importtime`` and return the slowest modules by self time."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line.removeprefix("import time:").split("|")
+        timings.append({"module": name.strip(), "self_ms": int(self_us) / 1e3})
+    timings.sort(key=lambda t: t["self_ms"], reverse=True)
+    return timings[:count]
+
+
+def measure(modules: tuple[str, ...], runs: int, top: int) -> dict[str, dict]:
+    """Measure each module, keeping its fastest run."""
+    report = {}
+    for module in modules:
+        samples = [_probe(module) for _ in range(runs)]
+        best = min(samples, key=lambda s: s["ms"])
+        report[module] = {
+            "ms": round(best["ms"], 1),
+            "rss_mib": round(min(s["rss_mib"] for s in samples), 2),
+            "slowest_imports": _slowest_imports(module, top) if top else [],
+        }
+    return report
+
+
+def check(report: dict[str, dict], budget: dict[str, dict]) -> list[str]:
+    """Return the budget violations of ``report``."""
+    violations = []
+    for module, figures in report.items():
+        limits = budget.get(module)
+        if limits is None:
+            continue
+        for key, unit in (("ms", "ms"), ("rss_mib", "MiB")):
+            if key in limits and figures[key] > limits[key]:
+                violations.append(
+                    f"{module}: {figures[key]} {unit} > budget {limits[key]} {unit}"
+                )
+    return violations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modules", help="Comma-separated modules to measure.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--top", type=int, default=5, help="Slowest imports listed per module."
+    )
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--update", action="store_true")
+    parser.add_argument("--headroom", type=float, default=0.5)
+    parser.add_argument("--budget", type=Path, default=BUDGET_FILE)
+    args = parser.parse_args()
+
+    modules = tuple(args.modules.split(",")) if args.modules else MODULES
+    report = measure(modules, args.runs, args.top)
+    for module, figures in report.items():
+        print(
+            f"{module:<40} {figures['ms']:>8.1f} ms {figures['rss_mib']:>7.2f} MiB",
+            file=sys.stderr,
+        )
+    print(json.dumps(report, indent=2))
+
+    if args.update:
+        budget = {
+            module: {
+                "ms": max(5, round(figures["ms"] * (1 + args.headroom))),
+                "rss_mib": round(figures["rss_mib"] * (1 + args.headroom) + 0.5, 1),
+            }
+            for module, figures in report.items()
+        }
+        args.budget.write_text(json.dumps(budget, indent=2) + "\n", encoding="utf-8")
+        print(f"Budget written to {args.budget}", file=sys.stderr)
+    elif args.check:
+        violations = check(report, json.loads(args.budget.read_text()))
+        for violation in violations:
+            print(f"OVER BUDGET {violation}", file=sys.stderr)
+        sys.exit(1 if violations else 0)
+
+
+if __name__ == "__main__":
+    main()
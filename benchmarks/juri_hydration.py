@@ -0,0 +1,108 @@
+"""Wall time of ``JuriAPI.search`` against page size and hydration workers.
+
+Every hit of a JURI search is hydrated by one ``/consult/juri`` call, so the
+wall time of a search grows with the page size. This benchmark runs
+``JuriAPI.search`` against :class:`~pylegifrance.testing.StubPisteServer`,
+with a per-request latency standing in for the PISTE round trip, for each
+combination of ``--page-sizes`` and ``--workers`` (the ``max_workers``
+argument of ``search``). ``max_workers=1`` is the serial baseline::
+
+    python -m benchmarks.juri_hydration [--page-sizes 10,25,50,100]
+        [--workers 1,4,8,16] [--latency 0.05] [--repeat 3]
+        [--output juri_hydration.json]
+
+The client's connection pool is sized to the largest worker count, so the
+figures measure the hydration rather than waiting for pooled connections.
+Results are printed as JSON, with the speed-up over the serial run.
+"""
+
+import argparse
+import json
+import logging
+import platform
+import sys
+import time
+from contextlib import closing
+from pathlib import Path
+
+from pylegifrance.client import LegifranceClient
+from pylegifrance.fonds.juri import JuriAPI
+from pylegifrance.models.juri.search import SearchRequest
+from pylegifrance.testing import StubPisteServer
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(v) for v in value.split(",") if v]
+
+
+def measure(
+    stub: StubPisteServer, page_sizes: list[int], workers: list[int], repeat: int
+) -> list[dict]:
+    """Time one search per page size and worker count, keeping the best run."""
+    config = stub.config(pool_maxsize=max(workers))
+    results = []
+    with closing(LegifranceClient(config)) as client:
+        juri = JuriAPI(client)
+        juri.search(SearchRequest(search="warmup", page_size=1))
+        for page_size in page_sizes:
+            request = SearchRequest(search="bail", page_size=page_size)
+            serial = None
+            for max_workers in workers:
+                timings = []
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    decisions = juri.search(request, max_workers=max_workers)
+                    timings.append(time.perf_counter() - started)
+                best = min(timings)
+                if max_workers == 1:
+                    serial = best
+                results.append(
+                    {
+                        "page_size": page_size,
+                        "max_workers": max_workers,
+                        "hits": len(decisions),
+                        "wall_ms": round(best * 1e3, 1),
+                        "speedup": round(serial / best, 2) if serial else None,
+                    }
+                )
+                print(
+                    f"page_size={page_size:<4} max_workers={max_workers:<3} "
+                    f"{best * 1e3:>9.1f} ms",
+                    file=sys.stderr,
+                )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--page-sizes", type=_int_list, default=[10, 25, 50, 100])
+    parser.add_argument("--workers", type=_int_list, default=[1, 4, 8, 16])
+    parser.add_argument(
+        "--latency", type=float, default=0.05, help="Stub latency in seconds."
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Write the JSON results to this file.")
+    args = parser.parse_args()
+
+    logging.getLogger("pylegifrance").setLevel(logging.WARNING)
+    with StubPisteServer(
+        corpus_size=max(args.page_sizes), latency=args.latency
+    ) as stub:
+        results = measure(stub, args.page_sizes, sorted(args.workers), args.repeat)
+
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "parameters": {"latency_s": args.latency, "repeat": args.repeat},
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,35 @@
-from .auth import ApiConfig
-from .client import LegifranceClient
+"""Python client for the Legifrance API.
 
-__all__ = ["LegifranceClient", "ApiConfig"]
+The public names are imported on first access (PEP 562), so ``import
+pylegifrance`` stays cheap and ``AsyncLegifranceClient`` only loads
+``asyncio`` and ``httpx`` for programs that use it.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .async_client import AsyncLegifranceClient
+    from .auth import ApiConfig
+    from .client import LegifranceClient
+
+_EXPORTS = {
+    "LegifranceClient": ".client",
+    "AsyncLegifranceClient": ".async_client",
+    "ApiConfig": ".auth",
+}
+
+__all__ = ["LegifranceClient", "AsyncLegifranceClient", "ApiConfig"]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _EXPORTS.keys())
@@ -0,0 +1,397 @@
+"""Asynchronous client for the Legifrance API.
+
+This module mirrors :mod:`pylegifrance.client` and :mod:`pylegifrance.auth`
+on top of ``httpx.AsyncClient`` so that a single event loop can keep many
+PISTE calls in flight without dedicating an OS thread to each of them.
+
+``httpx`` is an optional dependency, installed with the ``async`` extra::
+
+    pip install "pylegifrance[async]"
+
+Each façade has an asynchronous counterpart that takes an
+:class:`AsyncLegifranceClient` (:class:`~pylegifrance.fonds.juri.AsyncJuriAPI`,
+:class:`~pylegifrance.fonds.loda.AsyncLoda`,
+:class:`~pylegifrance.fonds.kali.AsyncKaliAPI` and
+:class:`~pylegifrance.fonds.code.AsyncCode`); their I/O methods keep the
+synchronous names and are coroutines::
+
+    async with AsyncLegifranceClient(config) as client:
+        decisions = await AsyncJuriAPI(client).search("contrat")
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any, Self
+
+from tenacity import retry, stop_after_attempt, wait_fixed
+
+from pylegifrance.auth import TokenInfo
+from pylegifrance.circuit import CircuitBreaker
+from pylegifrance.codec import JsonCodec, default_codec
+from pylegifrance.config import ApiConfig
+from pylegifrance.exceptions import error_from_response
+from pylegifrance.retry import RetryPolicy
+from pylegifrance.tracing import span
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 10
+
+
+def _require_httpx():
+    """Import ``httpx`` or fail with an actionable message."""
+    try:
+        import httpx
+    except ImportError as exc:  # pragma: no cover - depends on environment
+        raise ImportError(
+            "AsyncLegifranceClient requires the optional 'httpx' dependency. "
+            'Install it with: pip install "pylegifrance[async]"'
+        ) from exc
+    return httpx
+
+
+def _build_timeout(httpx_module, config: ApiConfig) -> "httpx.Timeout":
+    """Translate the ApiConfig timeouts into an ``httpx.Timeout``."""
+    return httpx_module.Timeout(
+        config.read_timeout,
+        connect=config.connect_timeout,
+    )
+
+
+class AsyncAuthenticationManager:
+    """
+    Asynchronous counterpart of :class:`pylegifrance.auth.AuthenticationManager`.
+
+    Token semantics are identical (same :class:`TokenInfo`, same retry policy
+    on the token endpoint). Concurrent coroutines hitting an expired token
+    share a single refresh thanks to an :class:`asyncio.Lock`.
+    """
+
+    def __init__(self, config: ApiConfig):
+        """Initialize a new AsyncAuthenticationManager instance.
+
+        Args:
+            config: Configuration for the API authentication.
+        """
+        httpx = _require_httpx()
+        self._client_id = config.client_id
+        self._client_secret = config.client_secret
+        self._token_url = config.token_url
+        self._token_info = TokenInfo(access_token="", issued_at=0, expires_in=0)
+        self._lock = asyncio.Lock()
+        self._http = httpx.AsyncClient(timeout=_build_timeout(httpx, config))
+
+    @retry(stop=stop_after_attempt(3), wait=wait_fixed(5), reraise=True)
+    async def _fetch_new_token(self) -> TokenInfo:
+        """Fetch a new access token from the Legifrance API.
+
+        Returns:
+            Information about the newly acquired token.
+
+        Raises:
+            Exception: If the token acquisition fails.
+        """
+        data = {
+            "grant_type": "client_credentials",
+            "client_id": self._client_id,
+            "client_secret": self._client_secret,
+            "scope": "openid",
+        }
+
+        response = await self._http.post(self._token_url, data=data)
+        if 200 <= response.status_code < 300:
+            response_data = response.json()
+            token_info = TokenInfo(
+                access_token=response_data.get("access_token", ""),
+                issued_at=time.time(),
+                expires_in=response_data.get("expires_in", 0),
+            )
+            logger.info("Legifrance API authentication successful.")
+            return token_info
+        else:
+            logger.warning(
+                f"Failed to get token: {response.status_code} - {response.text}"
+            )
+            raise Exception(
+                f"Error obtaining token: {response.status_code} - {response.text}"
+            )
+
+    def update_credentials(self, client_id: str, client_secret: str) -> None:
+        """Update the authentication credentials.
+
+        Args:
+            client_id: The new client ID.
+            client_secret: The new client secret.
+        """
+        if self._client_id != client_id or self._client_secret != client_secret:
+            self._client_id = client_id
+            self._client_secret = client_secret
+            self._token_info = TokenInfo(access_token="", issued_at=0, expires_in=0)
+
+    async def ensure_valid_token(self) -> str:
+        """Ensure that a valid token is available, refreshing it if necessary.
+
+        Returns:
+            The valid access token.
+
+        Raises:
+            Exception: If the token acquisition or refresh fails.
+        """
+        if self._token_info.is_valid:
+            return self._token_info.access_token
+
+        async with self._lock:
+            # Another coroutine may have refreshed the token while we waited.
+            if not self._token_info.is_valid:
+                self._token_info = await self._fetch_new_token()
+        return self._token_info.access_token
+
+    async def aclose(self) -> None:
+        """Close the HTTP client used for token acquisition."""
+        await self._http.aclose()
+
+
+class AsyncLegifranceClient:
+    """
+    Asynchronous client for interacting with the Legifrance API.
+
+    Same contract as :class:`pylegifrance.client.LegifranceClient` —
+    ``call_api`` returns a response exposing ``status_code``, ``text`` and
+    ``json()`` and raises on 4xx/5xx — but every I/O method is a coroutine.
+    The number of requests in flight at any time is bounded by
+    ``max_concurrency``.
+
+    Attributes:
+        api_url: The base URL for the Legifrance API.
+        max_concurrency: Maximum number of concurrent API calls.
+        retry_policy: How :meth:`call_api` retries transient failures.
+        codec: The JSON codec encoding request payloads.
+        circuit_breaker: Fails calls fast on routes whose upstream keeps
+            failing, if set.
+        trust_responses: Whether the façades materialise responses through
+            the trusted fast path of :mod:`pylegifrance.hydration`.
+    """
+
+    def __init__(
+        self,
+        config: ApiConfig | None = None,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        retry_policy: RetryPolicy | None = None,
+        codec: JsonCodec | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        trust_responses: bool = False,
+    ):
+        """Initialize a new AsyncLegifranceClient instance.
+
+        Args:
+            config: Configuration for the API client. If None, will attempt to load
+                from environment variables.
+            max_concurrency: Maximum number of API calls in flight at once.
+            retry_policy: Retry policy for :meth:`call_api`. Defaults to
+                :class:`~pylegifrance.retry.RetryPolicy` with its default
+                settings.
+            codec: JSON codec for request bodies. Defaults to orjson when
+                installed, the standard library otherwise.
+            circuit_breaker: Optional per-route circuit breaker, see
+                :class:`~pylegifrance.circuit.CircuitBreaker`.
+            trust_responses: If True, the façades validate response bodies
+                straight from bytes, see :mod:`pylegifrance.hydration`.
+
+        Raises:
+            ValueError: If config is not provided and environment variables are
+                not set, or if ``max_concurrency`` is lower than 1.
+            ImportError: If ``httpx`` is not installed.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency doit être supérieur ou égal à 1")
+
+        if config is None:
+            try:
+                config = ApiConfig.from_env()
+            except ValueError as e:
+                logger.error(f"Failed to initialize async API client: {e}")
+                raise
+
+        httpx = _require_httpx()
+        self.api_url = config.api_url
+        self.max_concurrency = max_concurrency
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.codec = codec or default_codec()
+        self.circuit_breaker = circuit_breaker
+        self.trust_responses = trust_responses
+        self._transient_errors = (httpx.TransportError,)
+        self._auth_manager = AsyncAuthenticationManager(config)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._http = httpx.AsyncClient(
+            timeout=_build_timeout(httpx, config),
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+        )
+
+    def update_api_keys(
+        self, client_id: str | None = None, client_secret: str | None = None
+    ) -> None:
+        """Update the API keys for the client.
+
+        See :meth:`pylegifrance.client.LegifranceClient.update_api_keys`.
+        """
+        if client_id is not None and client_secret is not None:
+            self._auth_manager.update_credentials(client_id, client_secret)
+        else:
+            try:
+                new_config = ApiConfig.from_env()
+                self._auth_manager.update_credentials(
+                    new_config.client_id, new_config.client_secret
+                )
+            except ValueError as e:
+                logger.error(f"Failed to set API keys: {e}")
+                raise
+
+    async def call_api(self, route: str, data: Any) -> "httpx.Response":
+        """Call the Legifrance API with token management and error logging.
+
+        Args:
+            route: The API route to use.
+            data: The data to send as JSON.
+
+        Returns:
+            The API response.
+
+        Raises:
+            ValueError: If no data is provided.
+            APIError: If the API answers with an HTTP error status, once
+                retries are exhausted.
+            CircuitOpenError: If the circuit breaker of ``route`` is open.
+            Exception: If authentication fails.
+        """
+        if data is None:
+            logger.warning("No data provided to call_api; request not sent.")
+            raise ValueError("No data provided for API call.")
+
+        body = self.codec.dumps(data)
+        retrying = self.retry_policy.async_retrying(route, self._transient_errors)
+        with span("call_api", route=route):
+            async for attempt in retrying:
+                with attempt:
+                    response = await self._send(route, body)
+        return response
+
+    async def _send(self, route: str, body: bytes) -> "httpx.Response":
+        """Send a single POST request with an already encoded ``body``."""
+        breaker = self.circuit_breaker
+        with breaker.guard(route) if breaker is not None else nullcontext():
+            return await self._post(route, body)
+
+    async def _post(self, route: str, body: bytes) -> "httpx.Response":
+        url = f"{self.api_url}{route}"
+        async with self._semaphore:
+            token = await self._auth_manager.ensure_valid_token()
+            headers = {
+                "Authorization": f"Bearer {token}",
+                "accept": "application/json",
+                "Content-Type": "application/json",
+            }
+            with span("http.post", route=route, request_bytes=len(body)) as current:
+                response = await self._http.post(url, headers=headers, content=body)
+                current.set_attribute("status_code", response.status_code)
+
+        if 400 <= response.status_code < 600:
+            logger.error(
+                f"Client error {response.status_code} - {response.text} when calling the API."
+            )
+            raise error_from_response(
+                response.status_code, response.text, response.headers, route
+            )
+
+        logger.info(f"API call to '{route}' successful.")
+        return response
+
+    async def get(self, route: str) -> "httpx.Response":
+        """Perform a GET request on the given API route.
+
+        Args:
+            route: The route to target.
+
+        Returns:
+            The API response.
+
+        Raises:
+            httpx.HTTPStatusError: If the HTTP request returns an unsuccessful
+                status code.
+        """
+        url = f"{self.api_url}{route}"
+        async with self._semaphore:
+            token = await self._auth_manager.ensure_valid_token()
+            headers = {"Authorization": f"Bearer {token}"}
+            logger.info(f"GET request to URL: {url}")
+            response = await self._http.get(url, headers=headers)
+        response.raise_for_status()
+
+        logger.info(f"GET request successful for URL: {url}")
+        return response
+
+    async def ping(self, route: str = "consult/ping") -> bool:
+        """Check connectivity with the Legifrance API by sending a ping request.
+
+        Args:
+            route: Route to use for the ping (default: "consult/ping").
+
+        Returns:
+            True if the connection is successful, otherwise False.
+
+        Raises:
+            Exception: In case of API connection error or authentication failure.
+        """
+        httpx = _require_httpx()
+        try:
+            token = await self._auth_manager.ensure_valid_token()
+            headers = {
+                "Authorization": f"Bearer {token}",
+                "Accept": "text/plain",
+                "Content-Type": "application/json",
+            }
+            url = f"{self.api_url}{route}"
+            async with self._semaphore:
+                response = await self._http.get(url, headers=headers)
+
+            if response.status_code == 200:
+                logger.debug(
+                    "Ping successful: connection to Legifrance API established."
+                )
+                return True
+            logger.warning(
+                f"Ping failed: return code {response.status_code} - {response.text}"
+            )
+            return False
+        except httpx.HTTPError as e:
+            logger.error(f"Error during Legifrance API ping: {str(e)}")
+            raise Exception(f"API ping failed: {e}") from e
+
+    @classmethod
+    def create(
+        cls,
+        config: ApiConfig | None = None,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> Self:
+        """Factory method to create a new AsyncLegifranceClient instance."""
+        return cls(config=config, max_concurrency=max_concurrency)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the client's HTTP connections and authentication manager."""
+        await self._http.aclose()
+        await self._auth_manager.aclose()
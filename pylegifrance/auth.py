@@ -4,19 +4,31 @@ This module provides a class for handling authentication with the Legifrance API
 including token acquisition, storage, and refresh logic.
 """
 
+import hashlib
 import logging
+import threading
 import time
+from collections.abc import Callable
 from contextlib import contextmanager
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 import requests
 from tenacity import RetryError, retry, stop_after_attempt, wait_fixed
 
 from pylegifrance.config import ApiConfig
+from pylegifrance.pooling import mount_pooled_adapter
 from pylegifrance.utils import configure_session_timeouts
 
+if TYPE_CHECKING:
+    from pylegifrance.token_store import TokenStore
+
 logger = logging.getLogger(__name__)
 
+# Shortest delay before a background renewal, so that a token endpoint
+# returning very short lifetimes cannot drive a tight refresh loop.
+MIN_RENEWAL_DELAY = 1.0
+
 
 @dataclass
 class TokenInfo:
@@ -46,6 +58,24 @@ class TokenInfo:
         """Check if the token is valid and not expired."""
         return bool(self.access_token) and not self.is_expired
 
+    def renewal_delay(self, ratio: float) -> float:
+        """Seconds left before the token reaches ``ratio`` of its lifetime.
+
+        Args:
+            ratio: Fraction of ``expires_in`` after which renewal is due.
+
+        Returns:
+            The remaining delay, 0 if renewal is already due.
+        """
+        if not self.access_token:
+            return 0.0
+        elapsed_time = time.time() - self.issued_at
+        return max(0.0, self.expires_in * ratio - elapsed_time)
+
+    def needs_renewal(self, ratio: float) -> bool:
+        """Check if the token has consumed ``ratio`` of its lifetime."""
+        return self.renewal_delay(ratio) == 0.0
+
 
 class AuthenticationManager:
     """
@@ -59,19 +89,49 @@ class AuthenticationManager:
     - Obtaining access tokens
     - Refreshing expired tokens
     - Providing valid tokens for API requests
+
+    The manager is safe to share between threads. Refreshes are single-flight:
+    only one request to the OAuth server is in progress at any time and
+    concurrent callers reuse its result. Once a token has consumed
+    ``token_refresh_ratio`` of its lifetime it is renewed in a background
+    thread while callers keep using the still-valid token.
+
+    With a ``token_store``, tokens are also shared between processes: the
+    store is read before calling the token endpoint and every new token is
+    written back, under the store's lock.
+
+    Attributes:
+        on_token_fetched: Optional callback run each time a token is obtained
+            from the token endpoint, e.g. to count refreshes.
     """
 
-    def __init__(self, config: ApiConfig):
+    def __init__(self, config: ApiConfig, token_store: "TokenStore | None" = None):
         """Initialize a new AuthenticationManager instance.
 
         Args:
             config: Configuration for the API authentication.
+            token_store: Optional store sharing tokens between processes, such
+                as :class:`~pylegifrance.token_store.FileTokenStore`.
+
+        Raises:
+            ValueError: If ``config.token_refresh_ratio`` is not in ]0, 1].
         """
+        if not 0 < config.token_refresh_ratio <= 1:
+            raise ValueError("token_refresh_ratio must be in ]0, 1].")
+
         self._client_id = config.client_id
         self._client_secret = config.client_secret
         self._token_url = config.token_url
         self._token_info = TokenInfo(access_token="", issued_at=0, expires_in=0)
         self._session = requests.Session()
+        mount_pooled_adapter(self._session, config.token_url, config)
+        self._refresh_ratio = config.token_refresh_ratio
+        self._background_refresh = config.background_token_refresh
+        self._lock = threading.Lock()
+        self._renewal_timer: threading.Timer | None = None
+        self._closed = False
+        self._token_store = token_store
+        self.on_token_fetched: Callable[[], None] | None = None
 
         configure_session_timeouts(self._session, config)
 
@@ -101,6 +161,8 @@ class AuthenticationManager:
                 expires_in=response_data.get("expires_in", 0),
             )
             logger.info("Legifrance API authentication successful.")
+            if self.on_token_fetched is not None:
+                self.on_token_fetched()
             return token_info
         else:
             logger.warning(
@@ -117,29 +179,127 @@ class AuthenticationManager:
             client_id: The new client ID.
             client_secret: The new client secret.
         """
-        if self._client_id != client_id or self._client_secret != client_secret:
-            self._client_id = client_id
-            self._client_secret = client_secret
-            # Reset token state
-            self._token_info = TokenInfo(access_token="", issued_at=0, expires_in=0)
+        with self._lock:
+            if self._client_id != client_id or self._client_secret != client_secret:
+                self._client_id = client_id
+                self._client_secret = client_secret
+                # Reset token state
+                self._token_info = TokenInfo(access_token="", issued_at=0, expires_in=0)
 
     def ensure_valid_token(self) -> str:
         """Ensure that a valid token is available, refreshing it if necessary.
 
+        A still-valid token is returned immediately; if it is due for early
+        renewal, the renewal runs in a background thread. Only an expired or
+        missing token makes the caller wait, and concurrent callers then wait
+        on the same refresh.
+
         Returns:
             The valid access token.
 
         Raises:
             Exception: If the token acquisition or refresh fails.
         """
-        if not self._token_info.is_valid:
+        token_info = self._token_info
+        if not token_info.is_valid:
+            return self._refresh().access_token
+
+        if token_info.needs_renewal(self._refresh_ratio):
+            self._start_renewal()
+        return token_info.access_token
+
+    def _refresh(self) -> TokenInfo:
+        """Fetch a new token unless another thread did while we waited.
+
+        Returns:
+            A valid token.
+
+        Raises:
+            Exception: If the token acquisition fails.
+        """
+        with self._lock:
+            if self._token_info.is_valid:
+                return self._token_info
             try:
-                self._token_info = self._fetch_new_token()
+                self._set_token(self._obtain_token(lambda token: token.is_valid))
             except RetryError as exc:
                 logger.error(f"Could not obtain access token after retries: {exc}")
                 raise
+            return self._token_info
+
+    def _start_renewal(self) -> None:
+        """Renew the token in a background thread if no refresh is in flight."""
+        if self._closed or not self._lock.acquire(blocking=False):
+            return
+        try:
+            threading.Thread(
+                target=self._renew_and_release,
+                name="pylegifrance-token-renewal",
+                daemon=True,
+            ).start()
+        except RuntimeError:
+            self._lock.release()
+            raise
+
+    def _renew_and_release(self) -> None:
+        """Renew the token, then release the lock taken by :meth:`_start_renewal`."""
+        try:
+            if self._token_info.needs_renewal(self._refresh_ratio):
+                self._set_token(
+                    self._obtain_token(
+                        lambda token: (
+                            token.is_valid
+                            and not token.needs_renewal(self._refresh_ratio)
+                        )
+                    )
+                )
+                logger.debug("Access token renewed ahead of expiry.")
+        except Exception as exc:
+            # The current token stays in use until it actually expires.
+            logger.warning(f"Early token renewal failed: {exc}")
+        finally:
+            self._lock.release()
+
+    def _obtain_token(self, acceptable: Callable[[TokenInfo], bool]) -> TokenInfo:
+        """Get a token from the shared store, or from the token endpoint.
+
+        Args:
+            acceptable: Predicate a stored token must satisfy to be reused.
+
+        Returns:
+            The stored token if acceptable, otherwise a newly fetched one.
+        """
+        if self._token_store is None:
+            return self._fetch_new_token()
+
+        key = hashlib.sha256(self._client_id.encode("utf-8")).hexdigest()
+        with self._token_store.lock(key):
+            stored = self._token_store.load(key)
+            if stored is not None and acceptable(stored):
+                logger.debug("Reusing access token from the shared token store.")
+                return stored
+            token_info = self._fetch_new_token()
+            self._token_store.save(key, token_info)
+            return token_info
 
-        return self._token_info.access_token
+    def _set_token(self, token_info: TokenInfo) -> None:
+        """Store a new token and schedule its renewal if enabled.
+
+        Must be called with the lock held.
+        """
+        self._token_info = token_info
+        if not self._background_refresh or self._closed:
+            return
+        if self._renewal_timer is not None:
+            self._renewal_timer.cancel()
+            self._renewal_timer = None
+        if token_info.expires_in <= 0:
+            # No lifetime to plan against: renewal happens on the next call.
+            return
+        delay = max(MIN_RENEWAL_DELAY, token_info.renewal_delay(self._refresh_ratio))
+        self._renewal_timer = threading.Timer(delay, self._start_renewal)
+        self._renewal_timer.daemon = True
+        self._renewal_timer.start()
 
     def close(self) -> None:
         """
@@ -147,6 +307,9 @@ class AuthenticationManager:
 
         This should be called when the manager is no longer needed to free up resources.
         """
+        self._closed = True
+        if self._renewal_timer is not None:
+            self._renewal_timer.cancel()
         self._session.close()
 
     @contextmanager
@@ -0,0 +1,113 @@
+"""Bounded-concurrency batch execution of API calls.
+
+:meth:`LegifranceClient.map <pylegifrance.client.LegifranceClient.map>` runs
+one route against an iterable of payloads on a thread pool. Inputs are
+consumed lazily and at most ``2 * max_workers`` calls are pending at any
+time, so memory stays flat on arbitrarily long inputs. Failures are captured
+per item in :class:`BatchResult` instead of aborting the batch.
+"""
+
+import logging
+from collections import deque
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from dataclasses import dataclass
+from typing import Any
+
+from pylegifrance.tracing import propagate
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """
+    Outcome of one item of a batch.
+
+    Attributes:
+        index: Position of the payload in the input.
+        payload: The payload that was sent.
+        value: The result of the call, if it succeeded.
+        error: The exception raised by the call, if it failed.
+    """
+
+    index: int
+    payload: Any
+    value: Any = None
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the call succeeded."""
+        return self.error is None
+
+
+def _call(fn: Callable[[Any], Any], index: int, payload: Any) -> BatchResult:
+    try:
+        return BatchResult(index, payload, value=fn(payload))
+    except Exception as exc:
+        logger.debug(f"Batch item {index} failed: {exc}")
+        return BatchResult(index, payload, error=exc)
+
+
+def run_batch(
+    fn: Callable[[Any], Any],
+    payloads: Iterable[Any],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    ordered: bool = True,
+) -> Generator[BatchResult, None, None]:
+    """Apply ``fn`` to every payload on a thread pool, streaming the results.
+
+    Args:
+        fn: The function to call with each payload.
+        payloads: The inputs, consumed lazily.
+        max_workers: Number of worker threads.
+        ordered: If True, results are yielded in input order; otherwise as
+            soon as they complete.
+
+    Yields:
+        One :class:`BatchResult` per payload.
+
+    Raises:
+        ValueError: If ``max_workers`` is lower than 1.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+
+    max_pending = 2 * max_workers
+    inputs = enumerate(payloads)
+    # Calls made by the workers nest under the caller's current span.
+    call = propagate(_call)
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="pylegifrance-batch"
+    )
+    try:
+        if ordered:
+            queue: deque[Future[BatchResult]] = deque()
+            for index, payload in inputs:
+                queue.append(executor.submit(call, fn, index, payload))
+                if len(queue) >= max_pending:
+                    yield queue.popleft().result()
+            while queue:
+                yield queue.popleft().result()
+        else:
+            pending: set[Future[BatchResult]] = set()
+            for index, payload in inputs:
+                pending.add(executor.submit(call, fn, index, payload))
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            for future in as_completed(pending):
+                yield future.result()
+    finally:
+        # Also reached when the consumer stops iterating early.
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,434 @@
+"""Response cache for idempotent Legifrance API calls.
+
+Decisions, articles and convention containers are immutable for long
+periods, yet every ``fetch`` is a fresh POST. A :class:`ResponseCache` given
+to :class:`~pylegifrance.client.LegifranceClient` stores response bodies
+keyed by route and canonical JSON payload, so every façade benefits without
+code changes::
+
+    from pylegifrance.cache import ResponseCache, SQLiteCache
+
+    cache = ResponseCache(SQLiteCache("~/.cache/pylegifrance.sqlite"), ttl=86400)
+    client = LegifranceClient(config, cache=cache)
+
+Three backends are provided: :class:`MemoryCache` (per process),
+:class:`SQLiteCache` (a single file shared by processes) and
+:class:`DiskCache` (a directory of zlib-compressed blobs). All of them evict
+the least recently used entries beyond ``max_entries`` and report hit, miss
+and eviction counters.
+"""
+
+import fnmatch
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol, runtime_checkable
+
+from pylegifrance.utils import EnumEncoder
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Counters of a cache backend.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups not found or expired.
+        evictions: Entries dropped to respect ``max_entries``.
+        entries: Entries currently stored.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """Storage for cached response bodies."""
+
+    def get(self, key: str) -> bytes | None:
+        """Return the value stored under ``key``, or None if absent or expired."""
+        ...
+
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        """Store ``value`` under ``key``, expiring after ``ttl`` seconds."""
+        ...
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        ...
+
+    def stats(self) -> CacheStats:
+        """Return the backend counters."""
+        ...
+
+
+class _Counters:
+    """Thread-safe hit/miss/eviction counters shared by the backends."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def record(self, hits: int = 0, misses: int = 0, evictions: int = 0) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+            self.evictions += evictions
+
+    def snapshot(self, entries: int) -> CacheStats:
+        return CacheStats(self.hits, self.misses, self.evictions, entries)
+
+
+def _expiry(ttl: float | None) -> float:
+    return time.time() + ttl if ttl is not None else float("inf")
+
+
+class MemoryCache:
+    """
+    In-process LRU cache with per-entry expiry.
+
+    Attributes:
+        max_entries: Maximum number of entries kept.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = _Counters()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.time():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._counters.record(misses=1)
+                return None
+            self._entries.move_to_end(key)
+        self._counters.record(hits=1)
+        return entry[1]
+
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        evicted = 0
+        with self._lock:
+            self._entries[key] = (_expiry(ttl), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+        if evicted:
+            self._counters.record(evictions=evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            entries = len(self._entries)
+        return self._counters.snapshot(entries)
+
+
+class SQLiteCache:
+    """
+    LRU cache stored in a SQLite database file.
+
+    The file can be shared by several processes; SQLite serialises writers.
+
+    Attributes:
+        path: The database file.
+        max_entries: Maximum number of entries kept.
+    """
+
+    def __init__(self, path: str | os.PathLike, max_entries: int = 100_000):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._counters = _Counters()
+        self._conn = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None, timeout=30
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+            "ON responses (accessed_at)"
+        )
+
+    def get(self, key: str) -> bytes | None:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and row[1] <= now:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                row = None
+            if row is not None:
+                self._conn.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+        if row is None:
+            self._counters.record(misses=1)
+            return None
+        self._counters.record(hits=1)
+        return bytes(row[0])
+
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        now = time.time()
+        expires_at = _expiry(ttl)
+        if expires_at == float("inf"):
+            expires_at = 1e308  # SQLite REAL has no infinity literal
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, value, expires_at, now),
+            )
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+            excess = count - self.max_entries
+            if excess > 0:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    " SELECT key FROM responses ORDER BY accessed_at LIMIT ?)",
+                    (excess,),
+                )
+        if excess > 0:
+            self._counters.record(evictions=excess)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+        return self._counters.snapshot(count)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class DiskCache:
+    """
+    LRU cache storing each entry as a zlib-compressed file.
+
+    Each file starts with its expiry timestamp; the file modification time
+    records the last access and drives eviction.
+
+    Attributes:
+        directory: The directory holding the entries.
+        max_entries: Maximum number of entries kept.
+        compression_level: zlib compression level (1 fastest, 9 smallest).
+    """
+
+    _HEADER = struct.Struct("!d")
+    _SUFFIX = ".zlib"
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        max_entries: int = 100_000,
+        compression_level: int = 6,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.compression_level = compression_level
+        self._lock = threading.Lock()
+        self._counters = _Counters()
+        self._count = sum(1 for _ in self._files())
+
+    def _files(self):
+        return self.directory.glob(f"*{self._SUFFIX}")
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{self._SUFFIX}"
+
+    def get(self, key: str) -> bytes | None:
+        path = self._path(key)
+        try:
+            blob = path.read_bytes()
+            (expires_at,) = self._HEADER.unpack_from(blob)
+            if expires_at <= time.time():
+                self._remove(path)
+                raise FileNotFoundError(path)
+            value = zlib.decompress(blob[self._HEADER.size :])
+            os.utime(path)
+        except (FileNotFoundError, struct.error, zlib.error):
+            self._counters.record(misses=1)
+            return None
+        self._counters.record(hits=1)
+        return value
+
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        path = self._path(key)
+        blob = self._HEADER.pack(_expiry(ttl)) + zlib.compress(
+            value, self.compression_level
+        )
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(blob)
+        existed = path.exists()
+        os.replace(tmp_path, path)
+        with self._lock:
+            if not existed:
+                self._count += 1
+            if self._count > self.max_entries:
+                self._evict()
+
+    def _remove(self, path: Path) -> None:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return
+        with self._lock:
+            self._count -= 1
+
+    def _evict(self) -> None:
+        """Drop the least recently used files. Must hold the lock."""
+        files = []
+        for path in self._files():
+            try:
+                files.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+        self._count = len(files)
+        excess = self._count - self.max_entries
+        if excess <= 0:
+            return
+        files.sort()
+        for _, path in files[:excess]:
+            path.unlink(missing_ok=True)
+        self._count -= excess
+        self._counters.record(evictions=excess)
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in self._files():
+                path.unlink(missing_ok=True)
+            self._count = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            count = self._count
+        return self._counters.snapshot(count)
+
+
+def cache_key(url: str, payload: Any) -> str:
+    """Build the cache key of a call from its URL and canonical JSON payload.
+
+    Args:
+        url: The full URL of the route.
+        payload: The JSON payload. Key order does not change the key.
+
+    Returns:
+        A SHA-256 hex digest.
+    """
+    canonical = json.dumps(
+        payload,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        cls=EnumEncoder,
+    )
+    return hashlib.sha256(f"{url}\n{canonical}".encode()).hexdigest()
+
+
+class ResponseCache:
+    """
+    Caching policy applied by :class:`~pylegifrance.client.LegifranceClient`.
+
+    Only successful responses of cacheable routes are stored. By default the
+    ``consult/*`` routes are cached and ``search`` is not, since search
+    results change as the corpus is updated.
+
+    Attributes:
+        backend: Where responses are stored.
+        ttl: Lifetime of an entry in seconds. None keeps entries until evicted.
+        routes: Glob patterns of the cacheable routes.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        ttl: float | None = 86_400,
+        routes: tuple[str, ...] = ("consult/*",),
+    ):
+        """Initialize a new ResponseCache.
+
+        Args:
+            backend: Storage backend. Defaults to a :class:`MemoryCache`.
+            ttl: Lifetime of an entry in seconds (one day by default).
+            routes: Glob patterns of the cacheable routes.
+        """
+        self.backend = backend if backend is not None else MemoryCache()
+        self.ttl = ttl
+        self.routes = routes
+
+    def is_cacheable(self, route: str) -> bool:
+        """Check whether responses of ``route`` are cached."""
+        return any(fnmatch.fnmatchcase(route, pattern) for pattern in self.routes)
+
+    def get(self, key: str) -> bytes | None:
+        """Return the cached body for ``key``, if any."""
+        try:
+            return self.backend.get(key)
+        except Exception as exc:
+            logger.warning(f"Response cache lookup failed: {exc}")
+            return None
+
+    def set(self, key: str, body: bytes) -> None:
+        """Store a response body under ``key``."""
+        try:
+            self.backend.set(key, body, self.ttl)
+        except Exception as exc:
+            logger.warning(f"Response cache write failed: {exc}")
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self.backend.clear()
+
+    def stats(self) -> CacheStats:
+        """Return the backend counters."""
+        return self.backend.stats()
@@ -0,0 +1,265 @@
+"""Per-route circuit breaker for the Legifrance API.
+
+When PISTE degrades, every call would otherwise wait for the full read
+timeout. A :class:`CircuitBreaker` given to
+:class:`~pylegifrance.client.LegifranceClient` counts consecutive failures
+per route and, past ``failure_threshold``, *opens* the route: calls fail
+immediately with :class:`~pylegifrance.exceptions.CircuitOpenError` for
+``cooldown`` seconds. The route then turns *half-open* and lets a few probe
+calls through; a success closes it again, a failure re-opens it.
+
+Only server-side trouble counts as a failure: HTTP 5xx answers, connection
+errors and timeouts. Other exceptions, 4xx answers included, are recorded
+neither as failures nor as successes.
+"""
+
+import logging
+import sys
+import threading
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import StrEnum
+
+import requests
+
+from pylegifrance.exceptions import CircuitOpenError, ServerError
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(StrEnum):
+    """State of the circuit of one route."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitStats:
+    """
+    Snapshot of the circuit of one route.
+
+    Attributes:
+        state: The current state.
+        consecutive_failures: Failures since the last success.
+        failures: Failures recorded since creation.
+        successes: Successes recorded since creation.
+        rejected: Calls refused while the circuit was open.
+        opened: Number of times the circuit opened.
+    """
+
+    state: CircuitState
+    consecutive_failures: int
+    failures: int
+    successes: int
+    rejected: int
+    opened: int
+
+
+def _transport_errors() -> tuple[type[BaseException], ...]:
+    errors: tuple[type[BaseException], ...] = (
+        requests.ConnectionError,
+        requests.Timeout,
+    )
+    # httpx is optional: if it was never imported, it raised nothing.
+    httpx = sys.modules.get("httpx")
+    if httpx is not None:
+        errors += (httpx.TransportError,)
+    return errors
+
+
+def is_upstream_failure(exc: BaseException) -> bool:
+    """Default failure predicate: 5xx answers and transport errors.
+
+    Transport errors are the connection errors and timeouts of ``requests``
+    and the transport errors of ``httpx``. Anything else, 4xx answers and
+    the breaker's own errors included, is not a failure.
+    """
+    return isinstance(exc, (ServerError, *_transport_errors()))
+
+
+class _Circuit:
+    __slots__ = (
+        "state",
+        "consecutive_failures",
+        "opened_at",
+        "probes",
+        "failures",
+        "successes",
+        "rejected",
+        "opened",
+    )
+
+    def __init__(self):
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self.failures = 0
+        self.successes = 0
+        self.rejected = 0
+        self.opened = 0
+
+
+class CircuitBreaker:
+    """
+    Fails fast on routes whose upstream keeps failing.
+
+    Args:
+        failure_threshold: Consecutive failures that open the circuit.
+        cooldown: Seconds the circuit stays open before probing.
+        half_open_max_calls: Concurrent probe calls allowed while half-open.
+        is_failure: Decides whether an exception counts as a failure.
+            Defaults to :func:`is_upstream_failure`.
+        clock: Monotonic time source, in seconds.
+
+    Raises:
+        ValueError: If a threshold or the cooldown is not positive.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        cooldown: float = 30.0,
+        half_open_max_calls: int = 1,
+        is_failure: Callable[[BaseException], bool] = is_upstream_failure,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if failure_threshold < 1 or half_open_max_calls < 1:
+            raise ValueError("Circuit breaker thresholds must be at least 1.")
+        if cooldown <= 0:
+            raise ValueError("Circuit breaker cooldown must be positive.")
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.half_open_max_calls = half_open_max_calls
+        self.is_failure = is_failure
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._circuits: dict[str, _Circuit] = {}
+
+    def _circuit(self, route: str) -> _Circuit:
+        circuit = self._circuits.get(route)
+        if circuit is None:
+            circuit = self._circuits[route] = _Circuit()
+        return circuit
+
+    def _refresh(self, route: str, circuit: _Circuit) -> None:
+        if (
+            circuit.state is CircuitState.OPEN
+            and self._clock() - circuit.opened_at >= self.cooldown
+        ):
+            logger.info(f"Circuit for '{route}' is half-open; probing the API.")
+            circuit.state = CircuitState.HALF_OPEN
+            circuit.probes = 0
+
+    def before_call(self, route: str) -> None:
+        """Reserve a call on ``route``.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all
+                probe slots taken.
+        """
+        with self._lock:
+            circuit = self._circuit(route)
+            self._refresh(route, circuit)
+            if circuit.state is CircuitState.CLOSED:
+                return
+            if (
+                circuit.state is CircuitState.HALF_OPEN
+                and circuit.probes < self.half_open_max_calls
+            ):
+                circuit.probes += 1
+                return
+            circuit.rejected += 1
+            retry_after = max(0.0, circuit.opened_at + self.cooldown - self._clock())
+        raise CircuitOpenError(route, retry_after)
+
+    def record_success(self, route: str) -> None:
+        """Record a call on ``route`` that reached a healthy upstream."""
+        with self._lock:
+            circuit = self._circuit(route)
+            circuit.successes += 1
+            circuit.consecutive_failures = 0
+            if circuit.state is not CircuitState.CLOSED:
+                logger.info(f"Circuit for '{route}' closed.")
+                circuit.state = CircuitState.CLOSED
+
+    def record_failure(self, route: str) -> None:
+        """Record a failed call on ``route``, opening the circuit if needed."""
+        with self._lock:
+            circuit = self._circuit(route)
+            circuit.failures += 1
+            circuit.consecutive_failures += 1
+            if circuit.state is CircuitState.HALF_OPEN or (
+                circuit.state is CircuitState.CLOSED
+                and circuit.consecutive_failures >= self.failure_threshold
+            ):
+                logger.warning(
+                    f"Circuit for '{route}' opened after "
+                    f"{circuit.consecutive_failures} consecutive failures."
+                )
+                circuit.state = CircuitState.OPEN
+                circuit.opened_at = self._clock()
+                circuit.opened += 1
+
+    def release(self, route: str) -> None:
+        """Give back the probe slot of a call that recorded no outcome."""
+        with self._lock:
+            circuit = self._circuit(route)
+            if circuit.state is CircuitState.HALF_OPEN and circuit.probes > 0:
+                circuit.probes -= 1
+
+    @contextmanager
+    def guard(self, route: str) -> Generator[None, None, None]:
+        """Run the enclosed call under the circuit of ``route``.
+
+        A failure (see ``is_failure``) is recorded as such. Any other
+        exception is re-raised without recording a failure or a success.
+
+        Raises:
+            CircuitOpenError: If the circuit refuses the call.
+        """
+        self.before_call(route)
+        try:
+            yield
+        except BaseException as exc:
+            if self.is_failure(exc):
+                self.record_failure(route)
+            else:
+                self.release(route)
+            raise
+        self.record_success(route)
+
+    def state(self, route: str) -> CircuitState:
+        """Return the current state of the circuit of ``route``."""
+        with self._lock:
+            circuit = self._circuit(route)
+            self._refresh(route, circuit)
+            return circuit.state
+
+    def reset(self, route: str | None = None) -> None:
+        """Close the circuit of ``route``, or of every route."""
+        with self._lock:
+            if route is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(route, None)
+
+    def stats(self) -> dict[str, CircuitStats]:
+        """Return a snapshot of every circuit, by route."""
+        with self._lock:
+            snapshot = {}
+            for route, circuit in self._circuits.items():
+                self._refresh(route, circuit)
+                snapshot[route] = CircuitStats(
+                    state=circuit.state,
+                    consecutive_failures=circuit.consecutive_failures,
+                    failures=circuit.failures,
+                    successes=circuit.successes,
+                    rejected=circuit.rejected,
+                    opened=circuit.opened,
+                )
+            return snapshot
@@ -1,12 +1,35 @@
-import json
 import logging
-from contextlib import contextmanager
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import partial
 from typing import Any, Self
 
 import requests
 
 from pylegifrance.auth import AuthenticationManager
+from pylegifrance.batch import DEFAULT_MAX_WORKERS, BatchResult, run_batch
+from pylegifrance.cache import ResponseCache, cache_key
+from pylegifrance.circuit import CircuitBreaker
+from pylegifrance.coalesce import RequestCoalescer
+from pylegifrance.codec import (
+    JsonCodec,
+    adopt_response,
+    build_response,
+    default_codec,
+)
 from pylegifrance.config import ApiConfig
+from pylegifrance.exceptions import error_from_response
+from pylegifrance.instrumentation import log_payload
+from pylegifrance.metrics import MetricsRegistry
+from pylegifrance.pooling import PoolStats, mount_pooled_adapter
+from pylegifrance.ratelimit import RateLimiter
+from pylegifrance.retry import RetryPolicy
+from pylegifrance.token_store import TokenStore
+from pylegifrance.tracing import propagate, span
+from pylegifrance.transport import HttpTransport, Transport
 from pylegifrance.utils import configure_session_timeouts
 
 logger = logging.getLogger(__name__)
@@ -25,14 +48,67 @@ class LegifranceClient:
     Attributes:
         api_url: The base URL for the Legifrance API.
         session: The requests session used for making API calls.
+        rate_limiter: The limiter throttling :meth:`call_api`, if any.
+        retry_policy: How :meth:`call_api` retries transient failures.
+        codec: The JSON codec encoding payloads and decoding responses.
+        cache: The response cache consulted by :meth:`call_api`, if any.
+        coalescer: Collapses concurrent identical calls, if set.
+        circuit_breaker: Fails calls fast on routes whose upstream keeps
+            failing, if set.
+        metrics: Records per-route latency, sizes, statuses, retries and
+            cache hits, if set.
+        transport: Sends the requests built by :meth:`call_api`.
+        trust_responses: Whether the façades materialise responses through
+            the trusted fast path of :mod:`pylegifrance.hydration`.
     """
 
-    def __init__(self, config: ApiConfig | None = None):
+    def __init__(
+        self,
+        config: ApiConfig | None = None,
+        *,
+        token_store: TokenStore | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        codec: JsonCodec | None = None,
+        cache: ResponseCache | None = None,
+        coalescer: RequestCoalescer | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        metrics: MetricsRegistry | None = None,
+        transport: Transport | None = None,
+        trust_responses: bool = False,
+    ):
         """Initialize a new LegifranceClient instance.
 
         Args:
             config: Configuration for the API client. If None, will attempt to load
                 from environment variables.
+            token_store: Optional store sharing OAuth tokens between processes,
+                e.g. :class:`~pylegifrance.token_store.FileTokenStore`.
+            rate_limiter: Optional limiter keeping :meth:`call_api` under the
+                PISTE quotas. If None, calls are not throttled.
+            retry_policy: Retry policy for :meth:`call_api`. Defaults to
+                :class:`~pylegifrance.retry.RetryPolicy` with its default
+                settings; use ``RetryPolicy.disabled()`` to fail fast.
+            codec: JSON codec for request and response bodies. Defaults to
+                orjson when installed, the standard library otherwise.
+            cache: Optional response cache for idempotent routes (by default
+                ``consult/*``). If None, every call reaches the API.
+            coalescer: Optional single-flight layer. Concurrent calls with the
+                same route and payload then share one network request.
+            circuit_breaker: Optional
+                :class:`~pylegifrance.circuit.CircuitBreaker`. Routes whose
+                upstream keeps failing are then refused with
+                :class:`~pylegifrance.exceptions.CircuitOpenError` instead of
+                waiting for the read timeout.
+            metrics: Optional :class:`~pylegifrance.metrics.MetricsRegistry`
+                recording per-route metrics of :meth:`call_api`.
+            transport: Sends the requests of :meth:`call_api`. Defaults to
+                :class:`~pylegifrance.transport.HttpTransport`; see
+                :mod:`pylegifrance.transport` to record and replay calls.
+            trust_responses: If True, the façades validate response bodies
+                straight from bytes and skip redundant validation passes,
+                see :mod:`pylegifrance.hydration`. Only for responses from
+                the Legifrance API or a cache filled by this library.
 
         Raises:
             ValueError: If config is not provided and environment variables are not set.
@@ -45,8 +121,22 @@ class LegifranceClient:
                 raise
 
         self.api_url = config.api_url
-        self._auth_manager = AuthenticationManager(config)
+        self._auth_manager = AuthenticationManager(config, token_store=token_store)
+        if metrics is not None:
+            self._auth_manager.on_token_fetched = metrics.record_token_refresh
         self.session = requests.Session()
+        self._adapter = mount_pooled_adapter(self.session, config.api_url, config)
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.codec = codec or default_codec()
+        self.cache = cache
+        self.coalescer = coalescer
+        self.circuit_breaker = circuit_breaker
+        self.metrics = metrics
+        self.transport = transport or HttpTransport()
+        self.trust_responses = trust_responses
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
 
         configure_session_timeouts(self.session, config)
 
@@ -86,6 +176,14 @@ class LegifranceClient:
     def call_api(self, route: str, data: Any) -> requests.Response:
         """Call the Legifrance API with token management and error logging.
 
+        Transient failures (HTTP 429/5xx, connection errors, timeouts) on
+        idempotent routes are retried according to :attr:`retry_policy`.
+        With a :attr:`cache`, cacheable routes are answered from it when
+        possible and successful responses are stored in it. With a
+        :attr:`coalescer`, concurrent identical calls share one request.
+        With a :attr:`circuit_breaker`, calls to a failing route are refused
+        without being sent; cached responses are still served.
+
         Args:
             route: The API route to use.
             data: The data to send as JSON.
@@ -95,35 +193,170 @@ class LegifranceClient:
 
         Raises:
             ValueError: If no data is provided.
-            Exception: If the API call fails or authentication fails.
+            APIError: If the API answers with an HTTP error status, once
+                retries are exhausted. The subclass tells the kind of error
+                (:class:`~pylegifrance.exceptions.NotFound`,
+                :class:`~pylegifrance.exceptions.RateLimited`,
+                :class:`~pylegifrance.exceptions.ServerError`...).
+            CircuitOpenError: If the circuit breaker of ``route`` is open.
+            Exception: If authentication fails.
         """
         if data is None:
             logger.warning("No data provided to call_api; request not sent.")
             raise ValueError("No data provided for API call.")
 
-        token = self._auth_manager.ensure_valid_token()
+        url = f"{self.api_url}{route}"
+        log_payload(logger, f"Payload for request {url}", data)
+
+        cache = self.cache
+        if cache is not None and not cache.is_cacheable(route):
+            cache = None
+        coalescing = self.coalescer is not None and self.coalescer.applies_to(route)
+        key = cache_key(url, data) if cache is not None or coalescing else ""
+
+        def fetch() -> requests.Response:
+            body = self.codec.dumps(data)
+            on_retry = None
+            if self.metrics is not None:
+                on_retry = partial(self.metrics.record_retry, route)
+            for attempt in self.retry_policy.retrying(route, on_retry=on_retry):
+                with attempt:
+                    response = self._send(route, body)
+            if cache is not None:
+                cache.set(key, response.content)
+            return response
+
+        with span("call_api", route=route) as current:
+            if cache is not None:
+                cached = cache.get(key)
+                if self.metrics is not None:
+                    self.metrics.record_cache(route, hit=cached is not None)
+                if cached is not None:
+                    logger.debug(f"Response for '{route}' served from cache.")
+                    current.set_attribute("cache", "hit")
+                    return build_response(cached, url, self.codec)
+
+            if coalescing:
+                return self.coalescer.run(key, fetch)
+            return fetch()
+
+    def map(
+        self,
+        route: str,
+        payloads: Iterable[Any],
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        ordered: bool = True,
+    ) -> Iterator[BatchResult]:
+        """Call ``route`` once per payload with bounded concurrency.
+
+        Payloads are consumed lazily and results are streamed, so memory
+        stays flat on long inputs. A failing call does not stop the batch:
+        its exception is captured in the corresponding result.
+
+        ``max_workers`` should not exceed ``ApiConfig.pool_maxsize``, or
+        threads will wait for a pooled connection.
+
+        Args:
+            route: The API route to call.
+            payloads: The request bodies.
+            max_workers: Maximum number of concurrent calls.
+            ordered: Yield results in input order (default) or as they
+                complete.
+
+        Yields:
+            A :class:`~pylegifrance.batch.BatchResult` per payload, holding
+            the response or the exception.
+
+        Examples:
+            >>> ids = ["LEGIARTI000006419292", "LEGIARTI000006419293"]
+            >>> for result in client.map("consult/getArticle", ({"id": i} for i in ids)):
+            ...     if result.ok:
+            ...         print(result.value.json()["article"]["num"])
+        """
+        return run_batch(
+            lambda payload: self.call_api(route, payload),
+            payloads,
+            max_workers=max_workers,
+            ordered=ordered,
+        )
+
+    def submit(self, route: str, data: Any) -> Future[requests.Response]:
+        """Schedule :meth:`call_api` on the client's background thread pool.
+
+        The pool is created on first use with
+        :data:`~pylegifrance.batch.DEFAULT_MAX_WORKERS` threads and shut
+        down by :meth:`close`.
+
+        Args:
+            route: The API route to use.
+            data: The data to send as JSON.
+
+        Returns:
+            A future resolving to the response, or to the exception raised
+            by :meth:`call_api`.
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=DEFAULT_MAX_WORKERS,
+                    thread_name_prefix="pylegifrance-client",
+                )
+            executor = self._executor
+        return executor.submit(propagate(self.call_api), route, data)
+
+    def _send(self, route: str, body: bytes) -> requests.Response:
+        """Send a single POST request with an already encoded ``body``.
+
+        Raises:
+            APIError: If the API answers with an HTTP error status.
+            CircuitOpenError: If the circuit breaker of ``route`` is open.
+        """
+        breaker = self.circuit_breaker
+        with breaker.guard(route) if breaker is not None else nullcontext():
+            return self._post(route, body)
+
+    def _post(self, route: str, body: bytes) -> requests.Response:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(route)
+
         headers = {
-            "Authorization": f"Bearer {token}",
             "accept": "application/json",
             "Content-Type": "application/json",
         }
+        if self.transport.requires_auth:
+            token = self._auth_manager.ensure_valid_token()
+            headers["Authorization"] = f"Bearer {token}"
 
         url = f"{self.api_url}{route}"
-        logger.debug(
-            f"Payload for request {url}: {json.dumps(data, indent=2, ensure_ascii=False)}"
-        )
-        response = self.session.post(url, headers=headers, json=data)
+        started = time.perf_counter()
+        with span("http.post", route=route, request_bytes=len(body)) as attempt:
+            try:
+                response = self.transport.send(self.session, route, url, headers, body)
+            except Exception:
+                if self.metrics is not None:
+                    self.metrics.record_transport_error(route, len(body))
+                raise
+            attempt.set_attribute("status_code", response.status_code)
+        if self.metrics is not None:
+            self.metrics.observe_request(
+                route,
+                response.status_code,
+                time.perf_counter() - started,
+                len(body),
+                len(response.content),
+            )
 
         if 400 <= response.status_code < 600:
             logger.error(
                 f"Client error {response.status_code} - {response.text} when calling the API."
             )
-            raise Exception(
-                f"API client error {response.status_code} - {response.text}"
+            raise error_from_response(
+                response.status_code, response.text, response.headers, route
             )
 
         logger.info(f"API call to '{route}' successful.")
-        return response
+        return adopt_response(response, self.codec)
 
     def get(self, route: str) -> requests.Response:
         """Perform a GET request on the given API route.
@@ -187,6 +420,17 @@ class LegifranceClient:
             logger.error(f"Error during Legifrance API ping: {str(e)}")
             raise Exception(f"API ping failed: {e}") from e
 
+    def pool_stats(self) -> PoolStats:
+        """Report connection pool usage for the Legifrance API host.
+
+        ``connections_reused`` versus ``connections_created`` shows how many
+        TCP/TLS handshakes the keep-alive pool saved.
+
+        Returns:
+            A snapshot of the pool counters.
+        """
+        return self._adapter.stats()
+
     @classmethod
     def create(cls, config: ApiConfig | None = None) -> Self:
         """Factory method to create a new LegifranceClient instance.
@@ -220,5 +464,10 @@ class LegifranceClient:
 
         This should be called when the client is no longer needed to free up resources.
         """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self.transport.close()
         self.session.close()
         self._auth_manager.close()
@@ -0,0 +1,114 @@
+"""Single-flight coalescing of identical in-flight API calls.
+
+When several threads resolve overlapping references (decisions citing the
+same arrêt, laws modifying the same article), they issue the same POST at
+the same time. A :class:`RequestCoalescer` given to
+:class:`~pylegifrance.client.LegifranceClient` lets the first caller send
+the request while the others wait for its outcome, response or exception.
+"""
+
+import fnmatch
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from pylegifrance.retry import IDEMPOTENT_ROUTES
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class CoalescerStats:
+    """
+    Counters of a :class:`RequestCoalescer`.
+
+    Attributes:
+        calls: Calls that went through the coalescer.
+        coalesced: Calls answered by another caller's request, i.e. network
+            requests saved.
+        in_flight: Distinct requests currently in progress.
+    """
+
+    calls: int = 0
+    coalesced: int = 0
+    in_flight: int = 0
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    result: Any
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.error: BaseException | None = None
+
+
+class RequestCoalescer:
+    """
+    Collapses concurrent identical calls into a single request.
+
+    Attributes:
+        routes: Glob patterns of the routes eligible for coalescing. Only
+            idempotent routes should be listed.
+    """
+
+    def __init__(self, routes: tuple[str, ...] = IDEMPOTENT_ROUTES):
+        self.routes = routes
+        self._lock = threading.Lock()
+        self._flights: dict[str, _Flight] = {}
+        self._calls = 0
+        self._coalesced = 0
+
+    def applies_to(self, route: str) -> bool:
+        """Check whether calls to ``route`` may be coalesced."""
+        return any(fnmatch.fnmatchcase(route, pattern) for pattern in self.routes)
+
+    def run(self, key: str, fn: Callable[[], T]) -> T:
+        """Run ``fn`` unless a call with the same ``key`` is in flight.
+
+        Args:
+            key: Identifies the request, e.g. a hash of route and payload.
+            fn: Sends the request and returns its result.
+
+        Returns:
+            The result of ``fn``, possibly obtained by another thread.
+
+        Raises:
+            Exception: Whatever ``fn`` raised, in every waiting caller.
+        """
+        with self._lock:
+            self._calls += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            result = fn()
+            flight.result = result
+            return result
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def stats(self) -> CoalescerStats:
+        """Return the coalescer counters."""
+        with self._lock:
+            return CoalescerStats(self._calls, self._coalesced, len(self._flights))
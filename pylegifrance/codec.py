@@ -0,0 +1,141 @@
+"""JSON codecs used by the clients to encode requests and decode responses.
+
+Payloads are encoded once, straight to bytes, and responses are decoded from
+the raw body bytes. :class:`OrjsonCodec` is used when the optional ``orjson``
+package is installed::
+
+    pip install "pylegifrance[fast]"
+
+:class:`StdlibCodec` is the fallback. Both accept enums and datetimes in
+payloads, so callers no longer need a ``json.loads(json.dumps(...))`` round
+trip to normalise them.
+"""
+
+import json
+import logging
+from typing import Any, Protocol, runtime_checkable
+
+import requests
+
+from pylegifrance.utils import EnumEncoder
+
+logger = logging.getLogger(__name__)
+
+
+@runtime_checkable
+class JsonCodec(Protocol):
+    """Encodes request payloads and decodes response bodies."""
+
+    name: str
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialise ``obj`` to UTF-8 encoded JSON."""
+        ...
+
+    def loads(self, data: bytes | str) -> Any:
+        """Parse a JSON document."""
+        ...
+
+
+class StdlibCodec:
+    """Codec based on the standard library :mod:`json` module."""
+
+    name = "json"
+
+    def __init__(self):
+        self._encoder = EnumEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """Codec based on ``orjson``, which serialises enums and datetimes natively.
+
+    Raises:
+        ImportError: If ``orjson`` is not installed.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        try:
+            import orjson
+        except ImportError as exc:
+            raise ImportError(
+                "OrjsonCodec requires the optional 'orjson' dependency. "
+                'Install it with: pip install "pylegifrance[fast]"'
+            ) from exc
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._orjson.loads(data)
+
+
+def default_codec() -> JsonCodec:
+    """Return :class:`OrjsonCodec` if ``orjson`` is installed, else :class:`StdlibCodec`."""
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        logger.debug("orjson is not installed; using the stdlib JSON codec.")
+        return StdlibCodec()
+
+
+class CodecResponse(requests.Response):
+    """A :class:`requests.Response` whose :meth:`json` uses a :class:`JsonCodec`.
+
+    The body is parsed from the raw bytes, skipping the charset detection and
+    text decoding done by :meth:`requests.Response.json`.
+    """
+
+    codec: JsonCodec | None = None
+
+    def json(self, **kwargs) -> Any:
+        if self.codec is None or kwargs:
+            return super().json(**kwargs)
+        return self.codec.loads(self.content)
+
+
+def adopt_response(response: requests.Response, codec: JsonCodec) -> requests.Response:
+    """Make ``response.json()`` decode with ``codec``.
+
+    Args:
+        response: A response returned by a :class:`requests.Session`.
+        codec: The codec to decode the body with.
+
+    Returns:
+        The same response object, now a :class:`CodecResponse`.
+    """
+    if type(response) is requests.Response:
+        response.__class__ = CodecResponse
+    if isinstance(response, CodecResponse):
+        response.codec = codec
+    return response
+
+
+def build_response(body: bytes, url: str, codec: JsonCodec) -> CodecResponse:
+    """Build a successful response around a JSON body, e.g. from a cache.
+
+    Args:
+        body: The raw JSON body.
+        url: The URL the body was fetched from.
+        codec: The codec to decode the body with.
+
+    Returns:
+        A 200 response whose :meth:`~CodecResponse.json` decodes ``body``.
+    """
+    response = CodecResponse()
+    response._content = body
+    response.status_code = 200
+    response.reason = "OK"
+    response.url = url
+    response.encoding = "utf-8"
+    response.headers["Content-Type"] = "application/json"
+    response.codec = codec
+    return response
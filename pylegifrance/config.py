@@ -17,6 +17,21 @@ class ApiConfig:
         api_url: The base URL for the Legifrance API.
         connect_timeout: Timeout in seconds for establishing connection with server.
         read_timeout: Timeout in seconds for receiving response after connection is established.
+        pool_connections: Number of per-host connection pools kept by each session.
+        pool_maxsize: Maximum number of connections kept open per host. Should
+            be at least the number of threads sharing a client.
+        pool_block: If True, callers wait for a free connection once
+            ``pool_maxsize`` is reached instead of opening a throw-away one.
+        keep_alive: Reuse HTTP connections between requests. When False every
+            request is sent with ``Connection: close``.
+        tcp_keepalive_idle: Idle time in seconds before TCP keep-alive probes
+            are sent on pooled connections. None disables TCP keep-alive.
+        token_refresh_ratio: Fraction of the token lifetime after which it is
+            renewed in the background while the current one is still served.
+            1.0 disables early renewal.
+        background_token_refresh: Keep the token renewed on a timer even when
+            no request is made, so the first call after an idle period does
+            not wait for the OAuth server.
     """
 
     client_id: str
@@ -25,6 +40,13 @@ class ApiConfig:
     api_url: str = "https://api.piste.gouv.fr/dila/legifrance/lf-engine-app/"
     connect_timeout: float = 3.05  # seconds
     read_timeout: float = 27.0  # seconds
+    pool_connections: int = 10
+    pool_maxsize: int = 32
+    pool_block: bool = False
+    keep_alive: bool = True
+    tcp_keepalive_idle: int | None = 60  # seconds
+    token_refresh_ratio: float = 0.8
+    background_token_refresh: bool = False
 
     @classmethod
     def from_env(cls) -> "ApiConfig":
@@ -0,0 +1,153 @@
+"""Exceptions raised by the Legifrance API clients.
+
+HTTP errors are mapped onto a small hierarchy so that callers can react to
+the kind of failure rather than parse messages:
+
+- :class:`APIError` — any 4xx/5xx answer, with ``status_code``, ``body`` and
+  ``route``.
+- :class:`ClientError` (4xx), specialised as :class:`NotFound` (404) and
+  :class:`RateLimited` (429, with ``retry_after``).
+- :class:`ServerError` (5xx).
+
+:class:`CircuitOpenError` is raised without any request being sent, while a
+route's circuit breaker is open.
+
+The message keeps the historical ``"API client error <code> - <body>"``
+format, so code matching on ``str(exc)`` keeps working.
+"""
+
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+
+class LegifranceError(Exception):
+    """Base class for the errors raised by pylegifrance."""
+
+
+class APIError(LegifranceError):
+    """
+    The Legifrance API answered with an HTTP error status.
+
+    Attributes:
+        status_code: The HTTP status code.
+        body: The response body as text.
+        route: The API route that was called, if known.
+    """
+
+    def __init__(self, status_code: int, body: str, route: str | None = None):
+        super().__init__(f"API client error {status_code} - {body}")
+        self.status_code = status_code
+        self.body = body
+        self.route = route
+
+
+class ClientError(APIError):
+    """The request was rejected (HTTP 4xx)."""
+
+
+class NotFound(ClientError):
+    """The requested resource does not exist (HTTP 404)."""
+
+
+class RateLimited(ClientError):
+    """
+    The PISTE quota was exceeded (HTTP 429).
+
+    Attributes:
+        retry_after: Seconds to wait before retrying, from the ``Retry-After``
+            header, or None if the server did not send one.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        body: str,
+        route: str | None = None,
+        retry_after: float | None = None,
+    ):
+        super().__init__(status_code, body, route)
+        self.retry_after = retry_after
+
+
+class ServerError(APIError):
+    """The API failed to process the request (HTTP 5xx)."""
+
+
+class CassetteMiss(LegifranceError):
+    """
+    A replayed call has no recording in the loaded cassettes.
+
+    Attributes:
+        route: The API route that was called.
+        payload: The decoded request payload.
+    """
+
+    def __init__(self, route: str, payload: Any):
+        super().__init__(f"No recorded interaction for route '{route}'")
+        self.route = route
+        self.payload = payload
+
+
+class CircuitOpenError(LegifranceError):
+    """
+    The call was refused because the route's circuit breaker is open.
+
+    Attributes:
+        route: The API route that was called.
+        retry_after: Seconds until the circuit lets a probe call through.
+    """
+
+    def __init__(self, route: str, retry_after: float):
+        super().__init__(
+            f"Circuit open for route '{route}'; retry in {retry_after:.1f}s"
+        )
+        self.route = route
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header into a number of seconds.
+
+    Args:
+        value: The header value, either delay-seconds or an HTTP date.
+
+    Returns:
+        The delay in seconds (never negative), or None if absent or invalid.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def error_from_response(
+    status_code: int, body: str, headers, route: str | None = None
+) -> APIError:
+    """Build the exception matching an HTTP error response.
+
+    Args:
+        status_code: The HTTP status code (4xx or 5xx).
+        body: The response body as text.
+        headers: The response headers (any case-insensitive mapping).
+        route: The API route that was called.
+
+    Returns:
+        The most specific :class:`APIError` subclass for the status.
+    """
+    if status_code == 429:
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+        return RateLimited(status_code, body, route, retry_after=retry_after)
+    if status_code == 404:
+        return NotFound(status_code, body, route)
+    if 400 <= status_code < 500:
+        return ClientError(status_code, body, route)
+    return ServerError(status_code, body, route)
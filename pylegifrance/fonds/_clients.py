@@ -0,0 +1,52 @@
+"""Contrôle du type de client transmis aux façades.
+
+Chaque façade existe en deux variantes : synchrone (:class:`JuriAPI`...),
+pour un :class:`~pylegifrance.client.LegifranceClient`, et asynchrone
+(:class:`AsyncJuriAPI`...), pour un
+:class:`~pylegifrance.async_client.AsyncLegifranceClient`. Un client de
+l'autre sorte est refusé dès la construction de la façade, plutôt qu'au
+premier appel.
+"""
+
+import inspect
+from typing import Any
+
+
+def _is_async(client: Any) -> bool:
+    return inspect.iscoroutinefunction(getattr(client, "call_api", None))
+
+
+def require_sync_client(client: Any, facade: str, async_facade: str) -> None:
+    """Refuse un client asynchrone.
+
+    Args:
+        client: Le client transmis à la façade.
+        facade: Le nom de la façade synchrone.
+        async_facade: Le nom de sa variante asynchrone, cité dans l'erreur.
+
+    Raises:
+        TypeError: Si ``client.call_api`` est une coroutine.
+    """
+    if _is_async(client):
+        raise TypeError(
+            f"{facade} attend un LegifranceClient ; "
+            f"utilisez {async_facade} avec un AsyncLegifranceClient"
+        )
+
+
+def require_async_client(client: Any, facade: str, sync_facade: str) -> None:
+    """Refuse un client synchrone.
+
+    Args:
+        client: Le client transmis à la façade.
+        facade: Le nom de la façade asynchrone.
+        sync_facade: Le nom de sa variante synchrone, cité dans l'erreur.
+
+    Raises:
+        TypeError: Si ``client.call_api`` n'est pas une coroutine.
+    """
+    if not _is_async(client):
+        raise TypeError(
+            f"{facade} attend un AsyncLegifranceClient ; "
+            f"utilisez {sync_facade} avec un LegifranceClient"
+        )
@@ -1,11 +1,12 @@
-import json
 import logging
 import re
 from collections.abc import Iterator
 from datetime import datetime
-from typing import Self
+from typing import TYPE_CHECKING, Self
 
 from pylegifrance import LegifranceClient
+from pylegifrance.fonds._clients import require_async_client, require_sync_client
+from pylegifrance.instrumentation import log_payload
 from pylegifrance.models.code import models
 from pylegifrance.models.code.enum import NomCode, TypeChampCode
 from pylegifrance.models.code.search import (
@@ -20,6 +21,17 @@ from pylegifrance.models.code.search import (
 )
 from pylegifrance.models.constants import EtatJuridique, TypeRecherche
 from pylegifrance.models.generated.model import CodeConsultRequest
+from pylegifrance.pagination import (
+    DEFAULT_PAGE_SIZE,
+    SearchCounts,
+    count_payload,
+    iter_pages,
+    search_counts,
+    total_results,
+)
+
+if TYPE_CHECKING:
+    from pylegifrance.async_client import AsyncLegifranceClient
 
 logger = logging.getLogger(__name__)
 
@@ -85,23 +97,18 @@ def _normalize_article_number(number: str) -> str:
     return number
 
 
-class CodeSearchBuilder:
-    """Builder pour construire des requêtes de recherche de codes juridiques.
-
-    Cette classe implémente le pattern Builder pour permettre la construction
-    fluide de requêtes de recherche dans les codes juridiques français.
-
-    Args:
-        api_client: Client API Légifrance pour exécuter les requêtes.
-        fond: Type de fond juridique (CODE_DATE ou CODE_ETAT).
+class _CodeSearchBase:
+    """Critères et lecture des réponses d'une recherche de codes.
 
-    Attributes:
-        api: Client API Légifrance.
-        fond: Type de fond juridique.
-        criteria: Critères de recherche en cours de construction.
+    Partagé par :class:`CodeSearchBuilder` et :class:`AsyncCodeSearchBuilder`,
+    qui ne diffèrent que par l'envoi de la requête.
     """
 
-    def __init__(self, api_client: LegifranceClient, fond: str):
+    api: "LegifranceClient | AsyncLegifranceClient"
+
+    def __init__(
+        self, api_client: "LegifranceClient | AsyncLegifranceClient", fond: str
+    ):
         self.api = api_client
         self.fond = fond
         self.criteria = CodeSearchCriteria()
@@ -283,11 +290,8 @@ class CodeSearchBuilder:
         self._formatter = True
         return self
 
-    def execute(self) -> list[models.Article]:
-        """Exécute la recherche et retourne les résultats.
-
-        Returns:
-            List[models.Article]: Liste des articles correspondant aux critères.
+    def _build_request(self) -> dict:
+        """Valide les critères et construit le corps de requête ``/search``.
 
         Raises:
             ValueError: Si les critères de recherche sont invalides.
@@ -339,33 +343,41 @@ class CodeSearchBuilder:
             request_dict["recherche"] = request.recherche.to_generated(
                 self.fond
             ).model_dump(by_alias=True, mode="json")
+        return request_dict
 
-        response = self.api.call_api("search", request_dict)
-
-        results = []
-        if response:
-            response_json = json.loads(response.text)
-
-            page_number = response_json.get("pageNumber", 1)
-            page_size = response_json.get("pageSize", 10)
-            total_results = response_json.get("totalResults", 0)
-            total_pages = (
-                (total_results + page_size - 1) // page_size if page_size > 0 else 0
-            )
-            logger.debug(f"Page number: {page_number}, Page size: {page_size}")
-            logger.debug(f"Total results: {total_results}, Total pages: {total_pages}")
-
-            if "results" in response_json:
-                logger.debug(
-                    f"Results: {json.dumps(response_json['results'], indent=2, ensure_ascii=False)}"
-                )
+    def _parse_response(self, response) -> list[models.Article]:
+        """Transforme la réponse ``/search`` en liste d'articles."""
+        if not response:
+            return []
+        response_json = response.json()
+
+        page_number = response_json.get("pageNumber", 1)
+        page_size = response_json.get("pageSize", 10)
+        total = total_results(response_json) or 0
+        total_pages = (total + page_size - 1) // page_size if page_size > 0 else 0
+        logger.debug(f"Page number: {page_number}, Page size: {page_size}")
+        logger.debug(f"Total results: {total}, Total pages: {total_pages}")
+
+        if "results" not in response_json:
+            return []
+        log_payload(logger, "Results", response_json["results"])
+        return self._to_articles(response_json["results"], self.criteria.page_size)
+
+    def _to_articles(
+        self, results: list[dict], limit: int | None = None
+    ) -> list[models.Article]:
+        """Convertit des résultats ``/search`` en articles.
 
-                for article_data in _extract_articles_from_response(
-                    response_json["results"], self._formatter
-                ):
-                    results.append(models.Article.from_orm(article_data))
-                    if len(results) >= self.criteria.page_size:
-                        break
+        Args:
+            results: Les ``results`` d'une page de recherche.
+            limit: Nombre maximal d'articles extraits avant le filtrage par
+                état juridique. Si None, tous les articles sont extraits.
+        """
+        articles = []
+        for article_data in _extract_articles_from_response(results, self._formatter):
+            articles.append(models.Article.from_orm(article_data))
+            if limit is not None and len(articles) >= limit:
+                break
 
         # Post-filter by legal status when an explicit status filter was requested.
         # The Legifrance API applies the EtatJuridique filter at the section level,
@@ -373,31 +385,146 @@ class CodeSearchBuilder:
         # different status.
         if self._requested_statuses is not None:
             requested_values = {s.value for s in self._requested_statuses}
-            results = [a for a in results if a.legal_status in requested_values]
+            articles = [a for a in articles if a.legal_status in requested_values]
 
-        return results
+        return articles
 
 
-class CodeConsultFetcher:
-    """Builder pour configurer et exécuter la consultation d'un code juridique.
+class CodeSearchBuilder(_CodeSearchBase):
+    """Builder pour construire des requêtes de recherche de codes juridiques.
 
-    Cette classe implémente le pattern Builder pour permettre la configuration
-    fluide de la consultation d'un code juridique français.
+    Cette classe implémente le pattern Builder pour permettre la construction
+    fluide de requêtes de recherche dans les codes juridiques français.
 
     Args:
         api_client: Client API Légifrance pour exécuter les requêtes.
-        text_id: Identifiant LEGITEXT du code à consulter.
+        fond: Type de fond juridique (CODE_DATE ou CODE_ETAT).
 
     Attributes:
         api: Client API Légifrance.
-        text_id: Identifiant du code.
-        date: Date de consultation (optionnelle).
-        abrogated: Inclure les textes abrogés.
-        searched_string: Texte de recherche pour mise en évidence.
-        section_id: Identifiant de section spécifique à consulter.
+        fond: Type de fond juridique.
+        criteria: Critères de recherche en cours de construction.
+
+    Raises:
+        TypeError: Si ``api_client`` est un client asynchrone.
     """
 
-    def __init__(self, api_client: LegifranceClient, text_id: str):
+    api: LegifranceClient
+
+    def __init__(self, api_client: LegifranceClient, fond: str):
+        require_sync_client(api_client, "CodeSearchBuilder", "AsyncCodeSearchBuilder")
+        super().__init__(api_client, fond)
+
+    def execute(self) -> list[models.Article]:
+        """Exécute la recherche et retourne les résultats.
+
+        Returns:
+            List[models.Article]: Liste des articles correspondant aux critères.
+
+        Raises:
+            ValueError: Si les critères de recherche sont invalides.
+        """
+        response = self.api.call_api("search", self._build_request())
+        return self._parse_response(response)
+
+    def count(self) -> SearchCounts:
+        """Compte les résultats de la recherche, sans construire les articles.
+
+        Une seule requête ``/search`` est envoyée, pour un seul résultat. Le
+        filtrage par état juridique de :meth:`execute`, fait côté client,
+        ne s'applique pas au total.
+
+        Returns:
+            SearchCounts: Le nombre total de résultats et les effectifs par
+            valeur de facette renvoyés par l'API.
+
+        Raises:
+            ValueError: Si les critères de recherche sont invalides.
+        """
+        response = self.api.call_api("search", count_payload(self._build_request()))
+        return search_counts(response)
+
+    def iter_search(
+        self,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_results: int | None = None,
+        page_workers: int = 1,
+    ) -> Iterator[models.Article]:
+        """Parcourt toutes les pages de résultats de la recherche.
+
+        La pagination fixée par :meth:`paginate` est ignorée. La page suivante
+        est déjà en cours de récupération pendant que l'appelant traite la
+        page courante (voir :func:`~pylegifrance.pagination.iter_pages`).
+
+        Avec ``page_workers`` supérieur à 1, les pages qui suivent la
+        première sont demandées en parallèle, toujours produites dans
+        l'ordre. Les codes n'ayant pas de facette de période, une recherche
+        de plus de 10 000 résultats s'arrête au 10 000e.
+
+        Args:
+            page_size: Nombre de résultats de recherche par page (100 au plus).
+            max_results: Nombre maximal de résultats de recherche parcourus.
+                Si None, la recherche est parcourue jusqu'au dernier.
+            page_workers: Nombre de pages demandées simultanément après la
+                première, pour les exports volumineux. 1 parcourt les pages
+                l'une après l'autre.
+
+        Yields:
+            models.Article: Les articles, dans l'ordre des résultats.
+
+        Raises:
+            ValueError: Si les critères de recherche sont invalides, ou si
+                ``page_size``, ``max_results`` ou ``page_workers`` est hors
+                limites.
+        """
+        for page in iter_pages(
+            self.api,
+            self._build_request(),
+            page_size=page_size,
+            max_results=max_results,
+            max_workers=page_workers,
+        ):
+            yield from self._to_articles(page.results)
+
+
+class AsyncCodeSearchBuilder(_CodeSearchBase):
+    """Équivalent asynchrone de :class:`CodeSearchBuilder`.
+
+    Raises:
+        TypeError: Si ``api_client`` est un client synchrone.
+    """
+
+    api: "AsyncLegifranceClient"
+
+    def __init__(self, api_client: "AsyncLegifranceClient", fond: str):
+        require_async_client(api_client, "AsyncCodeSearchBuilder", "CodeSearchBuilder")
+        super().__init__(api_client, fond)
+
+    async def execute(self) -> list[models.Article]:
+        """Version asynchrone de :meth:`CodeSearchBuilder.execute`."""
+        response = await self.api.call_api("search", self._build_request())
+        return self._parse_response(response)
+
+    async def count(self) -> SearchCounts:
+        """Version asynchrone de :meth:`CodeSearchBuilder.count`."""
+        response = await self.api.call_api(
+            "search", count_payload(self._build_request())
+        )
+        return search_counts(response)
+
+
+class _CodeConsultBase:
+    """Paramètres et corps de requête d'une consultation de code.
+
+    Partagé par :class:`CodeConsultFetcher` et :class:`AsyncCodeConsultFetcher`.
+    """
+
+    api: "LegifranceClient | AsyncLegifranceClient"
+
+    def __init__(
+        self, api_client: "LegifranceClient | AsyncLegifranceClient", text_id: str
+    ):
         self.api = api_client
         self.text_id = text_id
         self.date = None
@@ -405,38 +532,30 @@ class CodeConsultFetcher:
         self.searched_string = None
         self.section_id = None
 
-    def at(self, date: str) -> models.Code:
-        """Consulte le code à une date spécifique.
-
-        Args:
-            date: Date au format YYYY-MM-DD ou timestamp Unix en millisecondes.
-
-        Returns:
-            models.Article: L'article consulté.
+    def _set_date(self, date: str) -> None:
+        """Valide et enregistre la date de consultation.
 
         Raises:
             ValueError: Si le format de date est invalide.
         """
-        logger.debug(f"CodeConsultFetcher.at called with date: {date}")
         if date.isdigit() and len(date) >= 10:
             try:
                 timestamp = int(date) / 1000
                 dt = datetime.fromtimestamp(timestamp)
                 self.date = dt.strftime("%Y-%m-%d")
                 logger.debug(f"Date converted from timestamp to: {self.date}")
-                return self._execute()
+                return
             except (ValueError, OverflowError):
                 pass
 
         try:
             datetime.fromisoformat(date)
-            self.date = date
-            logger.debug(f"Date set to: {self.date}")
-            return self._execute()
         except ValueError:
             raise ValueError(
                 f"Format de date invalide: {date}. Utilisez YYYY-MM-DD ou un timestamp Unix en millisecondes"
             ) from None
+        self.date = date
+        logger.debug(f"Date set to: {self.date}")
 
     def include_abrogated(self, include: bool = True) -> Self:
         """Configure l'inclusion des textes abrogés.
@@ -462,15 +581,8 @@ class CodeConsultFetcher:
         self.section_id = section_id
         return self
 
-    def _execute(self) -> models.Code:
-        """Exécute la consultation et retourne le résultat.
-
-        Returns:
-            Code: Code consulté.
-
-        Raises:
-            ValueError: Si les paramètres de consultation sont invalides.
-        """
+    def _request_data(self) -> dict:
+        """Construit le corps de requête ``/consult/code``."""
         logger.debug(f"CodeConsultFetcher._execute called with self.date: {self.date}")
         if not self.date:
             self.date = datetime.now().strftime("%Y-%m-%d")
@@ -488,27 +600,102 @@ class CodeConsultFetcher:
 
         request_data = request.model_dump(by_alias=True, mode="json")
         logger.debug(f"Request data: {request_data}")
-        response = self.api.call_api("consult/code", request_data)
+        return request_data
 
-        return models.Code.from_orm(response.json())
 
+class CodeConsultFetcher(_CodeConsultBase):
+    """Builder pour configurer et exécuter la consultation d'un code juridique.
 
-class ArticleFetcher:
-    """Récupérateur d'articles utilisant le point de terminaison /consult/getArticle."""
+    Cette classe implémente le pattern Builder pour permettre la configuration
+    fluide de la consultation d'un code juridique français.
 
-    def __init__(self, api_client: LegifranceClient, article_id: str):
-        self.api = api_client
-        self.article_id = article_id
+    Args:
+        api_client: Client API Légifrance pour exécuter les requêtes.
+        text_id: Identifiant LEGITEXT du code à consulter.
 
-    def at(self, date: str | datetime | int) -> models.Article:
-        """Récupère un article à une date spécifique.
+    Attributes:
+        api: Client API Légifrance.
+        text_id: Identifiant du code.
+        date: Date de consultation (optionnelle).
+        abrogated: Inclure les textes abrogés.
+        searched_string: Texte de recherche pour mise en évidence.
+        section_id: Identifiant de section spécifique à consulter.
+
+    Raises:
+        TypeError: Si ``api_client`` est un client asynchrone.
+    """
+
+    api: LegifranceClient
+
+    def __init__(self, api_client: LegifranceClient, text_id: str):
+        require_sync_client(api_client, "CodeConsultFetcher", "AsyncCodeConsultFetcher")
+        super().__init__(api_client, text_id)
+
+    def at(self, date: str) -> models.Code:
+        """Consulte le code à une date spécifique.
 
         Args:
-            date: Date au format YYYY-MM-DD, datetime, ou timestamp (ms)
+            date: Date au format YYYY-MM-DD ou timestamp Unix en millisecondes.
 
         Returns:
-            models.Article: L'objet models.Article récupéré
+            models.Article: L'article consulté.
+
+        Raises:
+            ValueError: Si le format de date est invalide.
+        """
+        logger.debug(f"CodeConsultFetcher.at called with date: {date}")
+        self._set_date(date)
+        return self._execute()
+
+    def _execute(self) -> models.Code:
+        """Exécute la consultation et retourne le résultat.
+
+        Returns:
+            Code: Code consulté.
+
+        Raises:
+            ValueError: Si les paramètres de consultation sont invalides.
         """
+        response = self.api.call_api("consult/code", self._request_data())
+
+        return models.Code.from_orm(response.json())
+
+
+class AsyncCodeConsultFetcher(_CodeConsultBase):
+    """Équivalent asynchrone de :class:`CodeConsultFetcher`.
+
+    Raises:
+        TypeError: Si ``api_client`` est un client synchrone.
+    """
+
+    api: "AsyncLegifranceClient"
+
+    def __init__(self, api_client: "AsyncLegifranceClient", text_id: str):
+        require_async_client(
+            api_client, "AsyncCodeConsultFetcher", "CodeConsultFetcher"
+        )
+        super().__init__(api_client, text_id)
+
+    async def at(self, date: str) -> models.Code:
+        """Version asynchrone de :meth:`CodeConsultFetcher.at`."""
+        self._set_date(date)
+        response = await self.api.call_api("consult/code", self._request_data())
+        return models.Code.from_orm(response.json())
+
+
+class _ArticleFetcherBase:
+    """Corps de requête et lecture des réponses ``/consult/getArticle``."""
+
+    api: "LegifranceClient | AsyncLegifranceClient"
+
+    def __init__(
+        self, api_client: "LegifranceClient | AsyncLegifranceClient", article_id: str
+    ):
+        self.api = api_client
+        self.article_id = article_id
+
+    def _request_data(self, date: str | datetime | int) -> dict:
+        """Construit le corps de requête ``/consult/getArticle``."""
         # Convert date to string format
         if isinstance(date, datetime):
             date_str = date.strftime("%Y-%m-%d")
@@ -523,11 +710,10 @@ class ArticleFetcher:
             raise ValueError(f"Type de date invalide: {type(date)}")
 
         # Build request
-        request_data = {"id": self.article_id, "date": date_str}
-
-        # Execute request
-        response = self.api.call_api("consult/getArticle", request_data)
+        return {"id": self.article_id, "date": date_str}
 
+    def _parse_response(self, response) -> models.Article:
+        """Transforme la réponse ``/consult/getArticle`` en article."""
         if not response:
             raise ValueError(f"Article {self.article_id} non trouvé")
 
@@ -535,6 +721,45 @@ class ArticleFetcher:
         return models.Article.from_orm(response.json())
 
 
+class ArticleFetcher(_ArticleFetcherBase):
+    """Récupérateur d'articles utilisant le point de terminaison /consult/getArticle."""
+
+    api: LegifranceClient
+
+    def __init__(self, api_client: LegifranceClient, article_id: str):
+        require_sync_client(api_client, "ArticleFetcher", "AsyncArticleFetcher")
+        super().__init__(api_client, article_id)
+
+    def at(self, date: str | datetime | int) -> models.Article:
+        """Récupère un article à une date spécifique.
+
+        Args:
+            date: Date au format YYYY-MM-DD, datetime, ou timestamp (ms)
+
+        Returns:
+            models.Article: L'objet models.Article récupéré
+        """
+        response = self.api.call_api("consult/getArticle", self._request_data(date))
+        return self._parse_response(response)
+
+
+class AsyncArticleFetcher(_ArticleFetcherBase):
+    """Équivalent asynchrone de :class:`ArticleFetcher`."""
+
+    api: "AsyncLegifranceClient"
+
+    def __init__(self, api_client: "AsyncLegifranceClient", article_id: str):
+        require_async_client(api_client, "AsyncArticleFetcher", "ArticleFetcher")
+        super().__init__(api_client, article_id)
+
+    async def at(self, date: str | datetime | int) -> models.Article:
+        """Version asynchrone de :meth:`ArticleFetcher.at`."""
+        response = await self.api.call_api(
+            "consult/getArticle", self._request_data(date)
+        )
+        return self._parse_response(response)
+
+
 class Code:
     """Interface pour rechercher et consulter les codes juridiques français.
 
@@ -588,6 +813,10 @@ class Code:
         api: Client API Légifrance configuré pour les appels REST.
         fond: Type de fond juridique utilisé pour les recherches.
 
+    Raises:
+        TypeError: Si ``api_client`` est un client asynchrone (voir
+            :class:`AsyncCode`).
+
     See Also:
         LegifranceClient: Client de base pour l'authentification et les appels API
         CodeSearchBuilder: Builder pour construire des requêtes de recherche complexes
@@ -596,6 +825,7 @@ class Code:
     """
 
     def __init__(self, api_client: LegifranceClient, fond: str = "CODE_ETAT"):
+        require_sync_client(api_client, "Code", "AsyncCode")
         self.api = api_client
         self.fond = fond
 
@@ -633,3 +863,50 @@ class Code:
         if not article_id or not article_id.startswith("LEGIARTI"):
             raise ValueError(f"Identifiant d'article invalide: {article_id}")
         return ArticleFetcher(self.api, article_id)
+
+
+class AsyncCode:
+    """Équivalent asynchrone de :class:`Code`.
+
+    Les builders renvoyés s'utilisent comme ceux de :class:`Code`, leur
+    méthode finale (``execute()``, ``count()``, ``at()``) étant une
+    coroutine.
+
+    Args:
+        api_client: Client asynchrone pour se connecter à l'API Légifrance.
+        fond: Type de recherche, CODE_DATE ou CODE_ETAT (défaut).
+
+    Raises:
+        TypeError: Si ``api_client`` est un client synchrone.
+
+    Examples:
+        >>> code = AsyncCode(async_client)
+        >>> results = await code.search().in_code(NomCode.CC).text("bail").execute()
+    """
+
+    def __init__(self, api_client: "AsyncLegifranceClient", fond: str = "CODE_ETAT"):
+        require_async_client(api_client, "AsyncCode", "Code")
+        self.api = api_client
+        self.fond = fond
+
+    def search(self) -> AsyncCodeSearchBuilder:
+        """Démarre la construction d'une requête de recherche."""
+        return AsyncCodeSearchBuilder(self.api, self.fond)
+
+    def fetch_code(self, text_id: str) -> AsyncCodeConsultFetcher:
+        """Récupère le contenu complet d'un code juridique.
+
+        Args:
+            text_id: Identifiant LEGITEXT du code à récupérer.
+        """
+        return AsyncCodeConsultFetcher(self.api, text_id)
+
+    def fetch_article(self, article_id: str) -> AsyncArticleFetcher:
+        """Récupère un article en utilisant /consult/getArticle.
+
+        Args:
+            article_id: Identifiant LEGIARTI
+        """
+        if not article_id or not article_id.startswith("LEGIARTI"):
+            raise ValueError(f"Identifiant d'article invalide: {article_id}")
+        return AsyncArticleFetcher(self.api, article_id)
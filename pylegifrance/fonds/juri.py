@@ -1,10 +1,17 @@
-import json
+import asyncio
 import logging
 import re
+import threading
+from collections.abc import Iterator
 from datetime import date, datetime
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
+from pylegifrance.batch import DEFAULT_MAX_WORKERS, run_batch
 from pylegifrance.client import LegifranceClient
+from pylegifrance.exceptions import ClientError
+from pylegifrance.fonds._clients import require_async_client, require_sync_client
+from pylegifrance.hydration import envelope, is_trusted, validate_json
+from pylegifrance.instrumentation import log_payload
 from pylegifrance.models.generated.model import (
     ChampDTO,
     CritereDTO,
@@ -25,7 +32,17 @@ from pylegifrance.models.identifier import Cid, Eli, Nor
 from pylegifrance.models.juri.constants import FacettesJURI
 from pylegifrance.models.juri.models import Decision
 from pylegifrance.models.juri.search import SearchRequest
-from pylegifrance.utils import EnumEncoder
+from pylegifrance.pagination import (
+    DEFAULT_PAGE_SIZE,
+    SearchCounts,
+    count_payload,
+    iter_pages,
+    search_counts,
+)
+from pylegifrance.tracing import span
+
+if TYPE_CHECKING:
+    from pylegifrance.async_client import AsyncLegifranceClient
 
 HTTP_OK = 200
 CITATION_TYPE = "CITATION"
@@ -144,16 +161,30 @@ class JuriDecision:
     .latest(), .citations(), .versions(), et .at(date).
     """
 
-    def __init__(self, decision: Decision, client: LegifranceClient):
+    def __init__(self, decision: Decision, client: LegifranceClient | None):
         """Initialise une instance de JuriDecision.
 
         Args:
             decision: Le modèle Decision sous-jacent.
-            client: Le client pour interagir avec l'API Legifrance.
+            client: Le client pour interagir avec l'API Legifrance ; None
+                pour une décision obtenue par :class:`AsyncJuriAPI`.
         """
         self._decision = decision
         self._client = client
 
+    def _api(self) -> "JuriAPI":
+        """Façade utilisée pour naviguer depuis cette décision.
+
+        Raises:
+            TypeError: Si la décision a été obtenue par :class:`AsyncJuriAPI`.
+        """
+        if self._client is None:
+            raise TypeError(
+                "Décision obtenue par AsyncJuriAPI : sa navigation synchrone "
+                "n'est pas disponible, utilisez AsyncJuriAPI"
+            )
+        return JuriAPI(self._client)
+
     @property
     def id(self) -> str | None:
         """Récupère l'identifiant de la décision."""
@@ -369,7 +400,11 @@ class JuriDecision:
 
         Returns:
             Une liste d'objets JuriDecision représentant les citations.
+
+        Raises:
+            TypeError: Si la décision a été obtenue par :class:`AsyncJuriAPI`.
         """
+        api = self._api()
         citations = []
         for lien in self._decision.liens:
             if lien.type_lien != CITATION_TYPE:
@@ -378,7 +413,7 @@ class JuriDecision:
                 continue
 
             try:
-                decision = JuriAPI(self._client).fetch(lien.cid_texte)
+                decision = api.fetch(lien.cid_texte)
                 if decision:
                     citations.append(decision)
             except Exception:
@@ -396,6 +431,9 @@ class JuriDecision:
 
         Returns:
             La version de la décision à la date spécifiée, ou None si non trouvée.
+
+        Raises:
+            TypeError: Si la décision a été obtenue par :class:`AsyncJuriAPI`.
         """
         if isinstance(date, str):
             try:
@@ -407,10 +445,11 @@ class JuriDecision:
         date_str = date.isoformat()
 
         # Use the JuriAPI to fetch the version at the specified date
+        api = self._api()
         try:
             if self.id is None:
                 return None
-            return JuriAPI(self._client).fetch_version_at(self.id, date_str)
+            return api.fetch_version_at(self.id, date_str)
         except Exception:
             return None
 
@@ -419,12 +458,16 @@ class JuriDecision:
 
         Returns:
             La dernière version de la décision, ou None si non trouvée.
+
+        Raises:
+            TypeError: Si la décision a été obtenue par :class:`AsyncJuriAPI`.
         """
         if self.id is None:
             return None
 
+        api = self._api()
         try:
-            return JuriAPI(self._client).fetch(self.id)
+            return api.fetch(self.id)
         except Exception:
             return None
 
@@ -433,12 +476,16 @@ class JuriDecision:
 
         Returns:
             Une liste d'objets JuriDecision représentant toutes les versions.
+
+        Raises:
+            TypeError: Si la décision a été obtenue par :class:`AsyncJuriAPI`.
         """
         if self.id is None:
             return []
 
+        api = self._api()
         try:
-            return JuriAPI(self._client).fetch_versions(self.id)
+            return api.fetch_versions(self.id)
         except Exception:
             return []
 
@@ -467,12 +514,13 @@ class JuriDecision:
 
         from bs4 import BeautifulSoup
 
-        soup = BeautifulSoup(html, "html.parser")
-        for br in soup.find_all("br"):
-            br.replace_with(soup.new_string("\n"))
-        for tag in soup.find_all(["p", "div"]):
-            tag.insert_after(soup.new_string("\n"))
-        text = soup.get_text()
+        with span("juri.parse_html", chars=len(html)):
+            soup = BeautifulSoup(html, "html.parser")
+            for br in soup.find_all("br"):
+                br.replace_with(soup.new_string("\n"))
+            for tag in soup.find_all(["p", "div"]):
+                tag.insert_after(soup.new_string("\n"))
+            text = soup.get_text()
         text = re.sub(r"\n{3,}", "\n\n", text)
         return text.strip() or None
 
@@ -532,18 +580,114 @@ class JuriDecision:
         return f"JuriDecision(id={self.id}, date={self.date}, title={self.title})"
 
 
-class JuriAPI:
+# Clés d'un résultat ``/search`` reprises telles quelles dans le résumé
+# d'une LazyJuriDecision ; elles portent le même nom dans Decision.
+_SUMMARY_KEYS = ("num", "nature", "ecli", "formation", "juridiction", "solution")
+
+
+class _SummaryView:
+    """Vue du résumé d'une LazyJuriDecision.
+
+    Sert les champs présents dans le résultat de recherche et délègue tout
+    autre accès à la décision complète, consultée au premier besoin.
     """
-    API de haut niveau pour interagir avec les données JURI de l'API Legifrance.
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner: "LazyJuriDecision"):
+        self._owner = owner
+
+    def __getattr__(self, name: str) -> Any:
+        summary = self._owner._summary
+        if name in summary.model_fields_set:
+            return getattr(summary, name)
+        return getattr(self._owner._load(), name)
+
+
+class LazyJuriDecision(JuriDecision):
+    """
+    Décision construite à partir d'un résultat de recherche.
+
+    Renvoyée par ``JuriAPI.search(..., lazy=True)``. L'identifiant, le titre,
+    la date et les autres champs fournis par ``/search`` sont disponibles
+    sans appel réseau. Le premier accès à un champ absent du résultat de
+    recherche (``text``, ``text_html``, ``sommaire``, ``citations()``...)
+    déclenche une consultation ``/consult/juri`` ; la décision complète est
+    ensuite conservée.
     """
 
-    def __init__(self, client: LegifranceClient):
-        """Initialise une instance de JuriAPI.
+    def __init__(self, summary: Decision, client: LegifranceClient):
+        """Initialise une instance de LazyJuriDecision.
 
         Args:
-            client: Le client pour interagir avec l'API Legifrance.
+            summary: La décision partielle issue du résultat de recherche.
+            client: Le client utilisé pour la consultation différée.
         """
+        self._summary = summary
         self._client = client
+        self._full: Decision | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def _decision(self) -> Any:
+        if self._full is not None:
+            return self._full
+        return _SummaryView(self)
+
+    @property
+    def loaded(self) -> bool:
+        """Indique si la décision complète a été consultée."""
+        return self._full is not None
+
+    def _load(self) -> Decision:
+        """Consulte la décision complète, une seule fois.
+
+        Si la décision est introuvable, le résumé est conservé et les champs
+        absents valent None.
+
+        Raises:
+            Exception: Si l'appel API échoue ; l'accès suivant réessaie.
+        """
+        with self._lock:
+            if self._full is None:
+                text_id = self._summary.id
+                decision = self._api().fetch(text_id) if text_id else None
+                if decision is None:
+                    logger.warning(
+                        f"Décision {self._summary.id} introuvable, "
+                        "seul le résumé de recherche est disponible"
+                    )
+                    self._full = self._summary
+                else:
+                    self._full = decision._decision
+        return self._full
+
+    def __repr__(self) -> str:
+        """Représente la décision sans déclencher de consultation."""
+        summary = self._full or self._summary
+        return (
+            f"JuriDecision(id={summary.id}, date={summary.date_texte}, "
+            f"title={summary.titre})"
+        )
+
+
+class _JuriBase:
+    """
+    Construction des requêtes et lecture des réponses JURI.
+
+    Partagé par :class:`JuriAPI` et :class:`AsyncJuriAPI`, qui ne diffèrent
+    que par l'envoi des requêtes.
+    """
+
+    _client: "LegifranceClient | AsyncLegifranceClient"
+
+    def _navigation_client(self) -> LegifranceClient | None:
+        """Client rattaché aux décisions renvoyées.
+
+        None pour une façade asynchrone : la navigation depuis une décision
+        (``citations()``, ``versions()``...) est synchrone.
+        """
+        return None
 
     def _process_consult_response(self, response_data: dict) -> Decision | None:
         """Traite une réponse de consultation et extrait la Décision.
@@ -557,41 +701,296 @@ class JuriAPI:
         text_data = response_data.get("text")
         if not text_data:
             return None
-        return Decision.model_validate(text_data)
+        with span("validate", model="Decision"):
+            return Decision.model_validate(text_data)
 
-    def fetch(self, text_id: str) -> JuriDecision | None:
-        """Récupère une décision par son identifiant.
+    @staticmethod
+    def _decision_from_bytes(content: bytes) -> Decision | None:
+        """Valide la Décision directement depuis le corps brut de la réponse.
+
+        Chemin rapide des clients ``trust_responses=True`` : les autres
+        membres de la réponse ne sont pas matérialisés.
 
         Args:
-            text_id: L'identifiant de la décision à récupérer.
+            content: Le corps JSON de la réponse de consultation.
 
         Returns:
-            La décision, ou None si non trouvée.
+            L'objet Decision, ou None si la réponse n'en contient pas.
+        """
+        with span("validate", model="Decision", trusted=True):
+            decision = validate_json(envelope(Decision, "text"), content).text
+        if decision is None or not decision.model_fields_set:
+            return None
+        return decision
 
-        Raises:
-            ValueError: Si l'identifiant du texte est invalide.
-            Exception: Si l'appel à l'API échoue.
+    def _wrap_consult_response(self, response: Any) -> JuriDecision | None:
+        """Transforme une réponse de consultation en JuriDecision.
+
+        Args:
+            response: La réponse HTTP de ``/consult/juri``.
+
+        Returns:
+            La décision, ou None si la réponse est vide ou en erreur.
         """
+        if response.status_code != HTTP_OK:
+            return None
+
+        if is_trusted(self._client):
+            decision = self._decision_from_bytes(response.content)
+        else:
+            response_data = response.json()
+            log_payload(logger, "Données de réponse de consultation", response_data)
+            decision = self._process_consult_response(response_data)
+
+        if not decision:
+            return None
+
+        return JuriDecision(decision, self._navigation_client())
+
+    @staticmethod
+    def _fetch_payload(text_id: str) -> dict[str, Any]:
+        """Construit le corps de requête ``/consult/juri`` pour :meth:`fetch`."""
         if not text_id:
             raise ValueError("L'identifiant du texte ne peut pas être vide")
-
-        response = self._client.call_api(
-            "consult/juri",
-            JuriConsultRequest(textId=text_id, searchedString="").model_dump(
-                by_alias=True
-            ),
+        return JuriConsultRequest(textId=text_id, searchedString="").model_dump(
+            by_alias=True
         )
 
+    @staticmethod
+    def _search_payload(query: str | SearchRequest) -> dict[str, Any]:
+        """Construit le corps de requête ``/search`` à partir d'une requête."""
+        if isinstance(query, str):
+            search_query = SearchRequest(search=query)
+        else:
+            search_query = query
+
+        request_dto = search_query.to_api_model()
+
+        return request_dto.model_dump(by_alias=True, mode="json")
+
+    @classmethod
+    def _extract_hits(cls, response: Any) -> list[dict[str, Any]]:
+        """Extrait les résultats exploitables d'une réponse ``/search``.
+
+        Args:
+            response: La réponse HTTP de ``/search``.
+
+        Returns:
+            Les résultats dont ``titles[0].id`` est renseigné, dans l'ordre.
+        """
         if response.status_code != HTTP_OK:
-            return None
+            return []
 
         response_data = response.json()
-        decision = self._process_consult_response(response_data)
+        log_payload(logger, "Données de réponse de recherche", response_data)
 
-        if not decision:
-            return None
+        if "results" not in response_data or not isinstance(
+            response_data["results"], list
+        ):
+            return []
+
+        return cls._valid_hits(response_data["results"])
+
+    @staticmethod
+    def _valid_hits(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Filtre les résultats ``/search`` dont ``titles[0].id`` est renseigné."""
+        hits = []
+        for result in results:
+            if (
+                "titles" not in result
+                or not isinstance(result["titles"], list)
+                or len(result["titles"]) == 0
+            ):
+                continue
+
+            title = result["titles"][0]
+
+            if "id" not in title:
+                continue
+
+            hits.append(result)
+        return hits
+
+    @classmethod
+    def _extract_hit_ids(cls, response: Any) -> list[str]:
+        """Extrait les identifiants ``results[].titles[0].id`` d'une réponse ``/search``.
+
+        Args:
+            response: La réponse HTTP de ``/search``.
+
+        Returns:
+            Les identifiants des décisions trouvées, dans l'ordre des résultats.
+        """
+        return [hit["titles"][0]["id"] for hit in cls._extract_hits(response)]
+
+    @staticmethod
+    def _summary_from_hit(hit: dict[str, Any]) -> Decision:
+        """Construit la Décision partielle décrite par un résultat ``/search``.
+
+        Seuls les champs effectivement fournis par le résultat sont
+        renseignés, afin que :class:`LazyJuriDecision` sache lesquels
+        nécessitent une consultation.
+        """
+        title = hit["titles"][0]
+        data = {key: hit[key] for key in _SUMMARY_KEYS if hit.get(key) is not None}
+        for key, alias in (
+            ("id", "id"),
+            ("cid", "cid"),
+            ("title", "titre"),
+        ):
+            if title.get(key) is not None:
+                data[alias] = title[key]
+        if hit.get("date") is not None:
+            data["dateTexte"] = hit["date"]
+        if hit.get("origin") is not None:
+            data["origine"] = hit["origin"]
+
+        try:
+            return Decision.model_validate(data)
+        except Exception as e:
+            logger.warning(
+                f"Résultat de recherche {title['id']} partiellement invalide: {e}"
+            )
+            return Decision.model_validate({"id": title["id"]})
+
+    @staticmethod
+    def _collect_hydrated(
+        results: list[JuriDecision], text_id: str, decision: JuriDecision | None
+    ) -> None:
+        if decision:
+            results.append(decision)
+            logger.debug(f"Décision {text_id} récupérée et ajoutée avec succès")
+        else:
+            logger.warning(
+                f"Échec de récupération de la décision {text_id} (a retourné None)"
+            )
+
+    @staticmethod
+    def _fetch_by_id_payload(text_id: str) -> dict[str, Any]:
+        """Valide ``text_id`` et construit le corps de :meth:`fetch_by_id`."""
+        if not text_id or not text_id.strip():
+            raise ValueError("L'identifiant du texte ne peut pas être vide")
+
+        normalized = text_id.strip()
+        if not JURI_TEXT_ID_PATTERN.match(normalized):
+            raise ValueError(
+                "Invalid text_id format: expected JURITEXT<12 digits> or "
+                f"CETATEXT<12 digits>, got {text_id!r}"
+            )
+
+        # Match the DILA API cookbook example for POST /consult/juri which
+        # sends only ``{"textId": ...}``. Excluding None keeps the body
+        # minimal and avoids transmitting a dangling ``"searchedString":
+        # null`` that is not part of the documented contract.
+        return JuriConsultRequest(textId=normalized, searchedString=None).model_dump(
+            by_alias=True, exclude_none=True
+        )
+
+    @staticmethod
+    def _is_unknown_text_id_error(exc: Exception, text_id: str) -> bool:
+        """Reconnaît la réponse HTTP 400 « textId inconnu » de ``/consult/juri``.
+
+        Only the very specific "unknown textId" 400 signature is translated
+        into ``None``; every other failure propagates so the caller can
+        distinguish "not found" from "could not verify". Clients raise a
+        :class:`~pylegifrance.exceptions.ClientError`; plain exceptions
+        carrying the historical ``"API client error <code> - <body>"``
+        message (custom clients, test doubles) are still recognised.
+        """
+        if isinstance(exc, ClientError):
+            matched = exc.status_code == 400 and _UNKNOWN_TEXT_ID_MARKER in exc.body
+        else:
+            message = str(exc)
+            matched = "400" in message and _UNKNOWN_TEXT_ID_MARKER in message
+        if matched:
+            logger.debug(
+                "fetch_by_id: Legifrance reported unknown textId %s "
+                "(HTTP 400 'L'expression à valider est fausse'); "
+                "returning None.",
+                text_id,
+            )
+        return matched
+
+    def _build_field_search_dto(
+        self,
+        *,
+        value: str,
+        type_champ: TypeChamp,
+        fond: Fond,
+        filters: list[FiltreDTO] | None = None,
+    ) -> SearchRequestDTO:
+        """Build a :class:`SearchRequestDTO` for a single exact field search.
+
+        Mirrors the helpers on
+        :class:`pylegifrance.models.juri.search.SearchRequest` but operates
+        directly on DTOs so we can target fonds other than JURI and field
+        types (ECLI, NUM_AFFAIRE...) that the higher-level ``SearchRequest``
+        wrapper does not currently expose.
+        """
+        criteria = CritereDTO(
+            valeur=value,
+            operateur=Operateur.et,
+            typeRecherche=TypeRecherche.exacte,
+            proximite=None,
+            criteres=None,
+        )
+        champ = ChampDTO(
+            criteres=[criteria],
+            operateur=Operateur.et,
+            typeChamp=type_champ,
+        )
+        recherche = RechercheSpecifiqueDTO(
+            champs=[champ],
+            filtres=filters or [],
+            pageNumber=1,
+            pageSize=10,
+            sort="PERTINENCE",
+            fromAdvancedRecherche=False,
+            secondSort="ID",
+            typePagination=TypePagination.defaut,
+            operateur=Operateur.et,
+        )
+        return SearchRequestDTO(recherche=recherche, fond=fond)
+
+
+class JuriAPI(_JuriBase):
+    """
+    API de haut niveau pour interagir avec les données JURI de l'API Legifrance.
+    """
+
+    _client: LegifranceClient
+
+    def __init__(self, client: LegifranceClient):
+        """Initialise une instance de JuriAPI.
+
+        Args:
+            client: Le client pour interagir avec l'API Legifrance.
+
+        Raises:
+            TypeError: Si ``client`` est un client asynchrone.
+        """
+        require_sync_client(client, "JuriAPI", "AsyncJuriAPI")
+        self._client = client
+
+    def _navigation_client(self) -> LegifranceClient | None:
+        return self._client
+
+    def fetch(self, text_id: str) -> JuriDecision | None:
+        """Récupère une décision par son identifiant.
+
+        Args:
+            text_id: L'identifiant de la décision à récupérer.
+
+        Returns:
+            La décision, ou None si non trouvée.
 
-        return JuriDecision(decision, self._client)
+        Raises:
+            ValueError: Si l'identifiant du texte est invalide.
+            Exception: Si l'appel à l'API échoue.
+        """
+        payload = self._fetch_payload(text_id)
+        response = self._client.call_api("consult/juri", payload)
+        return self._wrap_consult_response(response)
 
     def fetch_with_ancien_id(self, ancien_id: str) -> JuriDecision | None:
         """Récupère une décision par son ancien identifiant.
@@ -610,16 +1009,7 @@ class JuriAPI:
             JuriConsultWithAncienId(ancienId=ancien_id).model_dump(by_alias=True),
         )
 
-        if response.status_code != HTTP_OK:
-            return None
-
-        response_data = response.json()
-        decision = self._process_consult_response(response_data)
-
-        if not decision:
-            return None
-
-        return JuriDecision(decision, self._client)
+        return self._wrap_consult_response(response)
 
     def fetch_version_at(self, text_id: str, date: str) -> JuriDecision | None:
         """Récupère la version d'une décision à une date spécifique.
@@ -642,16 +1032,7 @@ class JuriAPI:
         request = {"textId": text_id, "date": date}
         response = self._client.call_api("consult/juri/version", request)
 
-        if response.status_code != HTTP_OK:
-            return None
-
-        response_data = response.json()
-        decision = self._process_consult_response(response_data)
-
-        if not decision:
-            return None
-
-        return JuriDecision(decision, self._client)
+        return self._wrap_consult_response(response)
 
     def fetch_versions(self, text_id: str) -> list[JuriDecision]:
         """Récupère toutes les versions d'une décision.
@@ -684,68 +1065,173 @@ class JuriAPI:
 
         return versions
 
-    def search(self, query: str | SearchRequest) -> list[JuriDecision]:
+    def _hydrate(
+        self, text_ids: list[str], max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> list[JuriDecision]:
+        """Récupère les décisions correspondant aux identifiants de recherche.
+
+        Les consultations s'exécutent sur ``max_workers`` threads au plus
+        (voir :func:`~pylegifrance.batch.run_batch`) ; l'ordre des résultats
+        de recherche est conservé. Les identifiants dont la récupération
+        échoue sont ignorés.
+
+        Raises:
+            ValueError: Si ``max_workers`` est inférieur à 1.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers doit être supérieur ou égal à 1")
+        if not text_ids:
+            return []
+
+        results: list[JuriDecision] = []
+        workers = min(max_workers, len(text_ids))
+        for outcome in run_batch(self.fetch, text_ids, max_workers=workers):
+            if not outcome.ok:
+                logger.error(
+                    "Exception lors de la récupération de la décision "
+                    f"{outcome.payload}: {outcome.error}"
+                )
+                continue
+            self._collect_hydrated(results, outcome.payload, outcome.value)
+        return results
+
+    def search(
+        self,
+        query: str | SearchRequest,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        lazy: bool = False,
+    ) -> list[JuriDecision]:
         """Recherche des décisions correspondant à la requête.
 
+        Chaque résultat est ensuite récupéré par ``/consult/juri`` ; ces
+        consultations s'exécutent en parallèle, ``max_workers`` au plus à la
+        fois, et l'ordre des résultats de recherche est conservé.
+
+        Avec ``lazy=True``, aucune consultation n'est faite : chaque résultat
+        devient une :class:`LazyJuriDecision` construite à partir de la
+        réponse ``/search``, qui ne consulte la décision complète qu'au
+        premier accès à un champ absent de cette réponse.
+
+        Si ``query.fetch_all`` est vrai, toutes les pages de résultats sont
+        parcourues (voir :meth:`iter_search`), ``query.page_size`` résultats
+        à la fois, et ``page_number`` est ignoré.
+
         Args:
             query: La requête de recherche, soit sous forme de chaîne, soit sous forme d'objet SearchRequest.
+            max_workers: Nombre maximal de consultations simultanées. ``1``
+                les exécute l'une après l'autre. Ne devrait pas dépasser
+                ``ApiConfig.pool_maxsize``.
+            lazy: Renvoie des décisions consultées à la demande.
 
         Returns:
             Une liste d'objets JuriDecision correspondant à la requête.
-        """
-        if isinstance(query, str):
-            search_query = SearchRequest(search=query)
-        else:
-            search_query = query
 
-        request_dto = search_query.to_api_model()
-
-        request = request_dto.model_dump(by_alias=True)
-        request = json.loads(json.dumps(request, cls=EnumEncoder))
-
-        response = self._client.call_api("search", request)
+        Raises:
+            ValueError: Si ``max_workers`` est inférieur à 1.
+        """
+        if isinstance(query, SearchRequest) and query.fetch_all:
+            return list(
+                self.iter_search(
+                    query,
+                    page_size=query.page_size,
+                    max_workers=max_workers,
+                    lazy=lazy,
+                )
+            )
 
-        if response.status_code != HTTP_OK:
-            return []
+        with span("juri.search") as current:
+            response = self._client.call_api("search", self._search_payload(query))
+            hits = self._extract_hits(response)
+            current.set_attribute("hits", len(hits))
+            if lazy:
+                return [
+                    LazyJuriDecision(self._summary_from_hit(hit), self._client)
+                    for hit in hits
+                ]
+            return self._hydrate([hit["titles"][0]["id"] for hit in hits], max_workers)
+
+    def iter_search(
+        self,
+        query: str | SearchRequest,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_results: int | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        lazy: bool = False,
+        page_workers: int = 1,
+    ) -> Iterator[JuriDecision]:
+        """Parcourt toutes les pages de résultats d'une recherche.
+
+        Les pages sont demandées l'une après l'autre (voir
+        :func:`~pylegifrance.pagination.iter_pages`) : la page suivante est
+        déjà en cours de récupération pendant que l'appelant traite la
+        page courante. Les décisions de chaque page sont récupérées comme
+        par :meth:`search`. La mémoire utilisée ne dépend pas du nombre
+        total de résultats.
+
+        Avec ``page_workers`` supérieur à 1, les pages qui suivent la
+        première sont demandées en parallèle, toujours produites dans
+        l'ordre ; une recherche de plus de 10 000 résultats est découpée
+        sur sa facette de date (``date_facet``, ``DATE_DECISION`` par
+        défaut) et parcourue des décisions les plus anciennes aux plus
+        récentes.
 
-        response_data = response.json()
+        Args:
+            query: La requête de recherche ; sa pagination est ignorée.
+            page_size: Nombre de résultats par page (100 au plus).
+            max_results: Nombre maximal de résultats de recherche parcourus.
+                Si None, la recherche est parcourue jusqu'au dernier.
+            max_workers: Nombre maximal de consultations simultanées.
+            lazy: Renvoie des :class:`LazyJuriDecision`, sans consultation.
+            page_workers: Nombre de pages demandées simultanément après la
+                première, pour les exports volumineux. 1 parcourt les pages
+                l'une après l'autre.
+
+        Yields:
+            Les décisions, dans l'ordre des résultats de recherche.
 
-        if "results" not in response_data or not isinstance(
-            response_data["results"], list
+        Raises:
+            ValueError: Si ``page_size``, ``max_results``, ``max_workers`` ou
+                ``page_workers`` est hors limites.
+        """
+        if isinstance(query, str):
+            query = SearchRequest(search=query)
+        for page in iter_pages(
+            self._client,
+            self._search_payload(query),
+            page_size=page_size,
+            max_results=max_results,
+            max_workers=page_workers,
+            split_facet=query.date_facet,
         ):
-            return []
-
-        results = []
-        for result in response_data["results"]:
-            if (
-                "titles" not in result
-                or not isinstance(result["titles"], list)
-                or len(result["titles"]) == 0
-            ):
-                continue
+            hits = self._valid_hits(page.results)
+            if lazy:
+                for hit in hits:
+                    yield LazyJuriDecision(self._summary_from_hit(hit), self._client)
+            else:
+                ids = [hit["titles"][0]["id"] for hit in hits]
+                yield from self._hydrate(ids, max_workers)
 
-            title = result["titles"][0]
-
-            if "id" not in title:
-                continue
+    def count(self, query: str | SearchRequest) -> SearchCounts:
+        """Compte les résultats d'une recherche, sans récupérer les décisions.
 
-            text_id = title["id"]
+        Une seule requête ``/search`` est envoyée, pour un seul résultat ;
+        aucune consultation ne suit. Adapté aux tableaux de bord qui
+        comptent de nombreuses variantes d'une requête.
 
-            try:
-                decision = self.fetch(text_id)
-                if decision:
-                    results.append(decision)
-                    logger.debug(f"Décision {text_id} récupérée et ajoutée avec succès")
-                else:
-                    logger.warning(
-                        f"Échec de récupération de la décision {text_id} (a retourné None)"
-                    )
-            except Exception as e:
-                logger.error(
-                    f"Exception lors de la récupération de la décision {text_id}: {e}"
-                )
+        Args:
+            query: La requête de recherche ; sa pagination est ignorée.
 
-        return results
+        Returns:
+            Le nombre total de résultats et les effectifs par valeur de
+            facette renvoyés par l'API.
+        """
+        with span("juri.count"):
+            response = self._client.call_api(
+                "search", count_payload(self._search_payload(query))
+            )
+            return search_counts(response)
 
     def fetch_by_id(self, text_id: str) -> JuriDecision | None:
         """Verify and fetch a decision by its canonical Legifrance identifier.
@@ -801,56 +1287,23 @@ class JuriAPI:
             >>> if decision is None:
             ...     raise ValueError("Decision does not exist on Legifrance")
         """
-        if not text_id or not text_id.strip():
-            raise ValueError("L'identifiant du texte ne peut pas être vide")
-
-        normalized = text_id.strip()
-        if not JURI_TEXT_ID_PATTERN.match(normalized):
-            raise ValueError(
-                "Invalid text_id format: expected JURITEXT<12 digits> or "
-                f"CETATEXT<12 digits>, got {text_id!r}"
-            )
-
-        # Match the DILA API cookbook example for POST /consult/juri which
-        # sends only ``{"textId": ...}``. Excluding None keeps the body
-        # minimal and avoids transmitting a dangling ``"searchedString":
-        # null`` that is not part of the documented contract.
+        payload = self._fetch_by_id_payload(text_id)
         try:
-            response = self._client.call_api(
-                "consult/juri",
-                JuriConsultRequest(textId=normalized, searchedString=None).model_dump(
-                    by_alias=True, exclude_none=True
-                ),
-            )
+            response = self._client.call_api("consult/juri", payload)
         except Exception as exc:
-            # LegifranceClient wraps 4xx/5xx responses into plain
-            # ``Exception("API client error <code> - <body>")``. We only
-            # translate the very specific "unknown textId" 400 signature
-            # into ``None``; every other failure propagates so the caller
-            # can distinguish "not found" from "could not verify".
-            message = str(exc)
-            if "400" in message and _UNKNOWN_TEXT_ID_MARKER in message:
-                logger.debug(
-                    "fetch_by_id: Legifrance reported unknown textId %s "
-                    "(HTTP 400 'L'expression à valider est fausse'); "
-                    "returning None.",
-                    normalized,
-                )
+            if self._is_unknown_text_id_error(exc, payload["textId"]):
                 return None
             raise
 
-        if response.status_code != HTTP_OK:
-            return None
+        return self._wrap_consult_response(response)
 
-        response_data = response.json()
-        decision = self._process_consult_response(response_data)
-
-        if decision is None:
-            return None
-
-        return JuriDecision(decision, self._client)
-
-    def search_by_ecli(self, ecli: str, *, fond: str = "JURI") -> list[JuriDecision]:
+    def search_by_ecli(
+        self,
+        ecli: str,
+        *,
+        fond: str = "JURI",
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> list[JuriDecision]:
         """Resolve a European Case Law Identifier (ECLI) to Legifrance decisions.
 
         Wraps ``POST /search`` with a field search on ``typeChamp=ECLI``
@@ -869,6 +1322,8 @@ class JuriAPI:
                 (judicial case law — Cour de cassation, cours d'appel,
                 tribunaux judiciaires). Use ``"CETAT"`` to search the
                 administrative case law corpus (Conseil d'État) instead.
+            max_workers: Maximum number of concurrent ``/consult/juri``
+                calls hydrating the matches, see :meth:`search`.
 
         Returns:
             A list of matching :class:`JuriDecision` objects. Empty list if
@@ -904,7 +1359,7 @@ class JuriAPI:
             fond=fond_dto,
         )
 
-        return self._run_search_dto(request_dto)
+        return self._run_search_dto(request_dto, max_workers)
 
     def search_by_affaire(
         self,
@@ -913,6 +1368,7 @@ class JuriAPI:
         formation: str | None = None,
         date_decision: date | None = None,
         date_range: tuple[date, date] | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> list[JuriDecision]:
         """Exact-tuple lookup for Cassation-style case citations.
 
@@ -943,6 +1399,8 @@ class JuriAPI:
                 with ``date_range``.
             date_range: Optional ``(start, end)`` inclusive date range for
                 the decision date. Mutually exclusive with ``date_decision``.
+            max_workers: Maximum number of concurrent ``/consult/juri``
+                calls hydrating the matches, see :meth:`search`.
 
         Returns:
             A list of matching :class:`JuriDecision` objects. Empty list if
@@ -1025,93 +1483,105 @@ class JuriAPI:
             filters=filters,
         )
 
-        return self._run_search_dto(request_dto)
+        return self._run_search_dto(request_dto, max_workers)
 
-    def _build_field_search_dto(
-        self,
-        *,
-        value: str,
-        type_champ: TypeChamp,
-        fond: Fond,
-        filters: list[FiltreDTO] | None = None,
-    ) -> SearchRequestDTO:
-        """Build a :class:`SearchRequestDTO` for a single exact field search.
-
-        Mirrors the helpers on
-        :class:`pylegifrance.models.juri.search.SearchRequest` but operates
-        directly on DTOs so we can target fonds other than JURI and field
-        types (ECLI, NUM_AFFAIRE...) that the higher-level ``SearchRequest``
-        wrapper does not currently expose.
-        """
-        criteria = CritereDTO(
-            valeur=value,
-            operateur=Operateur.et,
-            typeRecherche=TypeRecherche.exacte,
-            proximite=None,
-            criteres=None,
-        )
-        champ = ChampDTO(
-            criteres=[criteria],
-            operateur=Operateur.et,
-            typeChamp=type_champ,
-        )
-        recherche = RechercheSpecifiqueDTO(
-            champs=[champ],
-            filtres=filters or [],
-            pageNumber=1,
-            pageSize=10,
-            sort="PERTINENCE",
-            fromAdvancedRecherche=False,
-            secondSort="ID",
-            typePagination=TypePagination.defaut,
-            operateur=Operateur.et,
-        )
-        return SearchRequestDTO(recherche=recherche, fond=fond)
-
-    def _run_search_dto(self, request_dto: SearchRequestDTO) -> list[JuriDecision]:
+    def _run_search_dto(
+        self, request_dto: SearchRequestDTO, max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> list[JuriDecision]:
         """Execute a prepared search DTO and hydrate matches into JuriDecisions.
 
-        Mirrors the post-processing loop of :meth:`search`: walks the
+        Mirrors the post-processing of :meth:`search`: walks the
         ``results[].titles[0].id`` path and calls :meth:`fetch` for each
-        hit so callers uniformly receive rich :class:`JuriDecision`
-        instances. Matches the behaviour of :meth:`search` for parity.
+        hit, at most ``max_workers`` at a time, so callers uniformly receive
+        rich :class:`JuriDecision` instances in result order. Matches the
+        behaviour of :meth:`search` for parity.
         """
-        request = request_dto.model_dump(by_alias=True)
-        request = json.loads(json.dumps(request, cls=EnumEncoder))
+        request = request_dto.model_dump(by_alias=True, mode="json")
 
         response = self._client.call_api("search", request)
+        return self._hydrate(self._extract_hit_ids(response), max_workers)
 
-        if response.status_code != HTTP_OK:
-            return []
 
-        response_data = response.json()
+class AsyncJuriAPI(_JuriBase):
+    """
+    Équivalent asynchrone de :class:`JuriAPI`.
 
-        if "results" not in response_data or not isinstance(
-            response_data["results"], list
-        ):
-            return []
+    Les décisions renvoyées ne sont pas rattachées à un client synchrone :
+    leurs méthodes de navigation (``citations()``, ``versions()``...)
+    lèvent TypeError.
+    """
 
-        results: list[JuriDecision] = []
-        for result in response_data["results"]:
-            if (
-                "titles" not in result
-                or not isinstance(result["titles"], list)
-                or len(result["titles"]) == 0
-            ):
-                continue
+    _client: "AsyncLegifranceClient"
 
-            title = result["titles"][0]
-            if "id" not in title:
-                continue
+    def __init__(self, client: "AsyncLegifranceClient"):
+        """Initialise une instance de AsyncJuriAPI.
 
-            text_id = title["id"]
-            try:
-                decision = self.fetch(text_id)
-                if decision is not None:
-                    results.append(decision)
-            except Exception as exc:
+        Args:
+            client: Le client asynchrone pour interagir avec l'API Legifrance.
+
+        Raises:
+            TypeError: Si ``client`` est un client synchrone.
+        """
+        require_async_client(client, "AsyncJuriAPI", "JuriAPI")
+        self._client = client
+
+    async def fetch(self, text_id: str) -> JuriDecision | None:
+        """Version asynchrone de :meth:`JuriAPI.fetch`."""
+        payload = self._fetch_payload(text_id)
+        response = await self._client.call_api("consult/juri", payload)
+        return self._wrap_consult_response(response)
+
+    async def _hydrate(self, text_ids: list[str]) -> list[JuriDecision]:
+        """Version asynchrone de :meth:`JuriAPI._hydrate`.
+
+        Les consultations sont lancées simultanément ; le client asynchrone
+        borne le nombre d'appels effectivement en vol. L'ordre des résultats
+        de recherche est conservé.
+        """
+        fetched = await asyncio.gather(
+            *(self.fetch(text_id) for text_id in text_ids), return_exceptions=True
+        )
+        results: list[JuriDecision] = []
+        for text_id, decision in zip(text_ids, fetched, strict=True):
+            if isinstance(decision, BaseException):
                 logger.error(
-                    f"Exception lors de la récupération de la décision {text_id}: {exc}"
+                    f"Exception lors de la récupération de la décision {text_id}: {decision}"
                 )
-
+                continue
+            self._collect_hydrated(results, text_id, decision)
         return results
+
+    async def search(self, query: str | SearchRequest) -> list[JuriDecision]:
+        """Version asynchrone de :meth:`JuriAPI.search`.
+
+        Les ``N`` consultations ``/consult/juri`` qui suivent la recherche
+        sont exécutées en parallèle, dans la limite de concurrence du
+        :class:`~pylegifrance.async_client.AsyncLegifranceClient`.
+        """
+        with span("juri.asearch") as current:
+            response = await self._client.call_api(
+                "search", self._search_payload(query)
+            )
+            text_ids = self._extract_hit_ids(response)
+            current.set_attribute("hits", len(text_ids))
+            return await self._hydrate(text_ids)
+
+    async def count(self, query: str | SearchRequest) -> SearchCounts:
+        """Version asynchrone de :meth:`JuriAPI.count`."""
+        with span("juri.acount"):
+            response = await self._client.call_api(
+                "search", count_payload(self._search_payload(query))
+            )
+            return search_counts(response)
+
+    async def fetch_by_id(self, text_id: str) -> JuriDecision | None:
+        """Version asynchrone de :meth:`JuriAPI.fetch_by_id`."""
+        payload = self._fetch_by_id_payload(text_id)
+        try:
+            response = await self._client.call_api("consult/juri", payload)
+        except Exception as exc:
+            if self._is_unknown_text_id_error(exc, payload["textId"]):
+                return None
+            raise
+
+        return self._wrap_consult_response(response)
@@ -10,7 +10,8 @@ accords. Les objets sont organisés en deux niveaux :
   articles.
 
 Cette façade expose un :class:`KaliAPI` mince (inspiré de
-:class:`pylegifrance.fonds.juri.JuriAPI`) et deux wrappers de domaine,
+:class:`pylegifrance.fonds.juri.JuriAPI`), sa variante asynchrone
+:class:`AsyncKaliAPI`, et deux wrappers de domaine,
 :class:`ConventionCollective` et :class:`TexteKali`. KALI n'exposant pas
 d'endpoint ``versions`` / ``version/at``, aucun équivalent à
 ``.at(date)`` ou ``.versions()`` n'est fourni.
@@ -26,12 +27,18 @@ section *Présentation du Consult*) :
 - ``POST /consult/kaliArticle`` — texte parent d'un article.
 """
 
-import json
+import asyncio
 import logging
 import re
-from typing import Any
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
 
 from pylegifrance.client import LegifranceClient
+from pylegifrance.fonds._clients import require_async_client, require_sync_client
+from pylegifrance.hydration import is_trusted, validate_json
+from pylegifrance.instrumentation import log_payload
 from pylegifrance.models.generated.model import (
     ConsultKaliContResponse,
     ConsultKaliTextResponse,
@@ -41,8 +48,19 @@ from pylegifrance.models.generated.model import (
     KaliTextConsultRequest,
     KaliTextConsultSectionRequest,
 )
+from pylegifrance.models.kali.enum import FacettesKALI
 from pylegifrance.models.kali.search import SearchRequest
-from pylegifrance.utils import EnumEncoder
+from pylegifrance.pagination import (
+    DEFAULT_PAGE_SIZE,
+    SearchCounts,
+    count_payload,
+    iter_pages,
+    search_counts,
+)
+from pylegifrance.tracing import span, traced
+
+if TYPE_CHECKING:
+    from pylegifrance.async_client import AsyncLegifranceClient
 
 HTTP_OK = 200
 
@@ -65,7 +83,7 @@ logger = logging.getLogger(__name__)
 class ConventionCollective:
     """Conteneur d'une convention collective (niveau IDCC)."""
 
-    def __init__(self, data: ConsultKaliContResponse, client: LegifranceClient):
+    def __init__(self, data: ConsultKaliContResponse, client: LegifranceClient | None):
         self._data = data
         self._client = client
 
@@ -138,7 +156,7 @@ class ConventionCollective:
 class TexteKali:
     """Texte individuel du fond KALI (texte de base, avenant, accord)."""
 
-    def __init__(self, data: ConsultKaliTextResponse, client: LegifranceClient):
+    def __init__(self, data: ConsultKaliTextResponse, client: LegifranceClient | None):
         self._data = data
         self._client = client
 
@@ -249,104 +267,269 @@ class TexteKali:
         )
 
 
-class KaliAPI:
-    """API haut niveau pour le fond KALI."""
+class _KaliBase:
+    """Construction des requêtes et lecture des réponses KALI.
 
-    def __init__(self, client: LegifranceClient):
-        self._client = client
+    Partagé par :class:`KaliAPI` et :class:`AsyncKaliAPI`, qui ne diffèrent
+    que par l'envoi des requêtes.
+    """
 
-    def fetch_container(self, kali_id: str) -> ConventionCollective | None:
-        """Récupère un conteneur par son identifiant ``KALICONT``.
+    _client: "LegifranceClient | AsyncLegifranceClient"
 
-        Wraps ``POST /consult/kaliCont``.
-        """
+    def _navigation_client(self) -> LegifranceClient | None:
+        """Client rattaché aux objets renvoyés, None pour une façade asynchrone."""
+        return None
+
+    @staticmethod
+    def _container_request(kali_id: str) -> tuple[str, dict[str, Any]]:
         if not kali_id or not kali_id.strip():
             raise ValueError("kali_id ne peut pas être vide")
         payload = KaliContConsultRequest(id=kali_id.strip()).model_dump(
             by_alias=True, exclude_none=True
         )
-        response = self._client.call_api("consult/kaliCont", payload)
-        return self._wrap_container(response.json())
+        return "consult/kaliCont", payload
 
-    def fetch_by_idcc(self, idcc: str | int) -> ConventionCollective | None:
-        """Récupère un conteneur par son numéro IDCC.
-
-        Wraps ``POST /consult/kaliContIdcc``. ``idcc`` doit être un
-        entier ou une chaîne de chiffres (ex: ``"1261"``).
-        """
+    @staticmethod
+    def _idcc_request(idcc: str | int) -> tuple[str, dict[str, Any]]:
         idcc_str = str(idcc).strip()
         if not _IDCC_PATTERN.match(idcc_str):
             raise ValueError(
                 f"IDCC invalide: {idcc!r}. Attendu: 1 à 5 chiffres (ex: '1261')."
             )
         payload = KaliContConsultIdccRequest(id=idcc_str).model_dump(by_alias=True)
-        response = self._client.call_api("consult/kaliContIdcc", payload)
-        return self._wrap_container(response.json())
-
-    def fetch_text(self, kali_id: str) -> TexteKali | None:
-        """Récupère un texte KALI par son identifiant ``KALITEXT``.
+        return "consult/kaliContIdcc", payload
 
-        Wraps ``POST /consult/kaliText``.
-        """
+    @staticmethod
+    def _text_request(kali_id: str) -> tuple[str, dict[str, Any]]:
         if not kali_id or not kali_id.strip():
             raise ValueError("kali_id ne peut pas être vide")
         payload = KaliTextConsultRequest(id=kali_id.strip()).model_dump(
             by_alias=True, exclude_none=True
         )
-        response = self._client.call_api("consult/kaliText", payload)
-        return self._wrap_text(response.json())
-
-    def fetch_article(self, article_id: str) -> TexteKali | None:
-        """Récupère le texte parent contenant un article ``KALIARTI``.
+        return "consult/kaliText", payload
 
-        Wraps ``POST /consult/kaliArticle``. Le endpoint retourne le
-        texte entier contextualisé autour de l'article demandé.
-        """
+    @staticmethod
+    def _article_request(article_id: str) -> tuple[str, dict[str, Any]]:
         if not article_id or not article_id.strip():
             raise ValueError("article_id ne peut pas être vide")
         payload = KaliTextConsultArticleRequest(id=article_id.strip()).model_dump(
             by_alias=True
         )
-        response = self._client.call_api("consult/kaliArticle", payload)
-        return self._wrap_text(response.json())
-
-    def fetch_section(self, section_id: str) -> TexteKali | None:
-        """Récupère le texte parent contenant une section ``KALISCTA``.
+        return "consult/kaliArticle", payload
 
-        Wraps ``POST /consult/kaliSection``.
-        """
+    @staticmethod
+    def _section_request(section_id: str) -> tuple[str, dict[str, Any]]:
         if not section_id or not section_id.strip():
             raise ValueError("section_id ne peut pas être vide")
         payload = KaliTextConsultSectionRequest(id=section_id.strip()).model_dump(
             by_alias=True
         )
-        response = self._client.call_api("consult/kaliSection", payload)
-        return self._wrap_text(response.json())
+        return "consult/kaliSection", payload
 
-    def fetch(self, kali_id: str) -> ConventionCollective | TexteKali | None:
-        """Dispatcher basé sur le préfixe de l'identifiant.
+    @staticmethod
+    def _dispatch_name(kali_id: str) -> tuple[str, str]:
+        """Associe un identifiant KALI au nom de la méthode ``fetch_*`` adaptée.
 
-        - ``KALICONT`` → :meth:`fetch_container`
-        - ``KALITEXT`` → :meth:`fetch_text`
-        - ``KALIARTI`` → :meth:`fetch_article`
-        - ``KALISCTA`` → :meth:`fetch_section`
+        Returns:
+            Le couple ``(nom de méthode, identifiant normalisé)``.
         """
         if not kali_id or not kali_id.strip():
             raise ValueError("kali_id ne peut pas être vide")
         normalized = kali_id.strip()
         if normalized.startswith(KALI_CONT_PREFIX):
-            return self.fetch_container(normalized)
+            return "fetch_container", normalized
         if normalized.startswith(KALI_TEXT_PREFIX):
-            return self.fetch_text(normalized)
+            return "fetch_text", normalized
         if normalized.startswith(KALI_ARTI_PREFIX):
-            return self.fetch_article(normalized)
+            return "fetch_article", normalized
         if normalized.startswith(KALI_SCTA_PREFIX):
-            return self.fetch_section(normalized)
+            return "fetch_section", normalized
         raise ValueError(
             f"Préfixe KALI inconnu dans {kali_id!r}. "
             f"Attendu un des: {', '.join(KALI_PREFIXES)}."
         )
 
+    @staticmethod
+    def _search_payload(query: str | SearchRequest) -> dict[str, Any]:
+        if isinstance(query, str):
+            search_query = SearchRequest(search=query)
+        else:
+            search_query = query
+
+        request_dto = search_query.to_api_model()
+        return request_dto.model_dump(by_alias=True, mode="json")
+
+    def _extract_search_ids(self, response: Any) -> list[str]:
+        if response.status_code != HTTP_OK:
+            return []
+
+        response_data = response.json()
+        log_payload(logger, "Données de réponse de recherche", response_data)
+        raw_results = response_data.get("results")
+        if not isinstance(raw_results, list):
+            return []
+
+        return [
+            result_id
+            for result in raw_results
+            if (result_id := self._extract_result_id(result)) is not None
+        ]
+
+    @staticmethod
+    def _container_step(
+        entity: ConventionCollective | TexteKali | None,
+        seen_container_ids: set[str],
+    ) -> ConventionCollective | str | None:
+        """Ramène un hit de recherche à son conteneur, avec déduplication.
+
+        Returns:
+            Le conteneur lui-même pour un hit ``KALICONT``, l'identifiant
+            du conteneur parent à récupérer pour un hit texte, ou ``None``
+            si le hit doit être ignoré (doublon, parent inconnu,
+            ``KALIARTI`` / ``KALISCTA``).
+        """
+        if entity is None:
+            return None
+
+        if isinstance(entity, ConventionCollective):
+            cont_id = entity.id
+            if not cont_id or cont_id in seen_container_ids:
+                return None
+            seen_container_ids.add(cont_id)
+            return entity
+
+        if isinstance(entity, TexteKali):
+            parent_id = entity.container_id
+            if not parent_id or parent_id in seen_container_ids:
+                return None
+            seen_container_ids.add(parent_id)
+            return parent_id
+
+        # KALIARTI / KALISCTA hits are not search-level
+        # convention sources — skip.
+        return None
+
+    @staticmethod
+    def _extract_result_id(result: dict[str, Any]) -> str | None:
+        titles = result.get("titles")
+        if not isinstance(titles, list) or not titles:
+            return None
+        first = titles[0]
+        if not isinstance(first, dict):
+            return None
+        text_id = first.get("id")
+        return text_id if isinstance(text_id, str) and text_id else None
+
+    def _validate_response(self, response: Any, model: type[BaseModel]) -> Any:
+        """Valide le corps de ``response`` en ``model``.
+
+        Les clients ``trust_responses=True`` valident directement les octets
+        de la réponse (voir :mod:`pylegifrance.hydration`) ; les autres
+        décodent d'abord le JSON puis valident le dict obtenu.
+
+        Returns:
+            Le modèle validé, ou None si la réponse est vide ou invalide.
+        """
+        if is_trusted(self._client):
+            try:
+                with span("validate", model=model.__name__, trusted=True):
+                    validated = validate_json(model | None, response.content)
+            except Exception as exc:
+                logger.error("Échec de validation %s: %s", model.__name__, exc)
+                return None
+            if validated is None or not validated.model_fields_set:
+                return None
+            return validated
+
+        response_data = response.json()
+        if not response_data:
+            return None
+        try:
+            with span("validate", model=model.__name__):
+                return model.model_validate(response_data)
+        except Exception as exc:
+            logger.error("Échec de validation %s: %s", model.__name__, exc)
+            return None
+
+    def _wrap_container(self, response: Any) -> ConventionCollective | None:
+        model = self._validate_response(response, ConsultKaliContResponse)
+        if model is None:
+            return None
+        return ConventionCollective(model, self._navigation_client())
+
+    def _wrap_text(self, response: Any) -> TexteKali | None:
+        model = self._validate_response(response, ConsultKaliTextResponse)
+        if model is None:
+            return None
+        return TexteKali(model, self._navigation_client())
+
+
+class KaliAPI(_KaliBase):
+    """API haut niveau pour le fond KALI."""
+
+    _client: LegifranceClient
+
+    def __init__(self, client: LegifranceClient):
+        require_sync_client(client, "KaliAPI", "AsyncKaliAPI")
+        self._client = client
+
+    def _navigation_client(self) -> LegifranceClient | None:
+        return self._client
+
+    def fetch_container(self, kali_id: str) -> ConventionCollective | None:
+        """Récupère un conteneur par son identifiant ``KALICONT``.
+
+        Wraps ``POST /consult/kaliCont``.
+        """
+        response = self._client.call_api(*self._container_request(kali_id))
+        return self._wrap_container(response)
+
+    def fetch_by_idcc(self, idcc: str | int) -> ConventionCollective | None:
+        """Récupère un conteneur par son numéro IDCC.
+
+        Wraps ``POST /consult/kaliContIdcc``. ``idcc`` doit être un
+        entier ou une chaîne de chiffres (ex: ``"1261"``).
+        """
+        response = self._client.call_api(*self._idcc_request(idcc))
+        return self._wrap_container(response)
+
+    def fetch_text(self, kali_id: str) -> TexteKali | None:
+        """Récupère un texte KALI par son identifiant ``KALITEXT``.
+
+        Wraps ``POST /consult/kaliText``.
+        """
+        response = self._client.call_api(*self._text_request(kali_id))
+        return self._wrap_text(response)
+
+    def fetch_article(self, article_id: str) -> TexteKali | None:
+        """Récupère le texte parent contenant un article ``KALIARTI``.
+
+        Wraps ``POST /consult/kaliArticle``. Le endpoint retourne le
+        texte entier contextualisé autour de l'article demandé.
+        """
+        response = self._client.call_api(*self._article_request(article_id))
+        return self._wrap_text(response)
+
+    def fetch_section(self, section_id: str) -> TexteKali | None:
+        """Récupère le texte parent contenant une section ``KALISCTA``.
+
+        Wraps ``POST /consult/kaliSection``.
+        """
+        response = self._client.call_api(*self._section_request(section_id))
+        return self._wrap_text(response)
+
+    def fetch(self, kali_id: str) -> ConventionCollective | TexteKali | None:
+        """Dispatcher basé sur le préfixe de l'identifiant.
+
+        - ``KALICONT`` → :meth:`fetch_container`
+        - ``KALITEXT`` → :meth:`fetch_text`
+        - ``KALIARTI`` → :meth:`fetch_article`
+        - ``KALISCTA`` → :meth:`fetch_section`
+        """
+        method_name, normalized = self._dispatch_name(kali_id)
+        return getattr(self, method_name)(normalized)
+
+    @traced("kali.search")
     def search(self, query: str | SearchRequest) -> list[ConventionCollective]:
         """Recherche dans le fond KALI.
 
@@ -377,101 +560,220 @@ class KaliAPI:
             ce correctif ; une résolution complète nécessiterait un
             complément côté API Legifrance.
         """
-        if isinstance(query, str):
-            search_query = SearchRequest(search=query)
-        else:
-            search_query = query
+        response = self._client.call_api("search", self._search_payload(query))
+        return list(self._containers(self._extract_search_ids(response), set()))
 
-        request_dto = search_query.to_api_model()
-        payload = json.loads(
-            json.dumps(request_dto.model_dump(by_alias=True), cls=EnumEncoder)
-        )
-        response = self._client.call_api("search", payload)
+    def _containers(
+        self, result_ids: list[str], seen_container_ids: set[str]
+    ) -> Iterator[ConventionCollective]:
+        """Résout des identifiants de recherche en conteneurs, sans doublon.
 
-        if response.status_code != HTTP_OK:
-            return []
-
-        response_data = response.json()
-        raw_results = response_data.get("results")
-        if not isinstance(raw_results, list):
-            return []
+        Args:
+            result_ids: Les identifiants ``KALITEXT``/``KALICONT`` trouvés.
+            seen_container_ids: Les conteneurs déjà produits ; complété au
+                fil de l'itération.
 
-        containers: list[ConventionCollective] = []
-        seen_container_ids: set[str] = set()
-        for result in raw_results:
-            result_id = self._extract_result_id(result)
-            if result_id is None:
-                continue
+        Yields:
+            Les conteneurs pas encore vus, dans l'ordre des résultats.
+        """
+        for result_id in result_ids:
             try:
                 entity = self.fetch(result_id)
             except Exception as exc:
                 logger.warning("Échec de récupération KALI %s: %s", result_id, exc)
                 continue
-            if entity is None:
-                continue
 
-            container: ConventionCollective | None
-            if isinstance(entity, ConventionCollective):
-                cont_id = entity.id
-                if not cont_id or cont_id in seen_container_ids:
-                    continue
-                seen_container_ids.add(cont_id)
-                container = entity
-            elif isinstance(entity, TexteKali):
-                parent_id = entity.container_id
+            step = self._container_step(entity, seen_container_ids)
+            if isinstance(step, str):
                 # Dedupe BEFORE issuing the /consult/kaliCont call so
                 # N text hits under the same convention cost 1 extra
                 # fetch, not N.
-                if not parent_id or parent_id in seen_container_ids:
-                    continue
-                seen_container_ids.add(parent_id)
                 try:
-                    container = self.fetch_container(parent_id)
+                    container = self.fetch_container(step)
                 except Exception as exc:
                     logger.warning(
                         "Échec de récupération du conteneur KALI %s: %s",
-                        parent_id,
+                        step,
                         exc,
                     )
                     continue
             else:
-                # KALIARTI / KALISCTA hits are not search-level
-                # convention sources — skip.
+                container = step
+
+            if container is not None:
+                yield container
+
+    def iter_search(
+        self,
+        query: str | SearchRequest,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_results: int | None = None,
+        page_workers: int = 1,
+    ) -> Iterator[ConventionCollective]:
+        """Parcourt toutes les pages de résultats d'une recherche.
+
+        Chaque page est résolue en conteneurs comme par :meth:`search`, la
+        déduplication valant pour l'ensemble des pages. La page suivante est
+        déjà en cours de récupération pendant que l'appelant traite la page
+        courante (voir :func:`~pylegifrance.pagination.iter_pages`).
+
+        Avec ``page_workers`` supérieur à 1, les pages qui suivent la
+        première sont demandées en parallèle, toujours produites dans
+        l'ordre ; une recherche de plus de 10 000 résultats est découpée
+        sur la date de signature.
+
+        Args:
+            query: texte libre ou :class:`SearchRequest` pré-construit ; sa
+                pagination est ignorée.
+            page_size: Nombre de résultats par page (100 au plus).
+            max_results: Nombre maximal de résultats de recherche parcourus.
+                Si None, la recherche est parcourue jusqu'au dernier.
+            page_workers: Nombre de pages demandées simultanément après la
+                première, pour les exports volumineux. 1 parcourt les pages
+                l'une après l'autre.
+
+        Yields:
+            Les :class:`ConventionCollective`, dans l'ordre des résultats.
+
+        Raises:
+            ValueError: Si ``page_size``, ``max_results`` ou ``page_workers``
+                est hors limites.
+        """
+        seen_container_ids: set[str] = set()
+        for page in iter_pages(
+            self._client,
+            self._search_payload(query),
+            page_size=page_size,
+            max_results=max_results,
+            max_workers=page_workers,
+            split_facet=FacettesKALI.DATE_SIGNATURE.value,
+        ):
+            result_ids = [
+                result_id
+                for result in page.results
+                if (result_id := self._extract_result_id(result)) is not None
+            ]
+            yield from self._containers(result_ids, seen_container_ids)
+
+    @traced("kali.count")
+    def count(self, query: str | SearchRequest) -> SearchCounts:
+        """Compte les résultats d'une recherche, sans récupérer les conventions.
+
+        Une seule requête ``/search`` est envoyée, pour un seul résultat ;
+        aucune consultation ne suit. Adapté aux tableaux de bord qui
+        comptent de nombreuses variantes d'une requête.
+
+        Le total compte les résultats de recherche (textes et conteneurs),
+        avant le regroupement par convention opéré par :meth:`search`.
+
+        Args:
+            query: texte libre ou :class:`SearchRequest` pré-construit ; sa
+                pagination est ignorée.
+
+        Returns:
+            Le nombre total de résultats et les effectifs par valeur de
+            facette renvoyés par l'API.
+        """
+        response = self._client.call_api(
+            "search", count_payload(self._search_payload(query))
+        )
+        return search_counts(response)
+
+
+class AsyncKaliAPI(_KaliBase):
+    """Équivalent asynchrone de :class:`KaliAPI`."""
+
+    _client: "AsyncLegifranceClient"
+
+    def __init__(self, client: "AsyncLegifranceClient"):
+        require_async_client(client, "AsyncKaliAPI", "KaliAPI")
+        self._client = client
+
+    async def fetch_container(self, kali_id: str) -> ConventionCollective | None:
+        """Version asynchrone de :meth:`KaliAPI.fetch_container`."""
+        response = await self._client.call_api(*self._container_request(kali_id))
+        return self._wrap_container(response)
+
+    async def fetch_by_idcc(self, idcc: str | int) -> ConventionCollective | None:
+        """Version asynchrone de :meth:`KaliAPI.fetch_by_idcc`."""
+        response = await self._client.call_api(*self._idcc_request(idcc))
+        return self._wrap_container(response)
+
+    async def fetch_text(self, kali_id: str) -> TexteKali | None:
+        """Version asynchrone de :meth:`KaliAPI.fetch_text`."""
+        response = await self._client.call_api(*self._text_request(kali_id))
+        return self._wrap_text(response)
+
+    async def fetch_article(self, article_id: str) -> TexteKali | None:
+        """Version asynchrone de :meth:`KaliAPI.fetch_article`."""
+        response = await self._client.call_api(*self._article_request(article_id))
+        return self._wrap_text(response)
+
+    async def fetch_section(self, section_id: str) -> TexteKali | None:
+        """Version asynchrone de :meth:`KaliAPI.fetch_section`."""
+        response = await self._client.call_api(*self._section_request(section_id))
+        return self._wrap_text(response)
+
+    async def fetch(self, kali_id: str) -> ConventionCollective | TexteKali | None:
+        """Version asynchrone de :meth:`KaliAPI.fetch`."""
+        method_name, normalized = self._dispatch_name(kali_id)
+        return await getattr(self, method_name)(normalized)
+
+    @traced("kali.asearch")
+    async def search(self, query: str | SearchRequest) -> list[ConventionCollective]:
+        """Version asynchrone de :meth:`KaliAPI.search`.
+
+        Les hits sont récupérés en parallèle, puis les conteneurs parents
+        manquants en un second lot parallèle. L'ordre et la déduplication
+        sont identiques à ceux de :meth:`KaliAPI.search`.
+        """
+        response = await self._client.call_api("search", self._search_payload(query))
+        result_ids = self._extract_search_ids(response)
+
+        entities = await asyncio.gather(
+            *(self.fetch(result_id) for result_id in result_ids),
+            return_exceptions=True,
+        )
+
+        seen_container_ids: set[str] = set()
+        steps: list[ConventionCollective | str] = []
+        for result_id, entity in zip(result_ids, entities, strict=True):
+            if isinstance(entity, BaseException):
+                logger.warning("Échec de récupération KALI %s: %s", result_id, entity)
                 continue
+            step = self._container_step(entity, seen_container_ids)
+            if step is not None:
+                steps.append(step)
+
+        parent_ids = [step for step in steps if isinstance(step, str)]
+        parents = await asyncio.gather(
+            *(self.fetch_container(parent_id) for parent_id in parent_ids),
+            return_exceptions=True,
+        )
+        resolved = dict(zip(parent_ids, parents, strict=True))
 
+        containers: list[ConventionCollective] = []
+        for step in steps:
+            if isinstance(step, str):
+                container = resolved[step]
+                if isinstance(container, BaseException):
+                    logger.warning(
+                        "Échec de récupération du conteneur KALI %s: %s",
+                        step,
+                        container,
+                    )
+                    continue
+            else:
+                container = step
             if container is not None:
                 containers.append(container)
         return containers
 
-    @staticmethod
-    def _extract_result_id(result: dict[str, Any]) -> str | None:
-        titles = result.get("titles")
-        if not isinstance(titles, list) or not titles:
-            return None
-        first = titles[0]
-        if not isinstance(first, dict):
-            return None
-        text_id = first.get("id")
-        return text_id if isinstance(text_id, str) and text_id else None
-
-    def _wrap_container(
-        self, response_data: dict[str, Any] | None
-    ) -> ConventionCollective | None:
-        if not response_data:
-            return None
-        try:
-            model = ConsultKaliContResponse.model_validate(response_data)
-        except Exception as exc:
-            logger.error("Échec de validation ConsultKaliContResponse: %s", exc)
-            return None
-        return ConventionCollective(model, self._client)
-
-    def _wrap_text(self, response_data: dict[str, Any] | None) -> TexteKali | None:
-        if not response_data:
-            return None
-        try:
-            model = ConsultKaliTextResponse.model_validate(response_data)
-        except Exception as exc:
-            logger.error("Échec de validation ConsultKaliTextResponse: %s", exc)
-            return None
-        return TexteKali(model, self._client)
+    @traced("kali.acount")
+    async def count(self, query: str | SearchRequest) -> SearchCounts:
+        """Version asynchrone de :meth:`KaliAPI.count`."""
+        response = await self._client.call_api(
+            "search", count_payload(self._search_payload(query))
+        )
+        return search_counts(response)
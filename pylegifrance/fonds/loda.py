@@ -1,11 +1,18 @@
-import json
+import functools
 import logging
 import re
+from collections.abc import Iterator
 from datetime import datetime
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Annotated, Any, Optional
+
+from pydantic import Field, StringConstraints, create_model
 
 from pylegifrance.client import LegifranceClient
+from pylegifrance.fonds._clients import require_async_client, require_sync_client
+from pylegifrance.hydration import is_trusted, validate_json
+from pylegifrance.instrumentation import log_payload
 from pylegifrance.models.code.models import Article
+from pylegifrance.models.constants import Facette
 from pylegifrance.models.generated.model import (
     ConsultArticle,
     ConsultSection,
@@ -14,7 +21,17 @@ from pylegifrance.models.generated.model import (
 from pylegifrance.models.identifier import Cid, Nor
 from pylegifrance.models.loda.models import TexteLoda as TexteLodaModel
 from pylegifrance.models.loda.search import SearchRequest
-from pylegifrance.utils import EnumEncoder
+from pylegifrance.pagination import (
+    DEFAULT_PAGE_SIZE,
+    SearchCounts,
+    count_payload,
+    iter_pages,
+    search_counts,
+)
+from pylegifrance.tracing import span, traced
+
+if TYPE_CHECKING:
+    from pylegifrance.async_client import AsyncLegifranceClient
 
 # Constantes
 HTTP_OK = 200
@@ -36,6 +53,34 @@ URL_PARAMS_TO_REMOVE = ["cidTexte", "idArticle", "dateTexte", "categorieLien"]
 
 logger = logging.getLogger(__name__)
 
+# Champs de TexteLoda absents de ConsultTextResponse, avec leur alias JSON
+_TEXTE_LODA_FIELDS = {
+    "titre_long": "titreLong",
+    "last_update": "lastUpdate",
+    "texte_html": "texteHtml",
+}
+
+
+@functools.cache
+def _trusted_consult_model() -> type[ConsultTextResponse]:
+    """Modèle lisant en une passe une réponse de consultation LODA.
+
+    Étend ConsultTextResponse avec les champs propres à TexteLoda et avec
+    l'enveloppe ``texte`` de l'ancien format, afin que le chemin rapide
+    (``trust_responses=True``) ne valide le corps qu'une seule fois. Ces
+    champs sont exclus des sérialisations : l'instance obtenue sert telle
+    quelle de ``consult_response``.
+    """
+    stripped = Annotated[str, StringConstraints(strip_whitespace=True)]
+    fields: dict[str, Any] = {
+        name: (stripped | None, Field(None, alias=alias, exclude=True))
+        for name, alias in _TEXTE_LODA_FIELDS.items()
+    }
+    fields["texte"] = (Any, Field(None, exclude=True))
+    return create_model(
+        "TrustedConsultTextResponse", __base__=ConsultTextResponse, **fields
+    )
+
 
 class TexteLoda:
     """
@@ -45,16 +90,30 @@ class TexteLoda:
     .latest(), .versions(), et .at(date).
     """
 
-    def __init__(self, texte: TexteLodaModel, client: LegifranceClient):
+    def __init__(self, texte: TexteLodaModel, client: LegifranceClient | None):
         """Initialise une instance de TexteLoda.
 
         Args:
             texte: Le modèle TexteLoda sous-jacent.
-            client: Le client pour interagir avec l'API Legifrance.
+            client: Le client pour interagir avec l'API Legifrance ; None
+                pour un texte obtenu par :class:`AsyncLoda`.
         """
         self._texte = texte
         self._client = client
 
+    def _sync_client(self) -> LegifranceClient:
+        """Client utilisé pour naviguer depuis ce texte.
+
+        Raises:
+            TypeError: Si le texte a été obtenu par :class:`AsyncLoda`.
+        """
+        if self._client is None:
+            raise TypeError(
+                "Texte obtenu par AsyncLoda : sa navigation synchrone "
+                "n'est pas disponible, utilisez AsyncLoda"
+            )
+        return self._client
+
     @property
     def id(self) -> str | None:
         """Récupère l'identifiant du texte."""
@@ -204,6 +263,7 @@ class TexteLoda:
 
         Raises:
             ValueError: Si la date est invalide.
+            TypeError: Si le texte a été obtenu par :class:`AsyncLoda`.
         """
         # Convertir datetime en chaîne si nécessaire
         if isinstance(date, datetime):
@@ -216,7 +276,7 @@ class TexteLoda:
             except ValueError:
                 raise ValueError(f"Format de date invalide: {date_str}") from None
 
-        loda = Loda(self._client)
+        loda = Loda(self._sync_client())
         if self.id is None:
             raise ValueError("TexteLoda.id is None; cannot fetch version at.")
         return loda.fetch_version_at(self.id, date_str)
@@ -226,10 +286,13 @@ class TexteLoda:
 
         Returns:
             La dernière version du texte, ou None si non trouvée.
+
+        Raises:
+            TypeError: Si le texte a été obtenu par :class:`AsyncLoda`.
         """
         if self.id is None:
             raise ValueError("TexteLoda.id is None, cannot fetch Loda.")
-        loda = Loda(self._client)
+        loda = Loda(self._sync_client())
         return loda.fetch(self.id)
 
     def versions(self) -> list["TexteLoda"]:
@@ -237,8 +300,11 @@ class TexteLoda:
 
         Returns:
             Une liste de toutes les versions du texte.
+
+        Raises:
+            TypeError: Si le texte a été obtenu par :class:`AsyncLoda`.
         """
-        loda = Loda(self._client)
+        loda = Loda(self._sync_client())
         if self.id is None:
             return []
         return loda.fetch_versions(self.id)
@@ -251,6 +317,7 @@ class TexteLoda:
         """
         from pylegifrance.fonds.code import Code
 
+        code_api = Code(self._sync_client())
         logger.debug(f"Recherche des articles modifiés par la loi {self.id}")
         modified_articles = []
 
@@ -284,9 +351,7 @@ class TexteLoda:
                     continue
 
                 try:
-                    modified_article = self._fetch_modified_article(
-                        lien, Code(self._client)
-                    )
+                    modified_article = self._fetch_modified_article(lien, code_api)
                     modified_articles.append(modified_article)
                     logger.debug(
                         f"Article modifié {lien.article_id} récupéré avec succès"
@@ -308,6 +373,7 @@ class TexteLoda:
         """
         from pylegifrance.fonds.code import Code
 
+        code_api = Code(self._sync_client())
         logger.debug(f"Recherche des articles créés par la loi {self.id}")
         created_articles = []
 
@@ -341,9 +407,7 @@ class TexteLoda:
                     continue
 
                 try:
-                    created_article = self._fetch_created_article(
-                        lien, Code(self._client)
-                    )
+                    created_article = self._fetch_created_article(lien, code_api)
                     created_articles.append(created_article)
                     logger.debug(f"Article créé {lien.article_id} récupéré avec succès")
                 except Exception as e:
@@ -439,6 +503,7 @@ class TexteLoda:
         else:
             return code_api.fetch_article(lien.article_id)
 
+    @traced("loda.format_modifications_report")
     def format_modifications_report(self) -> str:
         """Formate un rapport complet de l'impact de cette loi (modifications, créations, abrogations).
 
@@ -449,6 +514,10 @@ class TexteLoda:
         if not self.articles:
             return "Aucun impact disponible."
 
+        from pylegifrance.fonds.code import Code
+
+        code_api = Code(self._sync_client())
+
         rapport = self._build_report_header()
         impact_counters = {"modifications": 0, "creations": 0, "abrogations": 0}
         impacts_found = False
@@ -456,7 +525,9 @@ class TexteLoda:
         for article in self.articles:
             if self._article_has_modification_links(article):
                 impacts_found = True
-                rapport += self._format_article_section(article, impact_counters)
+                rapport += self._format_article_section(
+                    article, impact_counters, code_api
+                )
 
         rapport += self._build_report_summary(impact_counters, impacts_found)
         return rapport
@@ -525,14 +596,16 @@ class TexteLoda:
             hasattr(article, "lst_lien_modification") and article.lst_lien_modification
         )
 
-    def _format_article_section(self, article, impact_counters: dict) -> str:
+    def _format_article_section(
+        self, article, impact_counters: dict, code_api: Any
+    ) -> str:
         """Formate la section d'un article avec ses impacts."""
         section = f"## Article {article.num}\n\n"
 
         if article.content:
             section += self._format_article_content(article.content)
 
-        section += self._format_modification_links(article, impact_counters)
+        section += self._format_modification_links(article, impact_counters, code_api)
         return section
 
     def _format_article_content(self, content: str) -> str:
@@ -543,7 +616,9 @@ class TexteLoda:
             "---\n\n"
         )
 
-    def _format_modification_links(self, article, impact_counters: dict) -> str:
+    def _format_modification_links(
+        self, article, impact_counters: dict, code_api: Any
+    ) -> str:
         """Formate les liens de modification d'un article."""
         section = ""
 
@@ -552,10 +627,10 @@ class TexteLoda:
 
             if link_type == MODIFICATION_LINK_TYPE and lien.article_id:
                 impact_counters["modifications"] += 1
-                section += self._format_modification_section(lien, i)
+                section += self._format_modification_section(lien, i, code_api)
             elif link_type in CREATION_LINK_TYPES and lien.article_id:
                 impact_counters["creations"] += 1
-                section += self._format_creation_section(lien, i)
+                section += self._format_creation_section(lien, i, code_api)
             elif link_type in ABROGATION_LINK_TYPES:
                 impact_counters["abrogations"] += 1
                 section += self._format_abrogation_section(lien, i)
@@ -589,16 +664,16 @@ class TexteLoda:
             f"- **Impact total**: {total_impact} article(s)\n\n"
         )
 
-    def _format_modification_section(self, lien: Any, index: int) -> str:
+    def _format_modification_section(self, lien: Any, index: int, code_api: Any) -> str:
         """Formate une section pour une modification d'article."""
         return self._format_article_impact_section(
-            lien, index, "Modification", "Nouveau contenu"
+            lien, index, "Modification", "Nouveau contenu", code_api
         )
 
-    def _format_creation_section(self, lien: Any, index: int) -> str:
+    def _format_creation_section(self, lien: Any, index: int, code_api: Any) -> str:
         """Formate une section pour une création d'article."""
         return self._format_article_impact_section(
-            lien, index, "Création", "Contenu créé"
+            lien, index, "Création", "Contenu créé", code_api
         )
 
     def _format_abrogation_section(self, lien: Any, index: int) -> str:
@@ -611,13 +686,18 @@ class TexteLoda:
         )
 
     def _format_article_impact_section(
-        self, lien: Any, index: int, action_type: str, content_label: str
+        self,
+        lien: Any,
+        index: int,
+        action_type: str,
+        content_label: str,
+        code_api: Any,
     ) -> str:
         """Formate une section générique pour un impact d'article (modification/création)."""
         section = f"### {action_type} {index}: {lien.text_title}\n\n"
 
         try:
-            article = self._fetch_article_from_link(lien)
+            article = self._fetch_article_from_link(lien, code_api)
             citation = self._format_article_citation(article, lien)
 
             section += f"**Citation**: {citation}\n\n"
@@ -629,12 +709,8 @@ class TexteLoda:
 
         return section
 
-    def _fetch_article_from_link(self, lien: Any):
+    def _fetch_article_from_link(self, lien: Any, code_api: Any):
         """Récupère un article à partir d'un lien de modification/création."""
-        from pylegifrance.fonds.code import Code
-
-        code_api = Code(self._client)
-
         # Pour les modifications, utiliser la date cible si disponible
         if hasattr(lien, "date_debut_cible") and lien.date_debut_cible:
             return code_api.fetch_article(lien.article_id).at(lien.date_debut_cible)
@@ -657,6 +733,7 @@ class TexteLoda:
         contenu_nettoye = self._clean_html_for_markdown(article.content)
         return f"**{content_label}**:\n\n```\n{contenu_nettoye}\n```\n\n"
 
+    @traced("loda.parse_html")
     def _clean_html_for_markdown(self, html_content: str) -> str:
         """Nettoie le contenu HTML pour un affichage propre en markdown.
 
@@ -740,18 +817,23 @@ class TexteLoda:
         return f"TexteLoda(id={self.id}, titre={self.titre})"
 
 
-class Loda:
+class _LodaBase:
     """
-    API de haut niveau pour interagir avec les données LODA de l'API Legifrance.
+    Construction des requêtes et lecture des réponses LODA.
+
+    Partagé par :class:`Loda` et :class:`AsyncLoda`, qui ne diffèrent que
+    par l'envoi des requêtes.
     """
 
-    def __init__(self, client: LegifranceClient):
-        """Initialise une instance de Loda.
+    _client: "LegifranceClient | AsyncLegifranceClient"
 
-        Args:
-            client: Le client pour interagir avec l'API Legifrance.
+    def _navigation_client(self) -> LegifranceClient | None:
+        """Client rattaché aux textes renvoyés.
+
+        None pour une façade asynchrone : la navigation depuis un texte
+        (``latest()``, ``versions()``...) est synchrone.
         """
-        self._client = client
+        return None
 
     def _extract_date_from_id(self, text_id: str) -> tuple[str, str | None]:
         """Extrait la date d'un identifiant de texte s'il en contient une.
@@ -847,26 +929,53 @@ class Loda:
 
         try:
             logger.debug(f"Création de TexteLodaModel avec ID: {data['id']}")
-            texte_model = TexteLodaModel.model_validate(data)
-            texte_model.consult_response = ConsultTextResponse.model_validate(data)
+            with span("validate", model="TexteLoda"):
+                texte_model = TexteLodaModel.model_validate(data)
+                texte_model.consult_response = ConsultTextResponse.model_validate(data)
             return texte_model
         except Exception as e:
             logger.error(f"Échec de création de TexteLodaModel: {e}")
             return None
 
-    def fetch(self, text_id: str) -> TexteLoda | None:
-        """Récupère un texte par son identifiant.
+    def _texte_model_from_bytes(self, content: bytes) -> TexteLodaModel | None:
+        """Construit un TexteLodaModel directement depuis le corps de la réponse.
+
+        Chemin rapide des clients ``trust_responses=True`` : le corps est
+        validé une seule fois, puis TexteLodaModel est assemblé sans nouvelle
+        validation autour de la ConsultTextResponse obtenue.
 
         Args:
-            text_id: L'identifiant du texte à récupérer.
+            content: Le corps JSON de la réponse de consultation.
 
         Returns:
-            Le texte, ou None si non trouvé.
-
-        Raises:
-            ValueError: Si text_id est invalide.
-            Exception: Si l'appel API échoue.
+            Le modèle TexteLoda, ou None si non trouvé.
         """
+        try:
+            with span("validate", model="TexteLoda", trusted=True):
+                parsed = validate_json(_trusted_consult_model(), content)
+        except Exception as e:
+            logger.error(f"Échec de création de TexteLodaModel: {e}")
+            return None
+
+        fields_set = parsed.model_fields_set
+        if "texte" in fields_set:
+            # Ancien format, rare : chemin standard sur le dict imbriqué
+            return self._process_consult_response({"texte": parsed.texte})
+        if "id" not in fields_set:
+            logger.warning("Les données ne contiennent pas le champ 'id' requis")
+            return None
+
+        return TexteLodaModel.model_construct(
+            consult_response=parsed,
+            **{
+                name: getattr(parsed, name)
+                for name in _TEXTE_LODA_FIELDS
+                if name in fields_set
+            },
+        )
+
+    def _fetch_payload(self, text_id: str) -> dict[str, Any]:
+        """Construit le corps de requête ``/consult/lawDecree`` pour :meth:`fetch`."""
         if not text_id:
             raise ValueError("text_id ne peut pas être vide")
 
@@ -881,18 +990,19 @@ class Loda:
         }
 
         # Debug log the consult request
-        logger.debug(
-            f"Payload de requête de consultation: {json.dumps(api_model, indent=2)}"
-        )
-
-        response = self._client.call_api("consult/lawDecree", api_model)
+        log_payload(logger, "Payload de requête de consultation", api_model)
+        return api_model
 
-        response_data = response.json()
-        logger.debug(
-            f"Données de réponse de consultation: {json.dumps(response_data, indent=2, default=str)}"
-        )
-
-        texte_model = self._process_consult_response(response_data)
+    def _texte_from_fetch_response(
+        self, response: Any, text_id: str
+    ) -> TexteLoda | None:
+        """Transforme la réponse de :meth:`fetch` en TexteLoda."""
+        if is_trusted(self._client):
+            texte_model = self._texte_model_from_bytes(response.content)
+        else:
+            response_data = response.json()
+            log_payload(logger, "Données de réponse de consultation", response_data)
+            texte_model = self._process_consult_response(response_data)
 
         if not texte_model:
             logger.warning(f"Impossible de traiter la réponse pour le texte {text_id}")
@@ -901,22 +1011,11 @@ class Loda:
         logger.debug(
             f"Texte {text_id} récupéré avec succès, titre: {texte_model.titre}"
         )
-        return TexteLoda(texte_model, self._client)
+        return TexteLoda(texte_model, self._navigation_client())
 
-    def fetch_version_at(self, text_id: str, date: str) -> TexteLoda | None:
-        """Récupère une version d'un texte à une date spécifique.
-
-        Args:
-            text_id: L'identifiant du texte à récupérer.
-            date: La date à laquelle récupérer la version, au format ISO.
-
-        Returns:
-            La version du texte à la date spécifiée, ou None si non trouvée.
-
-        Raises:
-            ValueError: Si text_id ou date est invalide.
-            Exception: Si l'appel API échoue.
-        """
+    @staticmethod
+    def _version_at_payload(text_id: str, date: str) -> dict[str, Any]:
+        """Construit le corps de requête ``/consult/loda/version``."""
         if not text_id:
             raise ValueError("text_id ne peut pas être vide")
 
@@ -925,46 +1024,30 @@ class Loda:
         except ValueError:
             raise ValueError(f"Format de date invalide: {date}") from None
 
-        api_model = {
+        return {
             "textId": text_id,
             "year": date_obj.year,
             "month": date_obj.month,
             "dayOfMonth": date_obj.day,
         }
 
-        response = self._client.call_api("consult/loda/version", api_model)
-
+    def _texte_from_response(self, response: Any) -> TexteLoda | None:
+        """Transforme une réponse de consultation en TexteLoda."""
         if response.status_code != HTTP_OK:
             return None
 
-        response_data = response.json()
-        texte_model = self._process_consult_response(response_data)
+        if is_trusted(self._client):
+            texte_model = self._texte_model_from_bytes(response.content)
+        else:
+            texte_model = self._process_consult_response(response.json())
 
         if not texte_model:
             return None
 
-        return TexteLoda(texte_model, self._client)
-
-    def fetch_versions(self, text_id: str) -> list[TexteLoda]:
-        """Récupère toutes les versions d'un texte.
-
-        Args:
-            text_id: L'identifiant du texte dont on veut récupérer les versions.
-
-        Returns:
-            Une liste d'objets TexteLoda représentant toutes les versions.
-
-        Raises:
-            ValueError: Si text_id est invalide.
-            Exception: Si l'appel API échoue.
-        """
-        if not text_id:
-            raise ValueError("text_id ne peut pas être vide")
-
-        api_model = {"textId": text_id}
-
-        response = self._client.call_api("consult/loda/versions", api_model)
+        return TexteLoda(texte_model, self._navigation_client())
 
+    def _versions_from_response(self, response: Any) -> list[TexteLoda]:
+        """Transforme la réponse ``/consult/loda/versions`` en liste de TexteLoda."""
         if response.status_code != HTTP_OK:
             return []
 
@@ -975,7 +1058,7 @@ class Loda:
             return []
 
         versions = [
-            TexteLoda(texte_model, self._client)
+            TexteLoda(texte_model, self._navigation_client())
             for version_data in response_data
             if (texte_model := self._process_consult_response(version_data)) is not None
         ]
@@ -1198,7 +1281,7 @@ class Loda:
                 last_update=None,
                 texte_html=None,
             )
-            return TexteLoda(texte_model, self._client)
+            return TexteLoda(texte_model, self._navigation_client())
 
         except Exception as e:
             logger.error(
@@ -1237,93 +1320,317 @@ class Loda:
             html_content = " ".join(extracts)
             texte._texte.texte_html = html_content
 
-    def search(self, query: SearchRequest | str) -> list[TexteLoda]:
-        """Recherche des textes correspondant à la requête.
+    def _search_payload(self, query: SearchRequest | str) -> dict[str, Any]:
+        """Construit le corps de requête ``/search`` à partir d'une requête."""
+        search_query = self._normalize_search_query(query)
+
+        # Use the new to_generated_model method
+        generated_model = search_query.to_generated_model()
+
+        # If it's a dictionary, use it directly
+        if isinstance(generated_model, dict):
+            serialized_request = generated_model
+        else:
+            # Convert the model to a dictionary
+            if hasattr(generated_model, "model_dump"):
+                serialized_request = generated_model.model_dump(
+                    by_alias=True, mode="json"
+                )
+            else:
+                # Fallback for objects without model_dump
+                serialized_request = dict(generated_model)
+
+        # Debug log the request
+        log_payload(logger, "Payload de requête de recherche", serialized_request)
+        return serialized_request
+
+    def _texts_from_search_response(self, response: Any) -> list[TexteLoda]:
+        """Transforme la réponse ``/search`` en liste de TexteLoda minimaux."""
+        if response.status_code != HTTP_OK:
+            logger.warning(
+                f"L'API de recherche a retourné un code d'état non-OK: {response.status_code}"
+            )
+            return []
+
+        response_data = response.json()
+        log_payload(logger, "Données de réponse de recherche", response_data)
+
+        results = self._process_search_results(response_data)
+        logger.debug(
+            f"Résultats de recherche traités: {len(results)} objets TexteLoda trouvés"
+        )
+
+        return results
+
+    def _count_payload(self, query: SearchRequest | str) -> dict[str, Any]:
+        """Construit le corps ``/search`` d'un comptage."""
+        try:
+            return count_payload(self._search_payload(query))
+        except Exception as e:
+            if "not a valid" in str(e):
+                raise ValueError(str(e)) from e
+            raise
+
+    def _normalize_search_query(self, query: str | SearchRequest) -> SearchRequest:
+        """Normalise une requête de recherche en objet SearchRequest.
 
         Args:
             query: La requête de recherche, soit sous forme de chaîne,
                 soit sous forme d'objet SearchRequest.
 
         Returns:
-            Une liste d'objets TexteLoda correspondant à la requête.
+            L'objet SearchRequest normalisé.
 
         Raises:
             ValueError: Si la requête contient des valeurs invalides
                 (comme une nature non reconnue).
         """
         try:
-            search_query = self._normalize_search_query(query)
+            if isinstance(query, str):
+                return SearchRequest(search=query)
+            return query
+        except Exception as e:
+            # Convert Pydantic validation errors to ValueError for better error handling
+            if "not a valid" in str(e):
+                raise ValueError(str(e)) from e
+            raise
 
-            # Use the new to_generated_model method
-            generated_model = search_query.to_generated_model()
 
-            # If it's a dictionary, use it directly
-            if isinstance(generated_model, dict):
-                serialized_request = generated_model
-            else:
-                # Convert the model to a dictionary
-                if hasattr(generated_model, "model_dump"):
-                    serialized_request = generated_model.model_dump(by_alias=True)
-                else:
-                    # Fallback for objects without model_dump
-                    serialized_request = dict(generated_model)
+class Loda(_LodaBase):
+    """
+    API de haut niveau pour interagir avec les données LODA de l'API Legifrance.
+    """
 
-            # Ensure proper JSON serialization
-            serialized_request = json.loads(
-                json.dumps(serialized_request, cls=EnumEncoder)
-            )
+    _client: LegifranceClient
 
-            # Debug log the request
-            logger.debug(
-                f"Payload de requête de recherche: {json.dumps(serialized_request, indent=2)}"
-            )
+    def __init__(self, client: LegifranceClient):
+        """Initialise une instance de Loda.
 
-            # Appeler l'API
-            response = self._client.call_api("search", serialized_request)
+        Args:
+            client: Le client pour interagir avec l'API Legifrance.
 
-            if response.status_code != HTTP_OK:
-                logger.warning(
-                    f"L'API de recherche a retourné un code d'état non-OK: {response.status_code}"
-                )
-                return []
+        Raises:
+            TypeError: Si ``client`` est un client asynchrone.
+        """
+        require_sync_client(client, "Loda", "AsyncLoda")
+        self._client = client
 
-            response_data = response.json()
-            logger.debug(
-                f"Données de réponse de recherche: {json.dumps(response_data, indent=2, default=str)}"
-            )
+    def _navigation_client(self) -> LegifranceClient | None:
+        return self._client
 
-            results = self._process_search_results(response_data)
-            logger.debug(
-                f"Résultats de recherche traités: {len(results)} objets TexteLoda trouvés"
-            )
+    def fetch(self, text_id: str) -> TexteLoda | None:
+        """Récupère un texte par son identifiant.
 
-            return results
-        except Exception as e:
-            # Convert Pydantic validation errors to ValueError for better error handling
-            if "not a valid" in str(e):
-                raise ValueError(str(e)) from e
-            raise
+        Args:
+            text_id: L'identifiant du texte à récupérer.
 
-    def _normalize_search_query(self, query: str | SearchRequest) -> SearchRequest:
-        """Normalise une requête de recherche en objet SearchRequest.
+        Returns:
+            Le texte, ou None si non trouvé.
+
+        Raises:
+            ValueError: Si text_id est invalide.
+            Exception: Si l'appel API échoue.
+        """
+        api_model = self._fetch_payload(text_id)
+        response = self._client.call_api("consult/lawDecree", api_model)
+        return self._texte_from_fetch_response(response, text_id)
+
+    def fetch_version_at(self, text_id: str, date: str) -> TexteLoda | None:
+        """Récupère une version d'un texte à une date spécifique.
+
+        Args:
+            text_id: L'identifiant du texte à récupérer.
+            date: La date à laquelle récupérer la version, au format ISO.
+
+        Returns:
+            La version du texte à la date spécifiée, ou None si non trouvée.
+
+        Raises:
+            ValueError: Si text_id ou date est invalide.
+            Exception: Si l'appel API échoue.
+        """
+        api_model = self._version_at_payload(text_id, date)
+        response = self._client.call_api("consult/loda/version", api_model)
+        return self._texte_from_response(response)
+
+    def fetch_versions(self, text_id: str) -> list[TexteLoda]:
+        """Récupère toutes les versions d'un texte.
+
+        Args:
+            text_id: L'identifiant du texte dont on veut récupérer les versions.
+
+        Returns:
+            Une liste d'objets TexteLoda représentant toutes les versions.
+
+        Raises:
+            ValueError: Si text_id est invalide.
+            Exception: Si l'appel API échoue.
+        """
+        if not text_id:
+            raise ValueError("text_id ne peut pas être vide")
+
+        response = self._client.call_api("consult/loda/versions", {"textId": text_id})
+        return self._versions_from_response(response)
+
+    def search(self, query: SearchRequest | str) -> list[TexteLoda]:
+        """Recherche des textes correspondant à la requête.
 
         Args:
             query: La requête de recherche, soit sous forme de chaîne,
                 soit sous forme d'objet SearchRequest.
 
         Returns:
-            L'objet SearchRequest normalisé.
+            Une liste d'objets TexteLoda correspondant à la requête.
 
         Raises:
             ValueError: Si la requête contient des valeurs invalides
                 (comme une nature non reconnue).
         """
         try:
-            if isinstance(query, str):
-                return SearchRequest(search=query)
-            return query
+            serialized_request = self._search_payload(query)
+            response = self._client.call_api("search", serialized_request)
+            return self._texts_from_search_response(response)
         except Exception as e:
             # Convert Pydantic validation errors to ValueError for better error handling
             if "not a valid" in str(e):
                 raise ValueError(str(e)) from e
             raise
+
+    def iter_search(
+        self,
+        query: SearchRequest | str,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_results: int | None = None,
+        page_workers: int = 1,
+    ) -> Iterator[TexteLoda]:
+        """Parcourt toutes les pages de résultats d'une recherche.
+
+        La page suivante est déjà en cours de récupération pendant que
+        l'appelant traite la page courante (voir
+        :func:`~pylegifrance.pagination.iter_pages`) ; la mémoire utilisée
+        ne dépend pas du nombre total de résultats.
+
+        Avec ``page_workers`` supérieur à 1, les pages qui suivent la
+        première sont demandées en parallèle, toujours produites dans
+        l'ordre ; une recherche de plus de 10 000 résultats est découpée
+        sur la date de signature et parcourue des textes les plus anciens
+        aux plus récents.
+
+        Args:
+            query: La requête de recherche ; sa pagination est ignorée.
+            page_size: Nombre de résultats par page (100 au plus).
+            max_results: Nombre maximal de résultats parcourus. Si None, la
+                recherche est parcourue jusqu'au dernier.
+            page_workers: Nombre de pages demandées simultanément après la
+                première, pour les exports volumineux. 1 parcourt les pages
+                l'une après l'autre.
+
+        Yields:
+            Les textes, dans l'ordre des résultats de recherche.
+
+        Raises:
+            ValueError: Si la requête contient des valeurs invalides, ou si
+                ``page_size``, ``max_results`` ou ``page_workers`` est hors
+                limites.
+        """
+        try:
+            serialized_request = self._search_payload(query)
+        except Exception as e:
+            if "not a valid" in str(e):
+                raise ValueError(str(e)) from e
+            raise
+
+        for page in iter_pages(
+            self._client,
+            serialized_request,
+            page_size=page_size,
+            max_results=max_results,
+            max_workers=page_workers,
+            split_facet=Facette.DATE_SIGNATURE.value,
+        ):
+            yield from self._process_search_results({"results": page.results})
+
+    def count(self, query: SearchRequest | str) -> SearchCounts:
+        """Compte les résultats d'une recherche, sans récupérer les textes.
+
+        Une seule requête ``/search`` est envoyée, pour un seul résultat ;
+        aucune consultation ne suit. Adapté aux tableaux de bord qui
+        comptent de nombreuses variantes d'une requête.
+
+        Args:
+            query: La requête de recherche ; sa pagination est ignorée.
+
+        Returns:
+            Le nombre total de résultats et les effectifs par valeur de
+            facette renvoyés par l'API.
+
+        Raises:
+            ValueError: Si la requête contient des valeurs invalides.
+        """
+        with span("loda.count"):
+            response = self._client.call_api("search", self._count_payload(query))
+            return search_counts(response)
+
+
+class AsyncLoda(_LodaBase):
+    """
+    Équivalent asynchrone de :class:`Loda`.
+
+    Les textes renvoyés ne sont pas rattachés à un client synchrone : leurs
+    méthodes de navigation (``latest()``, ``versions()``...) lèvent
+    TypeError.
+    """
+
+    _client: "AsyncLegifranceClient"
+
+    def __init__(self, client: "AsyncLegifranceClient"):
+        """Initialise une instance de AsyncLoda.
+
+        Args:
+            client: Le client asynchrone pour interagir avec l'API Legifrance.
+
+        Raises:
+            TypeError: Si ``client`` est un client synchrone.
+        """
+        require_async_client(client, "AsyncLoda", "Loda")
+        self._client = client
+
+    async def fetch(self, text_id: str) -> TexteLoda | None:
+        """Version asynchrone de :meth:`Loda.fetch`."""
+        api_model = self._fetch_payload(text_id)
+        response = await self._client.call_api("consult/lawDecree", api_model)
+        return self._texte_from_fetch_response(response, text_id)
+
+    async def fetch_version_at(self, text_id: str, date: str) -> TexteLoda | None:
+        """Version asynchrone de :meth:`Loda.fetch_version_at`."""
+        api_model = self._version_at_payload(text_id, date)
+        response = await self._client.call_api("consult/loda/version", api_model)
+        return self._texte_from_response(response)
+
+    async def fetch_versions(self, text_id: str) -> list[TexteLoda]:
+        """Version asynchrone de :meth:`Loda.fetch_versions`."""
+        if not text_id:
+            raise ValueError("text_id ne peut pas être vide")
+
+        response = await self._client.call_api(
+            "consult/loda/versions", {"textId": text_id}
+        )
+        return self._versions_from_response(response)
+
+    async def search(self, query: SearchRequest | str) -> list[TexteLoda]:
+        """Version asynchrone de :meth:`Loda.search`."""
+        try:
+            serialized_request = self._search_payload(query)
+            response = await self._client.call_api("search", serialized_request)
+            return self._texts_from_search_response(response)
+        except Exception as e:
+            if "not a valid" in str(e):
+                raise ValueError(str(e)) from e
+            raise
+
+    async def count(self, query: SearchRequest | str) -> SearchCounts:
+        """Version asynchrone de :meth:`Loda.count`."""
+        with span("loda.acount"):
+            response = await self._client.call_api("search", self._count_payload(query))
+            return search_counts(response)
@@ -0,0 +1,79 @@
+"""Trusted fast path for turning API responses into models.
+
+By default the façades decode a response body into Python objects, then
+validate those objects into models; LODA texts are even validated twice,
+once per wrapper. When the responses come from a trusted source, the
+Legifrance API itself or a cache filled by this library, a client can opt
+into the fast path::
+
+    client = LegifranceClient(config, trust_responses=True)
+
+The façades then validate the raw body bytes in a single pass, with the
+JSON parser of ``pydantic-core`` and validators built once per model (see
+:func:`validate_json`), and assemble their wrappers with ``model_construct``
+instead of validating the same data again. Malformed bodies still raise
+:class:`pydantic.ValidationError`; what is skipped is the intermediate
+Python object tree and the repeated validation, not the schema.
+
+Leave the option off for bodies of unknown origin, e.g. payloads supplied by
+a third party through a custom transport.
+"""
+
+import functools
+import logging
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter, create_model
+
+logger = logging.getLogger(__name__)
+
+
+def is_trusted(client: Any) -> bool:
+    """Tell whether ``client`` opted into the trusted fast path."""
+    return getattr(client, "trust_responses", False) is True
+
+
+@functools.cache
+def type_adapter(tp: Any) -> TypeAdapter:
+    """Return the adapter of ``tp``, built on first use."""
+    logger.debug("Building type adapter for %r", tp)
+    return TypeAdapter(tp)
+
+
+def validate_json(tp: Any, content: bytes | str) -> Any:
+    """Validate a JSON document straight into ``tp``.
+
+    Args:
+        tp: A model class or any type accepted by :class:`pydantic.TypeAdapter`,
+            e.g. ``list[ConsultTextResponse]``.
+        content: The raw response body.
+
+    Returns:
+        The validated value.
+
+    Raises:
+        pydantic.ValidationError: If the document is not valid JSON or does
+            not match ``tp``.
+    """
+    if isinstance(tp, type) and issubclass(tp, BaseModel):
+        return tp.model_validate_json(content)
+    return type_adapter(tp).validate_json(content)
+
+
+@functools.cache
+def envelope(model: type[BaseModel], key: str) -> type[BaseModel]:
+    """Return a model reading ``model`` from the ``key`` member of a body.
+
+    For responses such as ``{"text": {...}, "executionTime": 12}``, where
+    only one member is of interest: the other members are skipped by the
+    parser without being materialised.
+
+    Args:
+        model: The model of the member.
+        key: The name of the member in the body.
+
+    Returns:
+        A model with a single optional field ``key``.
+    """
+    fields: dict[str, Any] = {key: (model | None, None)}
+    return create_model(f"{model.__name__}{key.capitalize()}Envelope", **fields)
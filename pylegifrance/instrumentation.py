@@ -0,0 +1,114 @@
+"""Debug logging of request and response payloads.
+
+Dumping a multi-megabyte consult response to JSON costs about as much as
+parsing it. :func:`log_payload` therefore does nothing unless the logger is
+enabled for the requested level, and even then only serialises the payload
+when a handler actually formats the record. Dumps can be truncated and
+sampled through :func:`configure_payload_logging`.
+"""
+
+import json
+import logging
+import random
+from dataclasses import dataclass
+from typing import Any
+
+from pylegifrance.utils import EnumEncoder
+
+
+@dataclass
+class PayloadLogSettings:
+    """
+    Settings applied by :func:`log_payload`.
+
+    Attributes:
+        max_chars: Dumps longer than this are cut and suffixed with the number
+            of characters dropped. None keeps dumps whole.
+        sample_rate: Fraction of payloads logged, between 0 and 1.
+        indent: Indentation of the JSON dumps. None gives compact output.
+    """
+
+    max_chars: int | None = 10_000
+    sample_rate: float = 1.0
+    indent: int | None = 2
+
+
+_settings = PayloadLogSettings()
+
+
+def configure_payload_logging(
+    max_chars: int | None = 10_000,
+    sample_rate: float = 1.0,
+    indent: int | None = 2,
+) -> None:
+    """Configure how payloads are dumped in debug logs.
+
+    Args:
+        max_chars: Maximum length of a dump. None disables truncation.
+        sample_rate: Fraction of payloads logged, between 0 and 1.
+        indent: Indentation of the JSON dumps. None gives compact output.
+
+    Raises:
+        ValueError: If ``sample_rate`` is not between 0 and 1.
+    """
+    global _settings
+    if not 0 <= sample_rate <= 1:
+        raise ValueError("sample_rate must be between 0 and 1.")
+    _settings = PayloadLogSettings(
+        max_chars=max_chars, sample_rate=sample_rate, indent=indent
+    )
+
+
+class _LenientEncoder(EnumEncoder):
+    """EnumEncoder falling back to ``str`` for anything else."""
+
+    def default(self, o: Any) -> Any:
+        try:
+            return super().default(o)
+        except TypeError:
+            return str(o)
+
+
+class _PayloadDump:
+    """Defers the JSON dump of a payload until the log record is formatted."""
+
+    __slots__ = ("payload", "settings")
+
+    def __init__(self, payload: Any, settings: PayloadLogSettings):
+        self.payload = payload
+        self.settings = settings
+
+    def __str__(self) -> str:
+        try:
+            text = json.dumps(
+                self.payload,
+                indent=self.settings.indent,
+                ensure_ascii=False,
+                cls=_LenientEncoder,
+            )
+        except ValueError:  # circular reference
+            text = repr(self.payload)
+        max_chars = self.settings.max_chars
+        if max_chars is not None and len(text) > max_chars:
+            dropped = len(text) - max_chars
+            text = f"{text[:max_chars]}... [{dropped} chars truncated]"
+        return text
+
+
+def log_payload(
+    logger: logging.Logger, label: str, payload: Any, level: int = logging.DEBUG
+) -> None:
+    """Log ``payload`` as JSON, at no cost when ``level`` is disabled.
+
+    Args:
+        logger: The logger of the calling module.
+        label: Text preceding the dump (e.g. ``"Payload for request <url>"``).
+        payload: Any JSON-serialisable object (enums and datetimes allowed).
+        level: The logging level to use.
+    """
+    if not logger.isEnabledFor(level):
+        return
+    settings = _settings
+    if settings.sample_rate < 1 and random.random() >= settings.sample_rate:
+        return
+    logger.log(level, "%s: %s", label, _PayloadDump(payload, settings))
@@ -0,0 +1,333 @@
+"""In-process metrics for the Legifrance API clients.
+
+A :class:`MetricsRegistry` given to
+:class:`~pylegifrance.client.LegifranceClient` records, per route:
+
+- a latency histogram of every HTTP attempt;
+- request and response byte counts;
+- counters by HTTP status code, plus transport errors;
+- retry and cache hit/miss counts.
+
+Token refreshes are counted client-wide. The registry can be queried in
+process with :meth:`MetricsRegistry.snapshot`, or exported with
+:meth:`MetricsRegistry.to_prometheus` (text exposition format) and
+:meth:`MetricsRegistry.to_json`. No external service is needed.
+"""
+
+import bisect
+import json
+import logging
+import math
+import threading
+from collections import Counter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+"""Upper bounds, in seconds, of the latency histogram buckets."""
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram, as exported by Prometheus.
+
+    Attributes:
+        buckets: Sorted upper bounds of the buckets; an implicit ``+Inf``
+            bucket catches larger values.
+        count: Number of observations.
+        total: Sum of the observed values.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one value."""
+        self._counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """Return ``(upper_bound, count of values <= bound)`` for every bucket."""
+        result = []
+        running = 0
+        for bound, count in zip((*self.buckets, math.inf), self._counts, strict=True):
+            running += count
+            result.append((bound, running))
+        return result
+
+    def quantile(self, q: float) -> float:
+        """Estimate the ``q`` quantile by interpolating within its bucket.
+
+        Args:
+            q: The quantile, between 0 and 1.
+
+        Returns:
+            The estimate, 0.0 without observations. Values in the ``+Inf``
+            bucket are reported as the largest finite bound.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        lower = 0.0
+        previous = 0
+        for bound, running in self.cumulative():
+            if running >= rank:
+                if math.isinf(bound):
+                    return lower
+                in_bucket = running - previous
+                fraction = (rank - previous) / in_bucket if in_bucket else 0.0
+                return lower + (bound - lower) * fraction
+            lower, previous = bound, running
+        return lower
+
+
+class _RouteMetrics:
+    def __init__(self, buckets: tuple[float, ...]):
+        self.latency = Histogram(buckets)
+        self.statuses: Counter[int] = Counter()
+        self.transport_errors = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.retries = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def snapshot(self) -> dict:
+        latency = self.latency
+        return {
+            "requests": latency.count,
+            "status_codes": {str(code): n for code, n in sorted(self.statuses.items())},
+            "transport_errors": self.transport_errors,
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "retries": self.retries,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "latency": {
+                "count": latency.count,
+                "sum": latency.total,
+                "mean": latency.total / latency.count if latency.count else 0.0,
+                "p50": latency.quantile(0.5),
+                "p90": latency.quantile(0.9),
+                "p99": latency.quantile(0.99),
+                "buckets": {
+                    _format_bound(bound): n for bound, n in latency.cumulative()
+                },
+            },
+        }
+
+
+# (metric name, help text, _RouteMetrics attribute)
+_ROUTE_COUNTERS = (
+    (
+        "transport_errors_total",
+        "Attempts without an HTTP answer.",
+        "transport_errors",
+    ),
+    (
+        "request_bytes_total",
+        "Bytes sent in request bodies.",
+        "request_bytes",
+    ),
+    (
+        "response_bytes_total",
+        "Bytes received in response bodies.",
+        "response_bytes",
+    ),
+    (
+        "retries_total",
+        "Attempts retried after a transient failure.",
+        "retries",
+    ),
+    (
+        "cache_hits_total",
+        "Calls answered by the response cache.",
+        "cache_hits",
+    ),
+    (
+        "cache_misses_total",
+        "Cache lookups that found nothing.",
+        "cache_misses",
+    ),
+)
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if math.isinf(bound) else repr(bound)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsRegistry:
+    """
+    Thread-safe store of the client metrics.
+
+    Args:
+        latency_buckets: Upper bounds, in seconds, of the latency buckets.
+        namespace: Prefix of the exported Prometheus metric names.
+    """
+
+    def __init__(
+        self,
+        latency_buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+        namespace: str = "pylegifrance",
+    ):
+        self.latency_buckets = latency_buckets
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._routes: dict[str, _RouteMetrics] = {}
+        self._token_refreshes = 0
+
+    def _route(self, route: str) -> _RouteMetrics:
+        metrics = self._routes.get(route)
+        if metrics is None:
+            metrics = self._routes[route] = _RouteMetrics(self.latency_buckets)
+        return metrics
+
+    def observe_request(
+        self,
+        route: str,
+        status_code: int,
+        duration: float,
+        request_bytes: int,
+        response_bytes: int,
+    ) -> None:
+        """Record one HTTP attempt that got an answer.
+
+        Args:
+            route: The API route.
+            status_code: The HTTP status of the answer.
+            duration: Time from sending the request to receiving the body,
+                in seconds.
+            request_bytes: Size of the request body.
+            response_bytes: Size of the response body.
+        """
+        with self._lock:
+            metrics = self._route(route)
+            metrics.latency.observe(duration)
+            metrics.statuses[status_code] += 1
+            metrics.request_bytes += request_bytes
+            metrics.response_bytes += response_bytes
+
+    def record_transport_error(self, route: str, request_bytes: int = 0) -> None:
+        """Record an attempt that failed without an HTTP answer."""
+        with self._lock:
+            metrics = self._route(route)
+            metrics.transport_errors += 1
+            metrics.request_bytes += request_bytes
+
+    def record_retry(self, route: str) -> None:
+        """Record that a failed attempt on ``route`` is about to be retried."""
+        with self._lock:
+            self._route(route).retries += 1
+
+    def record_cache(self, route: str, hit: bool) -> None:
+        """Record a response cache lookup for ``route``."""
+        with self._lock:
+            metrics = self._route(route)
+            if hit:
+                metrics.cache_hits += 1
+            else:
+                metrics.cache_misses += 1
+
+    def record_token_refresh(self) -> None:
+        """Record a token obtained from the OAuth endpoint."""
+        with self._lock:
+            self._token_refreshes += 1
+
+    def reset(self) -> None:
+        """Forget every recorded value."""
+        with self._lock:
+            self._routes.clear()
+            self._token_refreshes = 0
+
+    def snapshot(self) -> dict:
+        """Return the current values as plain, JSON-serialisable data.
+
+        Returns:
+            ``{"token_refreshes": int, "routes": {route: {...}}}``, where each
+            route holds its counters and a ``latency`` summary with count,
+            sum, mean, estimated p50/p90/p99 and cumulative buckets.
+        """
+        with self._lock:
+            return {
+                "token_refreshes": self._token_refreshes,
+                "routes": {
+                    route: metrics.snapshot()
+                    for route, metrics in sorted(self._routes.items())
+                },
+            }
+
+    def to_json(self, indent: int | None = None) -> str:
+        """Serialise :meth:`snapshot` to JSON."""
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def to_prometheus(self) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        ns = self.namespace
+        lines: list[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> str:
+            lines.append(f"# HELP {ns}_{name} {help_text}")
+            lines.append(f"# TYPE {ns}_{name} {kind}")
+            return f"{ns}_{name}"
+
+        with self._lock:
+            routes = sorted(self._routes.items())
+
+            name = family(
+                "request_duration_seconds",
+                "histogram",
+                "Latency of Legifrance API attempts.",
+            )
+            for route, metrics in routes:
+                label = f'route="{_escape(route)}"'
+                for bound, count in metrics.latency.cumulative():
+                    lines.append(
+                        f'{name}_bucket{{{label},le="{_format_bound(bound)}"}} {count}'
+                    )
+                lines.append(f"{name}_sum{{{label}}} {metrics.latency.total}")
+                lines.append(f"{name}_count{{{label}}} {metrics.latency.count}")
+
+            name = family(
+                "responses_total", "counter", "API answers by HTTP status code."
+            )
+            for route, metrics in routes:
+                for code, count in sorted(metrics.statuses.items()):
+                    lines.append(
+                        f'{name}{{route="{_escape(route)}",status="{code}"}} {count}'
+                    )
+
+            for metric, help_text, attribute in _ROUTE_COUNTERS:
+                name = family(metric, "counter", help_text)
+                for route, metrics in routes:
+                    value = getattr(metrics, attribute)
+                    lines.append(f'{name}{{route="{_escape(route)}"}} {value}')
+
+            name = family(
+                "token_refreshes_total",
+                "counter",
+                "Access tokens obtained from the OAuth endpoint.",
+            )
+            lines.append(f"{name} {self._token_refreshes}")
+
+        return "\n".join(lines) + "\n"
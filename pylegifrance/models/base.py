@@ -10,4 +10,15 @@ class PyLegifranceBaseModel(BaseModel):
         validate_assignment=True,
         validate_by_name=True,
         validate_by_alias=True,
+        defer_build=True,
     )
+
+
+class GeneratedModel(BaseModel):
+    """Base of the DTOs generated in :mod:`pylegifrance.models.generated.model`.
+
+    Their validators are built on first use rather than at import, so that
+    a program only pays for the DTOs it actually validates.
+    """
+
+    model_config = ConfigDict(defer_build=True)
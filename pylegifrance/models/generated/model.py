@@ -8,14 +8,16 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field, RootModel
+from pydantic import Field, RootModel
+
+from pylegifrance.models.base import GeneratedModel
 
 
 class Model(RootModel[Any]):
     root: Any
 
 
-class KaliTextConsultArticleRequest(BaseModel):
+class KaliTextConsultArticleRequest(GeneratedModel):
     id: str = Field(
         ...,
         description="Identifiant du texte ou d'un de ses éléments enfants (section/article)",
@@ -23,7 +25,7 @@ class KaliTextConsultArticleRequest(BaseModel):
     )
 
 
-class SuggestRequest(BaseModel):
+class SuggestRequest(GeneratedModel):
     search_text: str | None = Field(
         None, alias="searchText", description="Texte à rechercher", examples=["mariage"]
     )
@@ -37,7 +39,7 @@ class Nature(Enum):
     jorfcont = "JORFCONT"
 
 
-class ModificateurDTO(BaseModel):
+class ModificateurDTO(GeneratedModel):
     id_text: str | None = Field(
         None,
         alias="idText",
@@ -60,7 +62,7 @@ class ModificateurDTO(BaseModel):
     )
 
 
-class DossierResult(BaseModel):
+class DossierResult(GeneratedModel):
     libelle_texte: str | None = Field(
         None,
         alias="libelleTexte",
@@ -75,7 +77,7 @@ class DossierResult(BaseModel):
     )
 
 
-class Legislature(BaseModel):
+class Legislature(GeneratedModel):
     date_debut: datetime | None = Field(
         None, alias="dateDebut", description="Date de début", examples=["1340668800000"]
     )
@@ -93,7 +95,7 @@ class TypePagination(Enum):
     article = "ARTICLE"
 
 
-class DebatsParlementairesListRequest(BaseModel):
+class DebatsParlementairesListRequest(GeneratedModel):
     second_sort_value: str | None = Field(
         None, alias="secondSortValue", examples=["ID_DESC"]
     )
@@ -120,7 +122,7 @@ class DebatsParlementairesListRequest(BaseModel):
     )
 
 
-class RelatedLinksArticleRequest(BaseModel):
+class RelatedLinksArticleRequest(GeneratedModel):
     article_id: str = Field(
         ...,
         alias="articleId",
@@ -129,7 +131,7 @@ class RelatedLinksArticleRequest(BaseModel):
     )
 
 
-class HasChronolegiResponse(BaseModel):
+class HasChronolegiResponse(GeneratedModel):
     execution_time: int | None = Field(
         None, alias="executionTime", description="Temps d'exécution"
     )
@@ -141,7 +143,7 @@ class HasChronolegiResponse(BaseModel):
     )
 
 
-class EsQuestionsEcritesParlementaires(BaseModel):
+class EsQuestionsEcritesParlementaires(GeneratedModel):
     url: str | None = None
     date_parution: datetime | None = Field(None, alias="dateParution")
     ref_injection: str | None = Field(None, alias="refInjection")
@@ -162,11 +164,11 @@ class TypeTexte(Enum):
     texte_extension = "TEXTE_EXTENSION"
 
 
-class Titrage(BaseModel):
+class Titrage(GeneratedModel):
     id: str | None = Field(None, description="Identifiant")
 
 
-class ArticleVersion(BaseModel):
+class ArticleVersion(GeneratedModel):
     date_debut: datetime | None = Field(
         None, alias="dateDebut", description="Date de début de la version"
     )
@@ -183,7 +185,7 @@ class ArticleVersion(BaseModel):
     )
 
 
-class Lien(BaseModel):
+class Lien(GeneratedModel):
     libelle: str | None = Field(
         None, description="Libellé", examples=["Dossier législatif du Sénat"]
     )
@@ -198,7 +200,7 @@ class Lien(BaseModel):
     )
 
 
-class DossierLegislatifResult(BaseModel):
+class DossierLegislatifResult(GeneratedModel):
     id: str | None = Field(
         None, description="Identifiant", examples=["JORFDOLE000037460423"]
     )
@@ -225,7 +227,7 @@ class DossierLegislatifResult(BaseModel):
     dossiers: list[DossierResult] | None = Field(None, description="Liste des dossiers")
 
 
-class BodmrTexts(BaseModel):
+class BodmrTexts(GeneratedModel):
     date_bodmr: datetime | None = Field(
         None, alias="dateBodmr", description="Date de publication du bodmr"
     )
@@ -238,14 +240,14 @@ class BodmrTexts(BaseModel):
     )
 
 
-class AdressePostale(BaseModel):
+class AdressePostale(GeneratedModel):
     ville: str | None = Field(None, description="Ville", examples=["PARIS"])
     code_postal: str | None = Field(
         None, alias="codePostal", description="Code postal", examples=["75005"]
     )
 
 
-class BoccListRequest(BaseModel):
+class BoccListRequest(GeneratedModel):
     idccs: list[str] | None = Field(None, examples=[1880])
     search_for_global_bocc: bool | None = Field(None, alias="searchForGlobalBocc")
     sort_value: str | None = Field(None, alias="sortValue", examples=["BOCC_SORT_DESC"])
@@ -272,7 +274,7 @@ class BoccListRequest(BaseModel):
     search_for_texts_bocc: bool | None = Field(None, alias="searchForTextsBocc")
 
 
-class SignataireKali(BaseModel):
+class SignataireKali(GeneratedModel):
     fait_a: str | None = Field(None, alias="faitA", description="Fait A")
     denonciation: str | None = Field(None, description="Dénonciation")
     execution: str | None = Field(None, description="Exécution")
@@ -284,7 +286,7 @@ class SignataireKali(BaseModel):
     )
 
 
-class JuriConsultRequest(BaseModel):
+class JuriConsultRequest(GeneratedModel):
     searched_string: str | None = Field(
         None,
         alias="searchedString",
@@ -299,7 +301,7 @@ class JuriConsultRequest(BaseModel):
     )
 
 
-class EsGlobalBocc(BaseModel):
+class EsGlobalBocc(GeneratedModel):
     date_parution: datetime | None = Field(None, alias="dateParution")
     file_name: str | None = Field(None, alias="fileName")
     display_size: str | None = Field(None, alias="displaySize")
@@ -307,7 +309,7 @@ class EsGlobalBocc(BaseModel):
     num_parution: str | None = Field(None, alias="numParution")
 
 
-class SearchAdditionalResult(BaseModel):
+class SearchAdditionalResult(GeneratedModel):
     properties: dict[str, str] | None = None
     id: str | None = None
 
@@ -346,7 +348,7 @@ class LegalStatu(Enum):
     remplace = "REMPLACE"
 
 
-class ConventionsListRequest(BaseModel):
+class ConventionsListRequest(GeneratedModel):
     textes_base: list[TextesBaseEnum] | None = Field(None, alias="textesBase")
     sort: Sort | None = Field(
         None, description="Ordre de tri", examples=["DATE_PUBLI_ASC"]
@@ -414,7 +416,7 @@ class Supply(Enum):
     pdf = "PDF"
 
 
-class SuggestSupplyRequest(BaseModel):
+class SuggestSupplyRequest(GeneratedModel):
     documents_dits: bool | None = Field(None, alias="documentsDits")
     search_text: str | None = Field(
         None, alias="searchText", description="Texte à rechercher", examples=["mariage"]
@@ -426,7 +428,7 @@ class SuggestSupplyRequest(BaseModel):
     )
 
 
-class SearchNearestVersionRequest(BaseModel):
+class SearchNearestVersionRequest(GeneratedModel):
     cid_section: str | None = Field(
         None,
         alias="cidSection",
@@ -444,7 +446,7 @@ class SearchNearestVersionRequest(BaseModel):
     )
 
 
-class ElasticData(BaseModel):
+class ElasticData(GeneratedModel):
     index_name: str | None = Field(
         None,
         alias="indexName",
@@ -465,7 +467,7 @@ class ElasticData(BaseModel):
     )
 
 
-class CodeConsultRequest(BaseModel):
+class CodeConsultRequest(GeneratedModel):
     abrogated: bool | None = None
     text_id: str = Field(
         ...,
@@ -489,7 +491,7 @@ class CodeConsultRequest(BaseModel):
     )
 
 
-class BoccAndTextListRequest(BaseModel):
+class BoccAndTextListRequest(GeneratedModel):
     page_number: int = Field(
         ...,
         alias="pageNumber",
@@ -508,7 +510,7 @@ class BoccAndTextListRequest(BaseModel):
     titre: str | None = None
 
 
-class SuggestValue(BaseModel):
+class SuggestValue(GeneratedModel):
     appellations: list[str] | None = Field(
         None, description="Appellations", examples=["Loi Macron"]
     )
@@ -542,13 +544,13 @@ class SuggestValue(BaseModel):
     )
 
 
-class ArticleRequest(BaseModel):
+class ArticleRequest(GeneratedModel):
     id: str = Field(
         ..., description="Identifiant de l'article", examples=["LEGIARTI000006307920"]
     )
 
 
-class ChronoLegiTextRequest(BaseModel):
+class ChronoLegiTextRequest(GeneratedModel):
     end_year: int = Field(
         ...,
         alias="endYear",
@@ -575,7 +577,7 @@ class ChronoLegiTextRequest(BaseModel):
     )
 
 
-class LegiSommaireConsultRequest(BaseModel):
+class LegiSommaireConsultRequest(GeneratedModel):
     date: str = Field(..., description="Date de consultation", examples=["2021-04-15"])
     nature: str | None = Field(
         None,
@@ -590,7 +592,7 @@ class LegiSommaireConsultRequest(BaseModel):
     )
 
 
-class JorfConsultWithIdEliAliasRequest(BaseModel):
+class JorfConsultWithIdEliAliasRequest(GeneratedModel):
     id_eli_or_alias: str = Field(
         ...,
         alias="idEliOrAlias",
@@ -599,7 +601,7 @@ class JorfConsultWithIdEliAliasRequest(BaseModel):
     )
 
 
-class Conteneur(BaseModel):
+class Conteneur(GeneratedModel):
     etat: str | None = Field(
         None, description="Etat juridique", examples=["VIGUEUR_ETEN"]
     )
@@ -656,7 +658,7 @@ class Type(Enum):
     proposition_loi = "PROPOSITION_LOI"
 
 
-class DossiersLegislatifsRequest(BaseModel):
+class DossiersLegislatifsRequest(GeneratedModel):
     type: Type = Field(
         ..., description="Type de dossier législatif", examples=["LOI_PUBLIEE"]
     )
@@ -668,7 +670,7 @@ class DossiersLegislatifsRequest(BaseModel):
     )
 
 
-class TableRequest(BaseModel):
+class TableRequest(GeneratedModel):
     end_year: int = Field(
         ..., alias="endYear", description="Année de fin", examples=[2017]
     )
@@ -677,7 +679,7 @@ class TableRequest(BaseModel):
     )
 
 
-class YearsWithNoTableResponse(BaseModel):
+class YearsWithNoTableResponse(GeneratedModel):
     lst_year_disabled: list[int] | None = Field(
         None,
         alias="lstYearDisabled",
@@ -686,7 +688,7 @@ class YearsWithNoTableResponse(BaseModel):
     )
 
 
-class DocumentAdministratif(BaseModel):
+class DocumentAdministratif(GeneratedModel):
     nor: str | None = Field(None, description="Numéro NOR", examples=["CCCJ1718194V"])
     date_document: datetime | None = Field(
         None,
@@ -743,7 +745,7 @@ class DocumentAdministratif(BaseModel):
     )
 
 
-class PdfMetadata(BaseModel):
+class PdfMetadata(GeneratedModel):
     path_to_file: str | None = Field(None, alias="pathToFile")
     file_name: str | None = Field(None, alias="fileName")
     display_size: str | None = Field(None, alias="displaySize")
@@ -756,7 +758,7 @@ class PdfMetadata(BaseModel):
     num: str | None = None
 
 
-class ConventionsListResult(BaseModel):
+class ConventionsListResult(GeneratedModel):
     etat: str | None = Field(
         None, description="Etat juridique du texte", examples=["ABROGE"]
     )
@@ -793,7 +795,7 @@ class ConventionsListResult(BaseModel):
     pdf_file_name: str | None = Field(None, alias="pdfFileName")
 
 
-class ConcordanceLinksRequest(BaseModel):
+class ConcordanceLinksRequest(GeneratedModel):
     article_id: str = Field(
         ...,
         alias="articleId",
@@ -802,7 +804,7 @@ class ConcordanceLinksRequest(BaseModel):
     )
 
 
-class KaliTextConsultSectionRequest(BaseModel):
+class KaliTextConsultSectionRequest(GeneratedModel):
     id: str = Field(
         ...,
         description="Identifiant du texte ou d'un de ses éléments enfants (section/article)",
@@ -827,7 +829,7 @@ class Fond(Enum):
     acco = "ACCO"
 
 
-class QuestionsEcritesParlementairesListRequest(BaseModel):
+class QuestionsEcritesParlementairesListRequest(GeneratedModel):
     second_sort_value: str | None = Field(
         None, alias="secondSortValue", examples=["ID_DESC"]
     )
@@ -854,7 +856,7 @@ class QuestionsEcritesParlementairesListRequest(BaseModel):
     )
 
 
-class SectionCidRequest(BaseModel):
+class SectionCidRequest(GeneratedModel):
     cid: str = Field(
         ...,
         description="Chronical CID de la section",
@@ -862,7 +864,7 @@ class SectionCidRequest(BaseModel):
     )
 
 
-class LienConcorde(BaseModel):
+class LienConcorde(GeneratedModel):
     nature_text: str | None = Field(
         None, alias="natureText", description="Nature du texte lié", examples=["LOI"]
     )
@@ -898,7 +900,7 @@ class LienConcorde(BaseModel):
     )
 
 
-class TexteLien(BaseModel):
+class TexteLien(GeneratedModel):
     title: str | None = Field(None, description="Titre")
     date_publi_texte: str | None = Field(
         None, alias="datePubliTexte", description="Date de publication"
@@ -920,7 +922,7 @@ class TexteLien(BaseModel):
     nor_texte: str | None = Field(None, alias="norTexte", description="NOR")
 
 
-class Niveau(BaseModel):
+class Niveau(GeneratedModel):
     libelle: str | None = Field(None, description="Libellé", examples=["Sénat"])
     id: str | None = Field(
         None, description="Identifiant du niveau", examples=["1415810580974"]
@@ -929,20 +931,20 @@ class Niveau(BaseModel):
     niveaux: list[Niveau] | None = Field(None, description="liste des niveaux enfants")
 
 
-class ElasticDataResponse(BaseModel):
+class ElasticDataResponse(GeneratedModel):
     lst_data: list[ElasticData] | None = Field(
         None, alias="lstData", description="Liste des informations par index"
     )
 
 
-class DecisionAttaquee(BaseModel):
+class DecisionAttaquee(GeneratedModel):
     date: datetime | None = Field(
         None, description="Date de la décision", examples=["32472144000000"]
     )
     formation: str | None = Field(None, description="formation")
 
 
-class BodmrListRequest(BaseModel):
+class BodmrListRequest(GeneratedModel):
     sort: str | None = Field(
         None, description="Ordre de tri", examples=["PUBLICATION_DATE_ASC"]
     )
@@ -1003,7 +1005,7 @@ class TypeChamp(Enum):
     idcc = "IDCC"
 
 
-class CibleChronoDTO(BaseModel):
+class CibleChronoDTO(GeneratedModel):
     date_debut: datetime | None = Field(
         None,
         alias="dateDebut",
@@ -1058,13 +1060,13 @@ class CibleChronoDTO(BaseModel):
     )
 
 
-class DocsAdminsListRequest(BaseModel):
+class DocsAdminsListRequest(GeneratedModel):
     years: list[str] | None = Field(
         None, description="Liste des années à filtrer", examples=[[2016, 2017]]
     )
 
 
-class Theme(BaseModel):
+class Theme(GeneratedModel):
     libelle: str | None = Field(
         None, description="Libellé", examples=["Calendrier des négociations"]
     )
@@ -1072,7 +1074,7 @@ class Theme(BaseModel):
     groupe: str | None = Field(None, description="Groupe", examples=["10"])
 
 
-class CodeConsultWithAncienId(BaseModel):
+class CodeConsultWithAncienId(GeneratedModel):
     ancien_id: str | None = Field(
         None,
         alias="ancienId",
@@ -1081,7 +1083,7 @@ class CodeConsultWithAncienId(BaseModel):
     )
 
 
-class CirculaireConsultRequest(BaseModel):
+class CirculaireConsultRequest(GeneratedModel):
     searched_string: str | None = Field(
         None,
         alias="searchedString",
@@ -1091,7 +1093,7 @@ class CirculaireConsultRequest(BaseModel):
     id: str = Field(..., description="Identifiant de la circulaire", examples=["44128"])
 
 
-class ArticleCidRequest(BaseModel):
+class ArticleCidRequest(GeneratedModel):
     cid: str = Field(
         ..., description="Chronical ID de l'article", examples=["LEGIARTI000006307920"]
     )
@@ -1119,7 +1121,7 @@ class Nature2(Enum):
     accord_fonction_publique = "ACCORD_FONCTION_PUBLIQUE"
 
 
-class BoccConsultRequest(BaseModel):
+class BoccConsultRequest(GeneratedModel):
     for_global_bocc: bool | None = Field(None, alias="forGlobalBocc")
     id: str | None = Field(None, examples=["boc_20200028_0001_p000.pdf"])
 
@@ -1143,11 +1145,11 @@ class Action(Enum):
     elargissement = "ELARGISSEMENT"
 
 
-class StreamingResponseBody(BaseModel):
+class StreamingResponseBody(GeneratedModel):
     pass
 
 
-class KaliTextConsultRequest(BaseModel):
+class KaliTextConsultRequest(GeneratedModel):
     searched_string: str | None = Field(
         None,
         alias="searchedString",
@@ -1161,7 +1163,7 @@ class KaliTextConsultRequest(BaseModel):
     )
 
 
-class ArticleIdEliOrAliasRequest(BaseModel):
+class ArticleIdEliOrAliasRequest(GeneratedModel):
     id_eli_or_alias: str = Field(
         ...,
         alias="idEliOrAlias",
@@ -1170,7 +1172,7 @@ class ArticleIdEliOrAliasRequest(BaseModel):
     )
 
 
-class FileMetadata(BaseModel):
+class FileMetadata(GeneratedModel):
     path_to_file: str | None = Field(
         None,
         alias="pathToFile",
@@ -1217,7 +1219,7 @@ class FileMetadata(BaseModel):
     )
 
 
-class ModificationDTO(BaseModel):
+class ModificationDTO(GeneratedModel):
     modificateur: ModificateurDTO | None = Field(
         None, description="Elément ayant apporté la modification"
     )
@@ -1226,13 +1228,13 @@ class ModificationDTO(BaseModel):
     )
 
 
-class SearchCanonicalArticleVersionResponse(BaseModel):
+class SearchCanonicalArticleVersionResponse(GeneratedModel):
     article_versions: list[ArticleVersion] | None = Field(
         None, alias="articleVersions", description="Liste des versions d'articles"
     )
 
 
-class Attachment(BaseModel):
+class Attachment(GeneratedModel):
     title: str | None = Field(None, description="Titre")
     name: str | None = Field(None, description="Nom")
     language: str | None = Field(None, description="Langue", examples=["fr"])
@@ -1252,7 +1254,7 @@ class Attachment(BaseModel):
     )
 
 
-class SameNumArticleRequest(BaseModel):
+class SameNumArticleRequest(GeneratedModel):
     date: str = Field(..., description="Date de référence", examples=["2021-04-15"])
     article_cid: str = Field(
         ...,
@@ -1271,7 +1273,7 @@ class SameNumArticleRequest(BaseModel):
     )
 
 
-class ServicePublicLinksArticleRequest(BaseModel):
+class ServicePublicLinksArticleRequest(GeneratedModel):
     article_cid: str | None = Field(
         None,
         alias="articleCid",
@@ -1283,7 +1285,7 @@ class ServicePublicLinksArticleRequest(BaseModel):
     )
 
 
-class LiensRelatifsDTO(BaseModel):
+class LiensRelatifsDTO(GeneratedModel):
     cid_text: str | None = Field(
         None,
         alias="cidText",
@@ -1320,7 +1322,7 @@ class MapStringSuggestValue(RootModel[dict[str, SuggestValue] | None]):
     root: dict[str, SuggestValue] | None = None
 
 
-class KaliContConsultRequest(BaseModel):
+class KaliContConsultRequest(GeneratedModel):
     searched_string: str | None = Field(
         None,
         alias="searchedString",
@@ -1334,14 +1336,14 @@ class KaliContConsultRequest(BaseModel):
     )
 
 
-class SuggestAccoValue(BaseModel):
+class SuggestAccoValue(GeneratedModel):
     siret: str | None = Field(None, description="SIRET")
     raison_sociale: str | None = Field(
         None, alias="raisonSociale", description="Raison sociale"
     )
 
 
-class ArticleDTO(BaseModel):
+class ArticleDTO(GeneratedModel):
     date_debut: datetime | None = Field(
         None,
         alias="dateDebut",
@@ -1378,7 +1380,7 @@ class ArticleDTO(BaseModel):
     )
 
 
-class SuggestPdcRequest(BaseModel):
+class SuggestPdcRequest(GeneratedModel):
     search_text: str | None = Field(
         None, alias="searchText", description="Texte à rechercher", examples=["mariage"]
     )
@@ -1390,7 +1392,7 @@ class MapStringSuggestAccoValue(RootModel[dict[str, SuggestAccoValue] | None]):
     root: dict[str, SuggestAccoValue] | None = None
 
 
-class LegislaturesListResponse(BaseModel):
+class LegislaturesListResponse(GeneratedModel):
     execution_time: int | None = Field(
         None, alias="executionTime", description="Temps d'exécution"
     )
@@ -1399,7 +1401,7 @@ class LegislaturesListResponse(BaseModel):
     )
 
 
-class ArticleConsultWithIdAndNum(BaseModel):
+class ArticleConsultWithIdAndNum(GeneratedModel):
     id: str | None = Field(
         None, description="ID du LEGITEXT cible", examples=["LEGITEXT000006075116"]
     )
@@ -1408,7 +1410,7 @@ class ArticleConsultWithIdAndNum(BaseModel):
     )
 
 
-class DebatParlementaireConsultRequest(BaseModel):
+class DebatParlementaireConsultRequest(GeneratedModel):
     id: str = Field(
         ...,
         description="Identifiant du débat parlementaire",
@@ -1416,7 +1418,7 @@ class DebatParlementaireConsultRequest(BaseModel):
     )
 
 
-class StructureLienSection(BaseModel):
+class StructureLienSection(GeneratedModel):
     date_debut: datetime | None = Field(None, alias="dateDebut")
     renvoi_num: str | None = Field(None, alias="renvoiNum")
     etat: str | None = None
@@ -1430,7 +1432,7 @@ class StructureLienSection(BaseModel):
     ordre: int | None = None
 
 
-class JorfConsultRequest(BaseModel):
+class JorfConsultRequest(GeneratedModel):
     searched_string: str | None = Field(
         None,
         alias="searchedString",
@@ -1445,7 +1447,7 @@ class JorfConsultRequest(BaseModel):
     )
 
 
-class GlobalBoccListRequest(BaseModel):
+class GlobalBoccListRequest(GeneratedModel):
     id_global_bocc: str | None = Field(
         None, alias="idGlobalBocc", examples=["CCO20190051"]
     )
@@ -1470,7 +1472,7 @@ class GlobalBoccListRequest(BaseModel):
     )
 
 
-class Facet(BaseModel):
+class Facet(GeneratedModel):
     field: str | None = Field(
         None,
         description="Nom du champ représentant la facette",
@@ -1499,7 +1501,7 @@ class Facet(BaseModel):
     )
 
 
-class SearchCanonicalVersionResponse(BaseModel):
+class SearchCanonicalVersionResponse(GeneratedModel):
     date_debut: str | None = Field(None, alias="dateDebut", description="Date de début")
     cid: str | None = Field(
         None, description="Chronical ID du texte", examples=["LEGITEXT000006070721"]
@@ -1507,7 +1509,7 @@ class SearchCanonicalVersionResponse(BaseModel):
     date_fin: str | None = Field(None, alias="dateFin", description="Date de fin")
 
 
-class EsTextBocc(BaseModel):
+class EsTextBocc(GeneratedModel):
     idccs: list[str] | None = None
     texte_date: datetime | None = Field(None, alias="texteDate")
     file_name: str | None = Field(None, alias="fileName")
@@ -1520,7 +1522,7 @@ class EsTextBocc(BaseModel):
     title: str | None = None
 
 
-class ChronoLegiArticleRequest(BaseModel):
+class ChronoLegiArticleRequest(GeneratedModel):
     text_cid: str = Field(
         ...,
         alias="textCid",
@@ -1535,7 +1537,7 @@ class ChronoLegiArticleRequest(BaseModel):
     )
 
 
-class DatesWithNoJoResponse(BaseModel):
+class DatesWithNoJoResponse(GeneratedModel):
     execution_time: int | None = Field(
         None, alias="executionTime", description="Temps d'exécution"
     )
@@ -1547,7 +1549,7 @@ class DatesWithNoJoResponse(BaseModel):
     )
 
 
-class Nomenclature(BaseModel):
+class Nomenclature(GeneratedModel):
     arbo: str | None = Field(None, description="arborescent")
     parent: str | None = Field(None, description="id du parent du jurinome")
     titre_juritext: str | None = Field(
@@ -1577,7 +1579,7 @@ class Nomenclature(BaseModel):
     )
 
 
-class DetailContext(BaseModel):
+class DetailContext(GeneratedModel):
     x_path: str | None = Field(
         None,
         alias="xPath",
@@ -1603,7 +1605,7 @@ class DetailContext(BaseModel):
 SearchCanonicalVersionRequest = SearchNearestVersionRequest
 
 
-class Bodmr(BaseModel):
+class Bodmr(GeneratedModel):
     texts: BodmrTexts | None = None
     ref_injection: str | None = Field(
         None,
@@ -1618,7 +1620,7 @@ class Bodmr(BaseModel):
     )
 
 
-class JuriPlanClassementRequest(BaseModel):
+class JuriPlanClassementRequest(GeneratedModel):
     search_by_niveau: bool | None = Field(
         None,
         alias="searchByNiveau",
@@ -1646,12 +1648,12 @@ class JuriPlanClassementRequest(BaseModel):
     )
 
 
-class Syndicat(BaseModel):
+class Syndicat(GeneratedModel):
     libelle: str | None = Field(None, description="Libellé", examples=["CFDT"])
     code: str | None = Field(None, description="Code", examples=["3"])
 
 
-class Dossier(BaseModel):
+class Dossier(GeneratedModel):
     libelle_texte: str | None = Field(
         None, alias="libelleTexte", description="Libellé", examples=["Projet de loi"]
     )
@@ -1661,7 +1663,7 @@ class Dossier(BaseModel):
     )
 
 
-class ParentChronoDTO(BaseModel):
+class ParentChronoDTO(GeneratedModel):
     date_debut: datetime | None = Field(
         None,
         alias="dateDebut",
@@ -1705,7 +1707,7 @@ class ParentChronoDTO(BaseModel):
     )
 
 
-class SuggestResponse(BaseModel):
+class SuggestResponse(GeneratedModel):
     total_result_number: int | None = Field(None, alias="totalResultNumber")
     results: dict[str, dict[str, SuggestValue]] | None = Field(
         None,
@@ -1714,7 +1716,7 @@ class SuggestResponse(BaseModel):
     execution_time: int | None = Field(None, alias="executionTime")
 
 
-class DatePeriod(BaseModel):
+class DatePeriod(GeneratedModel):
     start: datetime | None = Field(
         None, description="Date de début", examples=["2016-01-01"]
     )
@@ -1723,7 +1725,7 @@ class DatePeriod(BaseModel):
     )
 
 
-class TexteSommaire(BaseModel):
+class TexteSommaire(GeneratedModel):
     autre_resume: str | None = Field(
         None, alias="autreResume", description="Autre résumé"
     )
@@ -1734,7 +1736,7 @@ class TexteSommaire(BaseModel):
     )
 
 
-class ConsultDateRequest(BaseModel):
+class ConsultDateRequest(GeneratedModel):
     year: int | None = Field(None, description="Année", examples=[2019])
     month: int | None = Field(None, description="Mois", examples=[1])
     day_of_month: int | None = Field(
@@ -1742,7 +1744,7 @@ class ConsultDateRequest(BaseModel):
     )
 
 
-class LienTxt(BaseModel):
+class LienTxt(GeneratedModel):
     autorite: str | None = Field(None, description="Autorité lié au texte")
     etat: str | None = Field(None, description="Etat juridique du texte")
     id: str | None = Field(None, description="Identifiant du texte")
@@ -1759,7 +1761,7 @@ class LienTxt(BaseModel):
     ordre: int | None = Field(None, description="Numéro d'ordre")
 
 
-class JorfContConsultRequest(BaseModel):
+class JorfContConsultRequest(GeneratedModel):
     page_size: int | None = Field(
         None,
         alias="pageSize",
@@ -1800,7 +1802,7 @@ class JorfContConsultRequest(BaseModel):
     )
 
 
-class LienCitation(BaseModel):
+class LienCitation(GeneratedModel):
     date_debut: datetime | None = Field(None, alias="dateDebut")
     parent_cid: str | None = Field(None, alias="parentCid")
     nature_text: str | None = Field(
@@ -1840,7 +1842,7 @@ class LienCitation(BaseModel):
     num_texte: str | None = Field(None, alias="numTexte")
 
 
-class DossierLegislatifRequest(BaseModel):
+class DossierLegislatifRequest(GeneratedModel):
     id: str = Field(
         ...,
         description="Identifiant du dossier législatif",
@@ -1848,7 +1850,7 @@ class DossierLegislatifRequest(BaseModel):
     )
 
 
-class CodeListResult(BaseModel):
+class CodeListResult(GeneratedModel):
     date_debut: str | None = Field(
         None,
         alias="dateDebut",
@@ -1892,7 +1894,7 @@ class TypeRecherche(Enum):
     )
 
 
-class CritereDTO(BaseModel):
+class CritereDTO(GeneratedModel):
     proximite: int | None = Field(
         None,
         description="Proximité maximum entre les mots du champ valeur. La proximité représente la distance maximale, en mots, entre deux termes recherchés.",
@@ -1927,7 +1929,7 @@ class CritereDTO(BaseModel):
     )
 
 
-class CnilConsultWithAncienId(BaseModel):
+class CnilConsultWithAncienId(GeneratedModel):
     ancien_id: str | None = Field(
         None,
         alias="ancienId",
@@ -1936,7 +1938,7 @@ class CnilConsultWithAncienId(BaseModel):
     )
 
 
-class SearchExtract(BaseModel):
+class SearchExtract(GeneratedModel):
     date_debut: str | None = Field(
         None,
         alias="dateDebut",
@@ -1964,7 +1966,7 @@ class SearchExtract(BaseModel):
     num: str | None = None
 
 
-class KaliContConsultIdccRequest(BaseModel):
+class KaliContConsultIdccRequest(GeneratedModel):
     id: str = Field(
         ...,
         description="Identifiant de la convention collective ou son numéro IDCC",
@@ -1972,7 +1974,7 @@ class KaliContConsultIdccRequest(BaseModel):
     )
 
 
-class LienModification(BaseModel):
+class LienModification(GeneratedModel):
     link_type: str | None = Field(
         None, alias="linkType", description="Type de lien", examples=["MODIFIE"]
     )
@@ -2026,7 +2028,7 @@ class LienModification(BaseModel):
     )
 
 
-class SearchTitle(BaseModel):
+class SearchTitle(GeneratedModel):
     title: str | None = Field(None, description="Titre", examples=["Code civil"])
     legal_status: str | None = Field(
         None, alias="legalStatus", description="Etat juridique de la version"
@@ -2050,14 +2052,14 @@ class SearchTitle(BaseModel):
     nature: str | None = Field(None, description="Nature du texte")
 
 
-class TexteReference(BaseModel):
+class TexteReference(GeneratedModel):
     url: str | None = Field(None, description="Lien vers le texte")
     texte_reference: str | None = Field(
         None, alias="texteReference", description="Texte de référence"
     )
 
 
-class LawDecreeConsultRequest(BaseModel):
+class LawDecreeConsultRequest(GeneratedModel):
     searched_string: str | None = Field(
         None,
         alias="searchedString",
@@ -2074,7 +2076,7 @@ class LawDecreeConsultRequest(BaseModel):
     )
 
 
-class SectionsRevisionArticleResponse(BaseModel):
+class SectionsRevisionArticleResponse(GeneratedModel):
     new_texts: list[ArticleDTO] | None = Field(
         None, alias="newTexts", description="Liste des nouveaux textes liés à l'article"
     )
@@ -2086,14 +2088,14 @@ class SectionsRevisionArticleResponse(BaseModel):
     )
 
 
-class Arborescence(BaseModel):
+class Arborescence(GeneratedModel):
     liens: list[Lien] | None = Field(
         None, description="Liste des liens de premier niveau"
     )
     niveaux: list[Niveau] | None = Field(None, description="Liste des niveaux enfants")
 
 
-class AccoConsultRequest(BaseModel):
+class AccoConsultRequest(GeneratedModel):
     searched_string: str | None = Field(
         None,
         alias="searchedString",
@@ -2107,7 +2109,7 @@ class AccoConsultRequest(BaseModel):
     )
 
 
-class StructureLienArticle(BaseModel):
+class StructureLienArticle(GeneratedModel):
     date_debut: datetime | None = Field(None, alias="dateDebut")
     id: str | None = None
     etat: str | None = None
@@ -2119,7 +2121,7 @@ class Sort2(Enum):
     title_asc = "TITLE_ASC"
 
 
-class CodeListRequest(BaseModel):
+class CodeListRequest(GeneratedModel):
     sort: Sort2 | None = Field(None, description="Ordre de tri", examples=["TITLE_ASC"])
     page_size: int = Field(
         ...,
@@ -2146,7 +2148,7 @@ class CodeListRequest(BaseModel):
     )
 
 
-class CnilConsultRequest(BaseModel):
+class CnilConsultRequest(GeneratedModel):
     searched_string: str | None = Field(
         None,
         alias="searchedString",
@@ -2161,7 +2163,7 @@ class CnilConsultRequest(BaseModel):
     )
 
 
-class JuriConsultWithAncienId(BaseModel):
+class JuriConsultWithAncienId(GeneratedModel):
     ancien_id: str | None = Field(
         None,
         alias="ancienId",
@@ -2170,7 +2172,7 @@ class JuriConsultWithAncienId(BaseModel):
     )
 
 
-class LegiConsultRequest(BaseModel):
+class LegiConsultRequest(GeneratedModel):
     searched_string: str | None = Field(
         None,
         alias="searchedString",
@@ -2186,7 +2188,7 @@ class LegiConsultRequest(BaseModel):
     )
 
 
-class ServicePublicLinksArticleResponse(BaseModel):
+class ServicePublicLinksArticleResponse(GeneratedModel):
     execution_time: int | None = Field(
         None, alias="executionTime", description="Temps d'exécution"
     )
@@ -2197,13 +2199,13 @@ class ServicePublicLinksArticleResponse(BaseModel):
     )
 
 
-class LastNElementRequest(BaseModel):
+class LastNElementRequest(GeneratedModel):
     nb_element: int = Field(
         ..., alias="nbElement", description="Nombre de JO à remonter", examples=[5]
     )
 
 
-class Tms(BaseModel):
+class Tms(GeneratedModel):
     liens_txt: list[LienTxt] | None = Field(
         None,
         alias="liensTxt",
@@ -2219,11 +2221,11 @@ class Tms(BaseModel):
     niv: int | None = Field(None, description="Niveau de la section", examples=[1])
 
 
-class JorfConsultWithNorRequest(BaseModel):
+class JorfConsultWithNorRequest(GeneratedModel):
     nor: str = Field(..., description="NOR", examples=["MAEJ9830052D"])
 
 
-class DossiersLegislatifsListResponse(BaseModel):
+class DossiersLegislatifsListResponse(GeneratedModel):
     legislature: Legislature | None = Field(None, description="Législature associée")
     execution_time: int | None = Field(
         None, alias="executionTime", description="Temps d'exécution"
@@ -2235,7 +2237,7 @@ class DossiersLegislatifsListResponse(BaseModel):
     )
 
 
-class QuestionsEcritesParlementairesListResponse(BaseModel):
+class QuestionsEcritesParlementairesListResponse(GeneratedModel):
     total_result_number: int | None = Field(
         None,
         alias="totalResultNumber",
@@ -2261,7 +2263,7 @@ class QuestionsEcritesParlementairesListResponse(BaseModel):
     )
 
 
-class GetJorfContResponse(BaseModel):
+class GetJorfContResponse(GeneratedModel):
     total_nb_result: int | None = Field(
         None, alias="totalNbResult", description="Nombre de résultats", examples=[5]
     )
@@ -2273,7 +2275,7 @@ class GetJorfContResponse(BaseModel):
     )
 
 
-class DossierLegislatif(BaseModel):
+class DossierLegislatif(GeneratedModel):
     legislature: Legislature | None = Field(None, description="Législature")
     url: str | None = Field(None, description="chemin relatif vers le fichier xml")
     id: str | None = Field(
@@ -2331,7 +2333,7 @@ class DossierLegislatif(BaseModel):
     arborescence: Arborescence | None = Field(None, description="Arborescence")
 
 
-class LODAListResult(BaseModel):
+class LODAListResult(GeneratedModel):
     date_debut: str | None = Field(
         None,
         alias="dateDebut",
@@ -2369,7 +2371,7 @@ class LODAListResult(BaseModel):
     )
 
 
-class Circulaire(BaseModel):
+class Circulaire(GeneratedModel):
     nor: str | None = Field(None, description="Numéro NOR", examples=["MENV1829930J"])
     ministeres_deposants: list[str] | None = Field(
         None, alias="ministeresDeposants", description="Liste des ministères déposants"
@@ -2520,7 +2522,7 @@ class Circulaire(BaseModel):
     )
 
 
-class BodmrListResponse(BaseModel):
+class BodmrListResponse(GeneratedModel):
     total_result_number: int | None = Field(
         None,
         alias="totalResultNumber",
@@ -2547,7 +2549,7 @@ class BodmrListResponse(BaseModel):
     )
 
 
-class Debat(BaseModel):
+class Debat(GeneratedModel):
     date_parution: datetime | None = Field(None, alias="dateParution")
     display_size: str | None = Field(None, alias="displaySize")
     id: str | None = None
@@ -2568,7 +2570,7 @@ class Debat(BaseModel):
     nom_session: str | None = Field(None, alias="nomSession")
 
 
-class ConventionsListResponse(BaseModel):
+class ConventionsListResponse(GeneratedModel):
     total_result_number: int | None = Field(
         None,
         alias="totalResultNumber",
@@ -2596,7 +2598,7 @@ class ConventionsListResponse(BaseModel):
     )
 
 
-class SuggestAccoResponse(BaseModel):
+class SuggestAccoResponse(GeneratedModel):
     total_result_number: int | None = Field(None, alias="totalResultNumber")
     results: dict[str, dict[str, SuggestAccoValue]] | None = Field(
         None, description="Liste des suggestions"
@@ -2604,7 +2606,7 @@ class SuggestAccoResponse(BaseModel):
     execution_time: int | None = Field(None, alias="executionTime")
 
 
-class ConsultCirculaireResponse(BaseModel):
+class ConsultCirculaireResponse(GeneratedModel):
     dereferenced: bool | None = Field(
         None,
         description="Identifie si le contenu est référençable par les robots d'indexation",
@@ -2616,7 +2618,7 @@ class ConsultCirculaireResponse(BaseModel):
     circulaire: Circulaire | None = Field(None, description="Circulaire")
 
 
-class EsParutionBocc(BaseModel):
+class EsParutionBocc(GeneratedModel):
     texts: list[EsTextBocc] | None = None
     ref_injection: str | None = Field(None, alias="refInjection")
     global_bocc: EsGlobalBocc | None = Field(None, alias="globalBocc")
@@ -2624,7 +2626,7 @@ class EsParutionBocc(BaseModel):
     id_tech_injection: str | None = Field(None, alias="idTechInjection")
 
 
-class Context(BaseModel):
+class Context(GeneratedModel):
     nombre_version_parent: int | None = Field(
         None,
         alias="nombreVersionParent",
@@ -2644,7 +2646,7 @@ class Context(BaseModel):
     )
 
 
-class DocsAdminsListResponse(BaseModel):
+class DocsAdminsListResponse(GeneratedModel):
     total_result_number: int | None = Field(
         None,
         alias="totalResultNumber",
@@ -2662,7 +2664,7 @@ class DocsAdminsListResponse(BaseModel):
     )
 
 
-class CodeListResponse(BaseModel):
+class CodeListResponse(GeneratedModel):
     total_result_number: int | None = Field(
         None,
         alias="totalResultNumber",
@@ -2685,7 +2687,7 @@ class CodeListResponse(BaseModel):
     )
 
 
-class Accord(BaseModel):
+class Accord(GeneratedModel):
     date_effet: datetime | None = Field(
         None,
         alias="dateEffet",
@@ -2790,7 +2792,7 @@ class Accord(BaseModel):
     siret: str | None = Field(None, description="SIRET", examples=["87280278000025"])
 
 
-class Section(BaseModel):
+class Section(GeneratedModel):
     date_debut: datetime | None = Field(None, alias="dateDebut")
     id: str | None = None
     titre: str | None = None
@@ -2807,7 +2809,7 @@ class Section(BaseModel):
     ref_injection: str | None = Field(None, alias="refInjection")
 
 
-class ChampDTO(BaseModel):
+class ChampDTO(GeneratedModel):
     criteres: list[CritereDTO] | None = Field(
         None,
         description="Liste des critères/groupes de critères de recherche pour ce champ",
@@ -2823,7 +2825,7 @@ class ChampDTO(BaseModel):
     )
 
 
-class GetTableResponse(BaseModel):
+class GetTableResponse(GeneratedModel):
     total_nb_result: int | None = Field(None, alias="totalNbResult")
     execution_time: int | None = Field(
         None, alias="executionTime", description="Temps d'exécution"
@@ -2833,7 +2835,7 @@ class GetTableResponse(BaseModel):
     )
 
 
-class SearchNearestVersionResponse(BaseModel):
+class SearchNearestVersionResponse(GeneratedModel):
     title: SearchTitle | None = Field(
         None, description="Données sur la version d'un texte"
     )
@@ -2845,7 +2847,7 @@ class SearchNearestVersionResponse(BaseModel):
     )
 
 
-class RelatedLinksArticleResponse(BaseModel):
+class RelatedLinksArticleResponse(GeneratedModel):
     liens_cite_par: list[LiensRelatifsDTO] | None = Field(
         None,
         alias="liensCitePar",
@@ -2861,7 +2863,7 @@ class RelatedLinksArticleResponse(BaseModel):
     )
 
 
-class BoccTextsListResponse(BaseModel):
+class BoccTextsListResponse(GeneratedModel):
     idccs: Facet | None = Field(
         None, description="Facette listant les IDCCs relatifs aux textes BOCC"
     )
@@ -2879,7 +2881,7 @@ class BoccTextsListResponse(BaseModel):
     )
 
 
-class FiltreDTO(BaseModel):
+class FiltreDTO(GeneratedModel):
     dates: DatePeriod | None = Field(
         None, description="Période de dates dans le cas d'un filtre par période"
     )
@@ -2907,7 +2909,7 @@ class FiltreDTO(BaseModel):
     )
 
 
-class SearchSection(BaseModel):
+class SearchSection(GeneratedModel):
     title: str | None = None
     date_version: str | None = Field(
         None,
@@ -2920,7 +2922,7 @@ class SearchSection(BaseModel):
     extracts: list[SearchExtract] | None = None
 
 
-class ConsultArticle(BaseModel):
+class ConsultArticle(GeneratedModel):
     modificator_title: str | None = Field(
         None,
         alias="modificatorTitle",
@@ -3040,7 +3042,7 @@ class ConsultArticle(BaseModel):
     )
 
 
-class LODAListRequest(BaseModel):
+class LODAListRequest(GeneratedModel):
     sort: Sort1 | None = Field(
         None, description="Ordre de tri", examples=["PUBLICATION_DATE_ASC"]
     )
@@ -3081,7 +3083,7 @@ class LODAListRequest(BaseModel):
     )
 
 
-class ActionChronoDTO(BaseModel):
+class ActionChronoDTO(GeneratedModel):
     action: Action | None = Field(
         None, description="Action effectuée", examples=["MODIFICATION"]
     )
@@ -3091,7 +3093,7 @@ class ActionChronoDTO(BaseModel):
     )
 
 
-class ArticleModificateurDTO(BaseModel):
+class ArticleModificateurDTO(GeneratedModel):
     actions: dict[str, ActionChronoDTO] | None = Field(
         None,
         description="Map listant les actions effectuées par cet article sur le texte. La clé correspond au type d'action.",
@@ -3115,7 +3117,7 @@ class ArticleModificateurDTO(BaseModel):
     )
 
 
-class GetListPlanClassementJuriResponse(BaseModel):
+class GetListPlanClassementJuriResponse(GeneratedModel):
     total_nb_result: int | None = Field(
         None, alias="totalNbResult", description="Nombre de résultats", examples=[12]
     )
@@ -3127,7 +3129,7 @@ class GetListPlanClassementJuriResponse(BaseModel):
     )
 
 
-class ConsultDossierLegislatifResponse(BaseModel):
+class ConsultDossierLegislatifResponse(GeneratedModel):
     dossier_legislatif: DossierLegislatif | None = Field(
         None, alias="dossierLegislatif", description="Dossier législatif"
     )
@@ -3141,7 +3143,7 @@ class ConsultDossierLegislatifResponse(BaseModel):
     )
 
 
-class ConsultAccoResponse(BaseModel):
+class ConsultAccoResponse(GeneratedModel):
     acco: Accord | None = Field(None, description="Accord d'entreprise")
     execution_time: int | None = Field(
         None, alias="executionTime", description="Temps d'exécution"
@@ -3153,7 +3155,7 @@ class ConsultAccoResponse(BaseModel):
     )
 
 
-class BoccGlobalListResponse(BaseModel):
+class BoccGlobalListResponse(GeneratedModel):
     total_result_number: int | None = Field(None, alias="totalResultNumber")
     results: list[EsParutionBocc] | None = None
     execution_time: int | None = Field(
@@ -3163,7 +3165,7 @@ class BoccGlobalListResponse(BaseModel):
     total_result_idcc: int | None = Field(None, alias="totalResultIdcc")
 
 
-class StructureTxt(BaseModel):
+class StructureTxt(GeneratedModel):
     liens: list[LienTxt] | None = Field(
         None,
         description="Liste des liens vers les textes de premier niveau dans le conteneur",
@@ -3173,7 +3175,7 @@ class StructureTxt(BaseModel):
     )
 
 
-class GetListSectionResponse(BaseModel):
+class GetListSectionResponse(GeneratedModel):
     list_section: list[Section] | None = Field(
         None, alias="listSection", description="Liste des sections"
     )
@@ -3182,7 +3184,7 @@ class GetListSectionResponse(BaseModel):
     )
 
 
-class DebatsParlementairesListResponse(BaseModel):
+class DebatsParlementairesListResponse(GeneratedModel):
     total_result_number: int | None = Field(
         None,
         alias="totalResultNumber",
@@ -3213,7 +3215,7 @@ class DebatsParlementairesListResponse(BaseModel):
     )
 
 
-class VersionDTO(BaseModel):
+class VersionDTO(GeneratedModel):
     date_debut: datetime | None = Field(
         None,
         alias="dateDebut",
@@ -3232,7 +3234,7 @@ class VersionDTO(BaseModel):
     )
 
 
-class TextTitle(BaseModel):
+class TextTitle(GeneratedModel):
     nor: str | None = Field(None, description="Numéro NOR")
     visas: str | None = Field(None, description="Visas")
     date_texte: datetime | None = Field(
@@ -3291,7 +3293,7 @@ class TextTitle(BaseModel):
     )
 
 
-class LODAListResponse(BaseModel):
+class LODAListResponse(GeneratedModel):
     total_result_number: int | None = Field(
         None,
         alias="totalResultNumber",
@@ -3314,7 +3316,7 @@ class LODAListResponse(BaseModel):
     )
 
 
-class TexteSimple(BaseModel):
+class TexteSimple(GeneratedModel):
     travaux_preparatoires_html: str | None = Field(
         None,
         alias="travauxPreparatoiresHtml",
@@ -3622,7 +3624,7 @@ class TexteSimple(BaseModel):
     )
 
 
-class ConsultDebatResponse(BaseModel):
+class ConsultDebatResponse(GeneratedModel):
     execution_time: int | None = Field(
         None, alias="executionTime", description="Temps d'exécution"
     )
@@ -3634,7 +3636,7 @@ class ConsultDebatResponse(BaseModel):
     debat: Debat | None = Field(None, description="Débat parlementaire")
 
 
-class FullConteneur(BaseModel):
+class FullConteneur(GeneratedModel):
     structure: StructureTxt | None = Field(None, description="Structure du conteneur")
     etat: str | None = Field(None, description="Etat juridique du conteneur")
     id: str | None = Field(
@@ -3680,7 +3682,7 @@ class FullConteneur(BaseModel):
     relevant_date: datetime | None = Field(None, alias="relevantDate")
 
 
-class ConsultBoccResponse(BaseModel):
+class ConsultBoccResponse(GeneratedModel):
     date_parution: str | None = Field(
         None,
         alias="dateParution",
@@ -3696,7 +3698,7 @@ class ConsultBoccResponse(BaseModel):
     path_to_file: str | None = Field(None, alias="pathToFile")
 
 
-class Article(BaseModel):
+class Article(GeneratedModel):
     condition_differe: str | None = Field(
         None,
         alias="conditionDiffere",
@@ -3872,7 +3874,7 @@ class Article(BaseModel):
     inap: str | None = Field(None, description="INAP")
 
 
-class GetJorfContResponseItem(BaseModel):
+class GetJorfContResponseItem(GeneratedModel):
     jo_inap: FileMetadata | None = Field(
         None, alias="joInap", description="Métadonnées du JOINAP s'il en existe un"
     )
@@ -3887,7 +3889,7 @@ class GetJorfContResponseItem(BaseModel):
     )
 
 
-class ConsultJuriTextResponse(BaseModel):
+class ConsultJuriTextResponse(GeneratedModel):
     text: TexteSimple | None = Field(None, description="Texte")
     execution_time: int | None = Field(
         None, alias="executionTime", description="Temps d'exécution"
@@ -3899,7 +3901,7 @@ class ConsultJuriTextResponse(BaseModel):
     )
 
 
-class RegroupementDTO(BaseModel):
+class RegroupementDTO(GeneratedModel):
     versions: dict[str, VersionDTO] | None = Field(
         None,
         description="Map listant les versions dans l'ordre antéchronologique.  La clé correspond à la date de la version",
@@ -3910,7 +3912,7 @@ class RegroupementDTO(BaseModel):
     detail_loaded: bool | None = Field(None, alias="detailLoaded")
 
 
-class SearchResult(BaseModel):
+class SearchResult(GeneratedModel):
     nor: str | None = None
     etat: str | None = None
     themes: list[str] | None = None
@@ -3964,7 +3966,7 @@ class SearchResult(BaseModel):
     )
 
 
-class RechercheSpecifiqueDTO(BaseModel):
+class RechercheSpecifiqueDTO(GeneratedModel):
     filtres: list[FiltreDTO] | None = Field(
         None,
         description="Liste des filtres à appliquer. La requête est effectuée automatiquement avec un opérateur ET entre les filtres listés.",
@@ -4051,7 +4053,7 @@ class RechercheSpecifiqueDTO(BaseModel):
     )
 
 
-class ConsultSection(BaseModel):
+class ConsultSection(GeneratedModel):
     date_debut: str | None = Field(
         None, alias="dateDebut", description="Date de début de la version de la section"
     )
@@ -4123,7 +4125,7 @@ class ConsultSection(BaseModel):
     )
 
 
-class ChronolegiResponse(BaseModel):
+class ChronolegiResponse(GeneratedModel):
     date_publication: str | None = Field(
         None,
         alias="datePublication",
@@ -4138,7 +4140,7 @@ class ChronolegiResponse(BaseModel):
     )
 
 
-class GetListArticleResponse(BaseModel):
+class GetListArticleResponse(GeneratedModel):
     list_article: list[Article] | None = Field(
         None, alias="listArticle", description="Liste des versions de l'article"
     )
@@ -4150,7 +4152,7 @@ class GetListArticleResponse(BaseModel):
 ConsultCnilTextResponse = ConsultJuriTextResponse
 
 
-class ConsultKaliContResponse(BaseModel):
+class ConsultKaliContResponse(GeneratedModel):
     activite_pro: list[str] | None = Field(
         None, alias="activitePro", description="Liste des activités professionelles"
     )
@@ -4189,7 +4191,7 @@ class ConsultKaliContResponse(BaseModel):
     )
 
 
-class GetJosResponse(BaseModel):
+class GetJosResponse(GeneratedModel):
     total_nb_result: int | None = Field(
         None, alias="totalNbResult", description="Nombre de résultats", examples=[12]
     )
@@ -4201,7 +4203,7 @@ class GetJosResponse(BaseModel):
     )
 
 
-class GetArticleResponse(BaseModel):
+class GetArticleResponse(GeneratedModel):
     article: Article | None = Field(None, description="Détail de l'article")
     execution_time: int | None = Field(
         None, alias="executionTime", description="Temps d'exécution"
@@ -4213,7 +4215,7 @@ class GetArticleResponse(BaseModel):
     )
 
 
-class SearchResponseDTO(BaseModel):
+class SearchResponseDTO(GeneratedModel):
     total_result_number: int | None = Field(
         None,
         alias="totalResultNumber",
@@ -4241,7 +4243,7 @@ class SearchResponseDTO(BaseModel):
     )
 
 
-class ConsultKaliTextResponse(BaseModel):
+class ConsultKaliTextResponse(GeneratedModel):
     text_number: str | None = Field(
         None, alias="textNumber", description="Numéro de texte"
     )
@@ -4390,7 +4392,7 @@ class ConsultKaliTextResponse(BaseModel):
     )
 
 
-class ConsultJorfResponse(BaseModel):
+class ConsultJorfResponse(GeneratedModel):
     text_number: str | None = Field(
         None, alias="textNumber", description="Numéro de texte"
     )
@@ -4509,7 +4511,7 @@ class ConsultJorfResponse(BaseModel):
     )
 
 
-class SearchRequestDTO(BaseModel):
+class SearchRequestDTO(GeneratedModel):
     recherche: RechercheSpecifiqueDTO = Field(
         ..., description="Objet définissant la recherche"
     )
@@ -4520,7 +4522,7 @@ class SearchRequestDTO(BaseModel):
     )
 
 
-class ConsultTextResponse(BaseModel):
+class ConsultTextResponse(GeneratedModel):
     mots_cles: list[str] | None = Field(None, alias="motsCles", description="Mots-clés")
     date_parution: datetime | None = Field(
         None, alias="dateParution", description="Date de parution"
@@ -1,6 +1,6 @@
 """Core domain models for JURI."""
 
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 from pylegifrance.models.generated.model import TexteLien, TexteSimple
 
@@ -12,6 +12,8 @@ class Decision(TexteSimple):
     Extends the generated TexteSimple model with JURI-specific fields.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     siege_appel: str | None = Field(alias="siegeAppel", default=None)
     avocat_general: str | None = Field(alias="avocatGl", default=None)
     liens: list[TexteLien] = Field(default=[])
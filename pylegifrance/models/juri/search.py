@@ -40,7 +40,10 @@ class SearchRequest(PyLegifranceBaseModel):
 
     # Advanced options
     formatter: bool = Field(default=True, description="Extract only specific fields")
-    fetch_all: bool = Field(default=False, description="Fetch all results")
+    fetch_all: bool = Field(
+        default=False,
+        description="Walk every page of results instead of page_number only",
+    )
     keys: list[str] | None = Field(
         default=None, description="Specific field extraction keys"
     )
@@ -0,0 +1,393 @@
+"""Auto-paginating iteration over ``/search`` results.
+
+A ``/search`` answer holds one page of at most 100 results, plus the total
+number of results of the query. :func:`iter_pages` walks the pages of a
+prepared request body, one ``/search`` call per page, and stops at the
+total or at a caller-set cap. While the caller handles a page, the next
+one is already requested on a background thread, so the network round trip
+overlaps with the caller's work. At most two pages are held at a time,
+whatever the size of the result set.
+
+For bulk exports, ``max_workers`` above 1 switches to fan-out: the first
+page gives the total, then the remaining pages are requested concurrently,
+``max_workers`` at a time, and still yielded in page order. The search
+engine serves no result past the :data:`MAX_RESULT_WINDOW`-th; when a query
+goes past it and a date facet is given, the query is split in two on that
+facet, over and over, until every slice fits. Slices are walked from the
+oldest dates to the newest.
+
+The façades build on it: ``JuriAPI.iter_search``, ``Loda.iter_search``,
+``KaliAPI.iter_search`` and ``CodeSearchBuilder.iter_search`` turn each page
+into domain objects and yield them one at a time::
+
+    for decision in JuriAPI(client).iter_search("bail commercial", max_results=5000):
+        index(decision)
+
+When only the size of a result set matters, :func:`count_payload` asks for
+a single result and :func:`search_counts` reads the total and the facet
+buckets of the answer; the façades' ``count`` methods wrap the two, with no
+``/consult`` call.
+"""
+
+import logging
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from pylegifrance.batch import run_batch
+from pylegifrance.tracing import propagate
+
+logger = logging.getLogger(__name__)
+
+HTTP_OK = 200
+
+MAX_PAGE_SIZE = 100
+"""Largest ``pageSize`` accepted by the Legifrance ``/search`` endpoint."""
+
+DEFAULT_PAGE_SIZE = MAX_PAGE_SIZE
+
+MAX_RESULT_WINDOW = 10_000
+"""Deepest result served by the ``/search`` endpoint; later pages are refused."""
+
+EARLIEST_DATE = date(1500, 1, 1)
+"""Start of a date split when the query does not bound the facet."""
+
+
+@dataclass(frozen=True)
+class SearchPage:
+    """
+    One page of ``/search`` results.
+
+    Attributes:
+        number: The page number, starting at 1; it starts over with each
+            slice of a split query.
+        results: The ``results`` of the page, truncated to the cap.
+        total_results: The total number of results of the query, if the
+            API reported it.
+    """
+
+    number: int
+    results: list[dict[str, Any]]
+    total_results: int | None
+
+
+@dataclass(frozen=True)
+class SearchCounts:
+    """
+    Size of a ``/search`` result set.
+
+    Attributes:
+        total: The total number of results, if the API reported it.
+        facets: Result counts per facet value, keyed by facet name, e.g.
+            ``{"NATURE": {"LOI": 12, "DECRET": 40}}``. The sub-buckets of a
+            value ``v`` of facet ``f`` are listed under ``"f/v"``.
+    """
+
+    total: int | None
+    facets: dict[str, dict[str, int]]
+
+
+def total_results(response_data: dict[str, Any]) -> int | None:
+    """Read the total number of results of a ``/search`` answer.
+
+    The API names it ``totalResultNumber``; ``totalResults`` is accepted too.
+    """
+    for key in ("totalResultNumber", "totalResults"):
+        value = response_data.get(key)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def with_page(payload: dict[str, Any], number: int, size: int) -> dict[str, Any]:
+    """Return a copy of a ``/search`` body asking for page ``number``.
+
+    Only the ``recherche`` member is copied; the rest is shared.
+    """
+    recherche = {**payload.get("recherche", {}), "pageNumber": number, "pageSize": size}
+    return {**payload, "recherche": recherche}
+
+
+def count_payload(payload: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of a ``/search`` body asking for a single result."""
+    return with_page(payload, 1, 1)
+
+
+def search_counts(response: Any) -> SearchCounts:
+    """Read the total and the facet buckets of a ``/search`` answer.
+
+    Args:
+        response: The HTTP response of ``/search``.
+
+    Returns:
+        The counts; empty if the API answered with a non-OK status.
+    """
+    if response.status_code != HTTP_OK:
+        logger.warning(f"The search answered {response.status_code}")
+        return SearchCounts(None, {})
+    data = response.json()
+    facets: dict[str, dict[str, int]] = {}
+    for facet in data.get("facets") or []:
+        _add_buckets(facets, facet.get("facetElem") or facet.get("field"), facet)
+    return SearchCounts(total_results(data), facets)
+
+
+def _add_buckets(
+    facets: dict[str, dict[str, int]], name: str | None, facet: dict[str, Any]
+) -> None:
+    if name is None:
+        return
+    facets[name] = dict(facet.get("values") or {})
+    for parent, child in (facet.get("childs") or {}).items():
+        _add_buckets(facets, f"{name}/{parent}", child)
+
+
+def iter_pages(
+    client: Any,
+    payload: dict[str, Any],
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_results: int | None = None,
+    prefetch: bool = True,
+    max_workers: int = 1,
+    split_facet: str | None = None,
+) -> Iterator[SearchPage]:
+    """Walk the pages of a ``/search`` query.
+
+    Args:
+        client: The client whose ``call_api`` sends the requests.
+        payload: The ``/search`` body; its page number and size are
+            replaced for each page.
+        page_size: Number of results per page, at most
+            :data:`MAX_PAGE_SIZE`.
+        max_results: Stop after this many results. If None, walk every
+            result of the query.
+        prefetch: Request the next page while the caller handles the
+            current one. Ignored when ``max_workers`` is above 1.
+        max_workers: Number of pages requested at a time after the first
+            one. 1 walks the pages one after the other.
+        split_facet: Date facet on which a query going past
+            :data:`MAX_RESULT_WINDOW` is split, e.g. ``"DATE_DECISION"``.
+            Only used when ``max_workers`` is above 1; otherwise, or if
+            None, such a query stops at the window.
+
+    Yields:
+        The pages, in order. The iteration ends after the last result, on
+        a short or empty page, or on a non-OK answer.
+
+    Raises:
+        ValueError: If ``page_size``, ``max_results`` or ``max_workers`` is
+            out of range.
+        Exception: If a ``/search`` call fails.
+    """
+    if not 1 <= page_size <= MAX_PAGE_SIZE:
+        raise ValueError(f"page_size must be between 1 and {MAX_PAGE_SIZE}.")
+    if max_results is not None and max_results < 0:
+        raise ValueError("max_results must be positive.")
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+    if max_results == 0:
+        return
+    if max_workers > 1:
+        yield from _fan_out(
+            client, payload, page_size, max_results, max_workers, split_facet
+        )
+    else:
+        yield from _walk(client, payload, page_size, max_results, prefetch)
+
+
+def _walk(
+    client: Any,
+    payload: dict[str, Any],
+    page_size: int,
+    max_results: int | None,
+    prefetch: bool,
+    first: Any = None,
+) -> Iterator[SearchPage]:
+    """Walk the pages of the query one after the other.
+
+    ``first`` is the answer for page 1 when the caller already has it.
+    """
+
+    def fetch(number: int) -> Any:
+        return client.call_api("search", with_page(payload, number, page_size))
+
+    executor = (
+        ThreadPoolExecutor(max_workers=1, thread_name_prefix="pylegifrance-pager")
+        if prefetch
+        else None
+    )
+    # Prefetched calls nest under the caller's current span.
+    fetch_in_background = propagate(fetch)
+
+    def request(number: int) -> Future | Any:
+        if executor is None:
+            return fetch(number)
+        return executor.submit(fetch_in_background, number)
+
+    try:
+        number, walked = 1, 0
+        pending = request(number) if first is None else first
+        while True:
+            response = pending.result() if isinstance(pending, Future) else pending
+            if response.status_code != HTTP_OK:
+                logger.warning(
+                    f"Page {number} of the search answered {response.status_code}"
+                )
+                return
+            data = response.json()
+            results = data.get("results") or []
+            total = total_results(data)
+
+            limits = [n for n in (total, max_results) if n is not None]
+            wanted = min(limits) if limits else None
+            # Pages past the window are refused: stop there, as _fan_out does.
+            limit = (
+                MAX_RESULT_WINDOW if wanted is None else min(wanted, MAX_RESULT_WINDOW)
+            )
+            if number == 1 and wanted is not None and wanted > MAX_RESULT_WINDOW:
+                logger.warning(
+                    f"Search has {total} results; only the first "
+                    f"{MAX_RESULT_WINDOW} can be paged through"
+                )
+            page_results = results[: limit - walked]
+            walked += len(page_results)
+            has_more = len(results) >= page_size and walked < limit
+            logger.debug(
+                f"Search page {number}: {len(page_results)} results, "
+                f"{walked} walked of {total}"
+            )
+
+            if has_more:
+                pending = request(number + 1)
+            yield SearchPage(number, page_results, total)
+            if not has_more:
+                return
+            number += 1
+    finally:
+        # Also reached when the caller stops iterating early.
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _fan_out(
+    client: Any,
+    payload: dict[str, Any],
+    page_size: int,
+    max_results: int | None,
+    max_workers: int,
+    split_facet: str | None,
+) -> Iterator[SearchPage]:
+    """Walk the pages of each slice of the query, concurrently after the first."""
+
+    def fetch(request: dict[str, Any]) -> Any:
+        return client.call_api("search", request)
+
+    remaining = max_results
+    slices: deque[dict[str, Any]] = deque([payload])
+    while slices and (remaining is None or remaining > 0):
+        sliced = slices.popleft()
+        response = fetch(with_page(sliced, 1, page_size))
+        if response.status_code != HTTP_OK:
+            logger.warning(f"Page 1 of the search answered {response.status_code}")
+            return
+        data = response.json()
+        total = total_results(data)
+        if total is None:
+            # Without a total the pages cannot be planned: walk them in turn,
+            # starting from the page already fetched.
+            for page in _walk(
+                client, sliced, page_size, remaining, prefetch=True, first=response
+            ):
+                if remaining is not None:
+                    remaining -= len(page.results)
+                yield page
+            continue
+
+        wanted = total if remaining is None else min(total, remaining)
+        if wanted > MAX_RESULT_WINDOW:
+            halves = split_on_dates(sliced, split_facet) if split_facet else None
+            if halves is not None:
+                logger.debug(f"Splitting a search of {total} results on {split_facet}")
+                slices.extendleft(reversed(halves))
+                continue
+            logger.warning(
+                f"Search has {total} results; only the first "
+                f"{MAX_RESULT_WINDOW} can be paged through"
+            )
+            wanted = MAX_RESULT_WINDOW
+
+        first = (data.get("results") or [])[:wanted]
+        walked = len(first)
+        yield SearchPage(1, first, total)
+        last = -(-wanted // page_size)
+        requests = (with_page(sliced, n, page_size) for n in range(2, last + 1))
+        with closing(run_batch(fetch, requests, max_workers=max_workers)) as batch:
+            for number, result in enumerate(batch, start=2):
+                if result.error is not None:
+                    raise result.error
+                if result.value.status_code != HTTP_OK:
+                    logger.warning(
+                        f"Page {number} of the search answered "
+                        f"{result.value.status_code}"
+                    )
+                    return
+                results = (result.value.json().get("results") or [])[: wanted - walked]
+                walked += len(results)
+                yield SearchPage(number, results, total)
+        if remaining is not None:
+            remaining -= walked
+
+
+def split_on_dates(
+    payload: dict[str, Any], facet: str
+) -> tuple[dict[str, Any], dict[str, Any]] | None:
+    """Split a ``/search`` body in two on a date facet.
+
+    The period is read from the body's filter on ``facet``. An open bound
+    defaults to :data:`EARLIEST_DATE` or today.
+
+    Args:
+        payload: The ``/search`` body.
+        facet: The date facet, e.g. ``"DATE_SIGNATURE"``.
+
+    Returns:
+        Two bodies covering the first and the second half of the period,
+        or None if the period is a single day.
+    """
+    filtres = payload.get("recherche", {}).get("filtres") or []
+    period = next(
+        (f["dates"] for f in filtres if f.get("facette") == facet and f.get("dates")),
+        {},
+    )
+    start = _as_date(period.get("start")) or EARLIEST_DATE
+    end = _as_date(period.get("end")) or date.today()
+    if start >= end:
+        return None
+    middle = start + (end - start) // 2
+    return (
+        _with_period(payload, facet, start, middle),
+        _with_period(payload, facet, middle + timedelta(days=1), end),
+    )
+
+
+def _as_date(value: str | None) -> date | None:
+    return date.fromisoformat(value[:10]) if value else None
+
+
+def _with_period(
+    payload: dict[str, Any], facet: str, start: date, end: date
+) -> dict[str, Any]:
+    """Return a copy of a ``/search`` body restricted to a period of ``facet``."""
+    recherche = payload.get("recherche", {})
+    filtres = [f for f in recherche.get("filtres") or [] if f.get("facette") != facet]
+    period = {
+        "start": datetime.combine(start, datetime.min.time()).isoformat(),
+        "end": datetime.combine(end, datetime.min.time()).isoformat(),
+    }
+    filtres.append({"facette": facet, "dates": period})
+    return {**payload, "recherche": {**recherche, "filtres": filtres}}
@@ -0,0 +1,143 @@
+"""HTTP connection pooling for the Legifrance API.
+
+``requests`` mounts a default adapter that keeps at most 10 connections per
+host. Under a thread pool this forces most calls to wait for a free
+connection or to open a new TLS session. This module provides an adapter
+sized from :class:`~pylegifrance.config.ApiConfig` and a way to read back
+how many connections were created versus reused.
+"""
+
+import logging
+import socket
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+from pylegifrance.config import ApiConfig
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """
+    Snapshot of connection pool usage.
+
+    Attributes:
+        pools: Number of per-host pools currently held by the adapter.
+        requests: Number of requests sent through the pools.
+        connections_created: Number of new connections (TCP + TLS handshakes).
+        connections_reused: Number of requests served on an already open
+            connection.
+        idle_connections: Number of open connections waiting in the pools.
+    """
+
+    pools: int = 0
+    requests: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+    idle_connections: int = 0
+
+
+def _socket_options(config: ApiConfig) -> list[tuple[int, int, int]]:
+    """Build the socket options enabling TCP keep-alive probes."""
+    # urllib3 allows bytes values; its defaults (TCP_NODELAY) are all ints.
+    options = [
+        (level, name, value)
+        for level, name, value in HTTPConnection.default_socket_options
+        if isinstance(value, int)
+    ]
+    if config.tcp_keepalive_idle is None:
+        return options
+
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    idle = int(config.tcp_keepalive_idle)
+    if hasattr(socket, "TCP_KEEPIDLE"):  # Linux
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle))
+    elif hasattr(socket, "TCP_KEEPALIVE"):  # macOS
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, idle))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, max(1, idle // 4)))
+    return options
+
+
+class PoolingHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter sized from an :class:`ApiConfig`.
+
+    Applies the pool dimensions (``pool_connections``, ``pool_maxsize``,
+    ``pool_block``) and TCP keep-alive socket options, and exposes usage
+    statistics through :meth:`stats`.
+    """
+
+    def __init__(self, config: ApiConfig):
+        self._socket_options = _socket_options(config)
+        self._keep_alive = config.keep_alive
+        super().__init__(
+            pool_connections=config.pool_connections,
+            pool_maxsize=config.pool_maxsize,
+            pool_block=config.pool_block,
+        )
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", self._socket_options)
+        super().init_poolmanager(*args, **kwargs)
+
+    def stats(self) -> PoolStats:
+        """Aggregate the usage counters of every per-host pool."""
+        container = self.poolmanager.pools
+        pools = [
+            pool for key in container.keys() if (pool := container.get(key)) is not None
+        ]
+        total_requests = sum(pool.num_requests for pool in pools)
+        # urllib3 reopens a closed connection object in place, so without
+        # keep-alive its counter understates the number of handshakes.
+        if self._keep_alive:
+            created = sum(pool.num_connections for pool in pools)
+        else:
+            created = total_requests
+        idle = 0
+        for pool in pools:
+            queue = getattr(pool, "pool", None)
+            if queue is not None:
+                idle += sum(1 for conn in list(queue.queue) if conn is not None)
+        return PoolStats(
+            pools=len(pools),
+            requests=total_requests,
+            connections_created=created,
+            connections_reused=max(0, total_requests - created),
+            idle_connections=idle,
+        )
+
+
+def mount_pooled_adapter(
+    session: requests.Session, url: str, config: ApiConfig
+) -> PoolingHTTPAdapter:
+    """Mount a :class:`PoolingHTTPAdapter` on ``session`` for the origin of ``url``.
+
+    Args:
+        session: The session to configure.
+        url: Any URL of the target host (e.g. ``config.api_url``).
+        config: The configuration holding pool and keep-alive settings.
+
+    Returns:
+        The mounted adapter, whose :meth:`~PoolingHTTPAdapter.stats` reports
+        pool usage for that host.
+    """
+    parts = urlsplit(url)
+    prefix = f"{parts.scheme}://{parts.netloc}/"
+    adapter = PoolingHTTPAdapter(config)
+    session.mount(prefix, adapter)
+
+    if not config.keep_alive:
+        session.headers["Connection"] = "close"
+
+    logger.debug(
+        f"Mounted pooled adapter on {prefix} "
+        f"(pool_connections={config.pool_connections}, "
+        f"pool_maxsize={config.pool_maxsize}, pool_block={config.pool_block})"
+    )
+    return adapter
@@ -0,0 +1,243 @@
+"""Client-side rate limiting for the Legifrance API.
+
+PISTE enforces per-application quotas and answers 429 once they are
+exceeded. :class:`RateLimiter` spaces out calls with token buckets so that a
+batch job stays under the quota instead of stalling on rejected requests.
+
+A limiter has a global bucket and optional per-route buckets selected by
+glob patterns (``"search"``, ``"consult/*"``). By default bucket state lives
+in memory and is shared by the threads using the limiter; with a
+``state_dir`` it lives in lock-protected files so that several processes on
+the same host split a single quota.
+"""
+
+import fnmatch
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Generator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from pylegifrance.utils import exclusive_file_lock
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_BUCKET = "*"
+
+
+@dataclass(frozen=True)
+class RateLimitStats:
+    """
+    Waiting time spent in one bucket of a :class:`RateLimiter`.
+
+    Attributes:
+        acquired: Number of calls that went through the bucket.
+        throttled: Number of those calls that had to wait.
+        total_wait: Cumulated waiting time in seconds.
+        max_wait: Longest single wait in seconds.
+    """
+
+    acquired: int = 0
+    throttled: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        """Average wait per call in seconds."""
+        return self.total_wait / self.acquired if self.acquired else 0.0
+
+
+@dataclass
+class _BucketState:
+    tokens: float
+    updated_at: float
+
+
+class _MemoryState:
+    """Bucket state shared by the threads of one process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._states: dict[str, _BucketState] = {}
+
+    @contextmanager
+    def transaction(
+        self, name: str, capacity: float
+    ) -> Generator[_BucketState, None, None]:
+        with self._lock:
+            state = self._states.setdefault(
+                name, _BucketState(tokens=capacity, updated_at=time.time())
+            )
+            yield state
+
+
+class _FileState:
+    """Bucket state shared by the processes of one host through files."""
+
+    def __init__(self, directory: str | os.PathLike):
+        self._directory = Path(directory)
+        self._directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # flock is per open file description: threads must be serialized too.
+        self._thread_lock = threading.Lock()
+
+    def _path(self, name: str) -> Path:
+        safe = "".join(c if c.isalnum() else "_" for c in name)
+        return self._directory / f"bucket-{safe}.json"
+
+    @contextmanager
+    def transaction(
+        self, name: str, capacity: float
+    ) -> Generator[_BucketState, None, None]:
+        path = self._path(name)
+        with self._thread_lock, exclusive_file_lock(path.with_suffix(".lock")):
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                state = _BucketState(**data)
+            except (OSError, ValueError, TypeError):
+                state = _BucketState(tokens=capacity, updated_at=time.time())
+            yield state
+            path.write_text(
+                json.dumps({"tokens": state.tokens, "updated_at": state.updated_at}),
+                encoding="utf-8",
+            )
+
+
+class _Bucket:
+    """A token bucket refilled at ``rate`` tokens per second."""
+
+    def __init__(self, name: str, rate: float, burst: float, state):
+        if rate <= 0:
+            raise ValueError(f"Rate for '{name}' must be positive, got {rate}.")
+        if burst < 1:
+            raise ValueError(f"Burst for '{name}' must be at least 1, got {burst}.")
+        self.name = name
+        self.rate = rate
+        self.capacity = burst
+        self._state = state
+        self._stats_lock = threading.Lock()
+        self._stats = RateLimitStats()
+
+    def reserve(self) -> float:
+        """Take one token, returning how long the caller must wait for it.
+
+        The token is reserved immediately even when the bucket is empty, so
+        callers are served in arrival order and the bucket never needs to be
+        polled.
+        """
+        with self._state.transaction(self.name, self.capacity) as state:
+            now = time.time()
+            elapsed = max(0.0, now - state.updated_at)
+            tokens = min(self.capacity, state.tokens + elapsed * self.rate)
+            state.tokens = tokens - 1
+            state.updated_at = now
+            return max(0.0, -state.tokens / self.rate)
+
+    def record(self, wait: float) -> None:
+        with self._stats_lock:
+            stats = self._stats
+            self._stats = RateLimitStats(
+                acquired=stats.acquired + 1,
+                throttled=stats.throttled + (wait > 0),
+                total_wait=stats.total_wait + wait,
+                max_wait=max(stats.max_wait, wait),
+            )
+
+    @property
+    def stats(self) -> RateLimitStats:
+        return self._stats
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter selecting a bucket per API route.
+
+    Example:
+        >>> limiter = RateLimiter(
+        ...     rate=20, routes={"search": 5, "consult/*": (15, 30)}
+        ... )
+        >>> client = LegifranceClient(config, rate_limiter=limiter)
+
+    Route overrides replace the global rate for the routes they match. When
+    several patterns match, the longest one wins.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float | None = None,
+        routes: Mapping[str, float | tuple[float, float]] | None = None,
+        state_dir: str | os.PathLike | None = None,
+    ):
+        """Initialize a new RateLimiter.
+
+        Args:
+            rate: Global number of calls allowed per second.
+            burst: Number of calls allowed back to back after an idle period.
+                Defaults to ``max(1, rate)``.
+            routes: Per-route overrides, mapping a glob pattern on the route to
+                a rate or a ``(rate, burst)`` tuple.
+            state_dir: Directory for bucket state shared between processes. If
+                None, state is kept in memory for this process only.
+
+        Raises:
+            ValueError: If a rate is not positive or a burst is lower than 1.
+        """
+        state = _FileState(state_dir) if state_dir is not None else _MemoryState()
+        self._global = _Bucket(GLOBAL_BUCKET, rate, burst or max(1.0, rate), state)
+        self._routes: list[tuple[str, _Bucket]] = []
+        for pattern, limit in (routes or {}).items():
+            route_rate, route_burst = (
+                limit if isinstance(limit, tuple) else (limit, max(1.0, limit))
+            )
+            self._routes.append(
+                (pattern, _Bucket(pattern, route_rate, route_burst, state))
+            )
+        # Most specific pattern first.
+        self._routes.sort(key=lambda item: len(item[0]), reverse=True)
+        self._resolved: dict[str, _Bucket] = {}
+
+    def _bucket_for(self, route: str) -> _Bucket:
+        bucket = self._resolved.get(route)
+        if bucket is None:
+            bucket = next(
+                (
+                    b
+                    for pattern, b in self._routes
+                    if fnmatch.fnmatchcase(route, pattern)
+                ),
+                self._global,
+            )
+            self._resolved[route] = bucket
+        return bucket
+
+    def acquire(self, route: str) -> float:
+        """Block until a call to ``route`` is allowed.
+
+        Args:
+            route: The API route about to be called.
+
+        Returns:
+            The time waited, in seconds.
+        """
+        bucket = self._bucket_for(route)
+        wait = bucket.reserve()
+        if wait > 0:
+            logger.debug(f"Rate limit: waiting {wait:.3f}s before '{route}'")
+            time.sleep(wait)
+        bucket.record(wait)
+        return wait
+
+    def stats(self) -> dict[str, RateLimitStats]:
+        """Return the waiting statistics of each bucket.
+
+        Returns:
+            A mapping from bucket name (``"*"`` for the global bucket, the
+            pattern for route overrides) to its statistics.
+        """
+        buckets = [self._global] + [bucket for _, bucket in self._routes]
+        return {bucket.name: bucket.stats for bucket in buckets}
@@ -0,0 +1,168 @@
+"""Retry policy for Legifrance API data calls.
+
+Legifrance data routes (``search``, ``consult/*``, ``list/*``...) are POSTs
+that only read data, so a transient failure (HTTP 429/5xx, connection reset,
+timeout) can safely be replayed. :class:`RetryPolicy` describes which calls
+are retried and how long to wait between attempts; the clients turn it into
+a tenacity controller for each call.
+"""
+
+import fnmatch
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import requests
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    stop_before_delay,
+    wait_random_exponential,
+)
+
+from pylegifrance.exceptions import APIError, RateLimited
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_ROUTES: tuple[str, ...] = (
+    "search",
+    "consult/*",
+    "list/*",
+    "suggest",
+    "suggest/*",
+    "chrono/*",
+    "misc/*",
+)
+
+TRANSIENT_ERRORS: tuple[type[BaseException], ...] = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    How failed API calls are retried.
+
+    Waits use exponential backoff with full jitter: before attempt ``n + 1``
+    the client sleeps a random time between 0 and
+    ``min(max_backoff, initial_backoff * 2 ** (n - 1))``. When a 429 carries a
+    ``Retry-After`` header, that delay is used instead.
+
+    Attributes:
+        max_attempts: Maximum number of attempts per call, the first included.
+            1 disables retries.
+        initial_backoff: Upper bound of the first wait, in seconds.
+        max_backoff: Upper bound of any computed wait, in seconds.
+        max_elapsed: Total time budget per call, in seconds. No retry is
+            attempted if its wait would exceed the budget. None means no cap.
+        retry_statuses: HTTP statuses that trigger a retry.
+        retry_on_connection_errors: Retry on connection errors and timeouts.
+        idempotent_routes: Glob patterns of the routes safe to replay.
+    """
+
+    max_attempts: int = 4
+    initial_backoff: float = 0.5
+    max_backoff: float = 20.0
+    max_elapsed: float | None = 30.0
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    retry_on_connection_errors: bool = True
+    idempotent_routes: tuple[str, ...] = IDEMPOTENT_ROUTES
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+
+    @classmethod
+    def disabled(cls) -> "RetryPolicy":
+        """A policy making a single attempt per call."""
+        return cls(max_attempts=1)
+
+    def is_retryable_route(self, route: str) -> bool:
+        """Check whether calls to ``route`` may be replayed."""
+        return any(fnmatch.fnmatchcase(route, p) for p in self.idempotent_routes)
+
+    def is_retryable_error(
+        self,
+        exc: BaseException,
+        transient_errors: tuple[type[BaseException], ...] = TRANSIENT_ERRORS,
+    ) -> bool:
+        """Check whether ``exc`` denotes a transient failure."""
+        if isinstance(exc, APIError):
+            return exc.status_code in self.retry_statuses
+        return self.retry_on_connection_errors and isinstance(exc, transient_errors)
+
+    def _wait(self, retry_state: RetryCallState) -> float:
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        if isinstance(exc, RateLimited) and exc.retry_after is not None:
+            return exc.retry_after
+        backoff = wait_random_exponential(
+            multiplier=self.initial_backoff, max=self.max_backoff
+        )
+        return backoff(retry_state)
+
+    def _controller_kwargs(
+        self,
+        route: str,
+        transient_errors: tuple[type[BaseException], ...],
+        on_retry: Callable[[], None] | None,
+    ) -> dict:
+        attempts = self.max_attempts if self.is_retryable_route(route) else 1
+        stop = stop_after_attempt(attempts)
+        if self.max_elapsed is not None:
+            stop = stop | stop_before_delay(self.max_elapsed)
+
+        def before_sleep(retry_state: RetryCallState) -> None:
+            exc = retry_state.outcome.exception() if retry_state.outcome else None
+            delay = retry_state.upcoming_sleep
+            logger.warning(
+                f"Retrying '{route}' in {delay:.2f}s "
+                f"(attempt {retry_state.attempt_number} failed: {exc})"
+            )
+            if on_retry is not None:
+                on_retry()
+
+        return {
+            "stop": stop,
+            "wait": self._wait,
+            "retry": retry_if_exception(
+                lambda exc: self.is_retryable_error(exc, transient_errors)
+            ),
+            "before_sleep": before_sleep,
+            "reraise": True,
+        }
+
+    def retrying(
+        self,
+        route: str,
+        transient_errors: tuple[type[BaseException], ...] = TRANSIENT_ERRORS,
+        on_retry: Callable[[], None] | None = None,
+    ) -> Retrying:
+        """Build the retry controller for one call to ``route``.
+
+        Args:
+            route: The API route being called.
+            transient_errors: Exception types denoting transport failures.
+            on_retry: Called before sleeping ahead of each new attempt.
+
+        Example:
+            >>> for attempt in policy.retrying("search"):
+            ...     with attempt:
+            ...         response = send()
+        """
+        return Retrying(**self._controller_kwargs(route, transient_errors, on_retry))
+
+    def async_retrying(
+        self,
+        route: str,
+        transient_errors: tuple[type[BaseException], ...] = TRANSIENT_ERRORS,
+        on_retry: Callable[[], None] | None = None,
+    ) -> AsyncRetrying:
+        """Asynchronous counterpart of :meth:`retrying`."""
+        return AsyncRetrying(
+            **self._controller_kwargs(route, transient_errors, on_retry)
+        )
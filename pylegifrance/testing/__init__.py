@@ -0,0 +1,10 @@
+"""Test harnesses shipped with pylegifrance.
+
+:class:`~pylegifrance.testing.stub_server.StubPisteServer` is a local
+stand-in for the PISTE OAuth and Legifrance endpoints, used to load test the
+client without credentials or network access.
+"""
+
+from pylegifrance.testing.stub_server import StubPisteServer, StubServerStats
+
+__all__ = ["StubPisteServer", "StubServerStats"]
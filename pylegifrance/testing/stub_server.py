@@ -0,0 +1,556 @@
+"""Local stand-in for the PISTE OAuth and Legifrance API endpoints.
+
+:class:`StubPisteServer` implements the subset of the API used by the
+library on a local threaded HTTP server. It serves a synthetic, deterministic
+corpus of configurable size and can inject latency, HTTP 429 and HTTP 5xx
+answers, so concurrency, retry, rate-limiting and caching features can be
+exercised under load without credentials:
+
+    >>> with StubPisteServer(corpus_size=10_000, latency=0.02) as stub:
+    ...     client = LegifranceClient(stub.config())
+    ...     decisions = JuriAPI(client).search("responsabilité")
+    ...     stub.stats().requests
+    {'search': 1, 'consult/juri': 5}
+
+Implemented routes: the OAuth token endpoint, ``search``, ``consult/juri``,
+``consult/code``, ``consult/getArticle``, ``consult/lawDecree``,
+``consult/kali*`` and ``consult/loda/version(s)``. Documents are generated
+from their index: ``JURITEXT000000000001`` is the first decision, and so on;
+the convention ``KALICONT<n>`` has a single base text, ``KALITEXT<n>``.
+Unknown routes answer 404; well-formed but unknown identifiers answer like
+PISTE does (HTTP 400 on ``consult/juri``).
+"""
+
+import json
+import logging
+import random
+import re
+import secrets
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Self
+from urllib.parse import parse_qs
+
+from pylegifrance.config import ApiConfig
+
+logger = logging.getLogger(__name__)
+
+_API_PREFIX = "/dila/legifrance/lf-engine-app/"
+_TOKEN_PATH = "/api/oauth/token"
+_ID_RE = re.compile(r"^([A-Z]+?)(\d{12})$")
+
+# Prefix of the documents returned by ``search`` for each fond.
+_SEARCH_PREFIXES = {
+    "JURI": "JURITEXT",
+    "CETAT": "CETATEXT",
+    "JUFI": "JURITEXT",
+    "CONSTIT": "CONSTEXT",
+    "KALI": "KALITEXT",
+    "LODA_DATE": "LEGITEXT",
+    "LODA_ETAT": "LEGITEXT",
+    "CODE_DATE": "LEGIARTI",
+    "CODE_ETAT": "LEGIARTI",
+    "JORF": "JORFTEXT",
+}
+
+_WORDS = (
+    "attendu que la cour statuant sur le pourvoi formé par la société contre "
+    "l'arrêt rendu par la cour d'appel casse et annule en toutes ses "
+    "dispositions le contrat de travail responsabilité civile préjudice"
+).split()
+
+
+@dataclass(frozen=True)
+class StubServerStats:
+    """
+    Counters of a :class:`StubPisteServer`.
+
+    Attributes:
+        requests: API requests received, by route.
+        tokens_issued: Access tokens delivered by the OAuth endpoint.
+        unauthorized: Requests rejected for a missing or unknown token.
+        injected_errors: HTTP 5xx answers injected.
+        injected_rate_limits: HTTP 429 answers injected.
+    """
+
+    requests: dict[str, int] = field(default_factory=dict)
+    tokens_issued: int = 0
+    unauthorized: int = 0
+    injected_errors: int = 0
+    injected_rate_limits: int = 0
+
+    @property
+    def total_requests(self) -> int:
+        """API requests received on every route."""
+        return sum(self.requests.values())
+
+
+class StubPisteServer:
+    """
+    Threaded local HTTP server mimicking PISTE.
+
+    Args:
+        corpus_size: Number of documents per fond.
+        latency: Delay added to every API answer, in seconds.
+        jitter: Maximum random deviation of the latency, in seconds.
+        error_rate: Probability of answering an API call with HTTP 503.
+        rate_limit_rate: Probability of answering an API call with HTTP 429.
+        retry_after: ``Retry-After`` value sent with injected 429 answers, in
+            seconds; None sends no header.
+        text_chars: Approximate size of the generated document bodies.
+        articles_per_text: Number of articles of each LODA text; each one
+            modifies an article of the corpus.
+        token_ttl: Lifetime of the issued access tokens, in seconds.
+        seed: Seed of the fault-injection and jitter generator.
+        host: Interface to listen on.
+        port: Port to listen on; 0 picks a free port.
+    """
+
+    def __init__(
+        self,
+        corpus_size: int = 1000,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: float | None = 1.0,
+        text_chars: int = 2000,
+        articles_per_text: int = 3,
+        token_ttl: int = 3600,
+        seed: int | None = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.corpus_size = corpus_size
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.text_chars = text_chars
+        self.articles_per_text = articles_per_text
+        self.token_ttl = token_ttl
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens: set[str] = set()
+        self._scripted: list[tuple[int, float | None]] = []
+        self._requests: Counter[str] = Counter()
+        self._tokens_issued = 0
+        self._unauthorized = 0
+        self._injected_errors = 0
+        self._injected_rate_limits = 0
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    # -- lifecycle ---------------------------------------------------------
+
+    @property
+    def base_url(self) -> str:
+        """Root URL of the server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_url(self) -> str:
+        """Value for :attr:`ApiConfig.api_url`."""
+        return f"{self.base_url}{_API_PREFIX}"
+
+    @property
+    def token_url(self) -> str:
+        """Value for :attr:`ApiConfig.token_url`."""
+        return f"{self.base_url}{_TOKEN_PATH}"
+
+    def config(self, **overrides: Any) -> ApiConfig:
+        """Build an :class:`ApiConfig` pointing at this server.
+
+        Args:
+            **overrides: Other :class:`ApiConfig` fields, e.g. pool sizes.
+        """
+        values: dict[str, Any] = {
+            "client_id": "stub-client",
+            "client_secret": "stub-secret",
+            "api_url": self.api_url,
+            "token_url": self.token_url,
+        }
+        values.update(overrides)
+        return ApiConfig(**values)
+
+    def start(self) -> Self:
+        """Serve requests in a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever,
+                name="pylegifrance-stub-piste",
+                daemon=True,
+            )
+            self._thread.start()
+            logger.debug(f"Stub PISTE server listening on {self.base_url}")
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    # -- fault injection ---------------------------------------------------
+
+    def fail_next(
+        self, status: int = 503, times: int = 1, retry_after: float | None = None
+    ) -> None:
+        """Answer the next ``times`` API calls with ``status``.
+
+        Args:
+            status: The HTTP status to answer with.
+            times: Number of calls to fail.
+            retry_after: ``Retry-After`` header value, if any.
+        """
+        with self._lock:
+            self._scripted.extend([(status, retry_after)] * times)
+
+    def revoke_tokens(self) -> None:
+        """Invalidate every issued token, forcing clients to re-authenticate."""
+        with self._lock:
+            self._tokens.clear()
+
+    def stats(self) -> StubServerStats:
+        """Return the server counters."""
+        with self._lock:
+            return StubServerStats(
+                requests=dict(self._requests),
+                tokens_issued=self._tokens_issued,
+                unauthorized=self._unauthorized,
+                injected_errors=self._injected_errors,
+                injected_rate_limits=self._injected_rate_limits,
+            )
+
+    def reset_stats(self) -> None:
+        """Zero the server counters."""
+        with self._lock:
+            self._requests.clear()
+            self._tokens_issued = 0
+            self._unauthorized = 0
+            self._injected_errors = 0
+            self._injected_rate_limits = 0
+
+    # -- request handling --------------------------------------------------
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately; without TCP_NODELAY
+            # delayed ACKs add ~40 ms to every keep-alive exchange.
+            disable_nagle_algorithm = True
+
+            def log_message(self, format: str, *args: Any) -> None:
+                logger.debug(format % args)
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length)
+                status, headers, payload = stub._dispatch(
+                    self.path, self.headers.get("Authorization"), body
+                )
+                content = (
+                    payload
+                    if isinstance(payload, bytes)
+                    else json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                )
+                self.send_response(status)
+                self.send_header(
+                    "Content-Type", headers.pop("Content-Type", "application/json")
+                )
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+        return Handler
+
+    def _dispatch(
+        self, path: str, authorization: str | None, body: bytes
+    ) -> tuple[int, dict[str, str], Any]:
+        if path == _TOKEN_PATH:
+            return self._issue_token(body)
+        if not path.startswith(_API_PREFIX):
+            return 404, {}, {"error": f"Unknown path {path}"}
+
+        route = path[len(_API_PREFIX) :]
+        token = (authorization or "").removeprefix("Bearer ").strip()
+        with self._lock:
+            self._requests[route] += 1
+            if token not in self._tokens:
+                self._unauthorized += 1
+                return 401, {}, {"error": "invalid_token"}
+            fault = self._next_fault()
+            delay = self.latency
+            if self.jitter:
+                delay += self._random.uniform(-self.jitter, self.jitter)
+
+        if delay > 0:
+            time.sleep(delay)
+        if fault is not None:
+            status, retry_after = fault
+            headers = {} if retry_after is None else {"Retry-After": f"{retry_after:g}"}
+            return status, headers, {"error": "Injected failure"}
+
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError:
+            return 400, {}, {"error": "Invalid JSON body"}
+        return self._answer(route, payload)
+
+    def _next_fault(self) -> tuple[int, float | None] | None:
+        """Pick the injected failure of the current call, lock held."""
+        if self._scripted:
+            status, retry_after = self._scripted.pop(0)
+        elif self.rate_limit_rate and self._random.random() < self.rate_limit_rate:
+            status, retry_after = 429, self.retry_after
+        elif self.error_rate and self._random.random() < self.error_rate:
+            status, retry_after = 503, None
+        else:
+            return None
+        if status == 429:
+            self._injected_rate_limits += 1
+        elif status >= 500:
+            self._injected_errors += 1
+        return status, retry_after
+
+    def _issue_token(self, body: bytes) -> tuple[int, dict[str, str], Any]:
+        form = parse_qs(body.decode("utf-8"))
+        if form.get("grant_type") != ["client_credentials"]:
+            return 400, {}, {"error": "unsupported_grant_type"}
+        token = secrets.token_hex(16)
+        with self._lock:
+            self._tokens.add(token)
+            self._tokens_issued += 1
+        return (
+            200,
+            {},
+            {
+                "access_token": token,
+                "token_type": "Bearer",
+                "expires_in": self.token_ttl,
+                "scope": "openid",
+            },
+        )
+
+    # -- synthetic corpus --------------------------------------------------
+
+    def _answer(self, route: str, payload: dict) -> tuple[int, dict[str, str], Any]:
+        if route == "search":
+            return 200, {}, self._search(payload)
+        if route == "consult/juri":
+            return self._consult_juri(payload.get("textId", ""))
+        if route == "consult/getArticle":
+            return self._document(payload.get("id", ""), self._article)
+        if route == "consult/code":
+            return self._document(payload.get("textId", ""), self._code)
+        if route == "consult/lawDecree":
+            return self._document(payload.get("textId", ""), self._loda)
+        if route == "consult/loda/version":
+            return self._document(payload.get("textId", ""), self._loda)
+        if route == "consult/loda/versions":
+            return self._loda_versions(payload.get("textId", ""))
+        if route == "consult/kaliContIdcc":
+            index = int(payload.get("id", 0) or 0)
+            return self._document(_make_id("KALICONT", index), self._kali_container)
+        if route in ("consult/kaliCont",):
+            return self._document(payload.get("id", ""), self._kali_container)
+        if route.startswith("consult/kali"):
+            return self._document(payload.get("id", ""), self._kali_text)
+        return 404, {}, {"error": f"Unknown route {route}"}
+
+    def _index(self, document_id: str) -> int | None:
+        match = _ID_RE.match(document_id or "")
+        if not match:
+            return None
+        index = int(match.group(2))
+        return index if 1 <= index <= self.corpus_size else None
+
+    def _document(self, document_id: str, build) -> tuple[int, dict[str, str], Any]:
+        index = self._index(document_id)
+        if index is None:
+            return 404, {}, {"error": f"Unknown document {document_id}"}
+        return 200, {}, build(document_id, index)
+
+    def _text(self, index: int) -> str:
+        rng = random.Random(index)
+        words = []
+        size = 0
+        while size < self.text_chars:
+            word = rng.choice(_WORDS)
+            words.append(word)
+            size += len(word) + 1
+        return " ".join(words)
+
+    def _search(self, payload: dict) -> dict:
+        fond = payload.get("fond", "JURI")
+        recherche = payload.get("recherche") or {}
+        page_number = max(1, int(recherche.get("pageNumber") or 1))
+        page_size = max(1, int(recherche.get("pageSize") or 10))
+        prefix = _SEARCH_PREFIXES.get(fond, "JURITEXT")
+        first = (page_number - 1) * page_size + 1
+        last = min(self.corpus_size, first + page_size - 1)
+
+        results = []
+        for index in range(first, last + 1):
+            document_id = _make_id(prefix, index)
+            title = {
+                "id": document_id,
+                "cid": document_id,
+                "title": f"Document {index}",
+            }
+            result: dict[str, Any] = {"titles": [title], "nature": fond}
+            if prefix == "LEGIARTI":
+                title["cid"] = _make_id("LEGITEXT", 1)
+                result["sections"] = [
+                    {
+                        "id": _make_id("LEGISCTA", index),
+                        "extracts": [
+                            {
+                                "type": "articles",
+                                "id": document_id,
+                                "num": f"L{index}",
+                                "legalStatus": "VIGUEUR",
+                                "values": [self._text(index)[:200]],
+                            }
+                        ],
+                    }
+                ]
+            results.append(result)
+        return {
+            "totalResultNumber": self.corpus_size,
+            "executionTime": 1,
+            "pageNumber": page_number,
+            "pageSize": page_size,
+            "results": results,
+            "facets": [],
+        }
+
+    def _consult_juri(self, text_id: str) -> tuple[int, dict[str, str], Any]:
+        index = self._index(text_id)
+        if index is None:
+            return 400, {}, b"L'expression \xc3\xa0 valider est fausse"
+        text = self._text(index)
+        return (
+            200,
+            {},
+            {
+                "text": {
+                    "id": text_id,
+                    "cid": text_id,
+                    "titre": f"Cour de cassation, chambre civile, décision n° {index}",
+                    "juridiction": "Cour de cassation",
+                    "num": f"{index:02d}-{index % 100000:05d}",
+                    "nature": "ARRET",
+                    "solution": "Cassation",
+                    "texte": text,
+                    "texteHtml": f"<p>{text}</p>",
+                    "origine": "JURI",
+                }
+            },
+        )
+
+    def _article(self, article_id: str, index: int) -> dict:
+        text = self._text(index)
+        return {
+            "article": {
+                "id": article_id,
+                "cid": article_id,
+                "num": f"L{index}",
+                "etat": "VIGUEUR",
+                "texte": text,
+                "texteHtml": f"<p>{text}</p>",
+                "textTitles": [{"id": _make_id("LEGITEXT", 1), "titre": "Code civil"}],
+            }
+        }
+
+    def _code(self, text_id: str, index: int) -> dict:
+        return {
+            "id": text_id,
+            "cid": text_id,
+            "title": f"Code synthétique {index}",
+            "etat": "VIGUEUR",
+            "sections": [],
+            "articles": [],
+        }
+
+    def _loda(self, text_id: str, index: int) -> dict:
+        text = self._text(index)
+        articles = []
+        for number in range(1, self.articles_per_text + 1):
+            target = (index + number - 1) % self.corpus_size + 1
+            articles.append(
+                {
+                    "id": _make_id("LEGIARTI", target),
+                    "num": str(number),
+                    "content": f"<p>{text}</p>",
+                    "etat": "VIGUEUR",
+                    "lstLienModification": [
+                        {
+                            "linkType": "MODIFIE",
+                            "articleId": _make_id("LEGIARTI", target),
+                            "articleNum": f"L{target}",
+                            "textCid": _make_id("LEGITEXT", 1),
+                            "textTitle": "Code synthétique",
+                            "dateDebutCible": "2024-01-01",
+                        }
+                    ],
+                }
+            )
+        return {
+            "id": text_id,
+            "cid": text_id,
+            "title": f"Loi n° {2000 + index % 25}-{index} relative aux tests",
+            "nor": f"TSTX{index:07d}L",
+            "etat": "VIGUEUR",
+            "articles": articles,
+        }
+
+    def _loda_versions(self, text_id: str) -> tuple[int, dict[str, str], Any]:
+        index = self._index(text_id)
+        if index is None:
+            return 200, {}, []
+        return 200, {}, [{"id": text_id, "etat": "VIGUEUR"}]
+
+    def _kali_container(self, cont_id: str, index: int) -> dict:
+        return {
+            "id": cont_id,
+            "titre": f"Convention collective nationale n° {index}",
+            "num": str(index),
+            "numeroTexte": f"IDCC {index}",
+            "nature": "IDCC",
+            "texteBaseId": [_make_id("KALITEXT", index)],
+            "sections": [],
+        }
+
+    def _kali_text(self, text_id: str, index: int) -> dict:
+        return {
+            "title": f"Avenant n° {index}",
+            "etat": "VIGUEUR_ETEN",
+            "typeTexte": "AVENANT",
+            "idConteneur": _make_id("KALICONT", index),
+            "nor": None,
+            "articles": [],
+        }
+
+
+def _make_id(prefix: str, index: int) -> str:
+    return f"{prefix}{index:012d}"
@@ -0,0 +1,105 @@
+"""Token stores sharing OAuth tokens between processes.
+
+Each worker process (gunicorn, celery, multiprocessing pools...) otherwise
+fetches its own token from PISTE on its first request. When a store is given
+to :class:`~pylegifrance.auth.AuthenticationManager`, the manager reads the
+store before calling the token endpoint and writes every new token back, all
+under the store's lock so that only one process refreshes at a time.
+
+:class:`FileTokenStore` keeps tokens on the local disk. Any object
+implementing :class:`TokenStore` (e.g. backed by Redis or memcached) can be
+used instead.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from contextlib import AbstractContextManager
+from dataclasses import asdict
+from pathlib import Path
+from typing import Protocol, runtime_checkable
+
+from pylegifrance.auth import TokenInfo
+from pylegifrance.utils import exclusive_file_lock
+
+logger = logging.getLogger(__name__)
+
+
+@runtime_checkable
+class TokenStore(Protocol):
+    """
+    Storage shared by several :class:`AuthenticationManager` instances.
+
+    Keys are SHA-256 digests of the client ID, so they can be used as file
+    names or KV keys without exposing the ID. Implementations must make
+    :meth:`lock` exclusive across every process using the store, so that
+    reading, refreshing and saving a token is atomic.
+    """
+
+    def load(self, key: str) -> TokenInfo | None:
+        """Return the stored token for ``key``, or None if there is none."""
+        ...
+
+    def save(self, key: str, token_info: TokenInfo) -> None:
+        """Store ``token_info`` under ``key``."""
+        ...
+
+    def lock(self, key: str) -> AbstractContextManager[None]:
+        """Hold an exclusive lock on ``key`` for the duration of the block."""
+        ...
+
+
+class FileTokenStore:
+    """
+    Token store backed by one JSON file per client ID.
+
+    Files are created with owner-only permissions and replaced atomically.
+    Locking uses ``fcntl.flock`` (or ``msvcrt.locking`` on Windows) on a
+    companion ``.lock`` file, so it works between unrelated processes.
+
+    Attributes:
+        directory: Directory holding the token files.
+    """
+
+    def __init__(self, directory: str | os.PathLike | None = None):
+        """Initialize a new FileTokenStore.
+
+        Args:
+            directory: Where to keep token files. Defaults to
+                ``$XDG_CACHE_HOME/pylegifrance/tokens`` (``~/.cache`` if unset).
+        """
+        if directory is None:
+            cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+            directory = Path(cache_home) / "pylegifrance" / "tokens"
+        self.directory = Path(directory)
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def load(self, key: str) -> TokenInfo | None:
+        """Return the stored token for ``key``, or None if absent or unreadable."""
+        try:
+            data = json.loads(self._path(key).read_text(encoding="utf-8"))
+            return TokenInfo(**data)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as exc:
+            logger.warning(f"Ignoring unreadable token file for {key[:8]}: {exc}")
+            return None
+
+    def save(self, key: str, token_info: TokenInfo) -> None:
+        """Atomically write ``token_info`` under ``key``."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(asdict(token_info), handle)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def lock(self, key: str) -> AbstractContextManager[None]:
+        """Hold an exclusive inter-process lock on ``key``."""
+        return exclusive_file_lock(self.directory / f"{key}.lock")
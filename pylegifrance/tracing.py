@@ -0,0 +1,340 @@
+"""Lightweight hierarchical tracing of API operations.
+
+High-level operations fan out into many API calls: one
+:meth:`JuriAPI.search <pylegifrance.fonds.juri.JuriAPI.search>` is a
+``/search`` followed by up to ``page_size`` ``/consult/juri`` calls. The
+façades open a parent :func:`span` around such operations and
+:meth:`~pylegifrance.client.LegifranceClient.call_api` opens a child span
+per call, with a grandchild per HTTP attempt. Validation and HTML parsing
+get their own spans, so a trace shows where the wall time went.
+
+Tracing is off until an exporter is registered; :func:`span` then costs a
+context-variable lookup. To inspect traces in process::
+
+    exporter = InMemorySpanExporter()
+    add_exporter(exporter)
+    juri.search("responsabilité")
+    print(exporter.roots()[-1].format_tree())
+
+:func:`enable_opentelemetry` mirrors every span into OpenTelemetry when the
+``opentelemetry-api`` package is installed. The current span is held in a
+:mod:`contextvars` variable; :func:`propagate` carries it into worker
+threads.
+"""
+
+import contextvars
+import functools
+import inspect
+import logging
+import secrets
+import threading
+import time
+from collections.abc import Callable, Generator, Iterator
+from contextlib import contextmanager
+from typing import Any, Protocol, runtime_checkable
+
+logger = logging.getLogger(__name__)
+
+
+class Span:
+    """
+    A timed operation, possibly nested in a parent operation.
+
+    Attributes:
+        name: Name of the operation, e.g. ``"juri.search"`` or ``"call_api"``.
+        attributes: Free-form details (route, status code, hit count...).
+        trace_id: Identifier shared by every span of a trace.
+        span_id: Identifier of this span.
+        parent: The enclosing span, or None for a root span.
+        children: Spans started while this one was current.
+        start_time: Wall-clock start, in seconds since the epoch.
+        duration: Elapsed seconds, or None while the span is running.
+        error: The exception that ended the span, if any.
+    """
+
+    __slots__ = (
+        "name",
+        "attributes",
+        "trace_id",
+        "span_id",
+        "parent",
+        "children",
+        "start_time",
+        "duration",
+        "error",
+        "_started",
+    )
+
+    def __init__(self, name: str, parent: "Span | None", attributes: dict):
+        self.name = name
+        self.attributes = attributes
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent = parent
+        self.children: list[Span] = []
+        self.start_time = time.time()
+        self.duration: float | None = None
+        self.error: BaseException | None = None
+        self._started = time.perf_counter()
+        if parent is not None:
+            parent.children.append(self)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach a detail to the span."""
+        self.attributes[key] = value
+
+    def _finish(self) -> None:
+        self.duration = time.perf_counter() - self._started
+
+    @property
+    def self_time(self) -> float | None:
+        """Time not covered by child spans, or None while running.
+
+        Children running concurrently can cover more than the parent's
+        duration; the result is then clamped to 0.
+        """
+        if self.duration is None:
+            return None
+        covered = sum(child.duration or 0.0 for child in self.children)
+        return max(0.0, self.duration - covered)
+
+    def walk(self) -> Iterator["Span"]:
+        """Yield this span and its descendants, depth first."""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def format_tree(self, indent: str = "  ") -> str:
+        """Render the span and its descendants with their durations."""
+        lines: list[str] = []
+
+        def render(span: Span, depth: int) -> None:
+            duration = (
+                "running" if span.duration is None else f"{span.duration * 1000:.1f}ms"
+            )
+            details = " ".join(f"{k}={v}" for k, v in span.attributes.items())
+            failed = f" error={type(span.error).__name__}" if span.error else ""
+            lines.append(
+                f"{indent * depth}{span.name} [{duration}] {details}{failed}".rstrip()
+            )
+            for child in span.children:
+                render(child, depth + 1)
+
+        render(self, 0)
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return f"Span({self.name!r}, duration={self.duration}, attributes={self.attributes})"
+
+
+class _NoopSpan:
+    """Stand-in yielded by :func:`span` while tracing is disabled."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+@runtime_checkable
+class SpanExporter(Protocol):
+    """Receives every span once it has ended."""
+
+    def export(self, span: Span) -> None:
+        """Handle a finished span. Must not raise."""
+        ...
+
+
+class InMemorySpanExporter:
+    """
+    Keeps finished spans in memory, for tests and interactive inspection.
+
+    Args:
+        max_spans: Number of spans kept; the oldest are dropped first.
+    """
+
+    def __init__(self, max_spans: int = 10_000):
+        self.max_spans = max_spans
+        self._lock = threading.Lock()
+        self._spans: list[Span] = []
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+            if len(self._spans) > self.max_spans:
+                del self._spans[: len(self._spans) - self.max_spans]
+
+    @property
+    def spans(self) -> list[Span]:
+        """Finished spans, in the order they ended."""
+        with self._lock:
+            return list(self._spans)
+
+    def roots(self) -> list[Span]:
+        """Finished root spans, each holding its whole trace."""
+        return [span for span in self.spans if span.parent is None]
+
+    def clear(self) -> None:
+        """Forget the collected spans."""
+        with self._lock:
+            self._spans.clear()
+
+
+_current_span: contextvars.ContextVar[Span | None] = contextvars.ContextVar(
+    "pylegifrance_current_span", default=None
+)
+_exporters: list[SpanExporter] = []
+_otel_tracer: Any = None
+
+
+def add_exporter(exporter: SpanExporter) -> None:
+    """Register ``exporter``; tracing is enabled while one is registered."""
+    if exporter not in _exporters:
+        _exporters.append(exporter)
+
+
+def remove_exporter(exporter: SpanExporter) -> None:
+    """Unregister ``exporter``."""
+    if exporter in _exporters:
+        _exporters.remove(exporter)
+
+
+def enable_opentelemetry(tracer: Any = None) -> None:
+    """Mirror every span into OpenTelemetry.
+
+    Args:
+        tracer: An OpenTelemetry tracer. Defaults to
+            ``opentelemetry.trace.get_tracer("pylegifrance")``.
+
+    Raises:
+        ImportError: If no tracer is given and ``opentelemetry-api`` is not
+            installed.
+    """
+    global _otel_tracer
+    if tracer is None:
+        try:
+            from opentelemetry import trace  # ty: ignore[unresolved-import]
+        except ImportError as exc:
+            raise ImportError(
+                "enable_opentelemetry requires the 'opentelemetry-api' package. "
+                "Install it with: pip install opentelemetry-api"
+            ) from exc
+        tracer = trace.get_tracer("pylegifrance")
+    _otel_tracer = tracer
+
+
+def disable_opentelemetry() -> None:
+    """Stop mirroring spans into OpenTelemetry."""
+    global _otel_tracer
+    _otel_tracer = None
+
+
+def is_enabled() -> bool:
+    """Check whether spans are currently recorded."""
+    return bool(_exporters) or _otel_tracer is not None
+
+
+def current_span() -> Span | None:
+    """Return the innermost running span of this context, if any."""
+    return _current_span.get()
+
+
+def _otel_attribute(value: Any) -> Any:
+    if isinstance(value, str | bool | int | float):
+        return value
+    return str(value)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Generator[Span | _NoopSpan, None, None]:
+    """Time the enclosed block as a child of the current span.
+
+    Args:
+        name: Name of the operation.
+        **attributes: Details recorded on the span.
+
+    Yields:
+        The span, whose :meth:`~Span.set_attribute` adds details. A no-op
+        object is yielded while tracing is disabled.
+    """
+    if not is_enabled():
+        yield _NOOP_SPAN
+        return
+
+    current = Span(name, _current_span.get(), dict(attributes))
+    token = _current_span.set(current)
+    otel_tracer = _otel_tracer
+    otel_cm = None
+    otel_span = None
+    if otel_tracer is not None:
+        otel_cm = otel_tracer.start_as_current_span(
+            name,
+            attributes={k: _otel_attribute(v) for k, v in attributes.items()},
+        )
+        otel_span = otel_cm.__enter__()
+    try:
+        yield current
+    except BaseException as exc:
+        current.error = exc
+        raise
+    finally:
+        current._finish()
+        _current_span.reset(token)
+        if otel_cm is not None:
+            if otel_span is not None:
+                for key, value in current.attributes.items():
+                    if key not in attributes:
+                        otel_span.set_attribute(key, _otel_attribute(value))
+            error = current.error
+            otel_cm.__exit__(
+                type(error) if error else None,
+                error,
+                error.__traceback__ if error else None,
+            )
+        for exporter in list(_exporters):
+            try:
+                exporter.export(current)
+            except Exception as exc:
+                logger.warning(f"Span exporter {exporter!r} failed: {exc}")
+
+
+def propagate(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Bind ``fn`` to a copy of the current context, for another thread.
+
+    Spans opened by ``fn`` in a worker thread then nest under the span that
+    was current when :func:`propagate` was called. The result may be called
+    from several threads at once.
+    """
+    context = contextvars.copy_context()
+    return lambda *args, **kwargs: context.copy().run(fn, *args, **kwargs)
+
+
+def traced(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorate a function or coroutine function to run inside :func:`span`.
+
+    Example:
+        >>> @traced("kali.search")
+        ... def search(self, query): ...
+    """
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with span(name):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,279 @@
+"""Pluggable transports sending the requests of the API client.
+
+:class:`HttpTransport` is the default and posts to PISTE through the
+client's :class:`requests.Session`. :class:`RecordingTransport` wraps another
+transport and saves every exchange to a *cassette*: a gzip-compressed JSON
+Lines file holding one ``{"route", "payload", "status", "headers", "body",
+"elapsed"}`` record per call. :class:`ReplayTransport` serves a cassette
+back to a :class:`~pylegifrance.client.LegifranceClient` without any
+network access or credentials, optionally with simulated latency, so the
+whole stack (parsing, validation, hydration) can be benchmarked or load
+tested offline::
+
+    with RecordingTransport("juri.jsonl.gz") as recorder:
+        client = LegifranceClient(config, transport=recorder)
+        JuriAPI(client).search("responsabilité")
+
+    offline = LegifranceClient(
+        ApiConfig(client_id="offline", client_secret="offline"),
+        transport=ReplayTransport("juri.jsonl.gz", latency=0.05, jitter=0.02),
+    )
+
+Authorization headers are never written to cassettes.
+"""
+
+import gzip
+import itertools
+import json
+import logging
+import os
+import random
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Protocol, Self, runtime_checkable
+
+import requests
+
+from pylegifrance.cache import cache_key
+from pylegifrance.exceptions import CassetteMiss
+
+logger = logging.getLogger(__name__)
+
+# Response headers worth keeping; the others only describe the live server.
+_RECORDED_HEADERS = ("content-type", "retry-after")
+
+
+@runtime_checkable
+class Transport(Protocol):
+    """Sends one encoded API request and returns the raw response.
+
+    Attributes:
+        requires_auth: False if the transport never reaches PISTE, in which
+            case the client does not request an access token.
+    """
+
+    requires_auth: bool
+
+    def send(
+        self,
+        session: requests.Session,
+        route: str,
+        url: str,
+        headers: dict[str, str],
+        body: bytes,
+    ) -> requests.Response:
+        """Send ``body`` to ``url`` and return the response, whatever its status.
+
+        Args:
+            session: The client's session, with its pooled adapter.
+            route: The API route, e.g. ``"consult/juri"``.
+            url: The full URL of the route.
+            headers: The request headers.
+            body: The JSON-encoded payload.
+        """
+        ...
+
+    def close(self) -> None:
+        """Release the resources held by the transport."""
+        ...
+
+
+class HttpTransport:
+    """Posts requests through the client's :class:`requests.Session`."""
+
+    requires_auth = True
+
+    def send(
+        self,
+        session: requests.Session,
+        route: str,
+        url: str,
+        headers: dict[str, str],
+        body: bytes,
+    ) -> requests.Response:
+        return session.post(url, headers=headers, data=body)
+
+    def close(self) -> None:
+        pass
+
+
+def _decode_payload(body: bytes) -> Any:
+    try:
+        return json.loads(body)
+    except ValueError:
+        return body.decode("utf-8", errors="replace")
+
+
+def _interaction_key(route: str, payload: Any) -> str:
+    return cache_key(route, payload)
+
+
+class RecordingTransport:
+    """
+    Records every exchange of an inner transport to a cassette file.
+
+    Records are appended, so one cassette can collect several sessions.
+    The file is flushed after each record and closed by :meth:`close`, or
+    when the client owning the transport is closed.
+
+    Args:
+        path: The cassette file, conventionally ``*.jsonl.gz``.
+        inner: The transport doing the actual requests. Defaults to
+            :class:`HttpTransport`.
+        compression_level: gzip compression level, from 1 to 9.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        inner: Transport | None = None,
+        compression_level: int = 6,
+    ):
+        self.path = Path(path)
+        self.inner = inner or HttpTransport()
+        self.requires_auth = self.inner.requires_auth
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file = gzip.open(
+            self.path, "at", encoding="utf-8", compresslevel=compression_level
+        )
+        self.recorded = 0
+
+    def send(
+        self,
+        session: requests.Session,
+        route: str,
+        url: str,
+        headers: dict[str, str],
+        body: bytes,
+    ) -> requests.Response:
+        started = time.perf_counter()
+        response = self.inner.send(session, route, url, headers, body)
+        record = {
+            "route": route,
+            "payload": _decode_payload(body),
+            "status": response.status_code,
+            "headers": {
+                name: response.headers[name]
+                for name in _RECORDED_HEADERS
+                if name in response.headers
+            },
+            "body": response.content.decode("utf-8", errors="replace"),
+            "elapsed": round(time.perf_counter() - started, 6),
+        }
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            if self._file.closed:
+                logger.warning(
+                    f"Cassette {self.path} is closed; '{route}' not recorded."
+                )
+            else:
+                self._file.write(line)
+                self._file.flush()
+                self.recorded += 1
+        return response
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+        self.inner.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def read_cassette(path: str | os.PathLike) -> Iterator[dict[str, Any]]:
+    """Yield the records of a cassette file, in recording order."""
+    with gzip.open(path, "rt", encoding="utf-8") as cassette:
+        for line in cassette:
+            if line.strip():
+                yield json.loads(line)
+
+
+class ReplayTransport:
+    """
+    Serves recorded responses from cassette files, without network access.
+
+    Calls are matched on route and payload; key order in the payload does
+    not matter. When a call was recorded several times, the recorded
+    responses are served in turn.
+
+    Args:
+        *paths: One or more cassette files.
+        latency: Simulated latency per call, in seconds. None replays the
+            latency measured while recording.
+        jitter: Maximum random deviation added to or removed from the
+            latency, in seconds.
+        seed: Seed of the jitter generator, for reproducible runs.
+
+    Raises:
+        FileNotFoundError: If a cassette does not exist.
+    """
+
+    requires_auth = False
+
+    def __init__(
+        self,
+        *paths: str | os.PathLike,
+        latency: float | None = 0.0,
+        jitter: float = 0.0,
+        seed: int | None = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        recordings: dict[str, list[dict[str, Any]]] = {}
+        for path in paths:
+            for record in read_cassette(path):
+                key = _interaction_key(record["route"], record["payload"])
+                recordings.setdefault(key, []).append(record)
+        self._replays = {
+            key: itertools.cycle(records) for key, records in recordings.items()
+        }
+        self.interactions = sum(len(records) for records in recordings.values())
+        logger.debug(f"Loaded {self.interactions} recorded interactions.")
+
+    def _delay(self, record: dict[str, Any]) -> float:
+        base = record.get("elapsed", 0.0) if self.latency is None else self.latency
+        if self.jitter:
+            with self._lock:
+                base += self._random.uniform(-self.jitter, self.jitter)
+        return max(0.0, base)
+
+    def send(
+        self,
+        session: requests.Session,
+        route: str,
+        url: str,
+        headers: dict[str, str],
+        body: bytes,
+    ) -> requests.Response:
+        payload = _decode_payload(body)
+        replays = self._replays.get(_interaction_key(route, payload))
+        if replays is None:
+            raise CassetteMiss(route, payload)
+        with self._lock:
+            record = next(replays)
+
+        delay = self._delay(record)
+        if delay:
+            time.sleep(delay)
+
+        response = requests.Response()
+        response.status_code = record["status"]
+        response.reason = "Replayed"
+        response.url = url
+        response.encoding = "utf-8"
+        response.headers.update(record.get("headers", {}))
+        response._content = record["body"].encode("utf-8")
+        return response
+
+    def close(self) -> None:
+        pass
@@ -5,6 +5,10 @@ This module provides utility functions used across the package.
 
 import enum
 import json
+import os
+import sys
+from collections.abc import Generator
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Any
 
@@ -12,6 +16,11 @@ import requests
 
 from pylegifrance.config import ApiConfig
 
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
 
 class EnumEncoder(json.JSONEncoder):
     """JSON encoder that can handle Enum objects and datetime objects."""
@@ -46,3 +55,31 @@ def configure_session_timeouts(session: requests.Session, config: ApiConfig) ->
 
     # Replace the request method with our wrapper
     session.request = request_with_timeout  # ty: ignore[invalid-assignment]
+
+
+@contextmanager
+def exclusive_file_lock(path: str | os.PathLike) -> Generator[None, None, None]:
+    """Hold an exclusive inter-process lock on ``path`` for the block.
+
+    Uses ``fcntl.flock`` (``msvcrt.locking`` on Windows). The file is created
+    with owner-only permissions if needed and is left in place.
+
+    Args:
+        path: The lock file.
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        if sys.platform == "win32":
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if sys.platform == "win32":
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
@@ -0,0 +1,197 @@
+"""Unit tests for the asynchronous fond façades.
+
+The async client is replaced by an :class:`AsyncMock` at the
+``call_api`` boundary, mirroring the synchronous façade tests.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from pylegifrance.fonds.code import (
+    AsyncArticleFetcher,
+    AsyncCode,
+    AsyncCodeSearchBuilder,
+    Code,
+)
+from pylegifrance.fonds.juri import AsyncJuriAPI, JuriAPI
+from pylegifrance.fonds.kali import AsyncKaliAPI, ConventionCollective, KaliAPI
+from pylegifrance.fonds.loda import AsyncLoda, Loda
+from pylegifrance.models.code.enum import NomCode
+
+
+def _mock_response(status_code: int, payload):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = payload
+    return response
+
+
+def _async_client(side_effect):
+    client = MagicMock()
+    client.call_api = AsyncMock(side_effect=side_effect)
+    return client
+
+
+def test_juri_fetch_by_id_returns_none_for_unknown_text_id():
+    client = _async_client(
+        Exception("API client error 400 - L'expression à valider est fausse")
+    )
+
+    result = asyncio.run(AsyncJuriAPI(client).fetch_by_id("JURITEXT000000000000"))
+
+    assert result is None
+
+
+def test_kali_search_matches_sync_dedupe_and_order():
+    text_payload = {"title": "Avenant", "idConteneur": "KALICONT000000000001"}
+    cont_payloads = {
+        "KALICONT000000000001": {"id": "KALICONT000000000001", "titre": "CCN 1"},
+        "KALICONT000000000002": {"id": "KALICONT000000000002", "titre": "CCN 2"},
+    }
+
+    def route(route, payload):
+        if route == "search":
+            ids = [
+                "KALITEXT000000000001",
+                "KALICONT000000000002",
+                "KALITEXT000000000003",
+            ]
+            return _mock_response(
+                200, {"results": [{"titles": [{"id": i}]} for i in ids]}
+            )
+        if route == "consult/kaliText":
+            return _mock_response(200, text_payload)
+        if route == "consult/kaliCont":
+            return _mock_response(200, cont_payloads[payload["id"]])
+        raise AssertionError(route)
+
+    client = _async_client(route)
+
+    containers = asyncio.run(AsyncKaliAPI(client).search("boulangerie"))
+
+    assert all(isinstance(c, ConventionCollective) for c in containers)
+    assert [c.id for c in containers] == [
+        "KALICONT000000000001",
+        "KALICONT000000000002",
+    ]
+    # Two text hits under the same convention cost a single parent fetch.
+    parent_calls = [
+        call
+        for call in client.call_api.await_args_list
+        if call.args == ("consult/kaliCont", {"id": "KALICONT000000000001"})
+    ]
+    assert len(parent_calls) == 1
+
+
+def test_loda_fetch_versions_wraps_each_version():
+    client = _async_client(
+        lambda route, payload: _mock_response(
+            200, [{"id": "LEGITEXT000000000001"}, {"id": "LEGITEXT000000000002"}]
+        )
+    )
+
+    versions = asyncio.run(AsyncLoda(client).fetch_versions("LEGITEXT000000000001"))
+
+    assert [v.id for v in versions] == ["LEGITEXT000000000001", "LEGITEXT000000000002"]
+    client.call_api.assert_awaited_once_with(
+        "consult/loda/versions", {"textId": "LEGITEXT000000000001"}
+    )
+
+
+def test_texte_from_async_facade_refuses_the_modifications_report():
+    payload = {
+        "id": "LEGITEXT000000000001",
+        "articles": [{"id": "LEGIARTI000000000001", "num": "1"}],
+    }
+    client = _async_client(lambda route, body: _mock_response(200, payload))
+
+    texte = asyncio.run(AsyncLoda(client).fetch("LEGITEXT000000000001"))
+
+    assert texte is not None
+    with pytest.raises(TypeError, match="AsyncLoda"):
+        texte.format_modifications_report()
+
+
+def test_code_execute_and_article_at_use_same_payloads_as_sync():
+    search_response = _mock_response(200, {"results": []})
+    search_response.text = '{"results": []}'
+    client = _async_client(lambda route, payload: search_response)
+
+    builder = AsyncCodeSearchBuilder(client, "CODE_ETAT").in_code(NomCode.CC)
+    assert asyncio.run(builder.text("bail").execute()) == []
+    route, payload = client.call_api.await_args.args
+    assert route == "search"
+    assert payload["fond"] == "CODE_ETAT"
+
+    article_client = _async_client(
+        lambda route, payload: _mock_response(
+            200, {"article": {"id": "LEGIARTI000006419292", "num": "1"}}
+        )
+    )
+    fetcher = AsyncArticleFetcher(article_client, "LEGIARTI000006419292")
+    asyncio.run(fetcher.at("2020-01-01"))
+    article_client.call_api.assert_awaited_once_with(
+        "consult/getArticle", {"id": "LEGIARTI000006419292", "date": "2020-01-01"}
+    )
+
+
+def test_count_sends_one_minimal_search_per_facade():
+    body = {"totalResultNumber": 42, "facets": [{"facetElem": "NATURE"}]}
+    client = _async_client(lambda route, payload: _mock_response(200, body))
+
+    counts = [
+        asyncio.run(AsyncJuriAPI(client).count("bail")),
+        asyncio.run(AsyncKaliAPI(client).count("travail")),
+        asyncio.run(AsyncLoda(client).count("loi")),
+        asyncio.run(AsyncCode(client).search().in_code(NomCode.CC).count()),
+    ]
+
+    assert {c.total for c in counts} == {42}
+    assert all(c.facets == {"NATURE": {}} for c in counts)
+    assert client.call_api.await_count == 4
+    for call in client.call_api.await_args_list:
+        route, payload = call.args
+        assert route == "search"
+        assert payload["recherche"]["pageSize"] == 1
+
+
+@pytest.mark.parametrize(
+    "facade", [JuriAPI, KaliAPI, Loda, Code], ids=lambda f: f.__name__
+)
+def test_sync_facade_rejects_async_client(facade):
+    client = _async_client(AssertionError("no request expected"))
+
+    with pytest.raises(TypeError, match=f"utilisez Async{facade.__name__}"):
+        facade(client)
+
+    client.call_api.assert_not_awaited()
+
+
+@pytest.mark.parametrize(
+    "facade",
+    [AsyncJuriAPI, AsyncKaliAPI, AsyncLoda, AsyncCode],
+    ids=lambda f: f.__name__,
+)
+def test_async_facade_rejects_sync_client(facade):
+    client = MagicMock()
+
+    with pytest.raises(TypeError, match="attend un AsyncLegifranceClient"):
+        facade(client)
+
+    client.call_api.assert_not_called()
+
+
+def test_decision_from_async_facade_refuses_sync_navigation():
+    payload = {"text": {"id": "JURITEXT000037999394", "liens": []}}
+    client = _async_client(lambda route, body: _mock_response(200, payload))
+
+    decision = asyncio.run(AsyncJuriAPI(client).fetch("JURITEXT000037999394"))
+
+    assert decision is not None
+    assert decision.id == "JURITEXT000037999394"
+    with pytest.raises(TypeError, match="AsyncJuriAPI"):
+        decision.versions()
+    with pytest.raises(TypeError, match="AsyncJuriAPI"):
+        decision.citations()
@@ -79,6 +79,7 @@ def _mock_search_response(articles: list[dict]) -> MagicMock:
     }
     mock = MagicMock()
     mock.text = json.dumps(body)
+    mock.json.return_value = body
     return mock
 
 
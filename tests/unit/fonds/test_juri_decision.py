@@ -10,7 +10,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from pylegifrance.fonds.juri import JuriDecision
+from pylegifrance.fonds.juri import JuriAPI, JuriDecision, LazyJuriDecision
 from pylegifrance.models.generated.model import TexteSommaire
 from pylegifrance.models.juri.models import Decision
 
@@ -257,3 +257,85 @@ class TestJuriDecisionToMarkdown:
         rendered = decision.to_markdown()
 
         assert "**Publié au Bulletin**" not in rendered
+
+
+class TestLazyJuriDecision:
+    """Search results returned by ``JuriAPI.search(..., lazy=True)``."""
+
+    HIT = {
+        "titles": [
+            {
+                "id": "JURITEXT000041234567",
+                "cid": "JURITEXT000041234567",
+                "title": "Cour de cassation, Chambre sociale, 4 mars 2020",
+            }
+        ],
+        "date": "2020-03-04T00:00:00.000+0000",
+        "nature": "ARRET",
+        "juridiction": "Cour de cassation",
+        "origin": "JURI",
+    }
+
+    @staticmethod
+    def _response(payload: dict) -> MagicMock:
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = payload
+        return response
+
+    def _client(self) -> MagicMock:
+        client = MagicMock()
+
+        def call_api(route: str, data: dict) -> MagicMock:
+            if route == "search":
+                return self._response({"results": [self.HIT]})
+            return self._response(
+                {
+                    "text": {
+                        "id": data["textId"],
+                        "titre": "Cour de cassation, Chambre sociale, 4 mars 2020",
+                        "texte": "LA COUR...",
+                        "sommaire": [{"resumePrincipal": "CONTRAT DE TRAVAIL"}],
+                    }
+                }
+            )
+
+        client.call_api.side_effect = call_api
+        return client
+
+    def test_search_fields_need_no_consult(self):
+        client = self._client()
+
+        (decision,) = JuriAPI(client).search("licenciement", lazy=True)
+
+        assert isinstance(decision, LazyJuriDecision)
+        assert decision.id == "JURITEXT000041234567"
+        assert decision.title.startswith("Cour de cassation")
+        assert decision.date.year == 2020
+        assert decision.jurisdiction == "Cour de cassation"
+        assert decision.url.endswith("JURITEXT000041234567")
+        assert "JURITEXT000041234567" in repr(decision)
+        assert not decision.loaded
+        assert [c.args[0] for c in client.call_api.call_args_list] == ["search"]
+
+    def test_missing_fields_consult_once(self):
+        client = self._client()
+        (decision,) = JuriAPI(client).search("licenciement", lazy=True)
+
+        assert decision.text == "LA COUR..."
+        assert decision.headnote == "CONTRAT DE TRAVAIL"
+        assert decision.citations() == []
+
+        assert decision.loaded
+        routes = [c.args[0] for c in client.call_api.call_args_list]
+        assert routes == ["search", "consult/juri"]
+
+    def test_unknown_decision_keeps_the_summary(self):
+        client = self._client()
+        (decision,) = JuriAPI(client).search("licenciement", lazy=True)
+        client.call_api.side_effect = None
+        client.call_api.return_value = self._response({"text": None})
+
+        assert decision.text is None
+        assert decision.title.startswith("Cour de cassation")
+        assert client.call_api.call_count == 2
@@ -14,6 +14,8 @@ stub or monkey-patch the HTTP transport itself. This mirrors the existing
 unit-test style in ``tests/unit/fonds/test_juri_decision.py``.
 """
 
+import threading
+import time
 from datetime import date
 from unittest.mock import MagicMock
 
@@ -417,3 +419,66 @@ class TestSearchByAffaire:
 
         with pytest.raises(Exception, match="503"):
             JuriAPI(client).search_by_affaire(num_affaire="18-26.218")
+
+
+class TestConcurrentHydration:
+    """Unit tests for the bounded-parallel hydration of search hits."""
+
+    IDS = [f"JURITEXT0000000000{n:02d}" for n in range(12)]
+
+    def _client(self, failing: frozenset[str] = frozenset()):
+        """Client whose consults are slower for earlier hits.
+
+        Records the highest number of consults in flight at once.
+        """
+        client = MagicMock()
+        lock = threading.Lock()
+        state = {"in_flight": 0, "peak": 0}
+
+        def side_effect(route: str, data):
+            if route == "search":
+                return _mock_response(200, _search_payload(self.IDS))
+            text_id = data["textId"]
+            with lock:
+                state["in_flight"] += 1
+                state["peak"] = max(state["peak"], state["in_flight"])
+            try:
+                time.sleep(0.002 * (len(self.IDS) - self.IDS.index(text_id)))
+                if text_id in failing:
+                    raise Exception("API server error 500 - boom")
+                return _mock_response(200, _consult_payload(text_id))
+            finally:
+                with lock:
+                    state["in_flight"] -= 1
+
+        client.call_api.side_effect = side_effect
+        return client, state
+
+    def test_keeps_result_order_and_bounds_concurrency(self):
+        client, state = self._client()
+
+        decisions = JuriAPI(client).search("bail", max_workers=4)
+
+        assert [d.id for d in decisions] == self.IDS
+        assert 1 < state["peak"] <= 4
+
+    def test_serial_when_max_workers_is_one(self):
+        client, state = self._client()
+
+        decisions = JuriAPI(client).search_by_ecli("ECLI:FR:X", max_workers=1)
+
+        assert [d.id for d in decisions] == self.IDS
+        assert state["peak"] == 1
+
+    def test_failed_consults_are_skipped(self):
+        client, _ = self._client(failing=frozenset(self.IDS[1::2]))
+
+        decisions = JuriAPI(client).search_by_affaire("18-26.218", max_workers=8)
+
+        assert [d.id for d in decisions] == self.IDS[::2]
+
+    def test_rejects_invalid_max_workers(self):
+        client, _ = self._client()
+
+        with pytest.raises(ValueError, match="max_workers"):
+            JuriAPI(client).search("bail", max_workers=0)
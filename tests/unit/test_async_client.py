@@ -0,0 +1,182 @@
+"""Unit tests for :mod:`pylegifrance.async_client`.
+
+The client is exercised end-to-end against a local stub HTTP server
+(``http.server`` in a background thread) that implements the OAuth token
+endpoint and the two routes used by :meth:`AsyncJuriAPI.search`. No PISTE
+credentials are required.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from pylegifrance.async_client import AsyncLegifranceClient  # noqa: E402
+from pylegifrance.config import ApiConfig  # noqa: E402
+from pylegifrance.exceptions import NotFound  # noqa: E402
+from pylegifrance.fonds.juri import AsyncJuriAPI  # noqa: E402
+from pylegifrance.retry import RetryPolicy  # noqa: E402
+
+_CONSULT_DELAY_SECONDS = 0.2
+
+
+class _StubState:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.token_calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+
+def _make_handler(state: _StubState):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):  # silence stderr
+            pass
+
+        def _reply(self, status: int, payload) -> None:
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            raw = self.rfile.read(length)
+
+            if self.path == "/oauth/token":
+                with state.lock:
+                    state.token_calls += 1
+                self._reply(200, {"access_token": "stub-token", "expires_in": 3600})
+                return
+
+            if self.headers.get("Authorization") != "Bearer stub-token":
+                self._reply(401, {"error": "invalid_client"})
+                return
+
+            body = json.loads(raw)
+            if self.path == "/api/search":
+                ids = [f"JURITEXT0000000000{i:02d}" for i in range(5)]
+                self._reply(
+                    200, {"results": [{"titles": [{"id": tid}]} for tid in ids]}
+                )
+            elif self.path == "/api/consult/juri":
+                with state.lock:
+                    state.in_flight += 1
+                    state.max_in_flight = max(state.max_in_flight, state.in_flight)
+                time.sleep(_CONSULT_DELAY_SECONDS)
+                with state.lock:
+                    state.in_flight -= 1
+                text_id = body["textId"]
+                if text_id == "JURITEXT000000000003":
+                    self._reply(500, {"error": "boom"})
+                    return
+                self._reply(200, {"text": {"id": text_id, "titre": f"Arrêt {text_id}"}})
+            else:
+                self._reply(404, {"error": "not found"})
+
+    return Handler
+
+
+@pytest.fixture
+def stub_server():
+    state = _StubState()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(state))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    config = ApiConfig(
+        client_id="id",
+        client_secret="secret",
+        token_url=f"{base}/oauth/token",
+        api_url=f"{base}/api/",
+    )
+    yield config, state
+    server.shutdown()
+    server.server_close()
+
+
+def test_call_api_returns_json_response(stub_server):
+    config, state = stub_server
+
+    async def scenario():
+        async with AsyncLegifranceClient(config) as client:
+            response = await client.call_api(
+                "consult/juri", {"textId": "JURITEXT000000000001"}
+            )
+            return response.status_code, response.json()
+
+    status, payload = asyncio.run(scenario())
+
+    assert status == 200
+    assert payload["text"]["id"] == "JURITEXT000000000001"
+    assert state.token_calls == 1
+
+
+def test_call_api_raises_on_http_error(stub_server):
+    config, _ = stub_server
+
+    async def scenario():
+        async with AsyncLegifranceClient(config) as client:
+            await client.call_api("unknown/route", {"x": 1})
+
+    with pytest.raises(NotFound, match="API client error 404"):
+        asyncio.run(scenario())
+
+
+def test_concurrent_calls_share_a_single_token_refresh(stub_server):
+    config, state = stub_server
+
+    async def scenario():
+        async with AsyncLegifranceClient(config, max_concurrency=8) as client:
+            await asyncio.gather(
+                *(
+                    client.call_api(
+                        "consult/juri", {"textId": f"JURITEXT0000000001{i:02d}"}
+                    )
+                    for i in range(8)
+                )
+            )
+
+    asyncio.run(scenario())
+
+    assert state.token_calls == 1
+
+
+def test_asearch_hydrates_hits_concurrently_in_order(stub_server):
+    config, state = stub_server
+
+    async def scenario():
+        async with AsyncLegifranceClient(
+            config, max_concurrency=3, retry_policy=RetryPolicy.disabled()
+        ) as client:
+            return await AsyncJuriAPI(client).search("contrat")
+
+    started = time.perf_counter()
+    decisions = asyncio.run(scenario())
+    elapsed = time.perf_counter() - started
+
+    # The failing hit (…03) is skipped, the others keep the search order.
+    assert [d.id for d in decisions] == [
+        "JURITEXT000000000000",
+        "JURITEXT000000000001",
+        "JURITEXT000000000002",
+        "JURITEXT000000000004",
+    ]
+    # Concurrency is bounded by max_concurrency…
+    assert state.max_in_flight <= 3
+    assert state.max_in_flight > 1
+    # …and the five consults overlap instead of running back to back.
+    assert elapsed < 5 * _CONSULT_DELAY_SECONDS
+
+
+def test_rejects_invalid_max_concurrency():
+    config = ApiConfig(client_id="id", client_secret="secret")
+    with pytest.raises(ValueError):
+        AsyncLegifranceClient(config, max_concurrency=0)
@@ -0,0 +1,142 @@
+"""Unit tests for the token refresh logic of :class:`AuthenticationManager`.
+
+``_fetch_new_token`` is replaced on the instance so no OAuth server is needed.
+"""
+
+import threading
+import time
+
+import pytest
+
+from pylegifrance.auth import MIN_RENEWAL_DELAY, AuthenticationManager, TokenInfo
+from pylegifrance.config import ApiConfig
+
+
+class _FakeTokenEndpoint:
+    def __init__(self, delay: float = 0.0, expires_in: int = 3600):
+        self.delay = delay
+        self.expires_in = expires_in
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self) -> TokenInfo:
+        with self.lock:
+            self.calls += 1
+            number = self.calls
+        time.sleep(self.delay)
+        return TokenInfo(
+            access_token=f"token-{number}",
+            issued_at=time.time(),
+            expires_in=self.expires_in,
+        )
+
+
+def _manager(endpoint, **kwargs) -> AuthenticationManager:
+    config = ApiConfig(client_id="id", client_secret="secret", **kwargs)
+    manager = AuthenticationManager(config)
+    manager._fetch_new_token = endpoint
+    return manager
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+def test_concurrent_callers_share_a_single_refresh():
+    endpoint = _FakeTokenEndpoint(delay=0.2)
+    manager = _manager(endpoint)
+    barrier = threading.Barrier(8)
+    tokens = []
+
+    def worker():
+        barrier.wait()
+        tokens.append(manager.ensure_valid_token())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert endpoint.calls == 1
+    assert tokens == ["token-1"] * 8
+
+
+def test_token_is_renewed_early_without_blocking_callers():
+    endpoint = _FakeTokenEndpoint(delay=0.3)
+    manager = _manager(endpoint, token_refresh_ratio=0.5)
+    manager._token_info = TokenInfo(
+        access_token="old", issued_at=time.time() - 60, expires_in=100
+    )
+
+    started = time.perf_counter()
+    tokens = [manager.ensure_valid_token() for _ in range(5)]
+    elapsed = time.perf_counter() - started
+
+    # The old token is still valid and served while renewal runs aside.
+    assert tokens == ["old"] * 5
+    assert elapsed < endpoint.delay
+    _wait_for(lambda: manager._token_info.access_token == "token-1")
+    assert endpoint.calls == 1
+    assert manager.ensure_valid_token() == "token-1"
+
+
+def test_failed_early_renewal_keeps_current_token():
+    manager = _manager(_FakeTokenEndpoint(), token_refresh_ratio=0.5)
+
+    def failing():
+        raise Exception("Error obtaining token: 503")
+
+    manager._fetch_new_token = failing
+    manager._token_info = TokenInfo(
+        access_token="old", issued_at=time.time() - 60, expires_in=100
+    )
+
+    assert manager.ensure_valid_token() == "old"
+    _wait_for(lambda: not manager._lock.locked())
+    assert manager.ensure_valid_token() == "old"
+
+
+def test_background_refresh_renews_without_traffic():
+    endpoint = _FakeTokenEndpoint(expires_in=1)
+    manager = _manager(endpoint, token_refresh_ratio=0.1, background_token_refresh=True)
+    try:
+        assert manager.ensure_valid_token() == "token-1"
+        _wait_for(lambda: endpoint.calls >= 2)
+    finally:
+        manager.close()
+
+
+def test_rejects_invalid_refresh_ratio():
+    config = ApiConfig(client_id="id", client_secret="secret", token_refresh_ratio=0)
+    with pytest.raises(ValueError):
+        AuthenticationManager(config)
+
+
+def test_background_refresh_is_not_scheduled_without_lifetime():
+    endpoint = _FakeTokenEndpoint(expires_in=0)
+    manager = _manager(endpoint, background_token_refresh=True)
+    try:
+        manager.ensure_valid_token()
+        assert manager._renewal_timer is None
+    finally:
+        manager.close()
+
+
+def test_background_refresh_waits_at_least_the_minimum_delay():
+    endpoint = _FakeTokenEndpoint(expires_in=1)
+    manager = _manager(
+        endpoint, token_refresh_ratio=0.01, background_token_refresh=True
+    )
+    try:
+        manager.ensure_valid_token()
+        assert manager._renewal_timer is not None
+        assert manager._renewal_timer.interval == MIN_RENEWAL_DELAY
+        time.sleep(0.3)
+        assert endpoint.calls == 1
+    finally:
+        manager.close()
@@ -0,0 +1,128 @@
+"""Unit tests for :mod:`pylegifrance.batch` and the client batch API."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from pylegifrance.batch import run_batch
+from pylegifrance.client import LegifranceClient
+from pylegifrance.config import ApiConfig
+from pylegifrance.exceptions import NotFound
+from pylegifrance.retry import RetryPolicy
+
+
+def _slow_echo(payload):
+    time.sleep(0.01 * (5 - payload % 5))
+    return payload * 2
+
+
+def test_ordered_results_follow_input_order():
+    results = list(run_batch(_slow_echo, range(20), max_workers=4))
+
+    assert [r.index for r in results] == list(range(20))
+    assert [r.value for r in results] == [i * 2 for i in range(20)]
+    assert all(r.ok for r in results)
+
+
+def test_unordered_results_cover_every_input():
+    results = list(run_batch(_slow_echo, range(20), max_workers=4, ordered=False))
+
+    assert sorted(r.index for r in results) == list(range(20))
+    assert [r.index for r in results] != list(range(20))
+
+
+def test_errors_are_captured_per_item():
+    def fn(payload):
+        if payload == 2:
+            raise ValueError("bad payload")
+        return payload
+
+    results = list(run_batch(fn, range(4), max_workers=2))
+
+    assert [r.ok for r in results] == [True, True, False, True]
+    assert isinstance(results[2].error, ValueError)
+    assert results[2].payload == 2
+    assert results[3].value == 3
+
+
+def test_inputs_are_consumed_lazily():
+    consumed = []
+
+    def payloads():
+        for i in range(1000):
+            consumed.append(i)
+            yield i
+
+    batch = run_batch(lambda p: p, payloads(), max_workers=2)
+    first = next(batch)
+    batch.close()
+
+    assert first.value == 0
+    assert len(consumed) <= 5
+
+
+def test_concurrency_is_bounded():
+    lock = threading.Lock()
+    active = peak = 0
+
+    def fn(payload):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return payload
+
+    list(run_batch(fn, range(30), max_workers=3))
+
+    assert peak <= 3
+
+
+def test_invalid_worker_count():
+    with pytest.raises(ValueError):
+        list(run_batch(lambda p: p, [1], max_workers=0))
+
+
+@pytest.fixture
+def client():
+    client = LegifranceClient(
+        ApiConfig(client_id="id", client_secret="secret"),
+        retry_policy=RetryPolicy.disabled(),
+    )
+    client._auth_manager = MagicMock()
+    client._auth_manager.ensure_valid_token.return_value = "token"
+
+    def post(url, headers=None, data=None, **kwargs):
+        response = requests.Response()
+        response.status_code = 404 if b"missing" in data else 200
+        response._content = data
+        return response
+
+    client.session = MagicMock()
+    client.session.post.side_effect = post
+    yield client
+    client.close()
+
+
+def test_client_map(client):
+    payloads = [{"id": "LEGIARTI1"}, {"id": "missing"}, {"id": "LEGIARTI2"}]
+
+    results = list(client.map("consult/getArticle", payloads, max_workers=2))
+
+    assert results[0].value.json() == {"id": "LEGIARTI1"}
+    assert isinstance(results[1].error, NotFound)
+    assert results[2].value.json() == {"id": "LEGIARTI2"}
+    assert client.session.post.call_count == 3
+
+
+def test_client_submit(client):
+    futures = [client.submit("consult/getArticle", {"id": i}) for i in range(3)]
+
+    assert [f.result().json() for f in futures] == [{"id": i} for i in range(3)]
+    with pytest.raises(NotFound):
+        client.submit("consult/getArticle", {"id": "missing"}).result()
@@ -0,0 +1,119 @@
+"""Unit tests for :mod:`pylegifrance.cache`."""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from pylegifrance.cache import (
+    CacheBackend,
+    DiskCache,
+    MemoryCache,
+    ResponseCache,
+    SQLiteCache,
+    cache_key,
+)
+from pylegifrance.client import LegifranceClient
+from pylegifrance.config import ApiConfig
+from pylegifrance.fonds.juri import JuriAPI
+
+
+@pytest.fixture(params=["memory", "sqlite", "disk"])
+def make_backend(request, tmp_path):
+    def factory(max_entries: int = 100):
+        if request.param == "memory":
+            return MemoryCache(max_entries=max_entries)
+        if request.param == "sqlite":
+            return SQLiteCache(tmp_path / "cache.sqlite", max_entries=max_entries)
+        return DiskCache(tmp_path / "blobs", max_entries=max_entries)
+
+    return factory
+
+
+def test_backend_round_trip_and_counters(make_backend):
+    backend = make_backend()
+
+    assert isinstance(backend, CacheBackend)
+    assert backend.get("a") is None
+    backend.set("a", b'{"id": "JURITEXT000000000001"}')
+
+    assert backend.get("a") == b'{"id": "JURITEXT000000000001"}'
+    stats = backend.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+
+def test_backend_expires_entries(make_backend):
+    backend = make_backend()
+    backend.set("a", b"1", ttl=0.05)
+
+    time.sleep(0.1)
+
+    assert backend.get("a") is None
+    assert backend.stats().entries == 0
+
+
+def test_backend_evicts_least_recently_used(make_backend):
+    backend = make_backend(max_entries=2)
+    backend.set("a", b"1")
+    time.sleep(0.01)
+    backend.set("b", b"2")
+    time.sleep(0.01)
+    backend.get("a")  # "b" is now the least recently used
+    time.sleep(0.01)
+    backend.set("c", b"3")
+
+    assert backend.get("b") is None
+    assert backend.get("a") == b"1"
+    assert backend.get("c") == b"3"
+    assert backend.stats().evictions == 1
+
+
+def test_cache_key_ignores_key_order():
+    url = "https://api/consult/juri"
+    assert cache_key(url, {"a": 1, "b": 2}) == cache_key(url, {"b": 2, "a": 1})
+    assert cache_key(url, {"a": 1}) != cache_key(url + "x", {"a": 1})
+
+
+def _json_response(body: bytes) -> requests.Response:
+    response = requests.Response()
+    response._content = body
+    response.status_code = 200
+    return response
+
+
+def _client(cache: ResponseCache) -> LegifranceClient:
+    client = LegifranceClient(
+        ApiConfig(client_id="id", client_secret="secret"), cache=cache
+    )
+    client._auth_manager = MagicMock()
+    client._auth_manager.ensure_valid_token.return_value = "token"
+    client.session = MagicMock()
+    return client
+
+
+def test_client_serves_consult_routes_from_cache():
+    client = _client(ResponseCache(MemoryCache()))
+    client.session.post.side_effect = lambda *a, **k: _json_response(
+        b'{"text": {"id": "JURITEXT000000000001", "titre": "Arr\\u00eat"}}'
+    )
+    juri = JuriAPI(client)
+
+    first = juri.fetch("JURITEXT000000000001")
+    second = juri.fetch("JURITEXT000000000001")
+
+    assert first.id == second.id == "JURITEXT000000000001"
+    assert client.session.post.call_count == 1
+    assert client.cache.stats().hits == 1
+
+
+def test_client_does_not_cache_search_by_default():
+    client = _client(ResponseCache())
+    client.session.post.side_effect = lambda *a, **k: _json_response(b'{"results": []}')
+
+    client.call_api("search", {"fond": "JURI"})
+    client.call_api("search", {"fond": "JURI"})
+
+    assert client.session.post.call_count == 2
+    assert client.cache.stats().entries == 0
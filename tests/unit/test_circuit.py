@@ -0,0 +1,176 @@
+"""Unit tests for :mod:`pylegifrance.circuit`."""
+
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from pylegifrance.cache import MemoryCache, ResponseCache
+from pylegifrance.circuit import CircuitBreaker, CircuitState
+from pylegifrance.client import LegifranceClient
+from pylegifrance.config import ApiConfig
+from pylegifrance.exceptions import CircuitOpenError, NotFound, ServerError
+from pylegifrance.retry import RetryPolicy
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _fail(breaker: CircuitBreaker, route: str, exc: Exception) -> None:
+    with pytest.raises(type(exc)):
+        with breaker.guard(route):
+            raise exc
+
+
+def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=3, cooldown=10, clock=_Clock())
+
+    for _ in range(3):
+        assert breaker.state("search") is CircuitState.CLOSED
+        _fail(breaker, "search", ServerError(503, "down"))
+
+    assert breaker.state("search") is CircuitState.OPEN
+    with pytest.raises(CircuitOpenError) as excinfo:
+        breaker.before_call("search")
+    assert excinfo.value.route == "search"
+    assert excinfo.value.retry_after == 10
+    # Other routes are unaffected.
+    breaker.before_call("consult/juri")
+
+
+def test_success_resets_the_failure_count():
+    breaker = CircuitBreaker(failure_threshold=2, clock=_Clock())
+
+    _fail(breaker, "search", requests.ConnectionError("reset"))
+    with breaker.guard("search"):
+        pass
+    _fail(breaker, "search", requests.ConnectionError("reset"))
+
+    assert breaker.state("search") is CircuitState.CLOSED
+
+
+def test_client_errors_do_not_count():
+    breaker = CircuitBreaker(failure_threshold=1, clock=_Clock())
+
+    _fail(breaker, "consult/juri", NotFound(404, "missing"))
+
+    assert breaker.state("consult/juri") is CircuitState.CLOSED
+
+
+def test_transport_errors_count_as_failures():
+    import httpx
+
+    for exc in (requests.Timeout("slow"), httpx.ConnectError("refused")):
+        breaker = CircuitBreaker(failure_threshold=1, clock=_Clock())
+        _fail(breaker, "search", exc)
+        assert breaker.state("search") is CircuitState.OPEN
+
+
+def test_other_exceptions_record_nothing():
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=5, clock=clock)
+
+    _fail(breaker, "search", ValueError("bad payload"))
+    with pytest.raises(KeyboardInterrupt):
+        with breaker.guard("search"):
+            raise KeyboardInterrupt
+    stats = breaker.stats()["search"]
+    assert (stats.state, stats.failures, stats.successes) == (
+        CircuitState.CLOSED,
+        0,
+        0,
+    )
+
+    # A half-open probe that ends in neither outcome frees its slot.
+    _fail(breaker, "search", ServerError(500, "boom"))
+    clock.now = 5
+    _fail(breaker, "search", ValueError("bad payload"))
+    assert breaker.state("search") is CircuitState.HALF_OPEN
+    with breaker.guard("search"):
+        pass
+    assert breaker.state("search") is CircuitState.CLOSED
+
+
+def test_half_open_probe_closes_or_reopens():
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=5, clock=clock)
+    _fail(breaker, "search", ServerError(500, "boom"))
+
+    clock.now = 5
+    assert breaker.state("search") is CircuitState.HALF_OPEN
+    breaker.before_call("search")
+    # A single probe is allowed at a time.
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call("search")
+    breaker.record_failure("search")
+    assert breaker.state("search") is CircuitState.OPEN
+
+    clock.now = 10
+    with breaker.guard("search"):
+        pass
+    assert breaker.state("search") is CircuitState.CLOSED
+    stats = breaker.stats()["search"]
+    assert (stats.opened, stats.rejected, stats.failures) == (2, 1, 2)
+
+
+def test_invalid_settings():
+    with pytest.raises(ValueError):
+        CircuitBreaker(failure_threshold=0)
+    with pytest.raises(ValueError):
+        CircuitBreaker(cooldown=0)
+
+
+def _response(status: int, body: bytes = b"{}") -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    return response
+
+
+def _client(**kwargs) -> LegifranceClient:
+    client = LegifranceClient(
+        ApiConfig(client_id="id", client_secret="secret"),
+        retry_policy=RetryPolicy.disabled(),
+        **kwargs,
+    )
+    client._auth_manager = MagicMock()
+    client._auth_manager.ensure_valid_token.return_value = "token"
+    client.session = MagicMock()
+    return client
+
+
+def test_client_fails_fast_while_open():
+    client = _client(circuit_breaker=CircuitBreaker(failure_threshold=2))
+    client.session.post.return_value = _response(503)
+
+    for _ in range(2):
+        with pytest.raises(ServerError):
+            client.call_api("search", {"fond": "JURI"})
+    with pytest.raises(CircuitOpenError):
+        client.call_api("search", {"fond": "JURI"})
+
+    assert client.session.post.call_count == 2
+
+
+def test_cached_responses_are_served_while_open():
+    client = _client(
+        circuit_breaker=CircuitBreaker(failure_threshold=1),
+        cache=ResponseCache(MemoryCache()),
+    )
+    client.session.post.return_value = _response(200, b'{"text": {"id": "A"}}')
+    client.call_api("consult/juri", {"textId": "A"})
+
+    client.session.post.return_value = _response(503)
+    with pytest.raises(ServerError):
+        client.call_api("consult/juri", {"textId": "B"})
+
+    assert client.call_api("consult/juri", {"textId": "A"}).json() == {
+        "text": {"id": "A"}
+    }
+    with pytest.raises(CircuitOpenError):
+        client.call_api("consult/juri", {"textId": "B"})
@@ -0,0 +1,113 @@
+"""Unit tests for :mod:`pylegifrance.coalesce`."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from pylegifrance.client import LegifranceClient
+from pylegifrance.coalesce import RequestCoalescer
+from pylegifrance.config import ApiConfig
+from pylegifrance.retry import RetryPolicy
+
+
+def _run_concurrently(fn, count: int) -> list:
+    barrier = threading.Barrier(count)
+    outcomes = [None] * count
+
+    def worker(index):
+        barrier.wait()
+        try:
+            outcomes[index] = fn()
+        except Exception as exc:
+            outcomes[index] = exc
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+def test_concurrent_identical_calls_share_one_run():
+    coalescer = RequestCoalescer()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.2)
+        return "result"
+
+    outcomes = _run_concurrently(lambda: coalescer.run("key", slow), 6)
+
+    assert outcomes == ["result"] * 6
+    assert len(calls) == 1
+    stats = coalescer.stats()
+    assert (stats.calls, stats.coalesced, stats.in_flight) == (6, 5, 0)
+
+
+def test_errors_reach_every_waiter():
+    coalescer = RequestCoalescer()
+
+    def failing():
+        time.sleep(0.1)
+        raise RuntimeError("boom")
+
+    outcomes = _run_concurrently(lambda: coalescer.run("key", failing), 4)
+
+    assert all(isinstance(o, RuntimeError) for o in outcomes)
+    # The next call is not answered by the failed flight.
+    assert coalescer.run("key", lambda: "ok") == "ok"
+
+
+def test_sequential_calls_are_not_coalesced():
+    coalescer = RequestCoalescer()
+
+    assert coalescer.run("key", lambda: 1) == 1
+    assert coalescer.run("key", lambda: 2) == 2
+    assert coalescer.stats().coalesced == 0
+
+
+@pytest.fixture
+def client():
+    client = LegifranceClient(
+        ApiConfig(client_id="id", client_secret="secret"),
+        coalescer=RequestCoalescer(),
+        retry_policy=RetryPolicy.disabled(),
+    )
+    client._auth_manager = MagicMock()
+    client._auth_manager.ensure_valid_token.return_value = "token"
+
+    def post(*args, **kwargs):
+        time.sleep(0.2)
+        response = requests.Response()
+        response._content = kwargs["data"]
+        response.status_code = 200
+        return response
+
+    client.session = MagicMock()
+    client.session.post.side_effect = post
+    return client
+
+
+def test_client_collapses_identical_calls(client):
+    payload = {"textId": "JURITEXT000000000001"}
+
+    responses = _run_concurrently(lambda: client.call_api("consult/juri", payload), 5)
+
+    assert [r.json() for r in responses] == [payload] * 5
+    assert client.session.post.call_count == 1
+    assert client.coalescer.stats().coalesced == 4
+
+
+def test_client_keeps_distinct_payloads_apart(client):
+    counter = iter(range(100))
+
+    _run_concurrently(
+        lambda: client.call_api("consult/juri", {"textId": next(counter)}), 4
+    )
+
+    assert client.session.post.call_count == 4
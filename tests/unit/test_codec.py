@@ -0,0 +1,75 @@
+"""Unit tests for :mod:`pylegifrance.codec`."""
+
+import enum
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from pylegifrance.client import LegifranceClient
+from pylegifrance.codec import (
+    CodecResponse,
+    JsonCodec,
+    OrjsonCodec,
+    StdlibCodec,
+    adopt_response,
+)
+from pylegifrance.config import ApiConfig
+
+
+class _Fond(enum.Enum):
+    JURI = "JURI"
+
+
+def _codecs():
+    codecs = [StdlibCodec()]
+    try:
+        codecs.append(OrjsonCodec())
+    except ImportError:
+        pass
+    return codecs
+
+
+@pytest.mark.parametrize("codec", _codecs(), ids=lambda c: c.name)
+def test_codec_encodes_enums_and_datetimes_to_bytes(codec):
+    encoded = codec.dumps(
+        {"fond": _Fond.JURI, "date": datetime(2020, 1, 2, 3, 4, 5), "q": "é"}
+    )
+
+    assert isinstance(codec, JsonCodec)
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == {
+        "fond": "JURI",
+        "date": "2020-01-02T03:04:05",
+        "q": "é",
+    }
+
+
+def test_adopted_response_decodes_raw_bytes():
+    codec = MagicMock(wraps=StdlibCodec())
+    response = requests.Response()
+    response._content = '{"titre": "Arrêt"}'.encode()
+    response.status_code = 200
+
+    adopted = adopt_response(response, codec)
+
+    assert isinstance(adopted, CodecResponse)
+    assert adopted.json() == {"titre": "Arrêt"}
+    codec.loads.assert_called_once_with(response.content)
+
+
+def test_call_api_sends_encoded_bytes():
+    client = LegifranceClient(
+        ApiConfig(client_id="id", client_secret="secret"), codec=StdlibCodec()
+    )
+    client._auth_manager = MagicMock()
+    client._auth_manager.ensure_valid_token.return_value = "token"
+    client.session = MagicMock()
+    client.session.post.return_value = MagicMock(status_code=200)
+
+    client.call_api("search", {"fond": _Fond.JURI})
+
+    _, kwargs = client.session.post.call_args
+    assert kwargs["data"] == b'{"fond":"JURI"}'
+    assert "json" not in kwargs
@@ -0,0 +1,107 @@
+"""Unit tests for the trusted fast path of :mod:`pylegifrance.hydration`."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import ValidationError
+
+from pylegifrance.client import LegifranceClient
+from pylegifrance.fonds.juri import JuriAPI
+from pylegifrance.fonds.kali import KaliAPI
+from pylegifrance.fonds.loda import Loda
+from pylegifrance.hydration import envelope, is_trusted, type_adapter, validate_json
+from pylegifrance.models.generated.model import ConsultTextResponse, LienModification
+from pylegifrance.models.juri.models import Decision
+from pylegifrance.testing import StubPisteServer
+
+
+@pytest.fixture(scope="module")
+def stub():
+    with StubPisteServer(corpus_size=20, text_chars=300) as server:
+        yield server
+
+
+@pytest.fixture
+def clients(stub):
+    untrusted = LegifranceClient(stub.config())
+    trusted = LegifranceClient(stub.config(), trust_responses=True)
+    yield untrusted, trusted
+    untrusted.close()
+    trusted.close()
+
+
+def _response(body: object) -> SimpleNamespace:
+    return SimpleNamespace(status_code=200, content=json.dumps(body).encode())
+
+
+def _trusted_client() -> MagicMock:
+    client = MagicMock()
+    client.trust_responses = True
+    return client
+
+
+def test_only_an_explicit_opt_in_is_trusted():
+    assert is_trusted(SimpleNamespace(trust_responses=True))
+    assert not is_trusted(SimpleNamespace(trust_responses=False))
+    assert not is_trusted(MagicMock())
+    assert not is_trusted(object())
+
+
+def test_validate_json_uses_cached_adapters():
+    links = validate_json(list[LienModification], b'[{"linkType": "MODIFIE"}]')
+
+    assert links == [LienModification(linkType="MODIFIE")]
+    assert type_adapter(list[LienModification]) is type_adapter(list[LienModification])
+    with pytest.raises(ValidationError):
+        validate_json(ConsultTextResponse, b'{"sections": 3}')
+
+
+def test_envelope_reads_one_member():
+    model = envelope(Decision, "text")
+
+    parsed = model.model_validate_json(b'{"text": {"id": "J1"}, "other": [1, 2]}')
+    assert parsed.text == Decision(id="J1")
+    assert model.model_validate_json(b"{}").text is None
+    assert envelope(Decision, "text") is model
+
+
+def test_trusted_and_untrusted_results_match(clients):
+    untrusted, trusted = clients
+
+    for fetch in (
+        lambda c: JuriAPI(c).fetch("JURITEXT000000000004")._decision,
+        lambda c: KaliAPI(c).fetch_by_idcc("3")._data,
+        lambda c: KaliAPI(c).fetch_text("KALITEXT000000000003")._data,
+    ):
+        assert fetch(trusted).model_dump() == fetch(untrusted).model_dump()
+
+    expected = Loda(untrusted).fetch("LEGITEXT000000000002")._texte
+    texte = Loda(trusted).fetch("LEGITEXT000000000002")._texte
+    assert texte.model_dump() == expected.model_dump()
+    assert isinstance(texte.consult_response, ConsultTextResponse)
+    assert texte.consult_response.model_dump() == expected.consult_response.model_dump()
+    assert texte.model_fields_set == expected.model_fields_set
+
+
+def test_trusted_loda_handles_the_legacy_envelope_and_missing_ids():
+    loda = Loda(_trusted_client())
+    body = {"id": "LEGITEXT1", "title": "Loi", "titreLong": " Loi du 1er mai "}
+
+    texte = loda._texte_model_from_bytes(_response({"texte": body}).content)
+    assert texte.titre == "Loi"
+    assert texte.titre_long == "Loi du 1er mai"
+
+    assert loda._texte_model_from_bytes(_response({"title": "Loi"}).content) is None
+    assert loda._texte_model_from_bytes(b"not json") is None
+
+
+def test_trusted_empty_responses_give_none():
+    assert JuriAPI(_trusted_client())._wrap_consult_response(_response({})) is None
+    assert (
+        JuriAPI(_trusted_client())._wrap_consult_response(_response({"text": {}}))
+        is None
+    )
+    assert KaliAPI(_trusted_client())._wrap_text(_response({})) is None
+    assert KaliAPI(_trusted_client())._wrap_text(_response(None)) is None
@@ -0,0 +1,76 @@
+"""Unit tests for :mod:`pylegifrance.instrumentation`."""
+
+import enum
+import logging
+
+import pytest
+
+from pylegifrance.instrumentation import configure_payload_logging, log_payload
+
+
+class _Colour(enum.Enum):
+    RED = "red"
+
+
+class _Exploding:
+    """Fails the test if anything tries to serialise it."""
+
+    def __str__(self):
+        raise AssertionError("payload was serialised")
+
+    __repr__ = __str__
+
+
+@pytest.fixture(autouse=True)
+def _reset_settings():
+    yield
+    configure_payload_logging()
+
+
+@pytest.fixture
+def test_logger():
+    logger = logging.getLogger("pylegifrance.tests.instrumentation")
+    logger.setLevel(logging.DEBUG)
+    yield logger
+    logger.setLevel(logging.NOTSET)
+
+
+def test_disabled_level_does_not_serialise(test_logger):
+    test_logger.setLevel(logging.INFO)
+
+    log_payload(test_logger, "Payload", {"value": _Exploding()})
+
+
+def test_payload_is_dumped_when_enabled(test_logger, caplog):
+    with caplog.at_level(logging.DEBUG, logger=test_logger.name):
+        log_payload(test_logger, "Payload", {"colour": _Colour.RED, "n": "é"})
+
+    assert '"colour": "red"' in caplog.text
+    assert '"n": "é"' in caplog.text
+
+
+def test_long_payloads_are_truncated(test_logger, caplog):
+    configure_payload_logging(max_chars=20, indent=None)
+
+    with caplog.at_level(logging.DEBUG, logger=test_logger.name):
+        log_payload(test_logger, "Payload", {"text": "x" * 100})
+
+    (record,) = caplog.records
+    message = record.getMessage()
+    assert message.startswith('Payload: {"text": "xxxxxx')
+    assert message.endswith("chars truncated]")
+
+
+def test_sampling_skips_payloads(test_logger, caplog):
+    configure_payload_logging(sample_rate=0.0)
+
+    with caplog.at_level(logging.DEBUG, logger=test_logger.name):
+        for _ in range(10):
+            log_payload(test_logger, "Payload", {"value": _Exploding()})
+
+    assert caplog.records == []
+
+
+def test_rejects_invalid_sample_rate():
+    with pytest.raises(ValueError):
+        configure_payload_logging(sample_rate=1.5)
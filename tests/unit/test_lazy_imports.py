@@ -0,0 +1,31 @@
+"""Unit tests for the lazy exports of the package."""
+
+import json
+import subprocess
+import sys
+
+import pylegifrance
+from pylegifrance.client import LegifranceClient
+
+
+def _run(code: str) -> dict:
+    """Run ``code`` in a fresh interpreter and return the JSON it prints."""
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+def test_importing_the_package_loads_no_client():
+    loaded = _run(
+        "import json, sys, pylegifrance; "
+        "print(json.dumps(sorted(m for m in sys.modules "
+        "if m.startswith(('pylegifrance.', 'asyncio', 'httpx', 'pydantic')))))"
+    )
+
+    assert loaded == []
+
+
+def test_package_exports_resolve_on_access():
+    assert pylegifrance.LegifranceClient is LegifranceClient
+    assert set(pylegifrance.__all__) <= set(dir(pylegifrance))
@@ -0,0 +1,138 @@
+"""Unit tests for :mod:`pylegifrance.metrics`."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from pylegifrance.cache import MemoryCache, ResponseCache
+from pylegifrance.client import LegifranceClient
+from pylegifrance.config import ApiConfig
+from pylegifrance.exceptions import ServerError
+from pylegifrance.metrics import Histogram, MetricsRegistry
+from pylegifrance.retry import RetryPolicy
+
+
+def test_histogram_buckets_and_quantiles():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [(0.1, 2), (1.0, 3), (float("inf"), 4)]
+    assert histogram.quantile(0.5) == pytest.approx(0.1)
+    assert histogram.quantile(0.75) == pytest.approx(1.0)
+    assert histogram.quantile(1.0) == 1.0
+    assert Histogram().quantile(0.5) == 0.0
+
+
+def test_snapshot_and_json_export():
+    registry = MetricsRegistry()
+    registry.observe_request("search", 200, 0.2, 120, 4000)
+    registry.observe_request("search", 503, 0.4, 120, 20)
+    registry.record_retry("search")
+    registry.record_cache("consult/juri", hit=True)
+    registry.record_token_refresh()
+
+    snapshot = registry.snapshot()
+    search = snapshot["routes"]["search"]
+
+    assert snapshot["token_refreshes"] == 1
+    assert search["requests"] == 2
+    assert search["status_codes"] == {"200": 1, "503": 1}
+    assert (search["request_bytes"], search["response_bytes"]) == (240, 4020)
+    assert search["retries"] == 1
+    assert search["latency"]["mean"] == pytest.approx(0.3)
+    assert snapshot["routes"]["consult/juri"]["cache_hits"] == 1
+    assert json.loads(registry.to_json()) == snapshot
+
+
+def test_prometheus_export():
+    registry = MetricsRegistry(latency_buckets=(0.5,))
+    registry.observe_request("search", 200, 0.2, 10, 30)
+    registry.record_token_refresh()
+
+    text = registry.to_prometheus()
+
+    assert "# TYPE pylegifrance_request_duration_seconds histogram" in text
+    assert (
+        'pylegifrance_request_duration_seconds_bucket{route="search",le="0.5"} 1'
+        in text
+    )
+    assert (
+        'pylegifrance_request_duration_seconds_bucket{route="search",le="+Inf"} 1'
+        in text
+    )
+    assert 'pylegifrance_responses_total{route="search",status="200"} 1' in text
+    assert 'pylegifrance_response_bytes_total{route="search"} 30' in text
+    assert "pylegifrance_token_refreshes_total 1" in text
+    assert text.endswith("\n")
+
+
+def _response(status: int, body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    return response
+
+
+@pytest.fixture
+def client():
+    client = LegifranceClient(
+        ApiConfig(client_id="id", client_secret="secret"),
+        retry_policy=RetryPolicy(initial_backoff=0.001, max_backoff=0.001),
+        cache=ResponseCache(MemoryCache()),
+        metrics=MetricsRegistry(),
+    )
+    client._auth_manager = MagicMock()
+    client._auth_manager.ensure_valid_token.return_value = "token"
+    client.session = MagicMock()
+    return client
+
+
+def test_client_records_calls(client):
+    client.session.post.side_effect = [
+        _response(503, b"{}"),
+        _response(200, b'{"text": {"id": "A"}}'),
+    ]
+
+    client.call_api("consult/juri", {"textId": "A"})
+    client.call_api("consult/juri", {"textId": "A"})
+
+    route = client.metrics.snapshot()["routes"]["consult/juri"]
+    assert route["status_codes"] == {"200": 1, "503": 1}
+    assert route["retries"] == 1
+    assert (route["cache_hits"], route["cache_misses"]) == (1, 1)
+    assert route["response_bytes"] == len(b'{"text": {"id": "A"}}') + 2
+    assert route["latency"]["count"] == 2
+
+
+def test_client_records_transport_errors(client):
+    client.retry_policy = RetryPolicy.disabled()
+    client.session.post.side_effect = requests.ConnectionError("reset")
+
+    with pytest.raises(requests.ConnectionError):
+        client.call_api("search", {"fond": "JURI"})
+    client.session.post.side_effect = [_response(500, b"{}")]
+    with pytest.raises(ServerError):
+        client.call_api("search", {"fond": "JURI"})
+
+    route = client.metrics.snapshot()["routes"]["search"]
+    assert route["transport_errors"] == 1
+    assert route["status_codes"] == {"500": 1}
+
+
+def test_token_fetches_are_counted():
+    metrics = MetricsRegistry()
+    client = LegifranceClient(
+        ApiConfig(client_id="id", client_secret="secret"), metrics=metrics
+    )
+    auth = client._auth_manager
+    auth._session = MagicMock()
+    auth._session.post.return_value = _response(
+        200, b'{"access_token": "t", "expires_in": 3600}'
+    )
+
+    auth.ensure_valid_token()
+
+    assert metrics.snapshot()["token_refreshes"] == 1
@@ -0,0 +1,479 @@
+"""Unit tests for :mod:`pylegifrance.pagination` and the ``iter_search`` façades."""
+
+import json
+import threading
+import time
+from datetime import date, timedelta
+from itertools import islice
+from unittest.mock import MagicMock
+
+import pytest
+
+from pylegifrance import pagination
+from pylegifrance.client import LegifranceClient
+from pylegifrance.fonds.code import Code
+from pylegifrance.fonds.juri import JuriAPI, LazyJuriDecision
+from pylegifrance.fonds.kali import KaliAPI
+from pylegifrance.fonds.loda import Loda
+from pylegifrance.models.code.enum import NomCode
+from pylegifrance.models.juri.search import SearchRequest
+from pylegifrance.pagination import (
+    SearchCounts,
+    count_payload,
+    iter_pages,
+    search_counts,
+    split_on_dates,
+    total_results,
+    with_page,
+)
+from pylegifrance.testing import StubPisteServer
+
+CORPUS_SIZE = 25
+
+
+@pytest.fixture(scope="module")
+def stub():
+    with StubPisteServer(corpus_size=CORPUS_SIZE, text_chars=100) as server:
+        yield server
+
+
+@pytest.fixture
+def client(stub):
+    client = LegifranceClient(stub.config())
+    stub.reset_stats()
+    yield client
+    client.close()
+
+
+def _search_requests(stub: StubPisteServer) -> int:
+    return stub.stats().requests.get("search", 0)
+
+
+def _response(body: dict, status_code: int = 200) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = body
+    response.text = json.dumps(body)
+    return response
+
+
+def test_total_results_reads_either_key():
+    assert total_results({"totalResultNumber": 12}) == 12
+    assert total_results({"totalResults": 7}) == 7
+    assert total_results({"results": []}) is None
+
+
+def test_with_page_leaves_the_payload_untouched():
+    payload = {"fond": "JURI", "recherche": {"pageNumber": 1, "pageSize": 10}}
+
+    paged = with_page(payload, 3, 50)
+
+    assert paged["recherche"] == {"pageNumber": 3, "pageSize": 50}
+    assert payload["recherche"] == {"pageNumber": 1, "pageSize": 10}
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_pages_walks_every_page(stub, client, prefetch):
+    payload = {"fond": "JURI", "recherche": {}}
+
+    pages = list(iter_pages(client, payload, page_size=10, prefetch=prefetch))
+
+    assert [page.number for page in pages] == [1, 2, 3]
+    assert [len(page.results) for page in pages] == [10, 10, 5]
+    assert {page.total_results for page in pages} == {CORPUS_SIZE}
+    assert _search_requests(stub) == 3
+
+
+def test_iter_pages_stops_at_max_results(stub, client):
+    payload = {"fond": "JURI", "recherche": {}}
+
+    pages = list(iter_pages(client, payload, page_size=10, max_results=12))
+
+    assert [len(page.results) for page in pages] == [10, 2]
+    assert _search_requests(stub) == 2
+
+
+def test_iter_pages_stops_on_a_short_page_without_total():
+    client = MagicMock()
+    client.call_api.side_effect = [
+        _response({"results": [{"id": n} for n in range(10)]}),
+        _response({"results": [{"id": 10}]}),
+    ]
+
+    pages = list(iter_pages(client, {}, page_size=10, prefetch=False))
+
+    assert [len(page.results) for page in pages] == [10, 1]
+    assert client.call_api.call_count == 2
+
+
+def test_iter_pages_stops_on_an_error_answer():
+    client = MagicMock()
+    client.call_api.return_value = _response({}, status_code=500)
+
+    assert list(iter_pages(client, {}, prefetch=False)) == []
+
+
+def test_iter_pages_prefetches_at_most_one_page_ahead(stub, client):
+    payload = {"fond": "JURI", "recherche": {}}
+
+    pages = iter_pages(client, payload, page_size=5)
+    first = next(pages)
+    pages.close()
+
+    assert first.number == 1
+    assert _search_requests(stub) <= 2
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"page_size": 0}, {"page_size": 101}, {"max_results": -1}, {"max_workers": 0}],
+)
+def test_iter_pages_rejects_bad_limits(kwargs):
+    with pytest.raises(ValueError):
+        next(iter_pages(MagicMock(), {}, **kwargs))
+
+
+def test_iter_pages_with_no_results_wanted_sends_nothing():
+    client = MagicMock()
+
+    assert list(iter_pages(client, {}, max_results=0)) == []
+    client.call_api.assert_not_called()
+
+
+def test_juri_iter_search_yields_every_decision(stub, client):
+    decisions = list(JuriAPI(client).iter_search("bail", page_size=10))
+
+    assert len(decisions) == CORPUS_SIZE
+    assert decisions[0].id == "JURITEXT000000000001"
+    assert decisions[-1].id == "JURITEXT000000000025"
+    assert _search_requests(stub) == 3
+
+
+def test_juri_iter_search_lazy_sends_no_consult(stub, client):
+    decisions = list(
+        islice(JuriAPI(client).iter_search("bail", page_size=10, lazy=True), 15)
+    )
+
+    assert len(decisions) == 15
+    assert all(isinstance(d, LazyJuriDecision) for d in decisions)
+    assert stub.stats().requests.get("consult/juri", 0) == 0
+
+
+def test_juri_search_fetch_all_walks_every_page(client):
+    request = SearchRequest(search="bail", page_size=10, fetch_all=True)
+
+    decisions = JuriAPI(client).search(request, lazy=True)
+
+    assert len(decisions) == CORPUS_SIZE
+
+
+def test_juri_search_fetch_all_keeps_the_page_size(client, monkeypatch):
+    sent = []
+    call_api = client.call_api
+
+    def spy(route, data):
+        if route == "search":
+            sent.append(data["recherche"]["pageSize"])
+        return call_api(route, data)
+
+    monkeypatch.setattr(client, "call_api", spy)
+    request = SearchRequest(search="bail", page_size=10, fetch_all=True)
+
+    JuriAPI(client).search(request, lazy=True)
+
+    assert sent == [10, 10, 10]
+
+
+def test_loda_iter_search_yields_every_text(client):
+    textes = list(Loda(client).iter_search("loi", page_size=10, max_results=15))
+
+    assert [t.id for t in textes][:2] == [
+        "LEGITEXT000000000001",
+        "LEGITEXT000000000002",
+    ]
+    assert len(textes) == 15
+
+
+def test_kali_iter_search_dedupes_containers_across_pages(client):
+    conventions = list(KaliAPI(client).iter_search("travail", page_size=10))
+
+    ids = [c.id for c in conventions]
+    assert ids
+    assert len(ids) == len(set(ids))
+
+
+def test_code_iter_search_yields_articles(stub, client):
+    articles = list(
+        Code(client)
+        .search()
+        .in_code(NomCode.CC)
+        .text("contrat")
+        .iter_search(page_size=10)
+    )
+
+    assert len(articles) == CORPUS_SIZE
+    assert articles[0].id == "LEGIARTI000000000001"
+    assert _search_requests(stub) == 3
+
+
+class _DatedCorpus:
+    """Fake ``call_api`` serving one document a day and honouring date filters."""
+
+    def __init__(self, start: date, days: int, latency: float = 0.0):
+        self.dates = [start + timedelta(days=n) for n in range(days)]
+        self.latency = latency
+        self.pages: list[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, route: str, payload: dict) -> MagicMock:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.latency)
+        recherche = payload["recherche"]
+        start, end = date.min, date.max
+        for filtre in recherche.get("filtres") or []:
+            if filtre.get("facette") == "DATE_DECISION":
+                start = date.fromisoformat(filtre["dates"]["start"][:10])
+                end = date.fromisoformat(filtre["dates"]["end"][:10])
+        matches = [d for d in self.dates if start <= d <= end]
+        number, size = recherche["pageNumber"], recherche["pageSize"]
+        with self._lock:
+            self.pages.append(number)
+            self.in_flight -= 1
+        if number * size > pagination.MAX_RESULT_WINDOW:
+            return _response({}, status_code=400)
+        page = matches[(number - 1) * size : number * size]
+        return _response(
+            {
+                "totalResultNumber": len(matches),
+                "results": [{"id": d.isoformat()} for d in page],
+            }
+        )
+
+
+def _client_for(corpus: _DatedCorpus) -> MagicMock:
+    client = MagicMock()
+    client.call_api.side_effect = corpus
+    return client
+
+
+def _ids(pages) -> list[str]:
+    return [result["id"] for page in pages for result in page.results]
+
+
+def test_fan_out_yields_pages_in_order_concurrently():
+    corpus = _DatedCorpus(date(2020, 1, 1), 95, latency=0.02)
+
+    pages = list(
+        iter_pages(_client_for(corpus), {"recherche": {}}, page_size=10, max_workers=4)
+    )
+
+    assert [page.number for page in pages] == list(range(1, 11))
+    assert _ids(pages) == [d.isoformat() for d in corpus.dates]
+    assert corpus.max_in_flight > 1
+
+
+def test_fan_out_stops_at_max_results():
+    corpus = _DatedCorpus(date(2020, 1, 1), 95)
+
+    pages = list(
+        iter_pages(
+            _client_for(corpus),
+            {"recherche": {}},
+            page_size=10,
+            max_results=25,
+            max_workers=4,
+        )
+    )
+
+    assert len(_ids(pages)) == 25
+    assert sorted(corpus.pages) == [1, 2, 3]
+
+
+def test_fan_out_without_a_total_reuses_the_first_page():
+    client = MagicMock()
+    client.call_api.side_effect = [
+        _response({"results": [{"id": n} for n in range(10)]}),
+        _response({"results": [{"id": 10}]}),
+    ]
+
+    pages = list(iter_pages(client, {}, page_size=10, max_workers=4))
+
+    assert [page.number for page in pages] == [1, 2]
+    assert [len(page.results) for page in pages] == [10, 1]
+    assert [
+        call.args[1]["recherche"]["pageNumber"]
+        for call in client.call_api.call_args_list
+    ] == [1, 2]
+
+
+def test_fan_out_splits_on_the_date_facet_past_the_window(monkeypatch):
+    monkeypatch.setattr(pagination, "MAX_RESULT_WINDOW", 20)
+    corpus = _DatedCorpus(date(2020, 1, 1), 70)
+    payload = {
+        "recherche": {
+            "filtres": [
+                {
+                    "facette": "DATE_DECISION",
+                    "dates": {"start": "2020-01-01", "end": "2020-03-31"},
+                }
+            ]
+        }
+    }
+
+    pages = iter_pages(
+        _client_for(corpus),
+        payload,
+        page_size=10,
+        max_workers=4,
+        split_facet="DATE_DECISION",
+    )
+
+    assert _ids(pages) == [d.isoformat() for d in corpus.dates]
+
+
+def test_fan_out_without_a_facet_stops_at_the_window(monkeypatch, caplog):
+    monkeypatch.setattr(pagination, "MAX_RESULT_WINDOW", 20)
+    corpus = _DatedCorpus(date(2020, 1, 1), 70)
+
+    pages = iter_pages(
+        _client_for(corpus), {"recherche": {}}, page_size=10, max_workers=4
+    )
+
+    assert len(_ids(pages)) == 20
+    assert "only the first 20" in caplog.text
+
+
+@pytest.mark.parametrize("max_results", [None, 50])
+def test_iter_pages_stops_at_the_window(monkeypatch, caplog, max_results):
+    monkeypatch.setattr(pagination, "MAX_RESULT_WINDOW", 20)
+    corpus = _DatedCorpus(date(2020, 1, 1), 70)
+
+    pages = iter_pages(
+        _client_for(corpus), {"recherche": {}}, page_size=10, max_results=max_results
+    )
+
+    assert len(_ids(pages)) == 20
+    assert sorted(corpus.pages) == [1, 2]
+    assert "Search has 70 results; only the first 20" in caplog.text
+
+
+def test_split_on_dates_halves_the_period():
+    payload = {
+        "fond": "JURI",
+        "recherche": {
+            "filtres": [
+                {"facette": "NATURE", "valeurs": ["ARRET"]},
+                {
+                    "facette": "DATE_DECISION",
+                    "dates": {"start": "2020-01-01T00:00:00", "end": "2020-01-10"},
+                },
+            ]
+        },
+    }
+
+    first, second = split_on_dates(payload, "DATE_DECISION")
+
+    assert first["recherche"]["filtres"] == [
+        {"facette": "NATURE", "valeurs": ["ARRET"]},
+        {
+            "facette": "DATE_DECISION",
+            "dates": {"start": "2020-01-01T00:00:00", "end": "2020-01-05T00:00:00"},
+        },
+    ]
+    assert second["recherche"]["filtres"][1]["dates"]["start"] == (
+        "2020-01-06T00:00:00"
+    )
+    assert len(payload["recherche"]["filtres"]) == 2
+
+
+def test_split_on_dates_stops_at_a_single_day():
+    payload = {
+        "recherche": {
+            "filtres": [
+                {
+                    "facette": "DATE_SIGNATURE",
+                    "dates": {"start": "2020-01-01", "end": "2020-01-01"},
+                }
+            ]
+        }
+    }
+
+    assert split_on_dates(payload, "DATE_SIGNATURE") is None
+
+
+def test_split_on_dates_defaults_to_an_open_period():
+    first, second = split_on_dates({"recherche": {}}, "DATE_SIGNATURE")
+
+    assert first["recherche"]["filtres"][0]["dates"]["start"].startswith("1500-01-01")
+    assert second["recherche"]["filtres"][0]["dates"]["end"].startswith(
+        date.today().isoformat()
+    )
+
+
+def test_juri_iter_search_fans_out_pages(stub, client):
+    decisions = list(
+        JuriAPI(client).iter_search("bail", page_size=10, lazy=True, page_workers=4)
+    )
+
+    assert [d.id for d in decisions] == [
+        f"JURITEXT{n:012d}" for n in range(1, CORPUS_SIZE + 1)
+    ]
+    assert _search_requests(stub) == 3
+
+
+def test_count_payload_asks_for_one_result():
+    payload = {"fond": "LODA_DATE", "recherche": {"pageNumber": 4, "pageSize": 50}}
+
+    assert count_payload(payload)["recherche"] == {"pageNumber": 1, "pageSize": 1}
+
+
+def test_search_counts_reads_total_and_facet_buckets():
+    body = {
+        "totalResultNumber": 1560,
+        "facets": [
+            {"facetElem": "NATURE", "values": {"LOI": 12, "DECRET": 40}},
+            {
+                "field": "natureJuridiction",
+                "values": {"TRIBUNAL_ADMINISTATIF": 10},
+                "childs": {
+                    "TRIBUNAL_ADMINISTATIF": {"values": {"Bordeaux": 2, "Lille": 8}}
+                },
+            },
+        ],
+    }
+
+    counts = search_counts(_response(body))
+
+    assert counts == SearchCounts(
+        1560,
+        {
+            "NATURE": {"LOI": 12, "DECRET": 40},
+            "natureJuridiction": {"TRIBUNAL_ADMINISTATIF": 10},
+            "natureJuridiction/TRIBUNAL_ADMINISTATIF": {"Bordeaux": 2, "Lille": 8},
+        },
+    )
+
+
+def test_search_counts_of_an_error_answer_is_empty():
+    assert search_counts(_response({}, status_code=503)) == SearchCounts(None, {})
+
+
+@pytest.mark.parametrize(
+    "count",
+    [
+        lambda c: JuriAPI(c).count("bail"),
+        lambda c: Loda(c).count("loi"),
+        lambda c: KaliAPI(c).count("travail"),
+        lambda c: Code(c).search().in_code(NomCode.CC).text("contrat").count(),
+    ],
+    ids=["juri", "loda", "kali", "code"],
+)
+def test_facade_count_sends_a_single_search(stub, client, count):
+    counts = count(client)
+
+    assert counts.total == CORPUS_SIZE
+    assert stub.stats().requests == {"search": 1}
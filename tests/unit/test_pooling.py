@@ -0,0 +1,104 @@
+"""Unit tests for :mod:`pylegifrance.pooling`.
+
+Requests go to a local HTTP/1.1 server so that connection reuse can be
+observed without PISTE credentials.
+"""
+
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from pylegifrance.config import ApiConfig
+from pylegifrance.pooling import (
+    PoolingHTTPAdapter,
+    _socket_options,
+    mount_pooled_adapter,
+)
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):  # silence stderr
+        pass
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        body = json.dumps({"ok": True}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _config(**kwargs) -> ApiConfig:
+    return ApiConfig(client_id="id", client_secret="secret", **kwargs)
+
+
+def test_adapter_is_sized_from_config():
+    config = _config(pool_connections=4, pool_maxsize=64, pool_block=True)
+
+    adapter = PoolingHTTPAdapter(config)
+
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 64
+    assert adapter._pool_block is True
+
+
+def test_adapter_is_mounted_for_api_host():
+    session = requests.Session()
+    config = _config()
+
+    adapter = mount_pooled_adapter(session, config.api_url, config)
+
+    assert session.get_adapter(f"{config.api_url}search") is adapter
+
+
+def test_keep_alive_reuses_connections(base_url):
+    session = requests.Session()
+    adapter = mount_pooled_adapter(session, base_url, _config())
+
+    for _ in range(5):
+        session.post(f"{base_url}/api/search", json={}).raise_for_status()
+
+    stats = adapter.stats()
+    assert stats.requests == 5
+    assert stats.connections_created == 1
+    assert stats.connections_reused == 4
+    assert stats.idle_connections == 1
+
+
+def test_disabling_keep_alive_sends_connection_close(base_url):
+    session = requests.Session()
+    adapter = mount_pooled_adapter(session, base_url, _config(keep_alive=False))
+
+    for _ in range(3):
+        session.post(f"{base_url}/api/search", json={}).raise_for_status()
+
+    assert session.headers["Connection"] == "close"
+    assert adapter.stats().connections_created == 3
+
+
+def test_tcp_keepalive_socket_options():
+    enabled = _socket_options(_config(tcp_keepalive_idle=30))
+    disabled = _socket_options(_config(tcp_keepalive_idle=None))
+
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in enabled
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) not in disabled
@@ -0,0 +1,109 @@
+"""Unit tests for :mod:`pylegifrance.ratelimit`."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from pylegifrance.client import LegifranceClient
+from pylegifrance.config import ApiConfig
+from pylegifrance.ratelimit import RateLimiter
+
+
+def _timed(fn, count: int) -> float:
+    started = time.perf_counter()
+    for _ in range(count):
+        fn()
+    return time.perf_counter() - started
+
+
+def test_burst_is_served_without_waiting_then_throttled():
+    limiter = RateLimiter(rate=20, burst=5)
+
+    elapsed = _timed(lambda: limiter.acquire("search"), 5)
+    assert elapsed < 0.05
+
+    # 5 more calls need 5 refills at 20/s.
+    elapsed = _timed(lambda: limiter.acquire("search"), 5)
+    assert elapsed == pytest.approx(0.25, abs=0.08)
+
+    stats = limiter.stats()["*"]
+    assert stats.acquired == 10
+    assert stats.throttled == 5
+    assert stats.max_wait > 0
+    assert stats.total_wait == pytest.approx(0.25, abs=0.05)
+
+
+def test_route_overrides_use_their_own_bucket():
+    limiter = RateLimiter(
+        rate=1000, routes={"search": (10, 1), "consult/*": 1000, "consult/juri": 500}
+    )
+
+    elapsed = _timed(lambda: limiter.acquire("search"), 3)
+    assert elapsed == pytest.approx(0.2, abs=0.08)
+    assert _timed(lambda: limiter.acquire("consult/getArticle"), 10) < 0.05
+
+    stats = limiter.stats()
+    assert stats["search"].acquired == 3
+    assert stats["consult/*"].acquired == 10
+    assert stats["consult/juri"].acquired == 0
+    assert stats["*"].acquired == 0
+
+    limiter.acquire("consult/juri")
+    assert limiter.stats()["consult/juri"].acquired == 1
+
+
+def test_limiter_is_shared_across_threads():
+    limiter = RateLimiter(rate=50, burst=1)
+    threads = [
+        threading.Thread(target=lambda: limiter.acquire("search")) for _ in range(10)
+    ]
+
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    # One immediate call, then nine spaced by 20 ms.
+    assert elapsed == pytest.approx(0.18, abs=0.08)
+    assert limiter.stats()["*"].acquired == 10
+
+
+def test_file_state_splits_one_quota_between_limiters(tmp_path):
+    # Two limiters stand in for two processes sharing the state directory.
+    first = RateLimiter(rate=20, burst=1, state_dir=tmp_path)
+    second = RateLimiter(rate=20, burst=1, state_dir=tmp_path)
+
+    def alternate():
+        first.acquire("search")
+        second.acquire("search")
+
+    elapsed = _timed(alternate, 3)
+
+    # Six calls against a single 20/s bucket: five refills.
+    assert elapsed == pytest.approx(0.25, abs=0.08)
+
+
+def test_rejects_invalid_rates():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+    with pytest.raises(ValueError):
+        RateLimiter(rate=10, routes={"search": (5, 0.5)})
+
+
+def test_call_api_acquires_before_sending():
+    limiter = MagicMock()
+    client = LegifranceClient(
+        ApiConfig(client_id="id", client_secret="secret"), rate_limiter=limiter
+    )
+    client._auth_manager = MagicMock()
+    client._auth_manager.ensure_valid_token.return_value = "token"
+    client.session = MagicMock()
+    client.session.post.return_value = MagicMock(status_code=200)
+
+    client.call_api("consult/juri", {"textId": "JURITEXT000000000001"})
+
+    limiter.acquire.assert_called_once_with("consult/juri")
@@ -0,0 +1,176 @@
+"""Unit tests for :mod:`pylegifrance.retry` and :mod:`pylegifrance.exceptions`.
+
+``LegifranceClient.call_api`` runs against a local HTTP server that replays
+a scripted list of status codes, so retries hit a real socket.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+
+from pylegifrance.client import LegifranceClient
+from pylegifrance.config import ApiConfig
+from pylegifrance.exceptions import (
+    ClientError,
+    NotFound,
+    RateLimited,
+    ServerError,
+    error_from_response,
+    parse_retry_after,
+)
+from pylegifrance.fonds.juri import JuriAPI
+from pylegifrance.retry import RetryPolicy
+
+_FAST = RetryPolicy(initial_backoff=0.01, max_backoff=0.05)
+
+
+class _Script:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.replies: list[tuple[int, dict]] = []
+        self.calls = 0
+
+
+def _make_handler(script: _Script):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):  # silence stderr
+            pass
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            with script.lock:
+                script.calls += 1
+                status, headers = script.replies.pop(0) if script.replies else (200, {})
+            body = json.dumps({"status": status}).encode()
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
+
+
+@pytest.fixture
+def scripted():
+    script = _Script()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(script))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    def make_client(policy: RetryPolicy = _FAST) -> LegifranceClient:
+        config = ApiConfig(
+            client_id="id",
+            client_secret="secret",
+            api_url=f"http://127.0.0.1:{server.server_address[1]}/",
+        )
+        client = LegifranceClient(config, retry_policy=policy)
+        client._auth_manager = MagicMock()
+        client._auth_manager.ensure_valid_token.return_value = "token"
+        return client
+
+    yield script, make_client
+    server.shutdown()
+    server.server_close()
+
+
+def test_transient_errors_are_retried(scripted):
+    script, make_client = scripted
+    script.replies = [(503, {}), (502, {})]
+
+    response = make_client().call_api("consult/juri", {"textId": "x"})
+
+    assert response.status_code == 200
+    assert script.calls == 3
+
+
+def test_gives_up_after_max_attempts(scripted):
+    script, make_client = scripted
+    script.replies = [(500, {})] * 10
+
+    with pytest.raises(ServerError) as excinfo:
+        make_client(RetryPolicy(max_attempts=3, initial_backoff=0.01)).call_api(
+            "search", {}
+        )
+
+    assert script.calls == 3
+    assert excinfo.value.status_code == 500
+    assert excinfo.value.route == "search"
+
+
+def test_client_errors_are_not_retried(scripted):
+    script, make_client = scripted
+    script.replies = [(404, {})]
+
+    with pytest.raises(NotFound, match="API client error 404"):
+        make_client().call_api("consult/juri", {"textId": "x"})
+
+    assert script.calls == 1
+
+
+def test_non_idempotent_routes_are_not_retried(scripted):
+    script, make_client = scripted
+    script.replies = [(503, {})]
+
+    with pytest.raises(ServerError):
+        make_client().call_api("admin/reindex", {})
+
+    assert script.calls == 1
+
+
+def test_retry_after_is_respected(scripted):
+    script, make_client = scripted
+    script.replies = [(429, {"Retry-After": "0.3"})]
+
+    started = time.perf_counter()
+    make_client().call_api("search", {})
+
+    assert time.perf_counter() - started >= 0.3
+    assert script.calls == 2
+
+
+def test_retry_after_beyond_budget_fails_immediately(scripted):
+    script, make_client = scripted
+    script.replies = [(429, {"Retry-After": "120"})]
+
+    started = time.perf_counter()
+    with pytest.raises(RateLimited) as excinfo:
+        make_client(RetryPolicy(max_elapsed=5)).call_api("search", {})
+
+    assert time.perf_counter() - started < 1
+    assert excinfo.value.retry_after == 120
+    assert script.calls == 1
+
+
+def test_error_from_response_maps_status_codes():
+    assert isinstance(error_from_response(400, "", {}), ClientError)
+    assert isinstance(error_from_response(404, "", {}), NotFound)
+    assert isinstance(error_from_response(503, "", {}), ServerError)
+    limited = error_from_response(429, "slow down", {"Retry-After": "7"})
+    assert isinstance(limited, RateLimited)
+    assert limited.retry_after == 7
+    assert str(limited) == "API client error 429 - slow down"
+
+
+def test_parse_retry_after_accepts_http_dates():
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("not a date") is None
+    assert parse_retry_after(None) is None
+
+
+def test_juri_fetch_by_id_recognises_typed_unknown_id_error():
+    client = MagicMock()
+    client.call_api.side_effect = ClientError(
+        400, "L'expression à valider est fausse", "consult/juri"
+    )
+
+    assert JuriAPI(client).fetch_by_id("JURITEXT000000000000") is None
+
+    client.call_api.side_effect = ClientError(400, "malformed", "consult/juri")
+    with pytest.raises(ClientError):
+        JuriAPI(client).fetch_by_id("JURITEXT000000000000")
@@ -0,0 +1,94 @@
+"""Unit tests for :mod:`pylegifrance.testing.stub_server`."""
+
+import pytest
+
+from pylegifrance.client import LegifranceClient
+from pylegifrance.exceptions import ClientError, NotFound, RateLimited
+from pylegifrance.fonds.code import Code
+from pylegifrance.fonds.juri import JuriAPI
+from pylegifrance.fonds.kali import KaliAPI
+from pylegifrance.fonds.loda import Loda
+from pylegifrance.retry import RetryPolicy
+from pylegifrance.testing import StubPisteServer
+
+
+@pytest.fixture(scope="module")
+def stub():
+    with StubPisteServer(corpus_size=50, text_chars=200) as server:
+        yield server
+
+
+@pytest.fixture
+def client(stub):
+    stub.reset_stats()
+    client = LegifranceClient(
+        stub.config(),
+        retry_policy=RetryPolicy(max_attempts=3, initial_backoff=0, max_backoff=0),
+    )
+    yield client
+    client.close()
+
+
+def test_search_and_consult_through_real_auth(stub, client):
+    decisions = JuriAPI(client).search("responsabilité")
+
+    assert [d.id for d in decisions][:2] == [
+        "JURITEXT000000000001",
+        "JURITEXT000000000002",
+    ]
+    assert decisions[0].title.startswith("Cour de cassation")
+    stats = stub.stats()
+    assert stats.tokens_issued == 1
+    assert stats.requests["search"] == 1
+    assert stats.requests["consult/juri"] == len(decisions)
+
+
+def test_other_fonds(client):
+    kali = KaliAPI(client)
+    convention = kali.fetch_by_idcc("12")
+    assert convention.titre == "Convention collective nationale n° 12"
+    assert kali.fetch_text(convention.texte_base_ids[0]).container_id == convention.id
+
+    versions = Loda(client).fetch_versions("LEGITEXT000000000003")
+    assert [v.id for v in versions] == ["LEGITEXT000000000003"]
+
+    article = Code(client).fetch_article("LEGIARTI000000000007").at("2024-01-01")
+    assert article.id == "LEGIARTI000000000007"
+
+
+def test_unknown_documents_behave_like_piste(client):
+    with pytest.raises(ClientError) as excinfo:
+        JuriAPI(client).fetch("JURITEXT000000009999")
+    assert excinfo.value.status_code == 400
+    with pytest.raises(NotFound):
+        client.call_api("consult/getArticle", {"id": "LEGIARTI000000009999"})
+
+
+def test_injected_failures_are_retried(stub, client):
+    stub.fail_next(503)
+    stub.fail_next(429, retry_after=0)
+
+    client.call_api("consult/juri", {"textId": "JURITEXT000000000001"})
+
+    stats = stub.stats()
+    assert stats.injected_errors == 1
+    assert stats.injected_rate_limits == 1
+    assert stats.requests["consult/juri"] == 3
+
+
+def test_rate_limit_exhausts_retries(stub, client):
+    stub.fail_next(429, times=3, retry_after=0)
+
+    with pytest.raises(RateLimited):
+        client.call_api("consult/juri", {"textId": "JURITEXT000000000001"})
+
+
+def test_revoked_tokens_are_rejected(stub, client):
+    client.call_api("consult/juri", {"textId": "JURITEXT000000000001"})
+    stub.revoke_tokens()
+
+    with pytest.raises(ClientError) as excinfo:
+        client.call_api("consult/juri", {"textId": "JURITEXT000000000001"})
+
+    assert excinfo.value.status_code == 401
+    assert stub.stats().unauthorized == 1
@@ -0,0 +1,97 @@
+"""Unit tests for :mod:`pylegifrance.token_store`."""
+
+import stat
+import threading
+import time
+
+from pylegifrance.auth import AuthenticationManager, TokenInfo
+from pylegifrance.config import ApiConfig
+from pylegifrance.token_store import FileTokenStore, TokenStore
+
+
+class _CountingEndpoint:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self) -> TokenInfo:
+        with self.lock:
+            self.calls += 1
+            number = self.calls
+        time.sleep(self.delay)
+        return TokenInfo(
+            access_token=f"token-{number}", issued_at=time.time(), expires_in=3600
+        )
+
+
+def _manager(store, endpoint, client_id: str = "id") -> AuthenticationManager:
+    config = ApiConfig(client_id=client_id, client_secret="secret")
+    manager = AuthenticationManager(config, token_store=store)
+    manager._fetch_new_token = endpoint
+    return manager
+
+
+def test_file_store_round_trip(tmp_path):
+    store = FileTokenStore(tmp_path)
+    token = TokenInfo(access_token="abc", issued_at=123.0, expires_in=3600)
+
+    assert isinstance(store, TokenStore)
+    assert store.load("key") is None
+    store.save("key", token)
+
+    assert store.load("key") == token
+    mode = stat.S_IMODE((tmp_path / "key.json").stat().st_mode)
+    assert mode == 0o600
+
+
+def test_file_store_ignores_corrupt_file(tmp_path):
+    store = FileTokenStore(tmp_path)
+    (tmp_path / "key.json").write_text("{not json")
+
+    assert store.load("key") is None
+
+
+def test_managers_sharing_a_store_fetch_once(tmp_path):
+    store = FileTokenStore(tmp_path)
+    endpoint = _CountingEndpoint(delay=0.2)
+    managers = [_manager(store, endpoint) for _ in range(4)]
+    tokens = []
+
+    threads = [
+        threading.Thread(target=lambda m=m: tokens.append(m.ensure_valid_token()))
+        for m in managers
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert endpoint.calls == 1
+    assert tokens == ["token-1"] * 4
+
+
+def test_expired_stored_token_is_replaced(tmp_path):
+    store = FileTokenStore(tmp_path)
+    endpoint = _CountingEndpoint()
+    manager = _manager(store, endpoint)
+
+    first = manager.ensure_valid_token()
+    (stored_file,) = tmp_path.glob("*.json")
+    expired = TokenInfo(access_token=first, issued_at=0, expires_in=1)
+    store.save(stored_file.stem, expired)
+
+    assert _manager(store, endpoint).ensure_valid_token() == "token-2"
+    assert store.load(stored_file.stem).access_token == "token-2"
+
+
+def test_store_is_keyed_by_client_id(tmp_path):
+    store = FileTokenStore(tmp_path)
+    endpoint = _CountingEndpoint()
+
+    _manager(store, endpoint, client_id="a").ensure_valid_token()
+    _manager(store, endpoint, client_id="b").ensure_valid_token()
+
+    assert endpoint.calls == 2
+    assert len(list(tmp_path.glob("*.json"))) == 2
+    assert {p.stem for p in tmp_path.glob("*.json")}.isdisjoint({"a", "b"})
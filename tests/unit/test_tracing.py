@@ -0,0 +1,152 @@
+"""Unit tests for :mod:`pylegifrance.tracing`."""
+
+import asyncio
+import json
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from pylegifrance import tracing
+from pylegifrance.client import LegifranceClient
+from pylegifrance.config import ApiConfig
+from pylegifrance.fonds.juri import JuriAPI
+from pylegifrance.retry import RetryPolicy
+from pylegifrance.tracing import InMemorySpanExporter, span, traced
+
+
+@pytest.fixture
+def exporter():
+    exporter = InMemorySpanExporter()
+    tracing.add_exporter(exporter)
+    yield exporter
+    tracing.remove_exporter(exporter)
+
+
+def test_spans_are_no_ops_while_disabled():
+    assert not tracing.is_enabled()
+    with span("outer") as current:
+        current.set_attribute("ignored", True)
+        assert tracing.current_span() is None
+
+
+def test_nested_spans_form_a_tree(exporter):
+    with span("outer", kind="test") as outer:
+        with span("inner"):
+            pass
+        with pytest.raises(ValueError), span("failing"):
+            raise ValueError("boom")
+
+    (root,) = exporter.roots()
+    assert root is outer
+    assert [child.name for child in root.children] == ["inner", "failing"]
+    assert all(child.trace_id == root.trace_id for child in root.children)
+    assert isinstance(root.children[1].error, ValueError)
+    assert root.duration >= sum(child.duration for child in root.children)
+    assert 0 <= root.self_time <= root.duration
+    assert root.format_tree().splitlines()[0].startswith("outer [")
+    assert "error=ValueError" in root.format_tree()
+    assert tracing.current_span() is None
+
+
+def test_traced_decorator_supports_coroutines(exporter):
+    @traced("work")
+    async def work():
+        with span("step"):
+            await asyncio.sleep(0)
+        return 42
+
+    assert asyncio.run(work()) == 42
+    (root,) = exporter.roots()
+    assert [s.name for s in root.walk()] == ["work", "step"]
+
+
+def _json_response(body: dict) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(body).encode()
+    return response
+
+
+@pytest.fixture
+def client():
+    client = LegifranceClient(
+        ApiConfig(client_id="id", client_secret="secret"),
+        retry_policy=RetryPolicy.disabled(),
+    )
+    client._auth_manager = MagicMock()
+    client._auth_manager.ensure_valid_token.return_value = "token"
+
+    def post(url, headers=None, data=None):
+        if url.endswith("/search"):
+            return _json_response(
+                {
+                    "results": [
+                        {"titles": [{"id": f"JURITEXT00000000000{i}"}]} for i in (1, 2)
+                    ]
+                }
+            )
+        text_id = json.loads(data)["textId"]
+        return _json_response({"text": {"id": text_id, "titre": "Arrêt"}})
+
+    client.session = MagicMock()
+    client.session.post.side_effect = post
+    yield client
+    client.close()
+
+
+def test_search_trace_shows_the_fan_out(exporter, client):
+    JuriAPI(client).search("responsabilité")
+
+    (root,) = exporter.roots()
+    assert root.name == "juri.search"
+    assert root.attributes["hits"] == 2
+    calls = [child for child in root.children if child.name == "call_api"]
+    assert [c.attributes["route"] for c in calls] == [
+        "search",
+        "consult/juri",
+        "consult/juri",
+    ]
+    assert [c.name for c in calls[0].children] == ["http.post"]
+    assert calls[0].children[0].attributes["status_code"] == 200
+    assert [s.name for s in root.walk()].count("validate") == 2
+
+
+def test_spans_follow_batch_workers(exporter, client):
+    with span("batch"):
+        results = list(client.map("consult/juri", [{"textId": "A"}, {"textId": "B"}]))
+
+    assert all(r.ok for r in results)
+    (root,) = exporter.roots()
+    assert [c.name for c in root.children] == ["call_api", "call_api"]
+
+
+def test_opentelemetry_bridge(exporter):
+    started = []
+
+    class FakeOtelSpan:
+        def __init__(self):
+            self.attributes = {}
+
+        def set_attribute(self, key, value):
+            self.attributes[key] = value
+
+    class FakeTracer:
+        @contextmanager
+        def start_as_current_span(self, name, attributes=None):
+            otel_span = FakeOtelSpan()
+            otel_span.attributes.update(attributes or {})
+            started.append((name, otel_span))
+            yield otel_span
+
+    tracing.enable_opentelemetry(FakeTracer())
+    try:
+        with span("outer", route="search") as current:
+            current.set_attribute("hits", 3)
+    finally:
+        tracing.disable_opentelemetry()
+
+    ((name, otel_span),) = started
+    assert name == "outer"
+    assert otel_span.attributes == {"route": "search", "hits": 3}
@@ -0,0 +1,131 @@
+"""Unit tests for :mod:`pylegifrance.transport`."""
+
+import json
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from pylegifrance.client import LegifranceClient
+from pylegifrance.config import ApiConfig
+from pylegifrance.exceptions import CassetteMiss, NotFound
+from pylegifrance.fonds.juri import JuriAPI
+from pylegifrance.retry import RetryPolicy
+from pylegifrance.transport import (
+    RecordingTransport,
+    ReplayTransport,
+    Transport,
+    read_cassette,
+)
+
+
+def _fake_api(session, route, url, headers, body):
+    response = requests.Response()
+    response.headers["Content-Type"] = "application/json"
+    if route == "search":
+        hits = [{"titles": [{"id": f"JURITEXT00000000000{i}"}]} for i in (1, 2)]
+        content = {"results": hits}
+    elif b"JURITEXT999999999999" in body:
+        response.status_code = 404
+        response._content = b"not found"
+        return response
+    else:
+        text_id = json.loads(body)["textId"]
+        content = {"text": {"id": text_id, "titre": "Arrêt de la Cour"}}
+    response.status_code = 200
+    response._content = json.dumps(content).encode()
+    return response
+
+
+@pytest.fixture
+def cassette(tmp_path):
+    inner = MagicMock()
+    inner.requires_auth = True
+    inner.send.side_effect = _fake_api
+    path = tmp_path / "juri.jsonl.gz"
+
+    recorder = RecordingTransport(path, inner=inner)
+    client = LegifranceClient(
+        ApiConfig(client_id="id", client_secret="secret"),
+        transport=recorder,
+        retry_policy=RetryPolicy.disabled(),
+    )
+    client._auth_manager = MagicMock()
+    client._auth_manager.ensure_valid_token.return_value = "token"
+    JuriAPI(client).search("responsabilité")
+    with pytest.raises(NotFound):
+        client.call_api("consult/juri", {"textId": "JURITEXT999999999999"})
+    client.close()
+
+    assert recorder.recorded == 4
+    return path
+
+
+def _offline_client(transport: Transport) -> LegifranceClient:
+    client = LegifranceClient(
+        ApiConfig(client_id="offline", client_secret="offline"),
+        transport=transport,
+        retry_policy=RetryPolicy.disabled(),
+    )
+    client._auth_manager = MagicMock()
+    return client
+
+
+def test_cassette_records_calls_without_credentials(cassette):
+    records = list(read_cassette(cassette))
+
+    assert [r["route"] for r in records] == [
+        "search",
+        "consult/juri",
+        "consult/juri",
+        "consult/juri",
+    ]
+    assert records[1]["payload"]["textId"] == "JURITEXT000000000001"
+    assert records[-1]["status"] == 404
+    assert "token" not in cassette.read_bytes().decode("latin-1")
+
+
+def test_replay_runs_the_whole_stack_offline(cassette):
+    client = _offline_client(ReplayTransport(cassette))
+
+    decisions = JuriAPI(client).search("responsabilité")
+
+    assert [d.id for d in decisions] == [
+        "JURITEXT000000000001",
+        "JURITEXT000000000002",
+    ]
+    assert decisions[0].title == "Arrêt de la Cour"
+    client._auth_manager.ensure_valid_token.assert_not_called()
+
+
+def test_replay_preserves_errors_and_reports_misses(cassette):
+    client = _offline_client(ReplayTransport(cassette))
+
+    with pytest.raises(NotFound):
+        client.call_api("consult/juri", {"textId": "JURITEXT999999999999"})
+    with pytest.raises(CassetteMiss) as excinfo:
+        client.call_api("consult/juri", {"textId": "JURITEXT000000000042"})
+    assert excinfo.value.route == "consult/juri"
+
+
+def test_replay_matches_payloads_regardless_of_key_order(cassette):
+    transport = ReplayTransport(cassette)
+    record = next(r for r in read_cassette(cassette) if r["route"] == "search")
+    reordered = dict(reversed(list(record["payload"].items())))
+
+    response = transport.send(
+        None, "search", "http://x/search", {}, json.dumps(reordered).encode()
+    )
+
+    assert response.json()["results"]
+
+
+def test_replay_simulates_latency(cassette):
+    client = _offline_client(ReplayTransport(cassette, latency=0.05, jitter=0.01))
+    record = next(read_cassette(cassette))
+
+    started = time.perf_counter()
+    client.call_api(record["route"], record["payload"])
+
+    assert time.perf_counter() - started >= 0.04